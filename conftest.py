@@ -91,6 +91,18 @@ def set_xdg_config_path(
     monkeypatch.setenv("XDG_CONFIG_HOME", str(xdg_config_path))
 
 
+@pytest.fixture(autouse=True)
+def set_xdg_cache_path(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> pathlib.Path:
+    """Give each test its own XDG_CACHE_HOME so cached state never leaks."""
+    cache_path = tmp_path_factory.mktemp("xdg-cache")
+    monkeypatch.delenv("VCSPULL_CACHEDIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_path))
+    return cache_path
+
+
 @pytest.fixture
 def repos_path(user_path: pathlib.Path, request: pytest.FixtureRequest) -> pathlib.Path:
     """Return temporary directory for repository checkout guaranteed unique."""
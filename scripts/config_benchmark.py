@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Benchmark vcspull config parsing and writing on a large generated config.
+
+Builds a config with ``--entries`` repositories spread over a few hundred
+workspace roots, some of them duplicated, then times the duplicate-aware YAML
+loader and the YAML writer with libyaml and with PyYAML's pure-Python classes.
+It also times ``vcspull sync <name>``'s lookup, expanding every entry and
+expanding only the match, and measures the memory the expanded repositories
+take as compact records and as the plain dicts they replace::
+
+    $ python scripts/config_benchmark.py --entries 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import tempfile
+import time
+import tracemalloc
+import typing as t
+
+import yaml
+
+from vcspull._internal.config_reader import (
+    LIBYAML_AVAILABLE,
+    DuplicateAwareConfigReader,
+    _DuplicateTrackingSafeLoader,
+    _PyDuplicateTrackingSafeLoader,
+)
+from vcspull._internal.lazy_config import LazyConfig
+from vcspull.config import filter_repos, load_configs
+
+#: Repositories per workspace root in the generated config.
+REPOS_PER_ROOT = 40
+
+
+def generate_config(entries: int) -> str:
+    r"""Return YAML for a config with ``entries`` repositories.
+
+    Every tenth workspace root appears twice, so the duplicate tracking does
+    real work.
+
+    Examples
+    --------
+    >>> text = generate_config(3)
+    >>> print(text)
+    ~/code/group-0/:
+      repo-0: git+https://github.com/org-0/repo-0.git
+      repo-1:
+        repo: git+https://github.com/org-0/repo-1.git
+        options:
+          shallow: true
+      repo-2: git+https://github.com/org-0/repo-2.git
+    <BLANKLINE>
+    >>> len(yaml.safe_load(generate_config(100)))
+    3
+    """
+    lines: list[str] = []
+    for index in range(entries):
+        group = index // REPOS_PER_ROOT
+        if index % REPOS_PER_ROOT == 0 or (
+            group % 10 == 9 and index % REPOS_PER_ROOT == REPOS_PER_ROOT // 2
+        ):
+            lines.append(f"~/code/group-{group}/:")
+        url = f"git+https://github.com/org-{group}/repo-{index}.git"
+        if index % 3 == 1:
+            lines.extend(
+                [
+                    f"  repo-{index}:",
+                    f"    repo: {url}",
+                    "    options:",
+                    "      shallow: true",
+                ],
+            )
+        else:
+            lines.append(f"  repo-{index}: {url}")
+    return "\n".join(lines) + "\n"
+
+
+def best_of(func: t.Callable[[], object], repeat: int) -> float:
+    """Return the fastest of ``repeat`` timings of ``func``, in seconds.
+
+    Examples
+    --------
+    >>> best_of(lambda: None, repeat=3) >= 0
+    True
+    """
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(entries: int, repeat: int) -> list[tuple[str, float, float]]:
+    """Return ``(step, pure-Python seconds, libyaml seconds)`` per step.
+
+    Examples
+    --------
+    >>> [step for step, _, _ in run(entries=50, repeat=1)]
+    ['parse (duplicate-aware)', 'write']
+    """
+    text = generate_config(entries)
+    content, _, _ = DuplicateAwareConfigReader._load_yaml_with_duplicates(text)
+
+    def parse_with(loader: t.Any) -> t.Callable[[], object]:
+        return lambda: DuplicateAwareConfigReader._load_yaml_with_duplicates(
+            text,
+            loader_class=loader,
+        )
+
+    def write_with(dumper: t.Any) -> t.Callable[[], object]:
+        return lambda: yaml.dump(
+            content,
+            indent=2,
+            default_flow_style=False,
+            Dumper=dumper,
+        )
+
+    return [
+        (
+            "parse (duplicate-aware)",
+            best_of(parse_with(_PyDuplicateTrackingSafeLoader), repeat),
+            best_of(parse_with(_DuplicateTrackingSafeLoader), repeat),
+        ),
+        (
+            "write",
+            best_of(write_with(yaml.SafeDumper), repeat),
+            best_of(lambda: DuplicateAwareConfigReader._dump("yaml", content), repeat),
+        ),
+    ]
+
+
+def run_targeted(entries: int, repeat: int) -> tuple[float, float]:
+    """Return seconds to find one repository, eagerly and lazily.
+
+    Both sides parse the config without the config cache; the eager side
+    expands every entry before filtering.
+
+    Examples
+    --------
+    >>> eager, lazy = run_targeted(entries=50, repeat=1)
+    >>> eager > 0 and lazy > 0
+    True
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = pathlib.Path(tmp)
+        config_file = cwd / ".vcspull.yaml"
+        config_file.write_text(generate_config(entries), encoding="utf-8")
+        name = f"repo-{entries // 2}"
+        eager = best_of(
+            lambda: filter_repos(
+                load_configs([config_file], cwd=cwd, use_cache=False),
+                name=name,
+            ),
+            repeat,
+        )
+        lazy = best_of(
+            lambda: LazyConfig.load(
+                [config_file],
+                cwd=cwd,
+                use_cache=False,
+            ).filter(name=name),
+            repeat,
+        )
+    return eager, lazy
+
+
+def run_memory(entries: int) -> tuple[float, int, int]:
+    """Return load seconds, then bytes held by records and by plain dicts.
+
+    The dicts are what :func:`~vcspull.config.extract_repos` returned before
+    records: one per repository, with its checkout :class:`pathlib.Path`.
+
+    Examples
+    --------
+    >>> seconds, records, dicts = run_memory(entries=50)
+    >>> seconds > 0 and 0 < records < dicts
+    True
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = pathlib.Path(tmp)
+        config_file = cwd / ".vcspull.yaml"
+        config_file.write_text(generate_config(entries), encoding="utf-8")
+        seconds = best_of(
+            lambda: load_configs([config_file], cwd=cwd, use_cache=False),
+            repeat=1,
+        )
+        tracemalloc.start()
+        try:
+            repos = load_configs([config_file], cwd=cwd, use_cache=False)
+            record_bytes, _ = tracemalloc.get_traced_memory()
+            as_dicts = [dict(repo) for repo in repos]
+            del repos
+            dict_bytes, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    del as_dicts
+    return seconds, record_bytes, dict_bytes
+
+
+def main() -> None:
+    """Run the benchmark and print a table of timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if not LIBYAML_AVAILABLE:
+        print("PyYAML was built without libyaml; both columns use pure Python.")
+    print(f"{args.entries} repositories, best of {args.repeat}")
+    print(f"{'step':<26}{'pure Python':>12}{'libyaml':>10}{'speedup':>9}")
+    for step, pure, fast in run(args.entries, args.repeat):
+        speedup = pure / fast if fast else float("inf")
+        print(
+            f"{step:<26}{pure * 1000:>10.0f}ms{fast * 1000:>8.0f}ms{speedup:>8.1f}x",
+        )
+    eager, lazy = run_targeted(args.entries, args.repeat)
+    print(
+        f"{'lookup one repo by name':<26}"
+        f"{eager * 1000:>10.0f}ms{lazy * 1000:>8.0f}ms{eager / lazy:>8.1f}x"
+        "  (expand all / expand match)",
+    )
+    seconds, record_bytes, dict_bytes = run_memory(args.entries)
+    print(
+        f"load_configs: {seconds * 1000:.0f}ms; expanded repos take "
+        f"{record_bytes / 2**20:.1f} MiB as records, "
+        f"{dict_bytes / 2**20:.1f} MiB as dicts",
+    )
+
+
+if __name__ == "__main__":
+    main()
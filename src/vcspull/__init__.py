@@ -7,10 +7,23 @@
 # Set default logging handler to avoid "No handler found" warnings.
 from __future__ import annotations
 
+import importlib
 import logging
+import typing as t
 from logging import NullHandler
 
-from . import cli
 from .__about__ import __version__
 
 logging.getLogger(__name__).addHandler(NullHandler())
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import :mod:`vcspull.cli` on first access.
+
+    Shell completion imports :mod:`vcspull._internal.completion_cache` on every
+    keypress, so ``import vcspull`` itself stays free of the command line.
+    """
+    if name == "cli":
+        return importlib.import_module(".cli", __name__)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,369 @@
+"""Repository names, paths, and workspace roots for shell completion.
+
+Completing ``vcspull sync fl<TAB>`` needs the configured repository names,
+and loading every config on each keypress is far too slow for large
+configurations. :func:`build` loads the configs once and stores the names,
+checkout paths, and workspace roots as JSON under
+:func:`~vcspull.util.get_cache_dir`, together with the signature (mtime and
+size) of every path the result depends on: each config file, the home config
+files that could appear, and the config directories, whose mtime changes when
+a file is added to or removed from them. The values of the environment
+variables that pick the config directory or that the configs refer to are
+stored as well.
+
+:func:`main`, installed as ``vcspull-complete``, answers prefix queries from
+that file. While nothing recorded has changed it imports only this module,
+:mod:`vcspull.util`, and the standard library; otherwise it loads the configs
+again and stores a fresh copy. ``vcspull cache clear`` deletes the cache.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import sys
+import typing as t
+
+from vcspull.__about__ import __version__
+from vcspull.util import get_cache_dir
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+log = logging.getLogger(__name__)
+
+COMPLETION_CACHE_NAME = "completion"
+
+#: Config file sets kept at most: the default search and each ``-f`` list.
+#: The least recently built are dropped first.
+MAX_SOURCES = 8
+
+#: What :func:`complete` can list. ``patterns`` lists paths for a prefix
+#: ``vcspull sync`` would read as a path, and names otherwise.
+Kind: t.TypeAlias = t.Literal["names", "paths", "roots", "patterns"]
+KINDS: tuple[Kind, ...] = ("names", "paths", "roots", "patterns")
+
+#: Pattern prefixes ``vcspull sync`` reads as checkout paths.
+_PATH_PREFIXES = ("./", "/", "~", "$HOME")
+
+#: Environment variables that decide where config files are searched for.
+_SEARCH_ENV = ("HOME", "VCSPULL_CONFIGDIR", "XDG_CONFIG_HOME")
+
+#: Shell functions for ``shtab --preamble``; ``vcspull sync`` names them as
+#: the completers of its patterns and ``--workspace``.
+SHELL_PREAMBLES = {
+    "bash": """\
+_vcspull_complete_patterns() {
+  vcspull-complete patterns "$1" 2>/dev/null
+}
+_vcspull_complete_roots() {
+  vcspull-complete roots "$1" 2>/dev/null
+}
+""",
+    "zsh": """\
+_vcspull_complete_patterns() {
+  local -a values
+  values=(${(f)"$(vcspull-complete patterns "$PREFIX" 2>/dev/null)"})
+  compadd -a values
+}
+_vcspull_complete_roots() {
+  local -a values
+  values=(${(f)"$(vcspull-complete roots "$PREFIX" 2>/dev/null)"})
+  compadd -a values
+}
+""",
+}
+
+USAGE = """\
+usage: vcspull-complete [-f FILE]... {names,paths,roots,patterns} [PREFIX]
+       vcspull-complete preamble {bash,zsh}
+"""
+
+
+def default_completion_cache_dir() -> pathlib.Path:
+    """Return where completion data lives, inside :func:`get_cache_dir`.
+
+    Examples
+    --------
+    >>> default_completion_cache_dir().name
+    'completion'
+    """
+    return get_cache_dir() / COMPLETION_CACHE_NAME
+
+
+def _source_path(files: Sequence[str], cache_dir: pathlib.Path) -> pathlib.Path:
+    """Return the cache file for ``files``; none means the default search."""
+    if not files:
+        return cache_dir / "default.json"
+    digest = hashlib.sha256("\0".join(files).encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest[:16]}.json"
+
+
+def _normalize_files(files: Sequence[str | pathlib.Path]) -> list[str]:
+    """Return ``files`` as absolute paths, as ``-f`` resolves them."""
+    return [str(pathlib.Path(file).expanduser().absolute()) for file in files]
+
+
+def _signature(path: str) -> list[int] | None:
+    """Return ``[mtime_ns, size]`` of ``path``, or ``None`` if it is missing."""
+    try:
+        st = pathlib.Path(path).stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def starting_with(values: Sequence[str], prefix: str) -> list[str]:
+    """Return the items of sorted ``values`` that start with ``prefix``.
+
+    Examples
+    --------
+    >>> starting_with(["click", "django", "flask", "flask-login"], "fl")
+    ['flask', 'flask-login']
+    >>> starting_with(["click", "django"], "")
+    ['click', 'django']
+    """
+    start = bisect.bisect_left(values, prefix)
+    end = start
+    while end < len(values) and values[end].startswith(prefix):
+        end += 1
+    return list(values[start:end])
+
+
+def _matching_paths(paths: Sequence[str], prefix: str, cwd: str) -> list[str]:
+    """Return ``paths`` under ``prefix``, spelled the way ``prefix`` starts.
+
+    Examples
+    --------
+    >>> paths = ["/code/click", "/code/flask", "/home/u/study/flask"]
+    >>> _matching_paths(paths, "/code/f", cwd="/")
+    ['/code/flask']
+    >>> _matching_paths(paths, "./f", cwd="/code")
+    ['./flask']
+    """
+    home = str(pathlib.Path.home())
+    for alias, target in (("~", home), ("$HOME", home), (".", cwd)):
+        if prefix == alias or prefix.startswith(f"{alias}/"):
+            target = target.rstrip("/")
+            matches = starting_with(paths, target + prefix[len(alias) :])
+            return [alias + path[len(target) :] for path in matches]
+    return starting_with(paths, prefix)
+
+
+def _is_fresh(data: t.Any, cwd: str) -> bool:
+    """Return whether nothing ``data`` was built from has changed since."""
+    try:
+        return (
+            data["version"] == __version__
+            and data["cwd"] in {None, cwd}
+            and all(
+                os.environ.get(name) == value for name, value in data["env"].items()
+            )
+            and all(
+                _signature(path) == signature
+                for path, signature in data["watched"].items()
+            )
+        )
+    except (KeyError, TypeError, AttributeError):
+        return False
+
+
+def load(
+    files: Sequence[str | pathlib.Path] = (),
+    *,
+    cache_dir: pathlib.Path | None = None,
+) -> dict[str, t.Any] | None:
+    """Return the stored completion data for ``files`` if still current.
+
+    ``files`` are the ``-f`` config files; none means the files
+    ``vcspull sync`` finds on its own.
+    """
+    if cache_dir is None:
+        cache_dir = default_completion_cache_dir()
+    path = _source_path(_normalize_files(files), cache_dir)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not _is_fresh(data, str(pathlib.Path.cwd())):
+        return None
+    return t.cast("dict[str, t.Any]", data)
+
+
+def _store(path: pathlib.Path, data: dict[str, t.Any]) -> None:
+    """Write ``data`` to ``path`` atomically; drop the oldest other sources."""
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        partial.write_text(json.dumps(data), encoding="utf-8")
+        partial.replace(path)
+
+        sources = sorted(
+            path.parent.glob("*.json"),
+            key=lambda source: source.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for stale in sources[MAX_SOURCES:]:
+            stale.unlink()
+
+
+def build(
+    files: Sequence[str | pathlib.Path] = (),
+    *,
+    cache_dir: pathlib.Path | None = None,
+) -> dict[str, t.Any]:
+    r"""Load the configs, store their completion data, and return it.
+
+    Signatures are taken before the paths are read, so an edit made during
+    the load is noticed by the next query.
+
+    Examples
+    --------
+    >>> config = tmp_path / "work.yaml"
+    >>> _ = config.write_text(
+    ...     "~/code/:\n"
+    ...     "  flask: git+https://github.com/pallets/flask.git\n"
+    ...     "  click: git+https://github.com/pallets/click.git\n"
+    ... )
+    >>> data = build([config], cache_dir=tmp_path / "completion")
+    >>> data["names"], data["roots"]
+    (['click', 'flask'], ['~/code/'])
+    >>> load([config], cache_dir=tmp_path / "completion") == data
+    True
+    """
+    from vcspull._internal.config_cache import referenced_env_names
+    from vcspull.config import find_config_files, load_configs
+    from vcspull.util import config_dir_candidates
+
+    if cache_dir is None:
+        cache_dir = default_completion_cache_dir()
+    normalized = _normalize_files(files)
+    cwd = pathlib.Path.cwd()
+
+    watched: dict[str, list[int] | None] = {}
+    if normalized:
+        config_files = [pathlib.Path(file) for file in normalized]
+    else:
+        searched = [
+            *(
+                str(pathlib.Path(f"~/.vcspull.{ext}").expanduser())
+                for ext in ("yaml", "json", "jsonl")
+            ),
+            *(str(directory) for directory in config_dir_candidates()),
+        ]
+        watched.update((path, _signature(path)) for path in searched)
+        config_files = find_config_files(include_home=True)
+    env_names = set(_SEARCH_ENV)
+    for config_file in config_files:
+        watched[str(config_file)] = _signature(str(config_file))
+        with contextlib.suppress(OSError):
+            env_names |= referenced_env_names(config_file.read_bytes())
+
+    repos = load_configs(config_files, cwd=cwd)
+    roots = {str(repo.get("workspace_root", "")) for repo in repos}
+    roots.discard("")
+    relative_roots = any(
+        not pathlib.Path(os.path.expandvars(root)).expanduser().is_absolute()
+        for root in roots
+    )
+    data: dict[str, t.Any] = {
+        "version": __version__,
+        "cwd": str(cwd) if relative_roots else None,
+        "env": {name: os.environ.get(name) for name in sorted(env_names)},
+        "watched": watched,
+        "names": sorted({repo["name"] for repo in repos}),
+        "paths": sorted({str(repo["path"]) for repo in repos}),
+        "roots": sorted(roots),
+    }
+    _store(_source_path(normalized, cache_dir), data)
+    return data
+
+
+def complete(
+    kind: Kind,
+    prefix: str = "",
+    files: Sequence[str | pathlib.Path] = (),
+    *,
+    cache_dir: pathlib.Path | None = None,
+) -> list[str]:
+    r"""Return the configured values of ``kind`` that start with ``prefix``.
+
+    The configs are loaded only when the stored data is missing or stale.
+    A config that fails to load completes nothing rather than raising.
+
+    Examples
+    --------
+    >>> config = tmp_path / "work.yaml"
+    >>> _ = config.write_text(
+    ...     f"{tmp_path}/code/:\n"
+    ...     "  flask: git+https://github.com/pallets/flask.git\n"
+    ...     "  flask-login: git+https://github.com/maxcountryman/flask-login.git\n"
+    ...     "  click: git+https://github.com/pallets/click.git\n"
+    ... )
+    >>> complete("names", "fl", [config])
+    ['flask', 'flask-login']
+    >>> [
+    ...     pathlib.Path(path).name
+    ...     for path in complete("patterns", f"{tmp_path}/code/c", [config])
+    ... ]
+    ['click']
+    """
+    if kind == "patterns":
+        kind = "paths" if prefix.startswith(_PATH_PREFIXES) else "names"
+    data = load(files, cache_dir=cache_dir)
+    if data is None:
+        try:
+            data = build(files, cache_dir=cache_dir)
+        except Exception:
+            # Completion runs on a keypress; a broken config must not print
+            # a traceback into the command line being edited.
+            log.debug("Could not load configs for completion", exc_info=True)
+            return []
+    if kind == "paths":
+        return _matching_paths(data["paths"], prefix, str(pathlib.Path.cwd()))
+    return starting_with(data[kind], prefix)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Print completions, one per line; the ``vcspull-complete`` command.
+
+    Examples
+    --------
+    >>> main(["preamble", "bash"])
+    _vcspull_complete_patterns() {
+      vcspull-complete patterns "$1" 2>/dev/null
+    }
+    _vcspull_complete_roots() {
+      vcspull-complete roots "$1" 2>/dev/null
+    }
+    0
+    >>> main(["repos"])
+    2
+    """
+    args = list(sys.argv[1:] if argv is None else argv)
+    if len(args) == 2 and args[0] == "preamble" and args[1] in SHELL_PREAMBLES:
+        sys.stdout.write(SHELL_PREAMBLES[args[1]])
+        return 0
+
+    files: list[str] = []
+    while len(args) >= 2 and args[0] in {"-f", "--file"}:
+        files.append(args[1])
+        del args[:2]
+    if not 1 <= len(args) <= 2 or args[0] not in KINDS:
+        sys.stderr.write(USAGE)
+        return 2
+
+    kind = args[0]
+    prefix = args[1] if len(args) == 2 else ""
+    for value in complete(kind, prefix, files):
+        sys.stdout.write(f"{value}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
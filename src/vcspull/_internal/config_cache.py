@@ -0,0 +1,488 @@
+"""Snapshots of expanded repository lists, reused while config files are unchanged.
+
+Every command starts with :func:`~vcspull.config.load_configs`, which parses
+each config file, merges duplicate workspace roots, and expands every entry
+into a :class:`~vcspull.types.ConfigDict`. For configs with thousands of
+repositories that costs more than many commands spend on their actual work.
+This module stores the result of a load, pickled, in a small SQLite database
+under :func:`~vcspull.util.get_cache_dir`, so the next load of the same files
+can skip parsing entirely.
+
+A snapshot is keyed on everything the expanded list depends on: each file's
+path, mtime, size, and content hash, the working directory and home directory
+used to expand paths, the value of each environment variable the files
+reference, the load options, and the vcspull version. Loads that log a
+warning are not stored, so a cached load never hides one.
+
+``vcspull fmt`` and ``vcspull migrate`` keep a second table here: the keys
+of config files they found already in shape, hashed from each file's content
+and whatever else the check depends on. A file whose key is known is
+reported clean without being parsed again, and is never rewritten.
+
+``vcspull search`` stores its
+:class:`~vcspull._internal.search_index.SearchIndex` in a third table, under
+a snapshot key of its own, so a search of unchanged configs loads neither
+the files nor the expanded repositories.
+
+Like the other caches, this one is best effort: when it cannot be read or
+written, configs are loaded as before. ``vcspull --no-config-cache`` skips it
+and ``vcspull cache clear`` deletes it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import pickle
+import re
+import sqlite3
+import time
+import typing as t
+
+from vcspull.__about__ import __version__
+from vcspull.util import get_cache_dir
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
+log = logging.getLogger(__name__)
+
+CONFIG_CACHE_NAME = "config-cache.sqlite3"
+
+#: Bumped whenever the ``snapshot`` columns or the pickled repository type
+#: change; older caches are dropped.
+SCHEMA_VERSION = 2
+
+#: Snapshots kept at most; the oldest are dropped first. Different working
+#: directories or ``-f`` files each get their own snapshot.
+MAX_SNAPSHOTS = 16
+
+#: Clean-file keys kept at most; the oldest are dropped first.
+MAX_CLEAN_FILES = 4096
+
+#: Search indexes kept at most; the oldest are dropped first.
+MAX_SEARCH_INDEXES = 4
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS snapshot ("
+    "key TEXT PRIMARY KEY, repos BLOB NOT NULL, stored_at REAL NOT NULL)"
+)
+
+_CLEAN_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS clean_file ("
+    "key TEXT PRIMARY KEY, stored_at REAL NOT NULL)"
+)
+
+_SEARCH_INDEX_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS search_index ("
+    "key TEXT PRIMARY KEY, data BLOB NOT NULL, stored_at REAL NOT NULL)"
+)
+
+_ENV_REFERENCE_RE = re.compile(
+    rb"\$(?:\{([A-Za-z_][A-Za-z0-9_]*)\}|([A-Za-z_][A-Za-z0-9_]*))",
+)
+
+#: Errors :func:`pickle.loads` raises for snapshots it cannot rebuild.
+_UNPICKLE_ERRORS = (
+    pickle.UnpicklingError,
+    AttributeError,
+    EOFError,
+    ImportError,
+    IndexError,
+    TypeError,
+    ValueError,
+)
+
+_enabled = True
+
+
+def set_config_cache_enabled(enabled: bool) -> None:
+    """Turn config snapshots on or off for this process.
+
+    ``vcspull --no-config-cache`` turns them off.
+
+    Examples
+    --------
+    >>> set_config_cache_enabled(False)
+    >>> config_cache_enabled()
+    False
+    >>> set_config_cache_enabled(True)
+    >>> config_cache_enabled()
+    True
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def config_cache_enabled() -> bool:
+    """Return whether :func:`~vcspull.config.load_configs` uses snapshots."""
+    return _enabled
+
+
+def default_config_cache_path() -> pathlib.Path:
+    """Return where config snapshots live, inside :func:`get_cache_dir`.
+
+    Examples
+    --------
+    >>> default_config_cache_path().name
+    'config-cache.sqlite3'
+    """
+    return get_cache_dir() / CONFIG_CACHE_NAME
+
+
+def referenced_env_names(content: bytes) -> set[str]:
+    r"""Return the names of environment variables ``content`` refers to.
+
+    Examples
+    --------
+    >>> sorted(referenced_env_names(b"$HOME/code/:\n  x: ${FORGE}/x.git\n"))
+    ['FORGE', 'HOME']
+    """
+    return {
+        (braced or bare).decode("ascii")
+        for braced, bare in _ENV_REFERENCE_RE.findall(content)
+    }
+
+
+def snapshot_key(
+    files: Sequence[pathlib.Path],
+    *,
+    cwd: pathlib.Path,
+    options: Mapping[str, t.Any],
+) -> str | None:
+    r"""Return the snapshot key for loading ``files``, or ``None``.
+
+    ``None`` means a file could not be read; the load then goes ahead
+    uncached and reports the problem itself.
+
+    Examples
+    --------
+    >>> config = tmp_path / ".vcspull.yaml"
+    >>> _ = config.write_text("~/code/:\n  flask: git+https://x/flask\n")
+    >>> key = snapshot_key([config], cwd=tmp_path, options={})
+    >>> key == snapshot_key([config], cwd=tmp_path, options={})
+    True
+    >>> key == snapshot_key([config], cwd=tmp_path / "sub", options={})
+    False
+    >>> snapshot_key([tmp_path / "missing.yaml"], cwd=tmp_path, options={}) is None
+    True
+    """
+    fingerprints: list[tuple[str, int, int, str]] = []
+    env_names: set[str] = set()
+    for file in files:
+        try:
+            st = file.stat()
+            content = file.read_bytes()
+        except OSError:
+            return None
+        fingerprints.append(
+            (
+                str(file),
+                st.st_mtime_ns,
+                st.st_size,
+                hashlib.sha256(content).hexdigest(),
+            ),
+        )
+        env_names |= referenced_env_names(content)
+    payload = {
+        "version": __version__,
+        "files": fingerprints,
+        "cwd": str(cwd),
+        "home": str(pathlib.Path("~").expanduser()),
+        "env": {name: os.environ.get(name) for name in sorted(env_names)},
+        "options": dict(options),
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@contextlib.contextmanager
+def _open_cache(cache_path: pathlib.Path) -> Iterator[sqlite3.Connection]:
+    """Open the cache database, creating or resetting its schema."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_path, timeout=5.0)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS snapshot")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.execute(_SCHEMA)
+        conn.execute(_CLEAN_SCHEMA)
+        conn.execute(_SEARCH_INDEX_SCHEMA)
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def load_snapshot(
+    key: str,
+    *,
+    cache_path: pathlib.Path | None = None,
+) -> list[t.Any] | None:
+    """Return the list stored under ``key``, or ``None`` on a miss.
+
+    :func:`~vcspull.config.load_configs` stores expanded repositories;
+    :class:`~vcspull._internal.lazy_config.LazyConfig` stores raw entries
+    under keys of its own.
+
+    Examples
+    --------
+    >>> cache_path = tmp_path / "config-cache.sqlite3"
+    >>> load_snapshot("abc", cache_path=cache_path) is None
+    True
+    >>> store_snapshot("abc", [{"name": "flask"}], cache_path=cache_path)
+    >>> load_snapshot("abc", cache_path=cache_path)
+    [{'name': 'flask'}]
+    """
+    resolved_path = (
+        cache_path if cache_path is not None else default_config_cache_path()
+    )
+    if not resolved_path.exists():
+        return None
+    try:
+        with _open_cache(resolved_path) as conn:
+            row = conn.execute(
+                "SELECT repos FROM snapshot WHERE key = ?",
+                (key,),
+            ).fetchone()
+    except (OSError, sqlite3.Error) as exc:
+        log.debug("Config cache unavailable, loading configs: %s", exc)
+        return None
+    if row is None:
+        return None
+    try:
+        repos: list[t.Any] = pickle.loads(row[0])
+    except _UNPICKLE_ERRORS as exc:
+        log.debug("Discarding unreadable config snapshot: %s", exc)
+        return None
+    return repos
+
+
+def store_snapshot(
+    key: str,
+    repos: Sequence[object],
+    *,
+    cache_path: pathlib.Path | None = None,
+) -> None:
+    """Store ``repos`` under ``key``, dropping the oldest extra snapshots."""
+    resolved_path = (
+        cache_path if cache_path is not None else default_config_cache_path()
+    )
+    try:
+        blob = pickle.dumps(repos, protocol=pickle.HIGHEST_PROTOCOL)
+        with _open_cache(resolved_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshot (key, repos, stored_at) "
+                "VALUES (?, ?, ?)",
+                (key, blob, time.time()),
+            )
+            conn.execute(
+                "DELETE FROM snapshot WHERE key NOT IN ("
+                "SELECT key FROM snapshot ORDER BY stored_at DESC LIMIT ?)",
+                (MAX_SNAPSHOTS,),
+            )
+    except (OSError, sqlite3.Error, pickle.PicklingError, TypeError) as exc:
+        log.debug("Could not update config cache: %s", exc)
+
+
+def load_search_index(
+    key: str,
+    *,
+    cache_path: pathlib.Path | None = None,
+) -> object | None:
+    """Return the search index stored under ``key``, or ``None`` on a miss.
+
+    Examples
+    --------
+    >>> cache_path = tmp_path / "config-cache.sqlite3"
+    >>> load_search_index("abc", cache_path=cache_path) is None
+    True
+    >>> store_search_index("abc", {"name": ["flask"]}, cache_path=cache_path)
+    >>> load_search_index("abc", cache_path=cache_path)
+    {'name': ['flask']}
+    """
+    resolved_path = (
+        cache_path if cache_path is not None else default_config_cache_path()
+    )
+    if not resolved_path.exists():
+        return None
+    try:
+        with _open_cache(resolved_path) as conn:
+            row = conn.execute(
+                "SELECT data FROM search_index WHERE key = ?",
+                (key,),
+            ).fetchone()
+    except (OSError, sqlite3.Error) as exc:
+        log.debug("Config cache unavailable, building search index: %s", exc)
+        return None
+    if row is None:
+        return None
+    try:
+        return t.cast("object", pickle.loads(row[0]))
+    except _UNPICKLE_ERRORS as exc:
+        log.debug("Discarding unreadable search index: %s", exc)
+        return None
+
+
+def store_search_index(
+    key: str,
+    index: object,
+    *,
+    cache_path: pathlib.Path | None = None,
+) -> None:
+    """Store ``index`` under ``key``, dropping the oldest extra indexes."""
+    resolved_path = (
+        cache_path if cache_path is not None else default_config_cache_path()
+    )
+    try:
+        blob = pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL)
+        with _open_cache(resolved_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_index (key, data, stored_at) "
+                "VALUES (?, ?, ?)",
+                (key, blob, time.time()),
+            )
+            conn.execute(
+                "DELETE FROM search_index WHERE key NOT IN ("
+                "SELECT key FROM search_index ORDER BY stored_at DESC LIMIT ?)",
+                (MAX_SEARCH_INDEXES,),
+            )
+    except (OSError, sqlite3.Error, pickle.PicklingError, TypeError) as exc:
+        log.debug("Could not update config cache: %s", exc)
+
+
+def clean_file_key(
+    file: pathlib.Path,
+    *,
+    command: str,
+    cwd: pathlib.Path,
+    options: Mapping[str, t.Any],
+) -> str | None:
+    r"""Return the key recording that ``command`` left ``file`` as it is.
+
+    Hashes the file's content rather than its mtime, so touching or checking
+    out a file again keeps its key. ``None`` means the file could not be read.
+
+    Examples
+    --------
+    >>> config = tmp_path / ".vcspull.yaml"
+    >>> _ = config.write_text("~/code/:\n  flask: git+https://x/flask\n")
+    >>> key = clean_file_key(config, command="fmt", cwd=tmp_path, options={})
+    >>> key == clean_file_key(config, command="migrate", cwd=tmp_path, options={})
+    False
+    >>> _ = config.write_text("~/code/:\n  flask: git+https://y/flask\n")
+    >>> key == clean_file_key(config, command="fmt", cwd=tmp_path, options={})
+    False
+    """
+    try:
+        content = file.read_bytes()
+    except OSError:
+        return None
+    env_names = referenced_env_names(content)
+    payload = {
+        "version": __version__,
+        "command": command,
+        "file": str(file),
+        "content": hashlib.sha256(content).hexdigest(),
+        "cwd": str(cwd),
+        "home": str(pathlib.Path("~").expanduser()),
+        "env": {name: os.environ.get(name) for name in sorted(env_names)},
+        "options": dict(options),
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def known_clean_files(
+    keys: Sequence[str],
+    *,
+    cache_path: pathlib.Path | None = None,
+) -> set[str]:
+    """Return which of ``keys`` were stored by :func:`store_clean_files`.
+
+    Examples
+    --------
+    >>> cache_path = tmp_path / "config-cache.sqlite3"
+    >>> known_clean_files(["a", "b"], cache_path=cache_path)
+    set()
+    >>> store_clean_files(["a"], cache_path=cache_path)
+    >>> known_clean_files(["a", "b"], cache_path=cache_path)
+    {'a'}
+    """
+    resolved_path = (
+        cache_path if cache_path is not None else default_config_cache_path()
+    )
+    if not keys or not resolved_path.exists():
+        return set()
+    known: set[str] = set()
+    try:
+        with _open_cache(resolved_path) as conn:
+            # Batched to stay under SQLite's bound parameter limit.
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                placeholders = ", ".join("?" * len(batch))
+                known.update(
+                    row[0]
+                    for row in conn.execute(
+                        f"SELECT key FROM clean_file WHERE key IN ({placeholders})",
+                        batch,
+                    )
+                )
+    except (OSError, sqlite3.Error) as exc:
+        log.debug("Config cache unavailable, checking every file: %s", exc)
+        return set()
+    return known
+
+
+def store_clean_files(
+    keys: Sequence[str],
+    *,
+    cache_path: pathlib.Path | None = None,
+) -> None:
+    """Record ``keys`` as clean, dropping the oldest beyond the limit."""
+    if not keys:
+        return
+    resolved_path = (
+        cache_path if cache_path is not None else default_config_cache_path()
+    )
+    stored_at = time.time()
+    try:
+        with _open_cache(resolved_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO clean_file (key, stored_at) VALUES (?, ?)",
+                [(key, stored_at) for key in keys],
+            )
+            conn.execute(
+                "DELETE FROM clean_file WHERE key NOT IN ("
+                "SELECT key FROM clean_file ORDER BY stored_at DESC LIMIT ?)",
+                (MAX_CLEAN_FILES,),
+            )
+    except (OSError, sqlite3.Error) as exc:
+        log.debug("Could not update config cache: %s", exc)
+
+
+def clear_config_cache(*, cache_path: pathlib.Path | None = None) -> bool:
+    """Delete every config snapshot; return whether there was a cache.
+
+    Examples
+    --------
+    >>> cache_path = tmp_path / "config-cache.sqlite3"
+    >>> store_snapshot("abc", [], cache_path=cache_path)
+    >>> clear_config_cache(cache_path=cache_path)
+    True
+    >>> clear_config_cache(cache_path=cache_path)
+    False
+    """
+    resolved_path = (
+        cache_path if cache_path is not None else default_config_cache_path()
+    )
+    try:
+        resolved_path.unlink()
+    except FileNotFoundError:
+        return False
+    return True
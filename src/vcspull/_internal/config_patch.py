@@ -0,0 +1,335 @@
+"""Rewrite only the lines of a config file that a command changed.
+
+``vcspull add``, ``import`` and ``discover`` usually change a handful of
+repositories in a config that may hold thousands. Serializing the whole
+mapping again is slow on large files, drops comments, and reorders keys, so a
+one-line addition shows up as a rewrite of the file in version control.
+
+:func:`patch_config_text` compares the data a command wants saved with what
+the file holds and edits the text in place: changed repositories are
+replaced, removed ones deleted, new ones inserted after the last entry of
+their workspace root, and new workspace roots appended. YAML entries are
+located by the marks of the parsed nodes, which keep repeated workspace roots
+apart just as the duplicate-aware reader does, and JSONL entries by their
+line. Whenever the text cannot be patched safely, such as for flow-style
+sections or merged workspace roots, or a patched file does not read back as
+the requested data, ``None`` is returned and the caller writes the file in
+full.
+"""
+
+from __future__ import annotations
+
+import collections
+import typing as t
+
+import yaml
+
+from vcspull._internal.config_reader import (
+    ConfigReader,
+    dump_jsonl,
+    iter_jsonl_entries,
+    jsonl_line,
+    load_jsonl,
+)
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from vcspull._internal.config_reader import FormatLiteral
+
+#: Ordered ``(workspace_root, section)`` pairs, repeated roots included.
+ConfigItems: t.TypeAlias = "Sequence[tuple[str, t.Any]]"
+
+
+class _Splice(t.NamedTuple):
+    """Replace ``lines[start:end]`` with ``new_lines``; ``start == end`` inserts."""
+
+    start: int
+    end: int
+    new_lines: list[str]
+
+
+def _content_end(node: yaml.nodes.Node) -> int:
+    """Return the 0-based line after the last line holding ``node``'s content.
+
+    The end mark of a block collection points at the next token, past any
+    blank lines and comments that follow it, so those are left out by
+    descending into the collection's last value instead.
+    """
+    if isinstance(node, yaml.nodes.MappingNode) and not node.flow_style and node.value:
+        return _content_end(node.value[-1][1])
+    if isinstance(node, yaml.nodes.SequenceNode) and not node.flow_style and node.value:
+        return _content_end(node.value[-1])
+    mark = node.end_mark
+    return mark.line + 1 if mark.column > 0 else mark.line
+
+
+def _dump_yaml_lines(content: dict[str, t.Any], indent: int = 0) -> list[str]:
+    """Return ``content`` as block YAML lines, each indented by ``indent``."""
+    dumped = ConfigReader._dump(fmt="yaml", content=content, indent=2)
+    prefix = " " * indent
+    return [f"{prefix}{line}\n" for line in dumped.rstrip("\n").split("\n")]
+
+
+def _load_yaml_items(
+    text: str,
+) -> tuple[list[tuple[t.Any, t.Any]], list[tuple[yaml.nodes.Node, yaml.nodes.Node]]]:
+    """Return the top-level items of ``text`` and the nodes they were read from.
+
+    Repeated workspace roots are kept as separate items, as the
+    duplicate-tracking loader keeps them.
+    """
+    loader = _SafeLoader(text)
+    try:
+        root = loader.get_single_node()
+        if root is None:
+            return [], []
+        if not isinstance(root, yaml.nodes.MappingNode):
+            msg = "Loaded configuration is not a mapping"
+            raise TypeError(msg)
+        construct = t.cast("t.Callable[..., t.Any]", loader.construct_object)
+        items = [
+            (construct(key_node, deep=True), construct(value_node, deep=True))
+            for key_node, value_node in root.value
+        ]
+    finally:
+        loader.dispose()
+    return items, root.value
+
+
+def _section_splices(
+    section: dict[t.Any, t.Any],
+    target: dict[t.Any, t.Any],
+    node: yaml.nodes.Node,
+) -> list[_Splice] | None:
+    """Return the splices turning the YAML ``section`` at ``node`` into ``target``."""
+    if (
+        not isinstance(node, yaml.nodes.MappingNode)
+        or node.flow_style
+        or not node.value
+        or len(node.value) != len(section)
+    ):
+        return None
+    entry_nodes: dict[t.Any, tuple[yaml.nodes.Node, yaml.nodes.Node]] = {}
+    for name, (key_node, value_node) in zip(section, node.value, strict=True):
+        # Merge keys and aliases make the nodes disagree with the data.
+        if not isinstance(key_node, yaml.nodes.ScalarNode) or key_node.value != str(
+            name,
+        ):
+            return None
+        entry_nodes[name] = (key_node, value_node)
+
+    indent = node.value[0][0].start_mark.column
+    splices: list[_Splice] = []
+    for name, (key_node, value_node) in entry_nodes.items():
+        start, end = key_node.start_mark.line, _content_end(value_node)
+        if name not in target:
+            splices.append(_Splice(start, end, []))
+        elif target[name] != section[name]:
+            new_lines = _dump_yaml_lines({name: target[name]}, indent)
+            splices.append(_Splice(start, end, new_lines))
+    added = [name for name in target if name not in section]
+    if added:
+        new_lines = []
+        for name in added:
+            new_lines.extend(_dump_yaml_lines({name: target[name]}, indent))
+        end = _content_end(node)
+        splices.append(_Splice(end, end, new_lines))
+    return splices
+
+
+def patch_yaml(text: str, items: ConfigItems) -> str | None:
+    r"""Return ``text`` edited to hold ``items``, or ``None`` if it cannot be.
+
+    Parameters
+    ----------
+    text : str
+        Current YAML config.
+    items : sequence of (str, Any)
+        The config to save, as ordered top-level items. The file's own items
+        must come first, in the same order; further items are appended.
+
+    Examples
+    --------
+    >>> text = (
+    ...     "# Work repositories\n"
+    ...     "~/code/:\n"
+    ...     "  flask: git+https://github.com/pallets/flask.git  # upstream\n"
+    ...     "  rich: git+https://github.com/Textualize/rich.git\n"
+    ... )
+    >>> print(
+    ...     patch_yaml(
+    ...         text,
+    ...         [
+    ...             (
+    ...                 "~/code/",
+    ...                 {
+    ...                     "flask": "git+https://github.com/pallets/flask.git",
+    ...                     "rich": "git+https://github.com/fork/rich.git",
+    ...                     "click": "git+https://github.com/pallets/click.git",
+    ...                 },
+    ...             ),
+    ...             ("~/study/", {"cpython": "git+https://github.com/python/cpython.git"}),
+    ...         ],
+    ...     ),
+    ...     end="",
+    ... )
+    # Work repositories
+    ~/code/:
+      flask: git+https://github.com/pallets/flask.git  # upstream
+      rich: git+https://github.com/fork/rich.git
+      click: git+https://github.com/pallets/click.git
+    ~/study/:
+      cpython: git+https://github.com/python/cpython.git
+
+    Flow-style sections are left to a full rewrite:
+
+    >>> patch_yaml("~/code/: {flask: git+https://x}\n", [("~/code/", {})]) is None
+    True
+    """
+    try:
+        current_items, nodes = _load_yaml_items(text)
+    except (yaml.YAMLError, TypeError):
+        return None
+    items = list(items)
+    if len(items) < len(current_items):
+        return None
+
+    splices: list[_Splice] = []
+    for (label, section), (target_label, target), (_key_node, value_node) in zip(
+        current_items,
+        items,
+        nodes,
+        strict=False,
+    ):
+        if label != target_label:
+            return None
+        if section == target:
+            continue
+        if not isinstance(section, dict) or not isinstance(target, dict):
+            return None
+        section_splices = _section_splices(section, target, value_node)
+        if section_splices is None:
+            return None
+        splices.extend(section_splices)
+
+    lines = text.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    appended: list[str] = []
+    for label, section in items[len(current_items) :]:
+        appended.extend(_dump_yaml_lines({label: section}))
+    if appended:
+        splices.append(_Splice(len(lines), len(lines), appended))
+    if not splices:
+        return text
+
+    # Bottom-up, so earlier splices keep their line numbers; of two inserts at
+    # one line, the later goes in first and ends up below the earlier.
+    splices.sort(key=lambda splice: splice.start)
+    for splice in reversed(splices):
+        lines[splice.start : splice.end] = splice.new_lines
+    patched = "".join(lines)
+
+    try:
+        patched_items, _nodes = _load_yaml_items(patched)
+    except (yaml.YAMLError, TypeError):
+        return None
+    if patched_items != items:
+        return None
+    return patched
+
+
+def patch_jsonl(text: str, items: ConfigItems) -> str | None:
+    r"""Return JSONL ``text`` edited to hold ``items``, or ``None`` if it cannot be.
+
+    Lines of changed repositories are replaced, removed ones dropped, and
+    new ones appended; every other line is kept as written.
+
+    Examples
+    --------
+    >>> text = (
+    ...     '{"workspace_root": "~/code/", "name": "flask", "url": "git+https://x"}\n'
+    ...     '{"workspace_root": "~/code/", "name": "rich", "url": "git+https://y"}\n'
+    ... )
+    >>> print(
+    ...     patch_jsonl(text, [("~/code/", {"rich": "git+https://z"})]),
+    ...     end="",
+    ... )
+    {"workspace_root": "~/code/", "name": "rich", "url": "git+https://z"}
+    """
+    target = dict(items)
+    if len(target) != len(items) or not all(
+        isinstance(section, dict) for section in target.values()
+    ):
+        return None
+    lines = text.splitlines(keepends=True)
+    try:
+        entries = list(iter_jsonl_entries(lines))
+    except (ValueError, TypeError):
+        return None
+
+    def _target_line(workspace_root: str, name: str) -> str | None:
+        section = target.get(workspace_root, {})
+        if name not in section:
+            return None
+        return f"{jsonl_line(workspace_root, name, section[name])}\n"
+
+    counts = collections.Counter(
+        (entry.workspace_root, entry.name) for entry in entries
+    )
+    seen: set[tuple[str, str]] = set()
+    for entry in entries:
+        key = (entry.workspace_root, entry.name)
+        if key in seen:
+            # Later lines for a repository are ignored when read; they stay
+            # as written while the first line is left alone.
+            continue
+        seen.add(key)
+        new_line = _target_line(*key)
+        if new_line == f"{jsonl_line(*key, entry.data)}\n":
+            continue
+        if counts[key] > 1:
+            # Editing or removing the first line would leave, or bring into
+            # effect, a later one; a rewrite drops them all.
+            return None
+        lines[entry.line - 1] = new_line or ""
+    if lines and lines[-1] and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    for workspace_root, section in target.items():
+        lines.extend(
+            f"{jsonl_line(workspace_root, name, entry)}\n"
+            for name, entry in section.items()
+            if (workspace_root, name) not in seen
+        )
+    patched = "".join(lines)
+
+    try:
+        patched_content, _repeated = load_jsonl(patched.splitlines())
+    except (ValueError, TypeError):
+        return None
+    if patched_content != ConfigReader._load("jsonl", dump_jsonl(target)):
+        return None
+    return patched
+
+
+def patch_config_text(
+    fmt: FormatLiteral | None,
+    text: str,
+    items: ConfigItems,
+) -> str | None:
+    """Return config ``text`` edited to hold ``items``, or ``None`` to rewrite it.
+
+    JSON configs are always rewritten: :func:`json.dumps` lays them out the
+    same way every time, so a rewrite already only changes the edited lines.
+    """
+    if fmt == "yaml":
+        return patch_yaml(text, items)
+    if fmt == "jsonl":
+        return patch_jsonl(text, items)
+    return None
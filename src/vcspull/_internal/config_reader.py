@@ -7,9 +7,25 @@ import typing as t
 
 import yaml
 
-FormatLiteral = t.Literal["json", "yaml"]
+#: Whether YAML is parsed and emitted by libyaml. Its bindings read and write
+#: the same documents as PyYAML's pure-Python classes, several times faster.
+LIBYAML_AVAILABLE: bool
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+
+    LIBYAML_AVAILABLE = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import (  # type: ignore[assignment]
+        SafeDumper as _SafeDumper,
+        SafeLoader as _SafeLoader,
+    )
+
+    LIBYAML_AVAILABLE = False
+
+FormatLiteral = t.Literal["json", "yaml", "jsonl"]
 _SUPPORTED_CONFIG_SUFFIXES: dict[str, FormatLiteral] = {
     ".json": "json",
+    ".jsonl": "jsonl",
     ".yaml": "yaml",
     ".yml": "yaml",
 }
@@ -31,13 +47,15 @@ def config_format_from_path(path: pathlib.Path) -> FormatLiteral | None:
     Returns
     -------
     FormatLiteral | None
-        ``"json"`` or ``"yaml"`` when a supported suffix is found,
-        otherwise ``None``.
+        ``"json"``, ``"jsonl"``, or ``"yaml"`` when a supported suffix is
+        found, otherwise ``None``.
 
     Examples
     --------
     >>> config_format_from_path(pathlib.Path("config.yaml"))
     'yaml'
+    >>> config_format_from_path(pathlib.Path(".vcspull.jsonl"))
+    'jsonl'
     >>> import tempfile
     >>> with tempfile.TemporaryDirectory() as tmp:
     ...     root = pathlib.Path(tmp)
@@ -61,6 +79,183 @@ def config_format_from_path(path: pathlib.Path) -> FormatLiteral | None:
 RawConfigData: t.TypeAlias = dict[t.Any, t.Any]
 
 
+class JsonlEntry(t.NamedTuple):
+    """One repository line of a ``.vcspull.jsonl`` config.
+
+    Attributes
+    ----------
+    line : int
+        1-based line number.
+    workspace_root : str
+        Workspace root label, as a YAML config's top-level key.
+    name : str
+        Repository name, as the key under the workspace root.
+    data : str | dict
+        The entry as a YAML config would hold it: the URL alone when the line
+        has nothing else, otherwise a mapping with ``repo`` and the rest.
+    """
+
+    line: int
+    workspace_root: str
+    name: str
+    data: t.Any
+
+
+def iter_jsonl_entries(lines: t.Iterable[str]) -> t.Iterator[JsonlEntry]:
+    r"""Yield the entries of a ``.vcspull.jsonl`` config, one per line.
+
+    Each non-blank line is a JSON object with ``workspace_root``, ``name``,
+    ``url``, and any other keys a repository entry takes, such as
+    ``options``. Lines are parsed as they are read, so callers can stop early.
+
+    Raises
+    ------
+    ValueError
+        For a line that is not valid JSON.
+    TypeError
+        For a line that is not an object with string ``workspace_root`` and
+        ``name``.
+
+    Examples
+    --------
+    >>> lines = [
+    ...     '{"workspace_root": "~/code/", "name": "flask", "url": "git+https://x"}',
+    ...     "",
+    ...     '{"workspace_root": "~/code/", "name": "rich", "url": "git+https://y",'
+    ...     ' "options": {"shallow": true}}',
+    ... ]
+    >>> for entry in iter_jsonl_entries(lines):
+    ...     print(entry.line, entry.name, entry.data)
+    1 flask git+https://x
+    3 rich {'repo': 'git+https://y', 'options': {'shallow': True}}
+    >>> next(iter_jsonl_entries(['["flask"]']))
+    Traceback (most recent call last):
+    ...
+    TypeError: line 1: expected an object with workspace_root and name
+    """
+    for number, text in enumerate(lines, start=1):
+        if not text.strip():
+            continue
+        try:
+            item = json.loads(text)
+        except json.JSONDecodeError as exc:
+            msg = f"line {number}: {exc.msg}"
+            raise ValueError(msg) from exc
+        if not (
+            isinstance(item, dict)
+            and isinstance(item.get("workspace_root"), str)
+            and isinstance(item.get("name"), str)
+        ):
+            msg = f"line {number}: expected an object with workspace_root and name"
+            raise TypeError(msg)
+        workspace_root = item.pop("workspace_root")
+        name = item.pop("name")
+        url = item.pop("url", item.pop("repo", None))
+        data: t.Any = url
+        if item or not isinstance(url, str):
+            data = {"repo": url, **item} if url is not None else item
+        yield JsonlEntry(number, workspace_root, name, data)
+
+
+def iter_unique_jsonl_entries(lines: t.Iterable[str]) -> t.Iterator[JsonlEntry]:
+    """Yield :func:`iter_jsonl_entries`, skipping repositories seen on earlier lines.
+
+    The first line for a workspace root and name wins, as in
+    :func:`load_jsonl`. Later ones are dropped without a report, so streaming
+    readers leave that to commands that load the whole file.
+
+    Examples
+    --------
+    >>> lines = [
+    ...     '{"workspace_root": "~/a/", "name": "x", "url": "git+https://1"}',
+    ...     '{"workspace_root": "~/a/", "name": "x", "url": "git+https://2"}',
+    ...     '{"workspace_root": "~/b/", "name": "x", "url": "git+https://3"}',
+    ... ]
+    >>> [(entry.line, entry.data) for entry in iter_unique_jsonl_entries(lines)]
+    [(1, 'git+https://1'), (3, 'git+https://3')]
+    """
+    seen: set[tuple[str, str]] = set()
+    for entry in iter_jsonl_entries(lines):
+        key = (entry.workspace_root, entry.name)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield entry
+
+
+def load_jsonl(
+    lines: t.Iterable[str],
+) -> tuple[dict[str, dict[str, t.Any]], list[tuple[JsonlEntry, int]]]:
+    """Return a ``.vcspull.jsonl`` config as a YAML config would hold it.
+
+    The first line for a workspace root and name wins. Later lines for the
+    same repository are returned with the line number they lost to.
+
+    Examples
+    --------
+    >>> content, repeated = load_jsonl(
+    ...     [
+    ...         '{"workspace_root": "~/a/", "name": "x", "url": "git+https://1"}',
+    ...         '{"workspace_root": "~/a/", "name": "x", "url": "git+https://2"}',
+    ...     ]
+    ... )
+    >>> content
+    {'~/a/': {'x': 'git+https://1'}}
+    >>> [(entry.line, first) for entry, first in repeated]
+    [(2, 1)]
+    """
+    content: dict[str, dict[str, t.Any]] = {}
+    first_lines: dict[tuple[str, str], int] = {}
+    repeated: list[tuple[JsonlEntry, int]] = []
+    for entry in iter_jsonl_entries(lines):
+        key = (entry.workspace_root, entry.name)
+        first = first_lines.setdefault(key, entry.line)
+        if first != entry.line:
+            repeated.append((entry, first))
+            continue
+        content.setdefault(entry.workspace_root, {})[entry.name] = entry.data
+    return content, repeated
+
+
+def jsonl_line(workspace_root: str, name: str, data: t.Any) -> str:
+    """Return the ``.vcspull.jsonl`` line for one repository entry.
+
+    Examples
+    --------
+    >>> jsonl_line("~/code/", "flask", "git+https://x")
+    '{"workspace_root": "~/code/", "name": "flask", "url": "git+https://x"}'
+    >>> jsonl_line("~/code/", "rich", {"repo": "git+https://y", "rev": "v1"})
+    '{"workspace_root": "~/code/", "name": "rich", "url": "git+https://y", "rev": "v1"}'
+    """
+    item: dict[str, t.Any] = {"workspace_root": workspace_root, "name": name}
+    if isinstance(data, dict):
+        rest = dict(data)
+        url = rest.pop("repo", rest.pop("url", None))
+        if url is not None:
+            item["url"] = url
+        item.update(rest)
+    else:
+        item["url"] = data
+    return json.dumps(item, ensure_ascii=False)
+
+
+def dump_jsonl(content: RawConfigData) -> str:
+    r"""Return a config mapping as ``.vcspull.jsonl`` text, one line per repo.
+
+    Examples
+    --------
+    >>> print(dump_jsonl({"~/code/": {"flask": "git+https://x"}}), end="")
+    {"workspace_root": "~/code/", "name": "flask", "url": "git+https://x"}
+    """
+    lines = [
+        jsonl_line(workspace_root, name, data)
+        for workspace_root, repos in content.items()
+        if isinstance(repos, dict)
+        for name, data in repos.items()
+    ]
+    return "".join(f"{line}\n" for line in lines)
+
+
 class ConfigReader:
     r"""Parse string data (YAML and JSON) into a dictionary.
 
@@ -83,17 +278,25 @@ class ConfigReader:
 
         >>> ConfigReader._load("yaml", 'session_name: my session')
         {'session_name': 'my session'}
+
+        >>> ConfigReader._load(
+        ...     "jsonl", '{"workspace_root": "~/", "name": "x", "url": "git+https://x"}'
+        ... )
+        {'~/': {'x': 'git+https://x'}}
         """
         if fmt == "yaml":
             return t.cast(
                 "dict[str, t.Any]",
                 yaml.load(
                     content,
-                    Loader=yaml.SafeLoader,
+                    Loader=_SafeLoader,
                 ),
             )
         if fmt == "json":
             return t.cast("dict[str, t.Any]", json.loads(content))
+        if fmt == "jsonl":
+            loaded, _repeated = load_jsonl(content.splitlines())
+            return t.cast("dict[str, t.Any]", loaded)
         msg = f"{fmt} not supported in configuration"
         raise NotImplementedError(msg)
 
@@ -238,13 +441,15 @@ class ConfigReader:
                 content,
                 indent=2,
                 default_flow_style=False,
-                Dumper=yaml.SafeDumper,
+                Dumper=_SafeDumper,
             )
         if fmt == "json":
             return json.dumps(
                 content,
                 indent=2,
             )
+        if fmt == "jsonl":
+            return dump_jsonl(content)
         msg = f"{fmt} not supported in config"
         raise NotImplementedError(msg)
 
@@ -265,8 +470,8 @@ class ConfigReader:
         )
 
 
-class _DuplicateTrackingSafeLoader(yaml.SafeLoader):
-    """SafeLoader that records duplicate top-level keys.
+class _DuplicateTracking:
+    """Top-level key bookkeeping shared by the duplicate-tracking loaders.
 
     Notes
     -----
@@ -276,35 +481,66 @@ class _DuplicateTrackingSafeLoader(yaml.SafeLoader):
     top-level if they're direct children of that root node.
     """
 
+    top_level_key_values: dict[t.Any, list[t.Any]]
+    top_level_items: list[tuple[t.Any, t.Any]]
+    _root_mapping_node: yaml.nodes.MappingNode | None
+
+    def _start_tracking(self) -> None:
+        self.top_level_key_values = {}
+        self.top_level_items = []
+        self._root_mapping_node = None
+
+
+class _DuplicateTrackingSafeLoader(_DuplicateTracking, _SafeLoader):
+    """Safe loader that records duplicate top-level keys.
+
+    Built on libyaml's ``CSafeLoader`` when PyYAML has it, otherwise on
+    ``SafeLoader``.
+    """
+
+    def __init__(self, stream: str) -> None:
+        _SafeLoader.__init__(self, stream)
+        self._start_tracking()
+
+
+class _PyDuplicateTrackingSafeLoader(_DuplicateTracking, yaml.SafeLoader):
+    """Pure-Python :class:`_DuplicateTrackingSafeLoader`, for comparison."""
+
     def __init__(self, stream: str) -> None:
-        super().__init__(stream)
-        self.top_level_key_values: dict[t.Any, list[t.Any]] = {}
-        self._root_mapping_node: yaml.nodes.MappingNode | None = None
-        self.top_level_items: list[tuple[t.Any, t.Any]] = []
+        yaml.SafeLoader.__init__(self, stream)
+        self._start_tracking()
+
+
+_DuplicateTrackingLoader: t.TypeAlias = (
+    _DuplicateTrackingSafeLoader | _PyDuplicateTrackingSafeLoader
+)
 
 
 def _duplicate_tracking_construct_mapping(
-    loader: _DuplicateTrackingSafeLoader,
+    loader: _DuplicateTrackingLoader,
     node: yaml.nodes.MappingNode,
     deep: bool = False,
 ) -> dict[t.Any, t.Any]:
     # First mapping encountered is the root - remember it
     if loader._root_mapping_node is None:
         loader._root_mapping_node = node
+    is_root = node is loader._root_mapping_node
 
     loader.flatten_mapping(node)
     mapping: dict[t.Any, t.Any] = {}
 
     for key_node, value_node in node.value:
         construct = t.cast(
-            "t.Callable[[yaml.nodes.Node], t.Any]",
+            "t.Callable[..., t.Any]",
             loader.construct_object,
         )
         key = construct(key_node)
-        value = construct(value_node)
+        # Root values are copied below, so build them completely first;
+        # otherwise their lists would still be empty when copied.
+        value = construct(value_node, deep=is_root)
 
         # Only track keys that are direct children of the root mapping
-        if node is loader._root_mapping_node:
+        if is_root:
             duplicated_value = copy.deepcopy(value)
             loader.top_level_key_values.setdefault(key, []).append(duplicated_value)
             loader.top_level_items.append((copy.deepcopy(key), duplicated_value))
@@ -314,10 +550,11 @@ def _duplicate_tracking_construct_mapping(
     return mapping
 
 
-_DuplicateTrackingSafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-    _duplicate_tracking_construct_mapping,
-)
+for _loader_class in (_DuplicateTrackingSafeLoader, _PyDuplicateTrackingSafeLoader):
+    _loader_class.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
+        _duplicate_tracking_construct_mapping,
+    )
 
 
 class DuplicateAwareConfigReader(ConfigReader):
@@ -348,8 +585,32 @@ class DuplicateAwareConfigReader(ConfigReader):
     def _load_yaml_with_duplicates(
         cls,
         content: str,
+        *,
+        loader_class: type[_DuplicateTrackingLoader] | None = None,
     ) -> tuple[dict[str, t.Any], dict[str, list[t.Any]], list[tuple[str, t.Any]]]:
-        loader = _DuplicateTrackingSafeLoader(content)
+        r"""Parse YAML, returning its data, duplicate sections, and top-level items.
+
+        ``loader_class`` defaults to the libyaml-backed loader when available.
+
+        Examples
+        --------
+        >>> text = "~/a/:\n  x: git+https://x\n~/a/:\n  y: git+https://y\n"
+        >>> loaded, duplicates, items = (
+        ...     DuplicateAwareConfigReader._load_yaml_with_duplicates(text)
+        ... )
+        >>> loaded
+        {'~/a/': {'y': 'git+https://y'}}
+        >>> duplicates
+        {'~/a/': [{'x': 'git+https://x'}, {'y': 'git+https://y'}]}
+        >>> pure = DuplicateAwareConfigReader._load_yaml_with_duplicates(
+        ...     text, loader_class=_PyDuplicateTrackingSafeLoader
+        ... )
+        >>> pure == (loaded, duplicates, items)
+        True
+        """
+        if loader_class is None:
+            loader_class = _DuplicateTrackingSafeLoader
+        loader = loader_class(content)
 
         try:
             data = loader.get_single_data()
@@ -370,9 +631,9 @@ class DuplicateAwareConfigReader(ConfigReader):
             if len(values) > 1
         }
 
+        # The loader is discarded, so its copies need no further copying.
         top_level_items = [
-            (t.cast("str", key), copy.deepcopy(value))
-            for key, value in loader.top_level_items
+            (t.cast("str", key), value) for key, value in loader.top_level_items
         ]
 
         return loaded, duplicate_sections, top_level_items
@@ -385,6 +646,10 @@ class DuplicateAwareConfigReader(ConfigReader):
         if config_format_from_path(path) == "yaml":
             content = path.read_text(encoding="utf-8")
             return cls._load_yaml_with_duplicates(content)
+        if config_format_from_path(path) == "jsonl":
+            with path.open(encoding="utf-8") as lines:
+                loaded, _repeated = load_jsonl(lines)
+            return t.cast("dict[str, t.Any]", loaded), {}, []
 
         return ConfigReader._from_file(path), {}, []
 
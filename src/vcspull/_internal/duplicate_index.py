@@ -0,0 +1,151 @@
+"""Find repositories that several config files claim, in one pass.
+
+``vcspull`` reads every config file it finds, and teams often split their
+repositories over many small ones. Two files configuring the same checkout
+path cannot both be honoured, and two files checking the same remote out in
+different places is usually a copy-and-paste slip. :class:`DuplicateIndex`
+keeps one running map of checkout paths and one of URLs across files, so each
+file is checked against everything read before it at the cost of its own
+entries, and every collision names the files involved.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import typing as t
+
+from vcspull._internal.private_path import PrivatePath
+
+if t.TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterable
+
+
+class RepoClaim(t.NamedTuple):
+    """A repository as one config file configures it.
+
+    Attributes
+    ----------
+    name : str
+        Repository name.
+    checkout : str
+        Checkout directory, as ``str(pathlib.Path(...))`` would spell it.
+        Compared case-insensitively where the file system is.
+    url : str
+        Remote URL as written.
+    source : pathlib.Path
+        Config file the entry came from.
+    """
+
+    name: str
+    checkout: str
+    url: str
+    source: pathlib.Path
+
+
+@dataclasses.dataclass(frozen=True)
+class RepoCollision:
+    """Two config files claiming the same checkout path or the same remote.
+
+    Attributes
+    ----------
+    kind : {"path", "url"}
+        ``"path"`` when both claims check out to the same directory,
+        ``"url"`` when they check the same remote out to different ones.
+    first : RepoClaim
+        The claim from the earlier file.
+    second : RepoClaim
+        The claim from the later file.
+    """
+
+    kind: t.Literal["path", "url"]
+    first: RepoClaim
+    second: RepoClaim
+
+    def describe(self) -> str:
+        """Return a one-line description naming both files.
+
+        Examples
+        --------
+        >>> import pathlib
+        >>> first = RepoClaim(
+        ...     "flask",
+        ...     "/code/flask",
+        ...     "git+https://github.com/pallets/flask.git",
+        ...     pathlib.Path("/etc/vcspull/team-a.yaml"),
+        ... )
+        >>> second = first._replace(
+        ...     url="git+https://github.com/fork/flask.git",
+        ...     source=pathlib.Path("/etc/vcspull/team-b.yaml"),
+        ... )
+        >>> print(RepoCollision("path", first, second).describe())
+        /code/flask: git+https://github.com/pallets/flask.git
+        (/etc/vcspull/team-a.yaml) vs git+https://github.com/fork/flask.git
+        (/etc/vcspull/team-b.yaml)
+        """
+        if self.kind == "path":
+            return (
+                f"{PrivatePath(self.first.checkout)}: "
+                f"{self.first.url} ({PrivatePath(self.first.source)}) vs "
+                f"{self.second.url} ({PrivatePath(self.second.source)})"
+            )
+        return (
+            f"{self.first.url}: "
+            f"{PrivatePath(self.first.checkout)} ({PrivatePath(self.first.source)})"
+            f" vs {PrivatePath(self.second.checkout)}"
+            f" ({PrivatePath(self.second.source)})"
+        )
+
+
+class DuplicateIndex:
+    """Checkout paths and URLs claimed by the config files read so far.
+
+    Examples
+    --------
+    >>> import pathlib
+    >>> def claim(name, checkout, url, source):
+    ...     return RepoClaim(name, checkout, url, pathlib.Path(source))
+    >>> index = DuplicateIndex()
+    >>> index.add([claim("flask", "/code/flask", "git+https://x/flask", "a.yaml")])
+    []
+    >>> collisions = index.add(
+    ...     [
+    ...         claim("flask", "/code/flask", "git+https://y/flask", "b.yaml"),
+    ...         claim("flask2", "/src/flask", "git+https://x/flask", "b.yaml"),
+    ...     ]
+    ... )
+    >>> [collision.kind for collision in collisions]
+    ['path', 'url']
+    """
+
+    def __init__(self) -> None:
+        self._checkouts: dict[str, RepoClaim] = {}
+        self._urls: dict[str, RepoClaim] = {}
+
+    def add(self, claims: Iterable[RepoClaim]) -> list[RepoCollision]:
+        """Record one file's claims; return its collisions with earlier files.
+
+        Claims within the same file are not compared with each other, as
+        :func:`~vcspull.config.load_configs` never has. Costs one lookup per
+        claim, however many files came before.
+        """
+        claims = list(claims)
+        checkouts = {os.path.normcase(claim.checkout): claim for claim in claims}
+
+        collisions: list[RepoCollision] = []
+        for checkout, claim in checkouts.items():
+            earlier = self._checkouts.get(checkout)
+            if earlier is not None:
+                collisions.append(RepoCollision("path", earlier, claim))
+        for claim in claims:
+            earlier = self._urls.get(claim.url)
+            if earlier is not None and os.path.normcase(
+                earlier.checkout,
+            ) != os.path.normcase(claim.checkout):
+                collisions.append(RepoCollision("url", earlier, claim))
+
+        self._checkouts.update(checkouts)
+        for claim in claims:
+            self._urls.setdefault(claim.url, claim)
+        return collisions
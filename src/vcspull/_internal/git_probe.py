@@ -0,0 +1,509 @@
+"""Read git repository metadata from disk without spawning ``git``.
+
+These probes answer cheap questions (where is the git directory, what does
+``HEAD`` point at, which remote is ``origin``, is the clone shallow) by reading
+the files git itself maintains. They return ``None`` rather than raising when
+the layout is unexpected, so callers can fall back to a ``git`` subprocess.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+import re
+
+log = logging.getLogger(__name__)
+
+_SYMREF_PREFIX = "ref: "
+_GITDIR_PREFIX = "gitdir: "
+
+_SECTION_RE = re.compile(
+    r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\](.*)$',
+)
+_SUBSECTION_ESCAPE_RE = re.compile(r"\\(.)")
+_VARIABLE_RE = re.compile(r"^([A-Za-z][A-Za-z0-9-]*)\s*(?:=(.*))?$")
+_VALUE_ESCAPES = {"n": "\n", "t": "\t", "b": "\b", "\\": "\\", '"': '"'}
+
+#: Sections whose effect depends on files or conditions the parser does not
+#: evaluate; a config using them is left to ``git``.
+_UNSUPPORTED_SECTIONS = frozenset({"include", "includeif"})
+
+
+def resolve_git_dir(repo_path: pathlib.Path) -> pathlib.Path | None:
+    """Return the git directory for a working tree, following ``.git`` files.
+
+    A linked worktree or submodule stores a ``.git`` *file* holding
+    ``gitdir: <path>``; a relative target is resolved against ``repo_path``.
+
+    Parameters
+    ----------
+    repo_path : pathlib.Path
+        Working tree root.
+
+    Returns
+    -------
+    pathlib.Path | None
+        The git directory, or ``None`` when ``repo_path`` has no usable
+        ``.git`` entry.
+
+    Examples
+    --------
+    >>> repo = create_git_remote_repo()
+    >>> resolve_git_dir(repo) == repo / ".git"
+    True
+
+    A ``.git`` file redirects to the real git directory:
+
+    >>> linked = tmp_path / "linked"
+    >>> linked.mkdir()
+    >>> _ = (linked / ".git").write_text(f"gitdir: {repo / '.git'}")
+    >>> resolve_git_dir(linked) == repo / ".git"
+    True
+
+    >>> resolve_git_dir(tmp_path / "missing") is None
+    True
+    """
+    dot_git = repo_path / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        content = dot_git.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not content.startswith(_GITDIR_PREFIX):
+        return None
+    git_dir = pathlib.Path(content[len(_GITDIR_PREFIX) :])
+    if not git_dir.is_absolute():
+        git_dir = repo_path / git_dir
+    return git_dir if git_dir.is_dir() else None
+
+
+def resolve_common_dir(git_dir: pathlib.Path) -> pathlib.Path:
+    """Return the directory holding shared refs and config for ``git_dir``.
+
+    A linked worktree's git directory carries a ``commondir`` file pointing at
+    the main repository's git directory; every other git directory is its own
+    common directory.
+
+    Examples
+    --------
+    >>> repo = create_git_remote_repo()
+    >>> resolve_common_dir(repo / ".git") == repo / ".git"
+    True
+    """
+    try:
+        content = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return git_dir
+    common_dir = pathlib.Path(content)
+    if not common_dir.is_absolute():
+        common_dir = git_dir / common_dir
+    return common_dir
+
+
+def _read_packed_ref(common_dir: pathlib.Path, ref_name: str) -> str | None:
+    """Return the SHA recorded for ``ref_name`` in ``packed-refs``, if any."""
+    try:
+        with (common_dir / "packed-refs").open(encoding="utf-8") as packed:
+            for line in packed:
+                if line.startswith(("#", "^")):
+                    continue
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref_name:
+                    return sha
+    except OSError:
+        return None
+    return None
+
+
+def read_ref(git_dir: pathlib.Path, ref_name: str) -> str | None:
+    """Resolve a fully qualified ref such as ``refs/heads/main`` to a SHA.
+
+    Loose refs win over ``packed-refs``, matching git. Per-worktree refs live
+    in ``git_dir``; shared refs live in the common directory.
+
+    Examples
+    --------
+    >>> repo = create_git_remote_repo()
+    >>> sha = read_ref(repo / ".git", "refs/heads/master")
+    >>> len(sha)
+    40
+    >>> read_ref(repo / ".git", "refs/heads/no-such-branch") is None
+    True
+    """
+    common_dir = resolve_common_dir(git_dir)
+    for base in (git_dir, common_dir):
+        try:
+            value = (base / ref_name).read_text(encoding="utf-8").strip()
+        except OSError:
+            continue
+        if value:
+            return value
+    return _read_packed_ref(common_dir, ref_name)
+
+
+def read_head_revision(repo_path: pathlib.Path) -> str | None:
+    """Return the commit ``HEAD`` points at, read straight from disk.
+
+    Follows one level of symbolic ref (``ref: refs/heads/<branch>``) through
+    loose refs and ``packed-refs``. Costs a few small file reads instead of a
+    ``git rev-parse HEAD`` subprocess.
+
+    Parameters
+    ----------
+    repo_path : pathlib.Path
+        Working tree root.
+
+    Returns
+    -------
+    str | None
+        The full commit SHA, or ``None`` when the path is not a git checkout,
+        the branch is unborn, or the layout could not be read.
+
+    Examples
+    --------
+    >>> import subprocess
+    >>> repo = create_git_remote_repo()
+    >>> expected = subprocess.run(
+    ...     ["git", "-C", str(repo), "rev-parse", "HEAD"],
+    ...     check=True, capture_output=True, text=True,
+    ... ).stdout.strip()
+    >>> read_head_revision(repo) == expected
+    True
+
+    Packed refs resolve too:
+
+    >>> _ = subprocess.run(
+    ...     ["git", "-C", str(repo), "pack-refs", "--all"],
+    ...     check=True, capture_output=True,
+    ... )
+    >>> read_head_revision(repo) == expected
+    True
+
+    >>> read_head_revision(tmp_path) is None
+    True
+    """
+    git_dir = resolve_git_dir(repo_path)
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if head.startswith(_SYMREF_PREFIX):
+        return read_ref(git_dir, head[len(_SYMREF_PREFIX) :])
+    return head or None
+
+
+def read_head_branch(repo_path: pathlib.Path) -> str | None:
+    """Return the branch ``HEAD`` is attached to, or ``None`` when detached.
+
+    Examples
+    --------
+    >>> import subprocess
+    >>> repo = create_git_remote_repo()
+    >>> read_head_branch(repo)
+    'master'
+    >>> _ = subprocess.run(
+    ...     ["git", "-C", str(repo), "checkout", "--detach"],
+    ...     check=True, capture_output=True,
+    ... )
+    >>> read_head_branch(repo) is None
+    True
+    """
+    git_dir = resolve_git_dir(repo_path)
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    prefix = f"{_SYMREF_PREFIX}refs/heads/"
+    if head.startswith(prefix):
+        return head[len(prefix) :]
+    return None
+
+
+def _parse_config_value(
+    raw: str,
+    in_quote: bool,
+) -> tuple[str, bool, bool]:
+    """Decode one line of a config value.
+
+    Returns the decoded text, whether a quoted string is still open, and
+    whether the value continues on the next line.
+    """
+    out: list[str] = []
+    pending_space = ""
+    index = 0
+    while index < len(raw):
+        char = raw[index]
+        if char == "\\":
+            if index + 1 == len(raw):
+                return "".join(out) + pending_space, in_quote, True
+            escaped = _VALUE_ESCAPES.get(raw[index + 1])
+            if escaped is None:
+                msg = f"invalid escape in config value: {raw!r}"
+                raise ValueError(msg)
+            out.append(pending_space + escaped)
+            pending_space = ""
+            index += 2
+            continue
+        if char == '"':
+            in_quote = not in_quote
+        elif not in_quote and char in "#;":
+            break
+        elif not in_quote and char.isspace():
+            if out:
+                pending_space += char
+        else:
+            out.append(pending_space + char)
+            pending_space = ""
+        index += 1
+    if in_quote:
+        msg = f"unterminated quote in config value: {raw!r}"
+        raise ValueError(msg)
+    return "".join(out), in_quote, False
+
+
+def parse_git_config(text: str) -> dict[str, list[str]] | None:
+    r"""Parse git config ``text`` into values keyed like ``git config --get``.
+
+    Keys are ``section.subsection.name`` with the section and name lowercased;
+    each key maps to its values in file order. Returns ``None`` when the text
+    is malformed or uses ``include``/``includeIf``, whose effect this parser
+    does not evaluate.
+
+    Examples
+    --------
+    >>> parse_git_config(
+    ...     '[core]\n\tbare = false\n'
+    ...     '[remote "origin"]\n'
+    ...     '\turl = "git@example.com:org/repo.git" ; comment\n'
+    ... )
+    {'core.bare': ['false'], 'remote.origin.url': ['git@example.com:org/repo.git']}
+    >>> parse_git_config('[alias]\n\tlg = "log \\\n\t--oneline"\n')
+    {'alias.lg': ['log \t--oneline']}
+    >>> parse_git_config('[include]\n\tpath = ~/extra.gitconfig\n') is None
+    True
+    >>> parse_git_config('[remote "origin"\n') is None
+    True
+    """
+    values: dict[str, list[str]] = {}
+    section: str | None = None
+    lines = text.splitlines()
+    index = 0
+    try:
+        while index < len(lines):
+            line = lines[index].strip()
+            index += 1
+            if not line or line[0] in "#;":
+                continue
+            if line.startswith("["):
+                header = _SECTION_RE.match(line)
+                if header is None:
+                    return None
+                name, subsection, rest = header.groups()
+                if name.lower() in _UNSUPPORTED_SECTIONS:
+                    return None
+                section = name.lower()
+                if subsection is not None:
+                    unescaped = _SUBSECTION_ESCAPE_RE.sub(r"\1", subsection)
+                    section = f"{section}.{unescaped}"
+                line = rest.strip()
+                if not line or line[0] in "#;":
+                    continue
+            variable = _VARIABLE_RE.match(line)
+            if section is None or variable is None:
+                return None
+            key = f"{section}.{variable.group(1).lower()}"
+            raw = variable.group(2)
+            if raw is None:
+                values.setdefault(key, []).append("true")
+                continue
+            parts: list[str] = []
+            decoded, in_quote, continues = _parse_config_value(raw, in_quote=False)
+            parts.append(decoded)
+            while continues and index < len(lines):
+                decoded, in_quote, continues = _parse_config_value(
+                    lines[index],
+                    in_quote,
+                )
+                index += 1
+                parts.append(decoded)
+            values.setdefault(key, []).append("".join(parts))
+    except ValueError as exc:
+        log.debug("Could not parse git config: %s", exc)
+        return None
+    return values
+
+
+def _read_config_file(path: pathlib.Path) -> dict[str, list[str]] | None:
+    """Parse the config file at ``path``; a missing file has no values."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return {}
+    except (OSError, UnicodeDecodeError):
+        return None
+    return parse_git_config(text)
+
+
+def read_repo_config(repo_path: pathlib.Path) -> dict[str, list[str]] | None:
+    """Return the repository-level config of a checkout.
+
+    Reads the shared ``config`` in the common git directory, so linked
+    worktrees see their main repository's remotes. When the repository enables
+    ``extensions.worktreeConfig``, the worktree's ``config.worktree`` is layered
+    on top. User and system config files are not read.
+
+    Examples
+    --------
+    >>> import subprocess
+    >>> repo = create_git_remote_repo()
+    >>> _ = subprocess.run(
+    ...     ["git", "-C", str(repo), "remote", "add", "origin", "https://x/y.git"],
+    ...     check=True, capture_output=True,
+    ... )
+    >>> read_repo_config(repo)["remote.origin.url"]
+    ['https://x/y.git']
+    >>> read_repo_config(tmp_path) is None
+    True
+    """
+    git_dir = resolve_git_dir(repo_path)
+    if git_dir is None:
+        return None
+    values = _read_config_file(resolve_common_dir(git_dir) / "config")
+    if values is None:
+        return None
+    worktree_config = values.get("extensions.worktreeconfig", ["false"])[-1]
+    if worktree_config.lower() in {"true", "yes", "on", "1"}:
+        overlay = _read_config_file(git_dir / "config.worktree")
+        if overlay is None:
+            return None
+        for key, overlay_values in overlay.items():
+            values.setdefault(key, []).extend(overlay_values)
+    return values
+
+
+def read_origin_url(repo_path: pathlib.Path) -> str | None:
+    """Return ``remote.origin.url`` from a checkout's own config.
+
+    Matches ``git config --get remote.origin.url``: the last value wins. URL
+    rewrites (``url.<base>.insteadOf``) are not applied. Returns ``None`` when
+    no URL is configured or the config could not be read.
+
+    Examples
+    --------
+    >>> import subprocess
+    >>> repo = create_git_remote_repo()
+    >>> read_origin_url(repo) is None
+    True
+    >>> _ = subprocess.run(
+    ...     ["git", "-C", str(repo), "remote", "add", "origin", "https://x/y.git"],
+    ...     check=True, capture_output=True,
+    ... )
+    >>> read_origin_url(repo)
+    'https://x/y.git'
+    """
+    values = read_repo_config(repo_path)
+    if values is None:
+        return None
+    urls = values.get("remote.origin.url")
+    return urls[-1] if urls else None
+
+
+def _user_config_paths() -> list[pathlib.Path]:
+    """Return the global and system config files ``git`` would read."""
+    paths: list[pathlib.Path] = []
+    if "GIT_CONFIG_GLOBAL" in os.environ:
+        paths.append(pathlib.Path(os.environ["GIT_CONFIG_GLOBAL"]).expanduser())
+    else:
+        xdg_config = os.environ.get("XDG_CONFIG_HOME") or str(
+            pathlib.Path.home() / ".config",
+        )
+        paths.extend(
+            [
+                pathlib.Path(xdg_config) / "git" / "config",
+                pathlib.Path.home() / ".gitconfig",
+            ],
+        )
+    if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+        paths.append(
+            pathlib.Path(os.environ.get("GIT_CONFIG_SYSTEM", "/etc/gitconfig"))
+        )
+    return paths
+
+
+def may_rewrite_urls(repo_path: pathlib.Path) -> bool:
+    r"""Return whether ``url.<base>.insteadOf`` rules could apply to a checkout.
+
+    ``git remote get-url`` applies these rules, so callers that need its output
+    fall back to ``git`` whenever this is ``True``. Any config that could not be
+    parsed, and any ``GIT_CONFIG_COUNT`` override, counts as a possible rule.
+
+    Examples
+    --------
+    >>> repo = create_git_remote_repo()
+    >>> monkeypatch = getfixture("monkeypatch")
+    >>> monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "gitconfig"))
+    >>> monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    >>> may_rewrite_urls(repo)
+    False
+    >>> _ = (tmp_path / "gitconfig").write_text(
+    ...     '[url "git@github.com:"]\n\tinsteadOf = https://github.com/\n'
+    ... )
+    >>> may_rewrite_urls(repo)
+    True
+    """
+    if os.environ.get("GIT_CONFIG_COUNT"):
+        return True
+    repo_values = read_repo_config(repo_path)
+    if repo_values is None:
+        return True
+    sources: list[dict[str, list[str]] | None] = [repo_values]
+    sources.extend(_read_config_file(path) for path in _user_config_paths())
+    for values in sources:
+        if values is None:
+            return True
+        if any(key.startswith("url.") and key.endswith(".insteadof") for key in values):
+            return True
+    return False
+
+
+def read_shallow_commits(repo_path: pathlib.Path) -> frozenset[str] | None:
+    """Return the shallow boundary commits of a checkout.
+
+    A shallow clone lists the commits whose parents were cut off in
+    ``shallow`` in its common git directory. The set is empty for a full
+    clone; ``None`` means ``repo_path`` is not a readable git checkout.
+
+    Examples
+    --------
+    >>> import subprocess
+    >>> remote = create_git_remote_repo()
+    >>> read_shallow_commits(remote)
+    frozenset()
+    >>> shallow = tmp_path / "shallow"
+    >>> _ = subprocess.run(
+    ...     ["git", "clone", "--depth", "1", f"file://{remote}", str(shallow)],
+    ...     check=True, capture_output=True,
+    ... )
+    >>> read_shallow_commits(shallow) == {read_head_revision(shallow)}
+    True
+    >>> read_shallow_commits(tmp_path) is None
+    True
+    """
+    git_dir = resolve_git_dir(repo_path)
+    if git_dir is None:
+        return None
+    try:
+        content = (resolve_common_dir(git_dir) / "shallow").read_text(
+            encoding="utf-8",
+        )
+    except FileNotFoundError:
+        return frozenset()
+    except OSError:
+        return None
+    return frozenset(line.strip() for line in content.splitlines() if line.strip())
@@ -0,0 +1,134 @@
+"""Read Mercurial checkout metadata from disk without spawning ``hg``.
+
+Starting ``hg`` means starting a Python interpreter and importing Mercurial,
+which costs far more than reading the one file ``vcspull discover`` needs:
+``.hg/hgrc``, where ``hg clone`` records the ``default`` path. The probes
+return ``None`` when the file is missing or uses features the parser does not
+evaluate, so callers can fall back to ``hg paths default``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+import re
+
+log = logging.getLogger(__name__)
+
+HGRC_PATH = pathlib.PurePosixPath(".hg", "hgrc")
+
+_SECTION_RE = re.compile(r"^\[([^\[]+)\]")
+_ITEM_RE = re.compile(r"^([^=\s][^=]*?)\s*=\s*((.*\S)?)")
+_CONTINUATION_RE = re.compile(r"^\s+(\S|\S.*\S)\s*$")
+_COMMENT_RE = re.compile(r"^(;|#|\s*$)")
+_UNSET_RE = re.compile(r"^%unset\s+(\S+)")
+_SCHEME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]+:")
+
+
+def parse_hgrc(text: str) -> dict[str, dict[str, str]] | None:
+    r"""Parse Mercurial config text into ``{section: {name: value}}``.
+
+    Follows Mercurial's own rules: indented lines continue the previous
+    value, ``;`` and ``#`` start comment lines, later assignments win, and
+    ``%unset`` removes a name. Returns ``None`` for ``%include`` (which pulls
+    in files the parser does not read) and for lines it does not understand.
+
+    Examples
+    --------
+    >>> parse_hgrc("[paths]\ndefault = https://hg.example.com/repo\n")
+    {'paths': {'default': 'https://hg.example.com/repo'}}
+    >>> parse_hgrc("[ui]\nignore = a\n  b\n; note\n[ui]\nusername = me\n")
+    {'ui': {'ignore': 'a\nb', 'username': 'me'}}
+    >>> parse_hgrc("[paths]\ndefault = a\n%unset default\n")
+    {'paths': {}}
+    >>> parse_hgrc("%include ~/.hgrc.shared\n") is None
+    True
+    """
+    sections: dict[str, dict[str, str]] = {}
+    section: str | None = None
+    last_name: str | None = None
+    for line in text.splitlines():
+        if last_name is not None and section is not None:
+            continuation = _CONTINUATION_RE.match(line)
+            if continuation:
+                sections[section][last_name] += f"\n{continuation.group(1)}"
+                continue
+        last_name = None
+        if _COMMENT_RE.match(line):
+            continue
+        if line.startswith("%include"):
+            return None
+        if (unset := _UNSET_RE.match(line)) is not None:
+            if section is not None:
+                sections[section].pop(unset.group(1), None)
+            continue
+        if (header := _SECTION_RE.match(line)) is not None:
+            section = header.group(1).strip()
+            sections.setdefault(section, {})
+            continue
+        item = _ITEM_RE.match(line)
+        if item is None or section is None:
+            return None
+        last_name = item.group(1)
+        sections[section][last_name] = item.group(2)
+    return sections
+
+
+def _normalize_path(value: str, repo_path: pathlib.Path) -> str:
+    """Turn an ``hgrc`` path into the URL ``hg paths`` would report.
+
+    Examples
+    --------
+    >>> _normalize_path("ssh://hg@example.com/repo", pathlib.Path("/work/x"))
+    'ssh://hg@example.com/repo'
+    >>> _normalize_path("../upstream", pathlib.Path("/work/x"))
+    'file:///work/upstream'
+    """
+    if _SCHEME_RE.match(value):
+        return value
+    local = pathlib.Path(os.path.expandvars(value)).expanduser()
+    if not local.is_absolute():
+        local = repo_path / local
+    return pathlib.Path(os.path.normpath(local)).as_uri()
+
+
+def read_default_path(repo_path: pathlib.Path) -> str | None:
+    r"""Return the ``default`` path of a Mercurial checkout, read from ``hgrc``.
+
+    Local paths come back as ``file://`` URLs, resolved against the checkout.
+
+    Parameters
+    ----------
+    repo_path : pathlib.Path
+        Checkout root (the directory holding ``.hg``).
+
+    Returns
+    -------
+    str | None
+        The default path, or ``None`` when ``hgrc`` is missing, names no
+        default, or cannot be parsed.
+
+    Examples
+    --------
+    >>> (tmp_path / ".hg").mkdir()
+    >>> read_default_path(tmp_path) is None
+    True
+    >>> _ = (tmp_path / ".hg" / "hgrc").write_text(
+    ...     "[paths]\ndefault = https://hg.example.com/repo\n"
+    ... )
+    >>> read_default_path(tmp_path)
+    'https://hg.example.com/repo'
+    """
+    try:
+        text = (repo_path / HGRC_PATH).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        log.debug("Could not read hgrc for %s: %s", repo_path, exc)
+        return None
+    config = parse_hgrc(text)
+    if config is None:
+        return None
+    value = config.get("paths", {}).get("default")
+    if not value:
+        return None
+    return _normalize_path(value, repo_path)
@@ -0,0 +1,349 @@
+"""Config model that expands only the repositories a command asks for.
+
+:func:`~vcspull.config.load_configs` turns every entry of every config file
+into a :class:`~vcspull.types.ConfigDict`: it resolves the checkout path,
+builds :class:`~libvcs.sync.git.GitRemote` objects, and validates worktrees.
+``vcspull sync flask`` needs one of those entries, not all of them.
+
+:class:`LazyConfig` reads the files the same way (duplicate workspace roots
+merged, the same warnings logged) but keeps each entry in its raw form. A
+:class:`~vcspull._internal.repo_index.RepoIndex` over names, URLs, and (once a
+path pattern asks) checkout directories finds the matches without a scan.
+Matching entries are expanded one at a time with
+:func:`~vcspull.config.extract_repos` and memoized. The raw entries of a
+quiet load are stored in the config cache, so an unchanged config is not
+parsed again either.
+
+``.vcspull.jsonl`` files are streamed line by line straight into raw entries,
+without first building the whole config the way
+:func:`~vcspull.config.read_config_file` does. Repositories repeated on later
+lines are skipped silently; commands that load every repository report them.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import pathlib
+import typing as t
+
+from vcspull.config import (
+    detect_legacy_repo_options,
+    expand_dir,
+    extract_repos,
+    read_config_file,
+    report_collisions,
+    warn_legacy_repo_options,
+)
+
+from . import config_cache
+from .config_reader import config_format_from_path, iter_unique_jsonl_entries
+from .duplicate_index import DuplicateIndex, RepoClaim
+from .repo_index import RepoIndex
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from vcspull.types import ConfigDict, RawConfigDict
+
+
+@dataclasses.dataclass(frozen=True)
+class RawEntry:
+    """One repository entry as written in a config file.
+
+    Attributes
+    ----------
+    directory : str
+        Workspace root key the entry sits under.
+    key : str
+        The entry's key inside that workspace root.
+    data : t.Any
+        The entry's value: a URL string or a mapping.
+    name : str
+        Repository name (the ``name`` field, else ``key``).
+    url : str
+        Remote URL, as :func:`~vcspull.config.filter_repos` compares it.
+    """
+
+    directory: str
+    key: str
+    data: t.Any
+    name: str
+    url: str
+
+    @classmethod
+    def from_config(cls, directory: str, key: str, data: t.Any) -> RawEntry:
+        """Return the entry for ``key: data`` under ``directory``.
+
+        Examples
+        --------
+        >>> RawEntry.from_config("~/code/", "flask", "git+https://x/flask")
+        RawEntry(directory='~/code/', key='flask', data='git+https://x/flask',
+                 name='flask', url='git+https://x/flask')
+        >>> RawEntry.from_config("~/code/", "f", {"repo": "git+https://x/f"}).url
+        'git+https://x/f'
+        """
+        if isinstance(data, dict):
+            name = str(data.get("name", key))
+            url = str(data.get("url", data.get("repo")))
+        else:
+            name = str(key)
+            url = str(data)
+        return cls(
+            directory=str(directory), key=str(key), data=data, name=name, url=url
+        )
+
+
+def _checkout_path(
+    entry: RawEntry,
+    cwd: pathlib.Path,
+    roots: dict[str, pathlib.Path],
+) -> pathlib.Path:
+    """Return the ``path`` :func:`~vcspull.config.extract_repos` would set.
+
+    ``roots`` memoizes expanded workspace roots, so each is expanded once
+    rather than once per entry.
+
+    Examples
+    --------
+    >>> entry = RawEntry.from_config("/code/", "flask", "git+https://x/flask")
+    >>> str(_checkout_path(entry, tmp_path, {}))
+    '/code/flask'
+    """
+    if isinstance(entry.data, dict) and "path" in entry.data:
+        return pathlib.Path(entry.data["path"])
+    root = roots.get(entry.directory)
+    if root is None:
+        root = expand_dir(pathlib.Path(entry.directory), cwd=cwd)
+        roots[entry.directory] = root
+    if "$" in entry.name:
+        return expand_dir(root / entry.name, cwd=cwd)
+    return root / entry.name
+
+
+def _read_jsonl_entries(
+    file: pathlib.Path,
+    *,
+    warn_legacy_options: bool,
+) -> tuple[list[RawEntry], bool]:
+    r"""Return the raw entries of a ``.vcspull.jsonl`` file, read line by line.
+
+    Legacy options are warned about as :func:`~vcspull.config.read_config_file`
+    does. The flag is ``False`` when that warning was logged.
+
+    Examples
+    --------
+    >>> config_file = tmp_path / ".vcspull.jsonl"
+    >>> _ = config_file.write_text(
+    ...     '{"workspace_root": "/code/", "name": "flask", "url": "git+https://x"}\n'
+    ...     '{"workspace_root": "/code/", "name": "flask", "url": "git+https://y"}\n'
+    ... )
+    >>> entries, quiet = _read_jsonl_entries(config_file, warn_legacy_options=True)
+    >>> [entry.url for entry in entries], quiet
+    (['git+https://x'], True)
+    """
+    entries: list[RawEntry] = []
+    legacy_entries: list[tuple[str, str]] = []
+    with file.open(encoding="utf-8") as lines:
+        for line in iter_unique_jsonl_entries(lines):
+            if warn_legacy_options:
+                legacy_entries.extend(
+                    detect_legacy_repo_options(
+                        {line.workspace_root: {line.name: line.data}},
+                    ),
+                )
+            entries.append(
+                RawEntry.from_config(line.workspace_root, line.name, line.data),
+            )
+    if legacy_entries:
+        warn_legacy_repo_options(file, legacy_entries)
+    return entries, not legacy_entries
+
+
+def _expand_entry(entry: RawEntry, cwd: pathlib.Path) -> ConfigDict:
+    """Return ``entry`` expanded by :func:`~vcspull.config.extract_repos`."""
+    raw = t.cast("RawConfigDict", {entry.directory: {entry.key: entry.data}})
+    return extract_repos(raw, cwd=cwd)[0]
+
+
+class LazyConfig:
+    """Repositories from config files, expanded on demand.
+
+    Parameters
+    ----------
+    entries : Sequence[RawEntry]
+        Raw entries in config order.
+    cwd : pathlib.Path
+        Directory relative workspace roots are resolved against.
+
+    Examples
+    --------
+    >>> config = LazyConfig(
+    ...     [
+    ...         RawEntry.from_config("/code/", "flask", "git+https://x/flask"),
+    ...         RawEntry.from_config("/code/", "django", "git+https://x/django"),
+    ...     ],
+    ...     cwd=tmp_path,
+    ... )
+    >>> len(config)
+    2
+    >>> [str(repo["path"]) for repo in config.filter(name="flask")]
+    ['/code/flask']
+    >>> config.expanded_count
+    1
+    """
+
+    def __init__(self, entries: Sequence[RawEntry], cwd: pathlib.Path) -> None:
+        self._entries = list(entries)
+        self._cwd = cwd
+        self._expanded: dict[int, ConfigDict] = {}
+        self._roots: dict[str, pathlib.Path] = {}
+        self._index = RepoIndex(
+            (entry.name for entry in self._entries),
+            (entry.url for entry in self._entries),
+            lambda: (
+                str(_checkout_path(entry, cwd, self._roots).parent)
+                for entry in self._entries
+            ),
+        )
+
+    @classmethod
+    def load(
+        cls,
+        files: Sequence[pathlib.Path],
+        cwd: pathlib.Path | Callable[[], pathlib.Path] = pathlib.Path.cwd,
+        *,
+        warn_legacy_options: bool = False,
+        use_cache: bool | None = None,
+    ) -> LazyConfig:
+        r"""Read ``files`` without expanding their entries.
+
+        Logs the same messages and raises the same
+        :class:`~vcspull.exc.DuplicateRepoError` for a checkout claimed by two
+        files as :func:`~vcspull.config.load_configs`, except that
+        ``.vcspull.jsonl`` lines repeating a repository are not reported.
+
+        Examples
+        --------
+        >>> config_file = tmp_path / ".vcspull.yaml"
+        >>> _ = config_file.write_text(
+        ...     "~/code/:\n"
+        ...     "  flask: git+https://github.com/pallets/flask.git\n"
+        ...     "  django: git+https://github.com/django/django.git\n"
+        ... )
+        >>> config = LazyConfig.load([config_file], cwd=tmp_path)
+        >>> [repo["name"] for repo in config.filter(vcs_url="*pallets*")]
+        ['flask']
+        """
+        if callable(cwd):
+            cwd = cwd()
+        files = [pathlib.Path(file) for file in files]
+
+        if use_cache is None:
+            use_cache = config_cache.config_cache_enabled()
+        cache_key = (
+            config_cache.snapshot_key(
+                files,
+                cwd=cwd,
+                options={"lazy": True, "warn_legacy_options": warn_legacy_options},
+            )
+            if use_cache
+            else None
+        )
+        if cache_key is not None:
+            cached_entries = config_cache.load_snapshot(cache_key)
+            if cached_entries is not None:
+                return cls(cached_entries, cwd=cwd)
+
+        entries: list[RawEntry] = []
+        claimed = DuplicateIndex()
+        roots: dict[str, pathlib.Path] = {}
+        quiet = True
+        for file in files:
+            new_entries: list[RawEntry]
+            if config_format_from_path(file) == "jsonl":
+                new_entries, file_quiet = _read_jsonl_entries(
+                    file,
+                    warn_legacy_options=warn_legacy_options,
+                )
+            else:
+                config_content, file_quiet = read_config_file(
+                    file,
+                    warn_legacy_options=warn_legacy_options,
+                )
+                raw = t.cast("dict[str, dict[str, t.Any]]", config_content)
+                new_entries = [
+                    RawEntry.from_config(directory, key, data)
+                    for directory, repos in raw.items()
+                    for key, data in repos.items()
+                ]
+            quiet = quiet and file_quiet
+            entries.extend(new_entries)
+            # A single file cannot collide with itself; skip the path work.
+            if len(files) == 1:
+                continue
+            collisions = claimed.add(
+                RepoClaim(
+                    name=entry.name,
+                    checkout=str(
+                        _checkout_path(entry, cwd, roots).parent / entry.name,
+                    ),
+                    url=entry.url,
+                    source=file,
+                )
+                for entry in new_entries
+            )
+            if report_collisions(collisions):
+                quiet = False
+
+        if cache_key is not None and quiet:
+            config_cache.store_snapshot(cache_key, entries)
+        return cls(entries, cwd=cwd)
+
+    def __len__(self) -> int:
+        """Return the number of configured repositories."""
+        return len(self._entries)
+
+    @property
+    def expanded_count(self) -> int:
+        """Return how many entries have been expanded so far."""
+        return len(self._expanded)
+
+    def _expand(self, position: int) -> ConfigDict:
+        """Return the expanded entry at ``position``, expanding it once."""
+        repo = self._expanded.get(position)
+        if repo is None:
+            repo = _expand_entry(self._entries[position], self._cwd)
+            self._expanded[position] = repo
+        return repo
+
+    def filter(
+        self,
+        path: pathlib.Path | str | None = None,
+        vcs_url: str | None = None,
+        name: str | None = None,
+    ) -> list[ConfigDict]:
+        """Return the repositories matching the given patterns.
+
+        Same matching and ordering as :func:`~vcspull.config.filter_repos`,
+        but only the matches are expanded.
+
+        Parameters
+        ----------
+        path : pathlib.Path | str, optional
+            Parent directory of the checkout, fnmatch pattern supported
+        vcs_url : str, optional
+            Remote URL, fnmatch pattern supported
+        name : str, optional
+            Repository name, fnmatch pattern supported
+
+        Returns
+        -------
+        list[ConfigDict]
+            Matches for ``path``, then ``vcs_url``, then ``name``.
+        """
+        positions = self._index.match(path=path, vcs_url=vcs_url, name=name)
+        return [self._expand(position) for position in positions]
+
+    def all(self) -> list[ConfigDict]:
+        """Return every repository, expanded, in config order."""
+        return [self._expand(position) for position in range(len(self._entries))]
@@ -0,0 +1,201 @@
+"""Parse config files in worker processes, replaying their log output in order.
+
+Inventories split over hundreds of config fragments spend most of their load
+time in YAML parsing and :func:`~vcspull.config.extract_repos`, one file after
+another on a single core. :func:`map_in_processes` fans that work out to a
+process pool and hands results back in the order of the input files, so the
+caller can merge them, check duplicates, and raise exactly as a serial load
+would.
+
+Workers log into a :func:`capture_logs` buffer instead of the terminal. The
+records travel back with each result and :func:`replay_logs` emits them in the
+parent, in file order, through the parent's own loggers and levels, so the
+output does not depend on whether a pool was used.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import logging
+import multiprocessing
+import multiprocessing.context
+import os
+import pathlib
+import threading
+import typing as t
+from concurrent.futures.process import BrokenProcessPool
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+log = logging.getLogger(__name__)
+
+#: Use worker processes once a load reads at least this many files...
+PARALLEL_MIN_FILES = 32
+
+#: ...or at least two files totalling this many bytes.
+PARALLEL_MIN_BYTES = 2 * 1024 * 1024
+
+_T = t.TypeVar("_T")
+_R = t.TypeVar("_R")
+
+
+def parallel_workers(files: Sequence[pathlib.Path], *, force: bool = False) -> int:
+    r"""Return how many worker processes to load ``files`` with; ``0`` for none.
+
+    Below :data:`PARALLEL_MIN_FILES` files and :data:`PARALLEL_MIN_BYTES`
+    bytes, or on a single core, a pool costs more than it saves. ``force``
+    skips those checks, but a single file is always read in-process.
+
+    Examples
+    --------
+    >>> files = [tmp_path / f"team-{index}.yaml" for index in range(3)]
+    >>> for file in files:
+    ...     _ = file.write_text("~/code/:\n  flask: git+https://x/flask\n")
+    >>> parallel_workers(files)
+    0
+    >>> parallel_workers(files, force=True) >= 2
+    True
+    >>> parallel_workers(files[:1], force=True)
+    0
+    """
+    if len(files) < 2:
+        return 0
+    cpus = os.cpu_count() or 1
+    if force:
+        return min(len(files), max(cpus, 2))
+    if cpus < 2:
+        return 0
+    if len(files) < PARALLEL_MIN_FILES:
+        total = 0
+        for file in files:
+            with contextlib.suppress(OSError):
+                total += file.stat().st_size
+        if total < PARALLEL_MIN_BYTES:
+            return 0
+    return min(len(files), cpus)
+
+
+def _running_threads() -> int:
+    """Return how many threads this process runs, native ones included."""
+    try:
+        return sum(1 for _ in pathlib.Path("/proc/self/task").iterdir())
+    except OSError:
+        return threading.active_count()
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Return the start method for worker processes.
+
+    Forking is by far the cheapest, since the parent has already imported
+    everything a worker needs, but it is only safe while this process runs a
+    single thread. Otherwise workers start from a fork server, or fresh
+    interpreters where there is none.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and _running_threads() == 1:
+        return multiprocessing.get_context("fork")
+    if "forkserver" in methods:
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+class _RecordCollector(logging.Handler):
+    """Keep log records, made safe to pickle back to the parent process."""
+
+    def __init__(self) -> None:
+        super().__init__(level=logging.DEBUG)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store ``record`` with its message formatted and arguments dropped."""
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+
+@contextlib.contextmanager
+def capture_logs(logger_name: str = "vcspull") -> Iterator[list[logging.LogRecord]]:
+    """Collect everything ``logger_name`` and its children log, emitting nothing.
+
+    Examples
+    --------
+    >>> with capture_logs() as records:
+    ...     logging.getLogger("vcspull.config").warning("%s: shallow", "x.yaml")
+    >>> [record.getMessage() for record in records]
+    ['x.yaml: shallow']
+    """
+    logger = logging.getLogger(logger_name)
+    collector = _RecordCollector()
+    saved = (logger.level, logger.propagate, logger.handlers[:])
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.handlers = [collector]
+    try:
+        yield collector.records
+    finally:
+        logger.level, logger.propagate, logger.handlers = saved
+
+
+def replay_logs(records: Sequence[logging.LogRecord]) -> None:
+    """Emit ``records`` through this process's loggers, honouring their levels."""
+    for record in records:
+        logger = logging.getLogger(record.name)
+        if logger.isEnabledFor(record.levelno):
+            logger.handle(record)
+
+
+def map_in_processes(
+    func: Callable[[_T], _R],
+    items: Sequence[_T],
+    *,
+    workers: int,
+) -> Iterator[_R]:
+    """Yield ``func(item)`` for each item, in order, computed in a process pool.
+
+    ``func`` must be picklable, such as a module-level function or a
+    :func:`functools.partial` of one. An exception ``func`` raises is
+    re-raised when its item's turn comes. If the pool cannot start or a
+    worker dies, the remaining items run in this process instead.
+
+    Examples
+    --------
+    >>> list(map_in_processes(abs, [-1, 2, -3], workers=2))
+    [1, 2, 3]
+    """
+    done = 0
+    try:
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_pool_context(),
+        )
+    except (OSError, NotImplementedError, ValueError) as exc:
+        log.debug("Loading config files in-process: %s", exc)
+    else:
+        with pool:
+            try:
+                # Workers start as items are submitted, so a failing fork or
+                # spawn surfaces here rather than in the constructor.
+                results = pool.map(func, items)
+            except OSError as exc:
+                log.debug("Loading config files in-process: %s", exc)
+            else:
+                try:
+                    for result in results:
+                        yield result
+                        done += 1
+                except BrokenProcessPool as exc:
+                    log.debug("Config worker pool broke, loading in-process: %s", exc)
+                except BaseException:
+                    # The caller stopped early (an error, or a duplicate
+                    # found): drop the files no worker has started yet.
+                    pool.shutdown(cancel_futures=True)
+                    raise
+                else:
+                    return
+    for item in items[done:]:
+        yield func(item)
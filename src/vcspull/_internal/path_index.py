@@ -0,0 +1,293 @@
+"""On-disk index from checkout paths to configured repositories.
+
+Shell prompts and editor plugins ask "which configured repository is this
+directory in?" on every keystroke or prompt. Loading every config file and
+scanning the repository list answers that, but too slowly to run that often.
+This index maps resolved checkout paths to their config entries in a small
+SQLite database, so :func:`lookup_repo` costs one query over the ancestors of
+the directory asked about.
+
+The index is rebuilt whenever the set of config files, or any file's mtime or
+size, changes. When a config uses relative workspace roots, the directory the
+index was built from is part of that check too. Like the state store, the
+index is a cache: if it cannot be opened, lookups fall back to loading the
+configs directly.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+import typing as t
+
+from vcspull.config import load_configs
+from vcspull.util import get_cache_dir
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from vcspull.types import ConfigDict
+
+log = logging.getLogger(__name__)
+
+PATH_INDEX_NAME = "path-index.sqlite3"
+
+#: Bumped whenever the tables change; older indexes are dropped and rebuilt.
+SCHEMA_VERSION = 1
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    (
+        "CREATE TABLE IF NOT EXISTS repo_path ("
+        "path TEXT PRIMARY KEY, name TEXT NOT NULL, checkout TEXT NOT NULL, "
+        "workspace_root TEXT NOT NULL, url TEXT NOT NULL, vcs TEXT)"
+    ),
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class IndexedRepo:
+    """A configured repository, as stored in the path index.
+
+    Attributes
+    ----------
+    name : str
+        Repository name from the config.
+    path : str
+        Checkout path as configured, with ``~`` expanded.
+    workspace_root : str
+        Workspace root label from the config.
+    url : str
+        Repository URL.
+    vcs : str | None
+        Version control system, when known.
+    """
+
+    name: str
+    path: str
+    workspace_root: str
+    url: str
+    vcs: str | None = None
+
+    def to_config(self) -> ConfigDict:
+        """Return the minimal :class:`~vcspull.types.ConfigDict` for this repo.
+
+        Examples
+        --------
+        >>> repo = IndexedRepo("flask", "/src/flask", "/src/", "git+https://x/flask")
+        >>> repo.to_config()["path"]
+        PosixPath('/src/flask')
+        """
+        return {
+            "name": self.name,
+            "path": pathlib.Path(self.path),
+            "workspace_root": self.workspace_root,
+            "url": self.url,
+            "vcs": t.cast("t.Any", self.vcs),
+        }
+
+
+def default_index_path() -> pathlib.Path:
+    """Return where the path index lives, inside :func:`get_cache_dir`.
+
+    Examples
+    --------
+    >>> default_index_path().name
+    'path-index.sqlite3'
+    """
+    return get_cache_dir() / PATH_INDEX_NAME
+
+
+def config_fingerprint(config_files: Iterable[pathlib.Path]) -> str:
+    r"""Return a string that changes when any of ``config_files`` changes.
+
+    Covers which files exist and each file's mtime and size.
+
+    Examples
+    --------
+    >>> config = tmp_path / ".vcspull.yaml"
+    >>> _ = config.write_text("~/code/:\n  flask: git+https://x/flask\n")
+    >>> before = config_fingerprint([config])
+    >>> config_fingerprint([config]) == before
+    True
+    >>> _ = config.write_text("~/code/: {}\n")
+    >>> config_fingerprint([config]) == before
+    False
+    """
+    entries: list[tuple[str, int, int] | tuple[str, None, None]] = []
+    for config_file in sorted({str(path) for path in config_files}):
+        try:
+            st = pathlib.Path(config_file).stat()
+        except OSError:
+            entries.append((config_file, None, None))
+            continue
+        entries.append((config_file, st.st_mtime_ns, st.st_size))
+    return json.dumps(entries)
+
+
+def _is_cwd_relative(workspace_root: str) -> bool:
+    """Return whether a workspace root label resolves against the cwd.
+
+    Examples
+    --------
+    >>> _is_cwd_relative("./")
+    True
+    >>> _is_cwd_relative("~/code/")
+    False
+    """
+    expanded = pathlib.Path(os.path.expandvars(workspace_root)).expanduser()
+    return not expanded.is_absolute()
+
+
+def _index_keys(checkout: pathlib.Path) -> set[str]:
+    """Return the index keys for a checkout: its resolved and literal paths."""
+    literal = os.path.normpath(checkout.expanduser())
+    return {literal, str(pathlib.Path(literal).resolve())}
+
+
+def _index_rows(
+    repos: Iterable[ConfigDict],
+) -> tuple[dict[str, IndexedRepo], bool]:
+    """Map index keys to repositories; report whether any root is relative."""
+    rows: dict[str, IndexedRepo] = {}
+    cwd_relative = False
+    for repo in repos:
+        workspace_root = str(repo.get("workspace_root", ""))
+        cwd_relative = cwd_relative or _is_cwd_relative(workspace_root)
+        checkout = pathlib.Path(repo["path"])
+        indexed = IndexedRepo(
+            name=str(repo["name"]),
+            path=os.path.normpath(checkout.expanduser()),
+            workspace_root=workspace_root,
+            url=str(repo.get("url", "")),
+            vcs=repo.get("vcs"),
+        )
+        for key in _index_keys(checkout):
+            rows.setdefault(key, indexed)
+    return rows, cwd_relative
+
+
+def _ancestors(path: pathlib.Path) -> list[str]:
+    """Return ``path`` and its parents, nearest first, as index keys."""
+    resolved = path.resolve()
+    return [str(candidate) for candidate in (resolved, *resolved.parents)]
+
+
+@contextlib.contextmanager
+def _open_index(index_path: pathlib.Path) -> Iterator[sqlite3.Connection]:
+    """Open the index database, creating or resetting its schema."""
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(index_path, timeout=5.0)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS meta")
+            conn.execute("DROP TABLE IF EXISTS repo_path")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _index_is_current(
+    conn: sqlite3.Connection,
+    fingerprint: str,
+    cwd: pathlib.Path,
+) -> bool:
+    meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+    if meta.get("fingerprint") != fingerprint:
+        return False
+    built_cwd = meta.get("cwd", "")
+    return built_cwd in {"", str(cwd)}
+
+
+def _rebuild_index(
+    conn: sqlite3.Connection,
+    config_files: list[pathlib.Path],
+    fingerprint: str,
+    cwd: pathlib.Path,
+) -> None:
+    rows, cwd_relative = _index_rows(load_configs(config_files, cwd=cwd))
+    conn.execute("BEGIN IMMEDIATE")
+    conn.execute("DELETE FROM repo_path")
+    conn.execute("DELETE FROM meta")
+    conn.executemany(
+        "INSERT INTO repo_path "
+        "(path, name, checkout, workspace_root, url, vcs) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (key, repo.name, repo.path, repo.workspace_root, repo.url, repo.vcs)
+            for key, repo in rows.items()
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO meta (key, value) VALUES (?, ?)",
+        [("fingerprint", fingerprint), ("cwd", str(cwd) if cwd_relative else "")],
+    )
+
+
+def lookup_repo(
+    path: pathlib.Path,
+    config_files: list[pathlib.Path],
+    *,
+    index_path: pathlib.Path | None = None,
+) -> IndexedRepo | None:
+    r"""Return the configured repository containing ``path``, or ``None``.
+
+    The nearest enclosing checkout wins, so a directory inside a nested
+    checkout resolves to the inner repository. The index is rebuilt first if
+    ``config_files`` changed since it was written.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Directory (or file) to look up, typically the current directory
+    config_files : list[pathlib.Path]
+        Config files whose repositories the index covers
+    index_path : pathlib.Path | None
+        Index database (default: :func:`default_index_path`)
+
+    Examples
+    --------
+    >>> config = tmp_path / ".vcspull.yaml"
+    >>> _ = config.write_text(
+    ...     f"{tmp_path}/code/:\n"
+    ...     "  flask: git+https://github.com/pallets/flask.git\n"
+    ... )
+    >>> index_path = tmp_path / "path-index.sqlite3"
+    >>> nested = tmp_path / "code" / "flask" / "src" / "flask"
+    >>> lookup_repo(nested, [config], index_path=index_path).name
+    'flask'
+    >>> lookup_repo(tmp_path / "code", [config], index_path=index_path) is None
+    True
+    """
+    cwd = pathlib.Path.cwd()
+    fingerprint = config_fingerprint(config_files)
+    ancestors = _ancestors(path)
+    try:
+        with _open_index(
+            index_path if index_path is not None else default_index_path(),
+        ) as conn:
+            if not _index_is_current(conn, fingerprint, cwd):
+                _rebuild_index(conn, config_files, fingerprint, cwd)
+            placeholders = ", ".join("?" for _ in ancestors)
+            found = {
+                key: IndexedRepo(name, checkout, workspace_root, url, vcs)
+                for key, name, checkout, workspace_root, url, vcs in conn.execute(
+                    "SELECT path, name, checkout, workspace_root, url, vcs "
+                    f"FROM repo_path WHERE path IN ({placeholders})",
+                    ancestors,
+                )
+            }
+    except (OSError, sqlite3.Error) as exc:
+        log.debug("Path index unavailable, loading configs directly: %s", exc)
+        found, _ = _index_rows(load_configs(config_files, cwd=cwd))
+    return next((found[key] for key in ancestors if key in found), None)
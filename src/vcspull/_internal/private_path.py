@@ -42,23 +42,7 @@ class PrivatePath(PrivatePathBase):
     @classmethod
     def _collapse_home(cls, value: str) -> str:
         """Collapse the user's home directory to ``~`` in ``value``."""
-        if value.startswith("~"):
-            return value
-
-        home = str(pathlib.Path.home())
-        if value == home:
-            return "~"
-
-        separators = {os.sep}
-        if os.altsep:
-            separators.add(os.altsep)
-
-        for sep in separators:
-            home_with_sep = home + sep
-            if value.startswith(home_with_sep):
-                return "~" + value[len(home) :]
-
-        return value
+        return collapse_home(value)
 
     def __str__(self) -> str:
         original = pathlib.Path.__str__(self)
@@ -68,4 +52,36 @@ class PrivatePath(PrivatePathBase):
         return f"{self.__class__.__name__}({str(self)!r})"
 
 
-__all__ = ["PrivatePath"]
+def collapse_home(value: str, *, home: str | None = None) -> str:
+    """Collapse the user's home directory to ``~`` in ``value``.
+
+    Pass ``home`` to skip looking it up, when collapsing many paths.
+
+    Examples
+    --------
+    >>> collapse_home("/home/u/code/flask", home="/home/u")
+    '~/code/flask'
+    >>> collapse_home("/home/user2/flask", home="/home/u")
+    '/home/user2/flask'
+    """
+    if value.startswith("~"):
+        return value
+
+    if home is None:
+        home = str(pathlib.Path.home())
+    if value == home:
+        return "~"
+
+    separators = {os.sep}
+    if os.altsep:
+        separators.add(os.altsep)
+
+    for sep in separators:
+        home_with_sep = home + sep
+        if value.startswith(home_with_sep):
+            return "~" + value[len(home) :]
+
+    return value
+
+
+__all__ = ["PrivatePath", "collapse_home"]
@@ -0,0 +1,328 @@
+"""Index repository names, URLs, and checkout directories for pattern lookups.
+
+:func:`~vcspull.config.filter_repos` matches ``fnmatch`` patterns against
+three fields of every repository. Scripts that pass hundreds of names to
+``vcspull sync`` paid for a scan of the whole config per pattern. A
+:class:`RepoIndex` answers the same questions without a scan:
+
+- literal patterns are one dictionary lookup;
+- globs only test the keys that start with the pattern's literal prefix,
+  found by bisecting the sorted keys;
+- URL globs that spell out the host and owner (``*://github.com/pallets/*``)
+  only test URLs under that host and owner;
+- checkout directories sit in a trie of path components, so a directory glob
+  only tests the directories below its literal part.
+
+Matching itself is still :mod:`fnmatch`, on the same normalized case as
+:func:`fnmatch.fnmatch`, so results equal a linear scan.
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import functools
+import os
+import pathlib
+import re
+import typing as t
+
+from .repo_record import checkout_parent
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from vcspull.types import ConfigDict
+
+#: Characters that make a pattern a glob rather than a literal.
+_GLOB_CHARS = frozenset("*?[")
+
+_SCHEME_SEPARATOR = os.path.normcase("://")
+
+#: ``[user@]host[:port]/owner/`` right after a URL's ``://``.
+_HOST_OWNER_RE = re.compile(r"[^/]+/[^/]+/")
+
+#: The same, for patterns: no wildcards allowed.
+_LITERAL_HOST_OWNER_RE = re.compile(r"[^/*?\[]+/[^/*?\[]+/")
+
+
+def is_glob(pattern: str) -> bool:
+    """Return whether ``pattern`` uses :mod:`fnmatch` wildcards.
+
+    Examples
+    --------
+    >>> is_glob("flask"), is_glob("fla*"), is_glob("[fF]lask")
+    (False, True, True)
+    """
+    return not _GLOB_CHARS.isdisjoint(pattern)
+
+
+def literal_prefix(pattern: str) -> str:
+    """Return the part of ``pattern`` before its first wildcard.
+
+    Every string ``pattern`` matches starts with it.
+
+    Examples
+    --------
+    >>> literal_prefix("git+https://github.com/pallets/*")
+    'git+https://github.com/pallets/'
+    >>> literal_prefix("*flask")
+    ''
+    >>> literal_prefix("flask")
+    'flask'
+    """
+    for index, char in enumerate(pattern):
+        if char in _GLOB_CHARS:
+            return pattern[:index]
+    return pattern
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str) -> Callable[[str], re.Match[str] | None]:
+    """Return a matcher for an already normcased ``pattern``."""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+class KeyIndex:
+    """Positions of string keys, for exact and prefix-narrowed glob lookups.
+
+    Parameters
+    ----------
+    keys : Iterable[str]
+        One key per repository, in config order.
+
+    Examples
+    --------
+    >>> index = KeyIndex(["flask", "django", "flask-login", "flask"])
+    >>> index.lookup("flask")
+    [0, 3]
+    >>> index.lookup("flask*")
+    [0, 2, 3]
+    >>> index.lookup("*go")
+    [1]
+    >>> index.lookup("rails")
+    []
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self._positions: dict[str, list[int]] = {}
+        for position, key in enumerate(keys):
+            self._positions.setdefault(os.path.normcase(key), []).append(position)
+        self._sorted: list[str] | None = None
+
+    def _with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield the keys starting with ``prefix``."""
+        if not prefix:
+            yield from self._positions
+            return
+        if self._sorted is None:
+            self._sorted = sorted(self._positions)
+        start = bisect.bisect_left(self._sorted, prefix)
+        for key in self._sorted[start:]:
+            if not key.startswith(prefix):
+                return
+            yield key
+
+    def _candidates(self, pattern: str) -> Iterable[str]:
+        """Return the keys that could match the glob ``pattern``."""
+        return self._with_prefix(literal_prefix(pattern))
+
+    def lookup(self, pattern: str) -> list[int]:
+        """Return the positions whose key matches ``pattern``, in order."""
+        pattern = os.path.normcase(pattern)
+        if not is_glob(pattern):
+            return list(self._positions.get(pattern, ()))
+        match = _compile(pattern)
+        positions: list[int] = []
+        for key in self._candidates(pattern):
+            if match(key):
+                positions.extend(self._positions[key])
+        positions.sort()
+        return positions
+
+
+class UrlIndex(KeyIndex):
+    """A :class:`KeyIndex` of URLs that also groups them by host and owner.
+
+    Examples
+    --------
+    >>> index = UrlIndex(
+    ...     [
+    ...         "git+https://github.com/pallets/flask.git",
+    ...         "git+https://github.com/django/django.git",
+    ...         "git@github.com:pallets/click.git",
+    ...     ]
+    ... )
+    >>> index.lookup("*://github.com/pallets/*")
+    [0]
+    >>> index.lookup("*pallets*")
+    [0, 2]
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        super().__init__(keys)
+        self._by_host_owner: dict[str, list[str]] = {}
+        # URLs the host/owner shortcut cannot rule out; always tested.
+        self._loose: list[str] = []
+        for key in self._positions:
+            _scheme, separator, rest = key.partition(_SCHEME_SEPARATOR)
+            host_owner = _HOST_OWNER_RE.match(rest) if separator else None
+            if host_owner is None or _SCHEME_SEPARATOR in rest:
+                self._loose.append(key)
+            else:
+                self._by_host_owner.setdefault(host_owner.group(), []).append(key)
+
+    def _candidates(self, pattern: str) -> Iterable[str]:
+        """Narrow by host and owner when the pattern spells them out.
+
+        A URL with a single ``://`` can only match if the text after it
+        starts with the pattern's literal ``host/owner/``, as long as
+        nothing before the pattern's ``://`` is a bracket expression.
+        """
+        head, separator, rest = pattern.partition(_SCHEME_SEPARATOR)
+        if separator and "[" not in head:
+            host_owner = _LITERAL_HOST_OWNER_RE.match(rest)
+            if host_owner is not None:
+                return [*self._by_host_owner.get(host_owner.group(), ()), *self._loose]
+        return self._with_prefix(literal_prefix(pattern))
+
+
+class _TrieNode:
+    """A directory in :class:`PathTrie`."""
+
+    __slots__ = ("children", "keys")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.keys: list[str] = []
+
+    def walk(self) -> Iterator[str]:
+        """Yield the keys stored at and below this node."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield from node.keys
+            stack.extend(node.children.values())
+
+
+class PathTrie(KeyIndex):
+    """A :class:`KeyIndex` of directories, narrowed through a component trie.
+
+    Examples
+    --------
+    >>> index = PathTrie(["/code/python", "/code/rust", "/srv/python", "/code"])
+    >>> index.lookup("/code/*")
+    [0, 1]
+    >>> index.lookup("/code*")
+    [0, 1, 3]
+    >>> index.lookup("*/python")
+    [0, 2]
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        super().__init__(keys)
+        self._root = _TrieNode()
+        for key in self._positions:
+            node = self._root
+            for part in pathlib.PurePath(key).parts:
+                node = node.children.setdefault(part, _TrieNode())
+            node.keys.append(key)
+
+    def _candidates(self, pattern: str) -> Iterable[str]:
+        """Return the keys under the directories the literal prefix names."""
+        prefix = literal_prefix(pattern)
+        parents = list(pathlib.PurePath(prefix).parts)
+        partial = "" if not parents or prefix.endswith(os.sep) else parents.pop()
+        node = self._root
+        for part in parents:
+            child = node.children.get(part)
+            if child is None:
+                return []
+            node = child
+        if not partial:
+            return node.walk()
+        return [
+            key
+            for name, child in node.children.items()
+            if name.startswith(partial)
+            for key in child.walk()
+        ]
+
+
+class RepoIndex:
+    """Name, URL, and checkout-directory indexes over a list of repositories.
+
+    Parameters
+    ----------
+    names : Iterable[str]
+        Repository names, in config order.
+    urls : Iterable[str]
+        Remote URLs, in the same order.
+    parents : Callable[[], Iterable[str]]
+        Returns checkout parent directories, in the same order. Called the
+        first time a path pattern is looked up.
+
+    Examples
+    --------
+    >>> index = RepoIndex(
+    ...     ["flask", "django"],
+    ...     ["git+https://x/flask", "git+https://x/django"],
+    ...     lambda: ["/code", "/srv"],
+    ... )
+    >>> index.match(name="django")
+    [1]
+    >>> index.match(path="/code", vcs_url="*django")
+    [0, 1]
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str],
+        urls: Iterable[str],
+        parents: Callable[[], Iterable[str]],
+    ) -> None:
+        self._names = KeyIndex(names)
+        self._urls = UrlIndex(urls)
+        self._parents_factory = parents
+        self._parents: PathTrie | None = None
+
+    @classmethod
+    def from_repos(cls, repos: Sequence[ConfigDict]) -> RepoIndex:
+        """Index expanded repositories the way :func:`filter_repos` reads them.
+
+        Examples
+        --------
+        >>> repos = [
+        ...     {"name": "flask", "url": "git+https://x/flask", "path": "/code/flask"},
+        ... ]
+        >>> RepoIndex.from_repos(repos).match(path="/code")
+        [0]
+        """
+        return cls(
+            (str(repo.get("name")) for repo in repos),
+            (str(repo.get("url", repo.get("repo"))) for repo in repos),
+            lambda: (checkout_parent(repo) for repo in repos),
+        )
+
+    def match(
+        self,
+        path: pathlib.Path | str | None = None,
+        vcs_url: str | None = None,
+        name: str | None = None,
+    ) -> list[int]:
+        """Return matching positions: ``path`` hits, then ``vcs_url``, then ``name``.
+
+        Each group is in config order, and a repository matching several
+        patterns appears once per group, as with
+        :func:`~vcspull.config.filter_repos`.
+        """
+        positions: list[int] = []
+        if path:
+            if self._parents is None:
+                self._parents = PathTrie(self._parents_factory())
+            positions.extend(self._parents.lookup(str(path)))
+        if vcs_url:
+            positions.extend(self._urls.lookup(vcs_url))
+        if name:
+            positions.extend(self._names.lookup(name))
+        return positions
@@ -0,0 +1,309 @@
+"""Compact records for expanded repositories, read like a ``ConfigDict``.
+
+:func:`~vcspull.config.extract_repos` used to turn every config entry into a
+plain dict holding a :class:`pathlib.Path` for the checkout and a
+:class:`~libvcs.sync.git.GitRemote` per remote. With tens of thousands of
+repositories those objects, rather than the config itself, made up most of a
+load's memory. A :class:`RepoRecord` keeps the keys every entry has in slots,
+shares one interned string per workspace root, and builds the checkout path
+and remote objects only when a caller reads them.
+
+Records are mutable mappings with the keys of a
+:class:`~vcspull.types.ConfigDict` and compare equal to the dict they stand
+for, so code written against the dicts keeps working.
+"""
+
+from __future__ import annotations
+
+import enum
+import os
+import pathlib
+import sys
+import typing as t
+from collections.abc import Mapping, MutableMapping
+
+from libvcs.sync.git import GitRemote
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _Missing(enum.Enum):
+    """Marks a key a record does not have; pickles by name."""
+
+    MISSING = enum.auto()
+
+
+_MISSING = _Missing.MISSING
+
+#: Keys kept in slots, in the order records iterate them.
+_SLOT_KEYS: dict[str, str] = {
+    "name": "_name",
+    "url": "_url",
+    "workspace_root": "_workspace_root",
+    "path": "_path",
+    "remotes": "_remotes",
+}
+
+
+def is_plain_name(name: object) -> bool:
+    """Return whether joining ``name`` onto an expanded root needs no expansion.
+
+    Such a name is one path component with nothing for
+    :func:`~vcspull.config.expand_dir` to expand or normalize, so the
+    checkout path is simply ``root`` and ``name`` joined by a separator.
+
+    Examples
+    --------
+    >>> is_plain_name("flask"), is_plain_name("$HOME"), is_plain_name("a/b")
+    (True, False, False)
+    >>> is_plain_name(".."), is_plain_name(7)
+    (False, False)
+    """
+    return (
+        isinstance(name, str)
+        and name not in {"", ".", ".."}
+        and "$" not in name
+        and os.sep not in name
+        and (os.altsep is None or os.altsep not in name)
+        and not os.path.splitdrive(name)[0]
+    )
+
+
+def _join(parent: str, name: str) -> str:
+    """Join an expanded root and a plain name as ``str(Path(parent, name))``."""
+    if parent.endswith(os.sep):
+        return parent + name
+    return parent + os.sep + name
+
+
+def _build_remotes(remotes: Mapping[str, t.Any]) -> dict[str, t.Any]:
+    """Return ``remotes`` with URL strings and dicts turned into ``GitRemote``."""
+    built: dict[str, t.Any] = {}
+    for remote_name, url in remotes.items():
+        if isinstance(url, str):
+            built[remote_name] = GitRemote(
+                name=remote_name,
+                fetch_url=url,
+                push_url=url,
+            )
+        elif isinstance(url, dict):
+            built[remote_name] = GitRemote(name=remote_name, **url)
+        else:
+            built[remote_name] = url
+    return built
+
+
+def checkout_parent(repo: Mapping[str, t.Any]) -> str:
+    """Return the directory ``repo`` is checked out in, without a ``Path``.
+
+    Equals ``str(pathlib.Path(repo["path"]).parent)``.
+
+    Examples
+    --------
+    >>> checkout_parent(RepoRecord.from_dict({"name": "flask"}, parent="/code"))
+    '/code'
+    >>> checkout_parent({"name": "flask", "path": "/srv/flask"})
+    '/srv'
+    """
+    if isinstance(repo, RepoRecord) and repo._parent is not None:
+        return repo._parent
+    return str(pathlib.Path(repo["path"]).parent)
+
+
+def checkout_key(repo: Mapping[str, t.Any]) -> str:
+    """Return the checkout directory duplicate checks compare, as a string.
+
+    Equals ``str(pathlib.Path(repo["path"]).parent / repo["name"])``.
+
+    Examples
+    --------
+    >>> checkout_key(RepoRecord.from_dict({"name": "flask"}, parent="/code"))
+    '/code/flask'
+    >>> checkout_key({"name": "flask", "path": "/srv/flask-git"})
+    '/srv/flask'
+    """
+    if isinstance(repo, RepoRecord) and repo._parent is not None:
+        return _join(repo._parent, repo._name)
+    return str(pathlib.Path(repo["path"]).parent / repo["name"])
+
+
+class RepoRecord(MutableMapping[str, t.Any]):
+    """One expanded repository.
+
+    Build records with :meth:`from_dict`. When ``parent`` is given instead of
+    a ``path`` key, the checkout path is ``parent`` joined with the name and
+    is only turned into a :class:`pathlib.Path` when ``"path"`` is read.
+    ``remotes`` are stored as written and become
+    :class:`~libvcs.sync.git.GitRemote` objects the first time they are read.
+
+    Examples
+    --------
+    >>> record = RepoRecord.from_dict(
+    ...     {
+    ...         "url": "git+https://github.com/pallets/flask.git",
+    ...         "name": "flask",
+    ...         "workspace_root": "~/code/",
+    ...         "remotes": {"upstream": "git+https://github.com/pallets/flask"},
+    ...     },
+    ...     parent="/home/user/code",
+    ... )
+    >>> record["path"]
+    PosixPath('/home/user/code/flask')
+    >>> record["remotes"]["upstream"].fetch_url
+    'git+https://github.com/pallets/flask'
+    >>> record == dict(record)
+    True
+    >>> record.pop("url")
+    'git+https://github.com/pallets/flask.git'
+    >>> sorted(record)
+    ['name', 'path', 'remotes', 'workspace_root']
+    >>> type(record.copy()).__name__
+    'dict'
+    """
+
+    __slots__ = (
+        "_extra",
+        "_name",
+        "_parent",
+        "_path",
+        "_remotes",
+        "_remotes_built",
+        "_url",
+        "_workspace_root",
+    )
+
+    _name: t.Any
+    _url: t.Any
+    _workspace_root: t.Any
+    _path: t.Any
+    _remotes: t.Any
+    _remotes_built: bool
+    _parent: str | None
+    _extra: dict[str, t.Any] | None
+
+    def __init__(self) -> None:
+        self._name = self._url = self._workspace_root = _MISSING
+        self._path = self._remotes = _MISSING
+        self._remotes_built = False
+        self._parent = None
+        self._extra = None
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Mapping[str, t.Any],
+        *,
+        parent: str | None = None,
+    ) -> RepoRecord:
+        """Return a record holding the keys of ``data``.
+
+        ``parent`` is the expanded workspace root, interned and used for the
+        checkout path when ``data`` has no ``path`` and the name
+        :func:`is_plain_name`.
+        """
+        record = cls()
+        extra = dict(data)
+        for key, slot in _SLOT_KEYS.items():
+            if key in extra:
+                setattr(record, slot, extra.pop(key))
+        if isinstance(record._workspace_root, str):
+            record._workspace_root = sys.intern(record._workspace_root)
+        if (
+            parent is not None
+            and record._path is _MISSING
+            and is_plain_name(record._name)
+        ):
+            record._parent = sys.intern(parent)
+        record._extra = extra or None
+        return record
+
+    def _materialize_path(self) -> None:
+        """Turn a derived checkout path into a stored one."""
+        if self._parent is not None:
+            self._path = pathlib.Path(_join(self._parent, self._name))
+            self._parent = None
+
+    def __getitem__(self, key: str) -> t.Any:
+        slot = _SLOT_KEYS.get(key)
+        if slot is None:
+            if self._extra is None:
+                raise KeyError(key)
+            return self._extra[key]
+        if key == "path" and self._parent is not None:
+            # Built per read rather than kept, so records stay small.
+            return pathlib.Path(_join(self._parent, self._name))
+        value = getattr(self, slot)
+        if value is _MISSING:
+            raise KeyError(key)
+        if key == "remotes" and not self._remotes_built:
+            if isinstance(value, Mapping):
+                value = self._remotes = _build_remotes(value)
+            self._remotes_built = True
+        return value
+
+    def __setitem__(self, key: str, value: t.Any) -> None:
+        slot = _SLOT_KEYS.get(key)
+        if slot is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+            return
+        if key in {"name", "path"}:
+            self._materialize_path()
+        if key == "remotes":
+            # Stored as given, like a dict would.
+            self._remotes_built = True
+        setattr(self, slot, value)
+
+    def __delitem__(self, key: str) -> None:
+        slot = _SLOT_KEYS.get(key)
+        if slot is None:
+            if self._extra is None:
+                raise KeyError(key)
+            del self._extra[key]
+            return
+        if key in {"name", "path"}:
+            self._materialize_path()
+        if getattr(self, slot) is _MISSING:
+            raise KeyError(key)
+        setattr(self, slot, _MISSING)
+
+    def __contains__(self, key: object) -> bool:
+        slot = _SLOT_KEYS.get(t.cast("str", key))
+        if slot is None:
+            return self._extra is not None and key in self._extra
+        if key == "path" and self._parent is not None:
+            return True
+        return getattr(self, slot) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        for key in _SLOT_KEYS:
+            if key in self:
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def copy(self) -> dict[str, t.Any]:
+        """Return the keys and values as a plain :class:`dict`, like ``dict.copy``.
+
+        Examples
+        --------
+        >>> record = RepoRecord.from_dict({"name": "flask"}, parent="/code")
+        >>> record.copy()
+        {'name': 'flask', 'path': PosixPath('/code/flask')}
+        """
+        return dict(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self) == dict(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
@@ -0,0 +1,369 @@
+"""Find checkouts under a directory tree for ``vcspull discover``.
+
+:func:`os.walk` visits every directory under the scan root. That includes the
+inside of each checkout's ``.git``, its ``node_modules`` and build output, and
+any vendored trees, so a scan of a large home volume spends nearly all of its
+time in directories that can never hold a repository worth recording. This
+walker reads each directory once with :func:`os.scandir` and stops at a
+checkout's root unless nested checkouts are asked for. Exclude globs,
+``.vcspullignore`` files, and a depth limit can prune more of the tree.
+Directory reads run on a thread pool, because on network and spinning disks
+they spend most of their time waiting on I/O. With a
+:class:`~vcspull._internal.scan_cache.DirectoryCache`, directories unchanged
+since the last walk are not read at all.
+
+``.vcspullignore`` holds one glob per line; blank lines and lines starting
+with ``#`` are skipped. A pattern applies below the directory its file sits
+in and matches a directory's name or its path relative to that directory.
+A leading ``/`` anchors the pattern to that directory.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import fnmatch
+import logging
+import os
+import pathlib
+import time
+import typing as t
+
+from vcspull._internal.scan_cache import CachedDirectory
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from vcspull._internal.scan_cache import DirectoryCache
+
+log = logging.getLogger(__name__)
+
+IGNORE_FILE_NAME = ".vcspullignore"
+
+#: Metadata entry whose presence marks a directory as a checkout, and its VCS.
+#: The walker never descends into these entries. When a directory holds more
+#: than one, the first listed here wins.
+VCS_MARKERS: dict[str, str] = {".git": "git", ".hg": "hg", ".svn": "svn"}
+
+
+class FoundCheckout(t.NamedTuple):
+    """A checkout found by :func:`walk_checkouts`.
+
+    Attributes
+    ----------
+    path : pathlib.Path
+        Checkout root.
+    vcs : str
+        Version control system named by the checkout's metadata entry.
+    """
+
+    path: pathlib.Path
+    vcs: str
+
+
+class _IgnoreRule(t.NamedTuple):
+    """An exclude glob scoped to the directory it was declared for."""
+
+    base: str
+    pattern: str
+    anchored: bool
+
+    def matches(self, rel_path: str, name: str) -> bool:
+        """Return whether the directory at ``rel_path`` (from the root) matches.
+
+        Examples
+        --------
+        >>> rule = _IgnoreRule("", "build", anchored=False)
+        >>> rule.matches("pkg/build", "build")
+        True
+        >>> _IgnoreRule("", "build", anchored=True).matches("pkg/build", "build")
+        False
+        >>> _IgnoreRule("vendor", "*", anchored=False).matches("src/x", "x")
+        False
+        """
+        if self.base:
+            if not rel_path.startswith(f"{self.base}/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1 :]
+        if fnmatch.fnmatchcase(rel_path, self.pattern):
+            return True
+        return not self.anchored and fnmatch.fnmatchcase(name, self.pattern)
+
+
+class _DirectoryScan(t.NamedTuple):
+    """What one read of a directory found."""
+
+    vcs: str | None
+    subdirectories: tuple[tuple[str, bool], ...]
+    ignore_patterns: tuple[str, ...]
+    ignore_mtime_ns: int | None
+
+
+_UNREADABLE = _DirectoryScan(None, (), (), None)
+
+#: Listings of directories modified this close to the start of a walk are not
+#: cached: a change in the same mtime tick, after the read, would go unseen.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+_ReadResult: t.TypeAlias = tuple[_DirectoryScan, CachedDirectory | None, bool]
+
+
+def parse_ignore_patterns(lines: Iterable[str]) -> list[str]:
+    r"""Return the globs in the lines of a ``.vcspullignore`` file.
+
+    Examples
+    --------
+    >>> parse_ignore_patterns(["# scratch space\n", "\n", "tmp/\n", " /archive\n"])
+    ['tmp', '/archive']
+    """
+    patterns: list[str] = []
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        patterns.append(stripped.rstrip("/"))
+    return [pattern for pattern in patterns if pattern not in {"", "/"}]
+
+
+def _rules_for(base: str, patterns: Iterable[str]) -> list[_IgnoreRule]:
+    return [
+        _IgnoreRule(base, pattern.lstrip("/"), anchored=pattern.startswith("/"))
+        for pattern in patterns
+    ]
+
+
+def _scan_directory(path: pathlib.Path) -> _DirectoryScan:
+    """Read ``path`` once, noting its VCS marker, subdirectories, and ignores."""
+    markers: set[str] = set()
+    subdirectories: list[tuple[str, bool]] = []
+    ignore_mtime_ns: int | None = None
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    if name in VCS_MARKERS:
+                        markers.add(name)
+                    elif name == IGNORE_FILE_NAME:
+                        if entry.is_file():
+                            ignore_mtime_ns = entry.stat().st_mtime_ns
+                    elif entry.is_dir():
+                        subdirectories.append((name, entry.is_symlink()))
+                except OSError:
+                    continue
+    except OSError as exc:
+        log.debug("Could not read directory %s: %s", path, exc)
+        return _UNREADABLE
+
+    vcs = next((vcs for name, vcs in VCS_MARKERS.items() if name in markers), None)
+    ignore_patterns: list[str] = []
+    if ignore_mtime_ns is not None:
+        try:
+            with (path / IGNORE_FILE_NAME).open(encoding="utf-8") as ignore_file:
+                ignore_patterns = parse_ignore_patterns(ignore_file)
+        except (OSError, UnicodeDecodeError) as exc:
+            log.debug("Could not read %s in %s: %s", IGNORE_FILE_NAME, path, exc)
+    return _DirectoryScan(
+        vcs,
+        tuple(subdirectories),
+        tuple(ignore_patterns),
+        ignore_mtime_ns,
+    )
+
+
+def _read_directory(
+    path: pathlib.Path,
+    cache: DirectoryCache | None,
+    racy_after_ns: int,
+) -> _ReadResult:
+    """Return a directory's scan, reusing ``cache`` when it is still valid.
+
+    Also returns the listing to cache for the directory, if any, and whether
+    the cached listing was reused.
+    """
+    if cache is None:
+        return _scan_directory(path), None, False
+    try:
+        st = path.stat()
+    except OSError as exc:
+        log.debug("Could not read directory %s: %s", path, exc)
+        return _UNREADABLE, None, False
+
+    cached = cache.lookup(str(path))
+    if (
+        cached is not None
+        and (cached.inode, cached.mtime_ns) == (st.st_ino, st.st_mtime_ns)
+        and _ignore_file_mtime(path, cached.ignore_mtime_ns) == cached.ignore_mtime_ns
+    ):
+        scan = _DirectoryScan(
+            cached.vcs,
+            cached.subdirectories,
+            cached.ignore_patterns,
+            cached.ignore_mtime_ns,
+        )
+        return scan, None, True
+
+    scan = _scan_directory(path)
+    if (
+        scan is _UNREADABLE
+        or max(
+            st.st_mtime_ns,
+            scan.ignore_mtime_ns or 0,
+        )
+        >= racy_after_ns
+    ):
+        return scan, None, False
+    listing = CachedDirectory(
+        st.st_ino,
+        st.st_mtime_ns,
+        scan.vcs,
+        scan.subdirectories,
+        scan.ignore_mtime_ns,
+        scan.ignore_patterns,
+    )
+    return scan, listing, False
+
+
+def _ignore_file_mtime(path: pathlib.Path, cached_mtime_ns: int | None) -> int | None:
+    """Return the mtime of ``path``'s ignore file, if the cache says it has one.
+
+    Adding or removing the file changes the directory's own mtime, so it only
+    needs checking when the cached listing recorded one.
+    """
+    if cached_mtime_ns is None:
+        return None
+    try:
+        return (path / IGNORE_FILE_NAME).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _checkout_vcs(path: pathlib.Path) -> str | None:
+    """Return the VCS of the checkout at ``path``, or ``None``."""
+    for marker, vcs in VCS_MARKERS.items():
+        if (path / marker).exists():
+            return vcs
+    return None
+
+
+def walk_checkouts(
+    scan_dir: pathlib.Path,
+    *,
+    include_root: bool = True,
+    max_depth: int | None = None,
+    nested: bool = False,
+    exclude: Sequence[str] = (),
+    max_workers: int | None = None,
+    cache: DirectoryCache | None = None,
+) -> list[FoundCheckout]:
+    """Return the checkouts under ``scan_dir``, sorted by path.
+
+    Symlinked directories are reported when they are checkouts but never
+    descended into, so a scan cannot loop.
+
+    Parameters
+    ----------
+    scan_dir : pathlib.Path
+        Directory to scan.
+    include_root : bool
+        Whether ``scan_dir`` itself may be reported. When ``False``, the walk
+        always continues into its children.
+    max_depth : int | None
+        Deepest directory level to examine; children of ``scan_dir`` are
+        level 1. ``None`` means no limit.
+    nested : bool
+        Keep descending below a checkout's root to find checkouts inside it.
+    exclude : Sequence[str]
+        Globs for directories to skip, matched against a directory's name and
+        its path relative to ``scan_dir``.
+    max_workers : int | None
+        Threads used for directory reads (default: the executor's default).
+    cache : DirectoryCache | None
+        Listings from earlier walks. Unchanged directories are taken from it
+        instead of being read, and it is saved with this walk's listings.
+
+    Examples
+    --------
+    >>> for rel in ("code/flask", "code/flask/vendor/lib", "code/build/tool"):
+    ...     (tmp_path / rel / ".git").mkdir(parents=True)
+    >>> def names(checkouts):
+    ...     return [str(c.path.relative_to(tmp_path)) for c in checkouts]
+    >>> names(walk_checkouts(tmp_path))
+    ['code/build/tool', 'code/flask']
+    >>> names(walk_checkouts(tmp_path, nested=True))
+    ['code/build/tool', 'code/flask', 'code/flask/vendor/lib']
+    >>> names(walk_checkouts(tmp_path, exclude=["build"]))
+    ['code/flask']
+    >>> names(walk_checkouts(tmp_path, max_depth=1))
+    []
+    """
+    root_rules = _rules_for("", exclude)
+    found: list[tuple[tuple[str, ...], FoundCheckout]] = []
+    fresh: dict[str, CachedDirectory] = {}
+    reused: set[str] = set()
+    racy_after_ns = time.time_ns() - _RACY_WINDOW_NS
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(path: pathlib.Path) -> concurrent.futures.Future[_ReadResult]:
+            return executor.submit(_read_directory, path, cache, racy_after_ns)
+
+        pending: dict[
+            concurrent.futures.Future[_ReadResult],
+            tuple[pathlib.Path, str, int, list[_IgnoreRule]],
+        ] = {submit(scan_dir): (scan_dir, "", 0, root_rules)}
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                path, rel_path, depth, rules = pending.pop(future)
+                scan, listing, was_reused = future.result()
+                if was_reused:
+                    reused.add(str(path))
+                elif listing is not None:
+                    fresh[str(path)] = listing
+                if scan.vcs is not None and (depth > 0 or include_root):
+                    found.append(
+                        (tuple(rel_path.split("/")), FoundCheckout(path, scan.vcs)),
+                    )
+                    if not nested:
+                        continue
+                if max_depth is not None and depth >= max_depth:
+                    continue
+                child_rules = rules + _rules_for(rel_path, scan.ignore_patterns)
+                for name, is_symlink in scan.subdirectories:
+                    child_path = path / name
+                    child_rel = f"{rel_path}/{name}" if rel_path else name
+                    if any(rule.matches(child_rel, name) for rule in child_rules):
+                        log.debug("Excluding %s from discovery", child_path)
+                        continue
+                    if is_symlink:
+                        vcs = _checkout_vcs(child_path)
+                        if vcs is not None:
+                            found.append(
+                                (
+                                    tuple(child_rel.split("/")),
+                                    FoundCheckout(child_path, vcs),
+                                ),
+                            )
+                        continue
+                    pending[submit(child_path)] = (
+                        child_path,
+                        child_rel,
+                        depth + 1,
+                        child_rules,
+                    )
+
+    if cache is not None:
+        log.debug(
+            "Reused %d of %d cached directory listings under %s",
+            len(reused),
+            len(cache),
+            scan_dir,
+        )
+        cache.save(fresh, reused=reused)
+
+    found.sort(key=lambda item: item[0])
+    return [checkout for _, checkout in found]
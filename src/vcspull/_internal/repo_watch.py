@@ -0,0 +1,416 @@
+"""Detect which repositories changed on disk, for ``vcspull status --watch``.
+
+Two watchers share one interface: :class:`InotifyWatcher` uses Linux inotify
+through ``ctypes`` and sees edits anywhere in a working tree, and
+:class:`PollingWatcher` compares cheap ``stat`` fingerprints of each
+repository's git metadata and top-level entries. :func:`create_repo_watcher`
+picks inotify when the platform offers it.
+
+Both report repository *keys*, the strings the caller registered, so the caller
+can re-probe only those repositories.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import pathlib
+import select
+import struct
+import sys
+import time
+import typing as t
+
+from vcspull._internal.git_probe import resolve_common_dir, resolve_git_dir
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+log = logging.getLogger(__name__)
+
+#: Git metadata whose change means status may differ: checkout, commit,
+#: staging, fetch, and branch updates.
+_GIT_METADATA = ("HEAD", "index", "FETCH_HEAD", "ORIG_HEAD")
+_COMMON_METADATA = ("packed-refs", "refs/heads", "refs/remotes")
+
+Fingerprint = tuple[tuple[int, int] | None, ...]
+
+
+class RepoWatcher(t.Protocol):
+    """Interface shared by the watchers."""
+
+    def wait(self, timeout: float) -> set[str]:
+        """Block up to ``timeout`` seconds and return keys of changed repos."""
+        ...
+
+    def acknowledge(self, keys: Iterable[str]) -> None:
+        """Forget changes to ``keys`` caused by re-probing them."""
+        ...
+
+    def close(self) -> None:
+        """Release watcher resources."""
+        ...
+
+
+def _stat_signature(path: pathlib.Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for ``path``, or ``None`` when missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def repo_fingerprint(repo_path: pathlib.Path) -> Fingerprint:
+    """Return a cheap fingerprint that changes when a repository's status may.
+
+    Covers the checkout's existence, git metadata (``HEAD``, index, fetched
+    and local refs), and the top-level entries of the working tree. Edits
+    nested deeper than the top level that do not touch the index are only
+    caught by :class:`InotifyWatcher`.
+
+    Examples
+    --------
+    >>> import subprocess
+    >>> repo = create_git_remote_repo()
+    >>> before = repo_fingerprint(repo)
+    >>> repo_fingerprint(repo) == before
+    True
+    >>> _ = (repo / "new-file.txt").write_text("hello")
+    >>> repo_fingerprint(repo) == before
+    False
+
+    A missing checkout has a stable fingerprint until it appears:
+
+    >>> repo_fingerprint(tmp_path / "missing") == repo_fingerprint(
+    ...     tmp_path / "missing"
+    ... )
+    True
+    """
+    signature: list[tuple[int, int] | None] = [_stat_signature(repo_path)]
+    git_dir = resolve_git_dir(repo_path)
+    if git_dir is None:
+        return tuple(signature)
+    common_dir = resolve_common_dir(git_dir)
+    signature.extend(_stat_signature(git_dir / name) for name in _GIT_METADATA)
+    signature.extend(_stat_signature(common_dir / name) for name in _COMMON_METADATA)
+    try:
+        with os.scandir(repo_path) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if entry.name == ".git":
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                signature.append((st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return tuple(signature)
+
+
+class PollingWatcher:
+    """Detect changes by comparing :func:`repo_fingerprint` snapshots.
+
+    Examples
+    --------
+    >>> repo = create_git_remote_repo()
+    >>> watcher = PollingWatcher({"repo": repo})
+    >>> watcher.wait(0)
+    set()
+    >>> _ = (repo / "new-file.txt").write_text("hello")
+    >>> watcher.wait(0)
+    {'repo'}
+    >>> watcher.wait(0)
+    set()
+    """
+
+    def __init__(
+        self,
+        repos: Mapping[str, pathlib.Path],
+        *,
+        poll_interval: float = 1.0,
+    ) -> None:
+        self._repos = dict(repos)
+        self._poll_interval = poll_interval
+        self._fingerprints = {
+            key: repo_fingerprint(path) for key, path in self._repos.items()
+        }
+
+    def _changed(self) -> set[str]:
+        changed: set[str] = set()
+        for key, path in self._repos.items():
+            fingerprint = repo_fingerprint(path)
+            if fingerprint != self._fingerprints[key]:
+                self._fingerprints[key] = fingerprint
+                changed.add(key)
+        return changed
+
+    def wait(self, timeout: float) -> set[str]:
+        """Poll every ``poll_interval`` seconds until a change or ``timeout``."""
+        deadline = time.monotonic() + timeout
+        while True:
+            changed = self._changed()
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self._poll_interval, remaining))
+
+    def acknowledge(self, keys: Iterable[str]) -> None:
+        """Re-fingerprint ``keys`` so writes made by probing them are ignored."""
+        for key in keys:
+            self._fingerprints[key] = repo_fingerprint(self._repos[key])
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+# inotify(7) constants; see <sys/inotify.h>.
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+#: Upper bound on directories watched per working tree, to stay well inside
+#: ``fs.inotify.max_user_watches`` on large checkouts.
+MAX_WATCHED_DIRS_PER_REPO = 2000
+
+#: Quiet period used to coalesce the burst of events one git command makes.
+_SETTLE_SECONDS = 0.1
+
+
+def _load_libc() -> t.Any | None:
+    """Return libc with inotify entry points, or ``None`` when unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1"):
+        return None
+    return libc
+
+
+def inotify_available() -> bool:
+    """Return whether :class:`InotifyWatcher` can run on this platform.
+
+    Examples
+    --------
+    >>> isinstance(inotify_available(), bool)
+    True
+    """
+    return _load_libc() is not None
+
+
+class InotifyWatcher:
+    """Detect changes with Linux inotify, watching git metadata and worktrees.
+
+    Checkouts missing at start are polled for existence and watched once they
+    appear.
+
+    Raises
+    ------
+    OSError
+        If inotify cannot be initialised.
+    """
+
+    def __init__(self, repos: Mapping[str, pathlib.Path]) -> None:
+        libc = _load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._libc = libc
+        self._fd: int = fd
+        self._repos = dict(repos)
+        self._wd_to_key: dict[int, str] = {}
+        self._wd_to_dir: dict[int, pathlib.Path] = {}
+        self._dir_counts: dict[str, int] = {}
+        self._unwatched: set[str] = set()
+        self._pending: set[str] = set()
+        for key, path in self._repos.items():
+            self._watch_repo(key, path)
+
+    def _add_watch(self, key: str, directory: pathlib.Path) -> bool:
+        wd = self._libc.inotify_add_watch(
+            self._fd,
+            os.fsencode(directory),
+            _WATCH_MASK,
+        )
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                log.debug("inotify watch limit reached at %s", directory)
+            return False
+        self._wd_to_key[wd] = key
+        self._wd_to_dir[wd] = directory
+        return True
+
+    def _watch_tree(self, key: str, root: pathlib.Path) -> None:
+        """Watch ``root`` and its subdirectories, skipping ``.git``."""
+        stack = [root]
+        while stack:
+            if self._dir_counts.get(key, 0) >= MAX_WATCHED_DIRS_PER_REPO:
+                return
+            directory = stack.pop()
+            if not self._add_watch(key, directory):
+                continue
+            self._dir_counts[key] = self._dir_counts.get(key, 0) + 1
+            try:
+                with os.scandir(directory) as entries:
+                    stack.extend(
+                        pathlib.Path(entry.path)
+                        for entry in entries
+                        if entry.name != ".git" and entry.is_dir(follow_symlinks=False)
+                    )
+            except OSError:
+                continue
+
+    def _watch_repo(self, key: str, path: pathlib.Path) -> None:
+        git_dir = resolve_git_dir(path)
+        if not path.is_dir():
+            self._unwatched.add(key)
+            return
+        self._unwatched.discard(key)
+        self._watch_tree(key, path)
+        if git_dir is None:
+            return
+        common_dir = resolve_common_dir(git_dir)
+        for directory in {git_dir, common_dir}:
+            self._add_watch(key, directory)
+        for name in ("refs/heads", "refs/remotes"):
+            refs_dir = common_dir / name
+            if refs_dir.is_dir():
+                self._watch_tree(key, refs_dir)
+
+    def _read_events(self) -> set[str]:
+        changed: set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            except OSError as exc:
+                if exc.errno == errno.EINTR:
+                    continue
+                raise
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                name_bytes = data[
+                    offset + _EVENT_HEADER.size : offset + _EVENT_HEADER.size + length
+                ]
+                offset += _EVENT_HEADER.size + length
+                key = self._wd_to_key.get(wd)
+                if key is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    self._wd_to_key.pop(wd, None)
+                    self._wd_to_dir.pop(wd, None)
+                    continue
+                name = name_bytes.rstrip(b"\0")
+                if name.endswith(b".lock"):
+                    # git's lock files come and go within one command; the
+                    # rename onto the real file is what matters.
+                    continue
+                changed.add(key)
+                if mask & _IN_CREATE and mask & _IN_ISDIR and name != b".git":
+                    self._watch_tree(key, self._wd_to_dir[wd] / os.fsdecode(name))
+
+    def _poll_unwatched(self) -> set[str]:
+        appeared = {key for key in self._unwatched if self._repos[key].is_dir()}
+        for key in appeared:
+            self._watch_repo(key, self._repos[key])
+        return appeared
+
+    def wait(self, timeout: float) -> set[str]:
+        """Wait for inotify events, then let the burst settle before returning."""
+        changed = set(self._pending)
+        self._pending.clear()
+        changed |= self._poll_unwatched()
+        if changed:
+            return changed
+        deadline = time.monotonic() + timeout
+        while not changed:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Missing checkouts are polled at most once a second.
+            ready, _, _ = select.select([self._fd], [], [], min(remaining, 1.0))
+            if ready:
+                changed |= self._read_events()
+            changed |= self._poll_unwatched()
+        while changed:
+            ready, _, _ = select.select([self._fd], [], [], _SETTLE_SECONDS)
+            if not ready:
+                break
+            changed |= self._read_events()
+        # Checkouts deleted since they were watched go back to polling.
+        for key in changed:
+            if not self._repos[key].is_dir():
+                self._unwatched.add(key)
+        return changed
+
+    def acknowledge(self, keys: Iterable[str]) -> None:
+        """Drain events for ``keys`` raised while probing them; keep others."""
+        acknowledged = set(keys)
+        self._pending |= self._read_events() - acknowledged
+
+    def close(self) -> None:
+        """Close the inotify descriptor."""
+        if self._fd >= 0:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = -1
+
+
+def create_repo_watcher(
+    repos: Mapping[str, pathlib.Path],
+    *,
+    poll_interval: float = 1.0,
+    use_inotify: bool = True,
+) -> RepoWatcher:
+    """Return an inotify watcher when possible, otherwise a polling watcher.
+
+    Examples
+    --------
+    >>> repo = create_git_remote_repo()
+    >>> watcher = create_repo_watcher({"repo": repo}, use_inotify=False)
+    >>> type(watcher).__name__
+    'PollingWatcher'
+    >>> watcher.close()
+    """
+    if use_inotify and inotify_available():
+        try:
+            return InotifyWatcher(repos)
+        except OSError as exc:
+            log.debug("Falling back to stat polling: %s", exc)
+    return PollingWatcher(repos, poll_interval=poll_interval)
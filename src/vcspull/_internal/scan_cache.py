@@ -0,0 +1,250 @@
+"""Directory listings remembered between ``vcspull discover`` scans.
+
+A nightly ``vcspull discover ~/work --recursive`` reads the same directories
+every time, although almost none of them changed. A directory's mtime moves
+whenever an entry is added, removed, or renamed in it, so a listing recorded
+with the directory's inode and mtime stays valid for as long as both match.
+:func:`~vcspull._internal.repo_walker.walk_checkouts` then needs one ``stat``
+per unchanged directory instead of a full read. Changes deeper in the tree do
+not touch a parent's mtime, which is why every directory on the walk is still
+stat-ed rather than whole subtrees being skipped.
+
+The cache lives in a small SQLite database next to the other vcspull caches.
+Like them it is best effort: if it cannot be opened or written, scans read
+every directory as before.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import sqlite3
+import typing as t
+
+from vcspull.util import get_cache_dir
+
+if t.TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator, Mapping
+
+log = logging.getLogger(__name__)
+
+SCAN_CACHE_NAME = "discover-cache.sqlite3"
+
+#: Bumped whenever the ``directory`` columns or the markers the walker records
+#: change; older caches are dropped.
+SCHEMA_VERSION = 2
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS directory ("
+    "path TEXT PRIMARY KEY, inode INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+    "vcs TEXT, subdirectories TEXT NOT NULL, ignore_mtime_ns INTEGER, "
+    "ignore_patterns TEXT NOT NULL)"
+)
+
+
+class CachedDirectory(t.NamedTuple):
+    """What a directory held the last time it was read.
+
+    Attributes
+    ----------
+    inode : int
+        Inode of the directory when it was read.
+    mtime_ns : int
+        Modification time of the directory when it was read.
+    vcs : str | None
+        VCS named by a metadata entry in the directory, if any.
+    subdirectories : tuple[tuple[str, bool], ...]
+        Names of subdirectories, each with whether it is a symlink.
+    ignore_mtime_ns : int | None
+        Modification time of the directory's ``.vcspullignore``, or ``None``
+        if it has none.
+    ignore_patterns : tuple[str, ...]
+        Globs read from that ``.vcspullignore``.
+    """
+
+    inode: int
+    mtime_ns: int
+    vcs: str | None
+    subdirectories: tuple[tuple[str, bool], ...]
+    ignore_mtime_ns: int | None
+    ignore_patterns: tuple[str, ...]
+
+
+def default_scan_cache_path() -> pathlib.Path:
+    """Return where the scan cache lives, inside :func:`get_cache_dir`.
+
+    Examples
+    --------
+    >>> default_scan_cache_path().name
+    'discover-cache.sqlite3'
+    """
+    return get_cache_dir() / SCAN_CACHE_NAME
+
+
+def _subtree_bounds(root: str) -> tuple[str, str]:
+    """Return the half-open key range holding every path below ``root``.
+
+    Examples
+    --------
+    >>> _subtree_bounds("/home/user/work")
+    ('/home/user/work/', '/home/user/work0')
+    >>> _subtree_bounds("/")
+    ('/', '0')
+    """
+    prefix = root.rstrip("/") + "/"
+    return prefix, f"{prefix[:-1]}0"
+
+
+@contextlib.contextmanager
+def _open_cache(cache_path: pathlib.Path) -> Iterator[sqlite3.Connection]:
+    """Open the cache database, creating or resetting its schema."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_path, timeout=5.0)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS directory")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.execute(_SCHEMA)
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class DirectoryCache:
+    """Cached listings for the directories below one scan root.
+
+    Load it with :meth:`load`, pass it to
+    :func:`~vcspull._internal.repo_walker.walk_checkouts`, which looks entries up
+    from its worker threads and calls :meth:`save` once the walk is done.
+
+    Examples
+    --------
+    >>> cache_path = tmp_path / "discover-cache.sqlite3"
+    >>> cache = DirectoryCache.load(tmp_path, cache_path=cache_path)
+    >>> listing = CachedDirectory(1, 10, "git", (("src", False),), None, ())
+    >>> cache.save({str(tmp_path / "repo"): listing}, reused=set())
+    >>> reloaded = DirectoryCache.load(tmp_path, cache_path=cache_path)
+    >>> reloaded.lookup(str(tmp_path / "repo")).vcs
+    'git'
+    >>> DirectoryCache.load(tmp_path, cache_path=cache_path, reuse=False).lookup(
+    ...     str(tmp_path / "repo")
+    ... ) is None
+    True
+    """
+
+    def __init__(
+        self,
+        root: str,
+        entries: dict[str, CachedDirectory],
+        cache_path: pathlib.Path | None,
+    ) -> None:
+        self.root = root
+        self._entries = entries
+        self._cache_path = cache_path
+
+    @classmethod
+    def load(
+        cls,
+        root: pathlib.Path,
+        *,
+        cache_path: pathlib.Path | None = None,
+        reuse: bool = True,
+    ) -> DirectoryCache:
+        """Load the cached listings for ``root`` and the directories below it.
+
+        Parameters
+        ----------
+        root : pathlib.Path
+            Scan root.
+        cache_path : pathlib.Path | None
+            Cache database (default: :func:`default_scan_cache_path`).
+        reuse : bool
+            When ``False``, start empty so that every directory is read again;
+            :meth:`save` still records the fresh listings.
+        """
+        resolved_path = (
+            cache_path if cache_path is not None else default_scan_cache_path()
+        )
+        root_key = str(root)
+        if not reuse:
+            return cls(root_key, {}, resolved_path)
+        lower, upper = _subtree_bounds(root_key)
+        entries: dict[str, CachedDirectory] = {}
+        try:
+            with _open_cache(resolved_path) as conn:
+                rows = conn.execute(
+                    "SELECT path, inode, mtime_ns, vcs, subdirectories, "
+                    "ignore_mtime_ns, ignore_patterns FROM directory "
+                    "WHERE path = ? OR (path >= ? AND path < ?)",
+                    (root_key, lower, upper),
+                )
+                for path, inode, mtime_ns, vcs, subdirs, ignore_mtime, patterns in rows:
+                    entries[path] = CachedDirectory(
+                        inode,
+                        mtime_ns,
+                        vcs,
+                        tuple((name, bool(link)) for name, link in json.loads(subdirs)),
+                        ignore_mtime,
+                        tuple(json.loads(patterns)),
+                    )
+        except (OSError, sqlite3.Error, ValueError) as exc:
+            log.debug("Discover cache unavailable, reading every directory: %s", exc)
+            return cls(root_key, {}, None)
+        return cls(root_key, entries, resolved_path)
+
+    def __len__(self) -> int:
+        """Return the number of cached directories."""
+        return len(self._entries)
+
+    def lookup(self, path: str) -> CachedDirectory | None:
+        """Return the cached listing for ``path``, if any."""
+        return self._entries.get(path)
+
+    def save(
+        self,
+        fresh: Mapping[str, CachedDirectory],
+        *,
+        reused: set[str],
+    ) -> None:
+        """Write back the result of a walk.
+
+        Parameters
+        ----------
+        fresh : Mapping[str, CachedDirectory]
+            Listings of directories that were read during the walk.
+        reused : set[str]
+            Directories whose cached listing the walk used unchanged. Every
+            other cached directory below the root is dropped, since the walk
+            either read it again or no longer reached it.
+        """
+        if self._cache_path is None:
+            return
+        stale = [(path,) for path in self._entries if path not in reused]
+        try:
+            with _open_cache(self._cache_path) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany("DELETE FROM directory WHERE path = ?", stale)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO directory "
+                    "(path, inode, mtime_ns, vcs, subdirectories, "
+                    "ignore_mtime_ns, ignore_patterns) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (
+                            path,
+                            entry.inode,
+                            entry.mtime_ns,
+                            entry.vcs,
+                            json.dumps(entry.subdirectories),
+                            entry.ignore_mtime_ns,
+                            json.dumps(entry.ignore_patterns),
+                        )
+                        for path, entry in fresh.items()
+                    ),
+                )
+        except (OSError, sqlite3.Error) as exc:
+            log.debug("Could not update discover cache: %s", exc)
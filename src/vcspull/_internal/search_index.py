@@ -0,0 +1,418 @@
+"""Field columns and a trigram index for ``vcspull search``.
+
+``vcspull search`` matches regular expressions against four fields of each
+repository: its name, checkout path, URL, and workspace root. Computing those
+values means building a :class:`~vcspull._internal.private_path.PrivatePath`
+per repository, and matching means running each pattern over every row. For
+inventories of tens of thousands of repositories searched once per keystroke
+by a picker, both are too slow.
+
+A :class:`SearchIndex` holds the field values as columns, computed once, and
+maps each trigram of a field's lowercased value to the rows holding it. A
+pattern that is a plain literal (every ``--fixed-strings`` pattern, and a
+regex without metacharacters) can only match rows holding all of its
+trigrams, so :meth:`SearchIndex.candidates` narrows the rows the regex runs
+over. Values that are not ASCII are not indexed and always stay candidates,
+since case-insensitive matching may pair them with ASCII letters.
+
+:func:`load_search_index` keeps the index in the config cache under a key
+fingerprinting the config files (see
+:func:`~vcspull._internal.config_cache.snapshot_key`), so it is rebuilt only
+when they change.
+"""
+
+from __future__ import annotations
+
+import array
+import bisect
+import collections
+import functools
+import logging
+import pathlib
+import re
+import typing as t
+
+from vcspull.config import load_configs
+
+from . import config_cache
+from .parallel_load import capture_logs, replay_logs
+from .private_path import collapse_home
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+    from vcspull.types import ConfigDict
+
+#: Fields of a repository, in the order search results list them.
+SEARCH_FIELDS = ("name", "path", "url", "workspace")
+
+#: Bumped whenever the layout of :class:`SearchIndex` changes, so stored
+#: indexes of the old layout are rebuilt.
+INDEX_VERSION = 1
+
+#: Separates the values of a column; never part of a field value.
+_SEPARATOR = "\0"
+
+#: Rows a trigram may sit in before it counts as common, in small indexes.
+_MIN_COMMON_ROWS = 64
+
+
+def search_fields(repo: ConfigDict, *, home: str | None = None) -> dict[str, str]:
+    """Return the values ``vcspull search`` matches for ``repo``.
+
+    Paths under ``home`` (default: the user's home directory) start with
+    ``~``, as :class:`~vcspull._internal.private_path.PrivatePath` shows them.
+
+    Examples
+    --------
+    >>> search_fields(
+    ...     {
+    ...         "name": "django",
+    ...         "path": "/home/u/code/django",
+    ...         "url": "git+https://github.com/django/django.git",
+    ...         "workspace_root": "/home/u/code/",
+    ...     },
+    ...     home="/home/u",
+    ... )
+    {'name': 'django', 'path': '~/code/django',
+     'url': 'git+https://github.com/django/django.git', 'workspace': '~/code'}
+    """
+    if home is None:
+        home = str(pathlib.Path.home())
+    name = str(repo.get("name", ""))
+    path_value = collapse_home(str(pathlib.Path(repo.get("path", ""))), home=home)
+    url = str(repo.get("url", repo.get("pip_url", "")) or "")
+    workspace_raw = repo.get("workspace_root")
+    if workspace_raw:
+        workspace = _workspace_value(str(workspace_raw), home)
+    else:
+        workspace_path = pathlib.Path(repo.get("path", ""))
+        if workspace_path:
+            workspace_path = workspace_path.expanduser().parent
+        workspace = (
+            collapse_home(str(workspace_path), home=home) if workspace_path else ""
+        )
+    return {
+        "name": name,
+        "path": path_value,
+        "url": url,
+        "workspace": workspace,
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _workspace_value(workspace_root: str, home: str) -> str:
+    """Return the search value of a configured workspace root.
+
+    Many repositories share a root, so the path is only built once per root.
+    ``home`` is part of the cache key, as ``~`` expands to it.
+    """
+    workspace_path = pathlib.Path(workspace_root).expanduser()
+    return collapse_home(str(workspace_path), home=home)
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the three-character substrings of lowercased ``text``.
+
+    Examples
+    --------
+    >>> sorted(trigrams("Flask"))
+    ['ask', 'fla', 'las']
+    >>> trigrams("go")
+    set()
+    """
+    lowered = text.lower()
+    return {lowered[start : start + 3] for start in range(len(lowered) - 2)}
+
+
+class SearchIndex:
+    """Search field values of many repositories, with trigram postings.
+
+    Each field is kept as one string of its values joined by NUL characters,
+    with the offset where each value starts, so a stored index is read back
+    without rebuilding a string per value.
+
+    Examples
+    --------
+    >>> index = SearchIndex(
+    ...     {
+    ...         "name": ["flask", "django", "flask-login"],
+    ...         "path": ["~/code/flask", "~/code/django", "~/code/flask-login"],
+    ...         "url": ["git+https://x/flask", "git+https://x/dj", "git+https://x/fl"],
+    ...         "workspace": ["~/code", "~/code", "~/code"],
+    ...     },
+    ...     workspace_roots=["~/code/", "~/code/", "~/code/"],
+    ... )
+    >>> len(index)
+    3
+    >>> sorted(index.candidates("Flask", ("name",)))
+    [0, 2]
+    >>> index.candidates("fl", ("name",)) is None
+    True
+    >>> index.row(1)["path"]
+    '~/code/django'
+    """
+
+    __slots__ = (
+        "_common",
+        "_keys",
+        "_lowered",
+        "_offsets",
+        "_postings",
+        "_starts",
+        "_texts",
+        "workspace_roots",
+    )
+
+    def __init__(
+        self,
+        columns: Mapping[str, Sequence[str]],
+        *,
+        workspace_roots: Sequence[str],
+    ) -> None:
+        #: Each row's ``workspace_root`` as configured, for ``--workspace``.
+        self.workspace_roots = list(workspace_roots)
+        self._texts: dict[str, str] = {}
+        self._starts: dict[str, array.array[int]] = {}
+        self._lowered: dict[str, str] = {}
+        for field in SEARCH_FIELDS:
+            values = columns[field]
+            starts = array.array("I", [0])
+            for value in values:
+                starts.append(starts[-1] + len(value) + 1)
+            self._texts[field] = _SEPARATOR.join(values)
+            self._starts[field] = starts
+
+        # Keyed by field number, then trigram. Rows whose value is not ASCII
+        # sit under the bare field number and match every query. Trigrams in
+        # more than a quarter of the rows narrow nothing down and are only
+        # remembered as common.
+        postings: dict[str, list[int]] = {}
+        common: set[str] = set()
+        limit = max(len(self) // 4, _MIN_COMMON_ROWS)
+        for field_index, field in enumerate(SEARCH_FIELDS):
+            prefix = str(field_index)
+            field_postings: collections.defaultdict[str, list[int]] = (
+                collections.defaultdict(list)
+            )
+            unindexed: list[int] = []
+            for position, value in enumerate(columns[field]):
+                if not value.isascii():
+                    unindexed.append(position)
+                    continue
+                for gram in trigrams(value):
+                    field_postings[gram].append(position)
+            for gram, rows in field_postings.items():
+                if len(rows) > limit:
+                    common.add(prefix + gram)
+                else:
+                    postings[prefix + gram] = rows
+            if unindexed:
+                postings[prefix] = unindexed
+        self._common = frozenset(common)
+        self._keys = sorted(postings)
+        self._offsets = array.array("I", [0])
+        self._postings = array.array("I")
+        for key in self._keys:
+            self._postings.extend(postings[key])
+            self._offsets.append(len(self._postings))
+
+    @classmethod
+    def from_repos(cls, repos: Iterable[ConfigDict]) -> SearchIndex:
+        """Return the index of ``repos``, in their order."""
+        columns: dict[str, list[str]] = {field: [] for field in SEARCH_FIELDS}
+        workspace_roots: list[str] = []
+        home = str(pathlib.Path.home())
+        for repo in repos:
+            for field, value in search_fields(repo, home=home).items():
+                columns[field].append(value)
+            workspace_roots.append(str(repo.get("workspace_root") or ""))
+        return cls(columns, workspace_roots=workspace_roots)
+
+    def __len__(self) -> int:
+        """Return the number of repositories."""
+        return len(self.workspace_roots)
+
+    def span(self, field: str, position: int) -> tuple[int, int]:
+        """Return where ``field`` of the repository at ``position`` sits.
+
+        The offsets are into the joined column, as :meth:`finditer` reports.
+        """
+        starts = self._starts[field]
+        return starts[position], starts[position + 1] - 1
+
+    def value(self, field: str, position: int) -> str:
+        """Return ``field`` of the repository at ``position``."""
+        start, end = self.span(field, position)
+        return self._texts[field][start:end]
+
+    def row(self, position: int) -> dict[str, str]:
+        """Return every search field of the repository at ``position``."""
+        return {field: self.value(field, position) for field in SEARCH_FIELDS}
+
+    def lowered(self, field: str) -> str:
+        """Return the joined values of ``field`` lowercased, offsets kept.
+
+        Characters whose lowercase form is longer, such as ``İ``, are kept
+        as they are, so positions line up with :meth:`value`.
+        """
+        lowered = self._lowered.get(field)
+        if lowered is None:
+            text = self._texts[field]
+            lowered = text.lower()
+            if len(lowered) != len(text):
+                lowered = "".join(
+                    char.lower() if len(char.lower()) == 1 else char for char in text
+                )
+            self._lowered[field] = lowered
+        return lowered
+
+    def finditer(
+        self,
+        field: str,
+        regex: re.Pattern[str],
+    ) -> Iterator[tuple[int, re.Match[str]]]:
+        r"""Yield ``(row, match)`` for ``regex`` over lowercased ``field``.
+
+        The regex runs once over the joined column rather than once per
+        value, so it must not match the NUL between values. Match offsets
+        are into the joined column, which ``match.string`` holds.
+
+        Examples
+        --------
+        >>> index = SearchIndex(
+        ...     {
+        ...         "name": ["Flask", "django", "flask-login"],
+        ...         "path": ["", "", ""],
+        ...         "url": ["", "", ""],
+        ...         "workspace": ["", "", ""],
+        ...     },
+        ...     workspace_roots=["", "", ""],
+        ... )
+        >>> [row for row, _ in index.finditer("name", re.compile("fl[^\0]*"))]
+        [0, 2]
+        """
+        starts = self._starts[field]
+        for match in regex.finditer(self.lowered(field)):
+            yield bisect.bisect_right(starts, match.start()) - 1, match
+
+    def _posting(self, key: str) -> Sequence[int]:
+        """Return the rows stored under ``key``."""
+        slot = bisect.bisect_left(self._keys, key)
+        if slot == len(self._keys) or self._keys[slot] != key:
+            return ()
+        return self._postings[self._offsets[slot] : self._offsets[slot + 1]]
+
+    def candidates(self, literal: str, fields: Iterable[str]) -> set[int] | None:
+        """Return the rows whose ``fields`` may contain ``literal``.
+
+        ``None`` means every row may: the literal is shorter than a trigram,
+        is not ASCII, or only has common trigrams.
+        """
+        grams = trigrams(literal)
+        if not grams or not literal.isascii():
+            return None
+        rows: set[int] = set()
+        for field in fields:
+            prefix = str(SEARCH_FIELDS.index(field))
+            postings = sorted(
+                (
+                    self._posting(prefix + gram)
+                    for gram in grams
+                    if prefix + gram not in self._common
+                ),
+                key=len,
+            )
+            if not postings:
+                return None
+            matched = set(postings[0])
+            for posting in postings[1:]:
+                if not matched:
+                    break
+                matched.intersection_update(posting)
+            rows |= matched
+            rows.update(self._posting(prefix))
+        return rows
+
+    def __getstate__(self) -> tuple[t.Any, ...]:
+        """Return the joined columns and flat arrays, tagged with the layout."""
+        return (
+            INDEX_VERSION,
+            self.workspace_roots,
+            self._texts,
+            self._starts,
+            sorted(self._common),
+            self._keys,
+            self._offsets,
+            self._postings,
+        )
+
+    def __setstate__(self, state: tuple[t.Any, ...]) -> None:
+        """Restore the form :meth:`__getstate__` returned."""
+        version, *fields = state
+        if version != INDEX_VERSION:
+            msg = f"search index version {version} is not {INDEX_VERSION}"
+            raise ValueError(msg)
+        (
+            self.workspace_roots,
+            self._texts,
+            self._starts,
+            common,
+            self._keys,
+            self._offsets,
+            self._postings,
+        ) = fields
+        self._common = frozenset(common)
+        self._lowered = {}
+
+
+def load_search_index(
+    files: Sequence[pathlib.Path],
+    *,
+    cwd: pathlib.Path | None = None,
+) -> SearchIndex:
+    r"""Return the search index of ``files``, reusing a stored one if current.
+
+    Loads are the same as :func:`~vcspull.config.load_configs` and log the
+    same messages. A load that logs anything above debug level, such as
+    merged duplicate workspace roots, is not stored, so the message shows
+    again on the next search.
+
+    Examples
+    --------
+    >>> config = tmp_path / ".vcspull.yaml"
+    >>> _ = config.write_text("~/code/:\n  flask: git+https://x/flask.git\n")
+    >>> index = load_search_index([config])
+    >>> index.row(0)["name"], len(index)
+    ('flask', 1)
+    >>> load_search_index([config]).row(0) == index.row(0)
+    True
+    """
+    if cwd is None:
+        cwd = pathlib.Path.cwd()
+    key = (
+        config_cache.snapshot_key(
+            files,
+            cwd=cwd,
+            options={"search_index": INDEX_VERSION},
+        )
+        if config_cache.config_cache_enabled()
+        else None
+    )
+    if key is not None:
+        stored = config_cache.load_search_index(key)
+        if isinstance(stored, SearchIndex):
+            return stored
+
+    records: list[logging.LogRecord] = []
+    try:
+        with capture_logs() as records:
+            repos = load_configs(list(files), cwd=cwd)
+    finally:
+        replay_logs(records)
+    index = SearchIndex.from_repos(repos)
+    if key is not None and not any(
+        record.levelno > logging.DEBUG for record in records
+    ):
+        config_cache.store_search_index(key, index)
+    return index
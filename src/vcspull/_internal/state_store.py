@@ -0,0 +1,493 @@
+"""Local SQLite store of the last observed state of each repository.
+
+``vcspull sync``, ``vcspull status``, and ``vcspull sync --dry-run`` record what
+they saw about each checkout (HEAD, branch, ahead/behind, cleanliness, last
+fetch, last sync duration). ``vcspull list --dirty`` and ``vcspull status
+--from-cache`` read it back without running git, so shell prompts and
+dashboards can poll it cheaply.
+
+The store is a cache: writes are best effort and never fail a command, and a
+schema change simply discards old rows.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import logging
+import os
+import pathlib
+import sqlite3
+import time
+import typing as t
+
+from vcspull._internal.git_probe import read_head_revision
+from vcspull.util import get_cache_dir
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from typing_extensions import Self
+
+log = logging.getLogger(__name__)
+
+STATE_DB_NAME = "state.sqlite3"
+
+#: Bumped whenever the ``repo_state`` columns change; older stores are dropped.
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS repo_state (
+    path TEXT PRIMARY KEY,
+    name TEXT,
+    workspace_root TEXT,
+    present INTEGER,
+    is_git INTEGER,
+    head TEXT,
+    branch TEXT,
+    ahead INTEGER,
+    behind INTEGER,
+    clean INTEGER,
+    last_fetch REAL,
+    last_sync_duration REAL,
+    observed_at REAL NOT NULL,
+    clean_observed_at REAL,
+    behind_observed_at REAL
+)
+"""
+
+#: Columns a caller may record; ``path`` and the ``*observed_at`` columns are
+#: managed here.
+STATE_FIELDS: tuple[str, ...] = (
+    "name",
+    "workspace_root",
+    "present",
+    "is_git",
+    "head",
+    "branch",
+    "ahead",
+    "behind",
+    "clean",
+    "last_fetch",
+    "last_sync_duration",
+)
+
+_BOOL_FIELDS = frozenset({"present", "is_git", "clean"})
+
+#: Fields that keep their own observation time, since not every command that
+#: writes a row measures them. Others go by the row's ``observed_at``.
+_TIMED_FIELDS: dict[str, str] = {
+    "clean": "clean_observed_at",
+    "behind": "behind_observed_at",
+}
+
+
+@dataclasses.dataclass
+class RepoState:
+    """Last recorded observations for one checkout.
+
+    Attributes
+    ----------
+    path : str
+        Absolute checkout path; the store's key.
+    observed_at : float
+        Unix time of the most recent observation of any field.
+    name : str | None
+        Repository name as configured when last recorded.
+    workspace_root : str | None
+        Workspace root label as configured when last recorded.
+    present : bool | None
+        Whether the checkout existed on disk; ``None`` when never checked.
+    is_git : bool | None
+        Whether the checkout is a git working tree.
+    head : str | None
+        Commit ``HEAD`` pointed at.
+    branch : str | None
+        Branch checked out; ``None`` when detached or unknown.
+    ahead : int | None
+        Commits the branch held that its upstream lacked; ``None`` when not
+        measured since the last sync moved the branch.
+    behind : int | None
+        Commits the upstream held that the branch lacked; ``None`` when not
+        measured since the last sync moved the branch.
+    clean : bool | None
+        ``True`` when the working tree had no uncommitted changes.
+    last_fetch : float | None
+        Unix time remote refs were last refreshed by vcspull.
+    last_sync_duration : float | None
+        Seconds the last successful ``vcspull sync`` of this checkout took.
+    clean_observed_at : float | None
+        Unix time ``clean`` was recorded; a sync does not measure it.
+    behind_observed_at : float | None
+        Unix time ahead/behind counts were recorded or cleared.
+    """
+
+    path: str
+    observed_at: float
+    name: str | None = None
+    workspace_root: str | None = None
+    present: bool | None = None
+    is_git: bool | None = None
+    head: str | None = None
+    branch: str | None = None
+    ahead: int | None = None
+    behind: int | None = None
+    clean: bool | None = None
+    last_fetch: float | None = None
+    last_sync_duration: float | None = None
+    clean_observed_at: float | None = None
+    behind_observed_at: float | None = None
+
+    def observed_since(self, field: str, cutoff: float | None) -> bool:
+        """Whether ``field`` was recorded at or after the Unix time ``cutoff``.
+
+        ``clean`` and ``behind`` go by their own observation time, other
+        fields by :attr:`observed_at`. A ``cutoff`` of ``None`` accepts any.
+
+        Examples
+        --------
+        >>> state = RepoState(path="/src/a", observed_at=20.0, clean_observed_at=5.0)
+        >>> state.observed_since("present", 10.0), state.observed_since("clean", 10.0)
+        (True, False)
+        >>> RepoState(path="/src/a", observed_at=20.0).observed_since("behind", None)
+        True
+        """
+        if cutoff is None:
+            return True
+        timed = _TIMED_FIELDS.get(field)
+        observed_at = self.observed_at if timed is None else getattr(self, timed)
+        return observed_at is not None and observed_at >= cutoff
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether the working tree was last seen with uncommitted changes.
+
+        Examples
+        --------
+        >>> RepoState(path="/src/a", observed_at=0.0, clean=False).is_dirty
+        True
+        >>> RepoState(path="/src/a", observed_at=0.0).is_dirty
+        False
+        """
+        return self.present is not False and self.clean is False
+
+    @property
+    def is_behind(self) -> bool:
+        """Whether the branch was last seen behind its upstream.
+
+        Examples
+        --------
+        >>> RepoState(path="/src/a", observed_at=0.0, behind=2).is_behind
+        True
+        >>> RepoState(path="/src/a", observed_at=0.0, behind=0).is_behind
+        False
+        """
+        return self.present is not False and (self.behind or 0) > 0
+
+    @property
+    def is_missing(self) -> bool:
+        """Whether the checkout was last seen absent from disk.
+
+        Examples
+        --------
+        >>> RepoState(path="/src/a", observed_at=0.0, present=False).is_missing
+        True
+        """
+        return self.present is False
+
+
+def default_state_path() -> pathlib.Path:
+    """Return where the state store lives, inside :func:`get_cache_dir`.
+
+    Examples
+    --------
+    >>> default_state_path().name
+    'state.sqlite3'
+    """
+    return get_cache_dir() / STATE_DB_NAME
+
+
+def state_key(path: str | os.PathLike[str]) -> str:
+    """Return the store key for a checkout path: absolute, ``~`` expanded.
+
+    Symlinks are left alone, so the key matches the configured path without a
+    ``realpath`` syscall per repository.
+
+    Examples
+    --------
+    >>> state_key("/src/a/../b")
+    '/src/b'
+    >>> state_key("~/code/a") == str(pathlib.Path.home() / "code" / "a")
+    True
+    """
+    return os.path.normpath(pathlib.Path(path).expanduser().absolute())
+
+
+class StateStore:
+    """Read and write :class:`RepoState` rows in a SQLite database.
+
+    Writes made inside the ``with`` block commit together on exit.
+
+    Examples
+    --------
+    >>> db_path = tmp_path / "state.sqlite3"
+    >>> with StateStore(db_path) as store:
+    ...     store.record("/src/a", present=True, clean=False, observed_at=10.0)
+    ...     store.record("/src/a", branch="main", observed_at=20.0)
+    >>> with StateStore(db_path) as store:
+    ...     state = store.get("/src/a")
+    >>> (state.clean, state.branch, state.observed_at, state.clean_observed_at)
+    (False, 'main', 20.0, 10.0)
+    """
+
+    def __init__(self, db_path: pathlib.Path | None = None) -> None:
+        self.db_path = db_path if db_path is not None else default_state_path()
+        self._conn: sqlite3.Connection | None = None
+
+    def __enter__(self) -> Self:
+        """Open the database, creating it and its schema when missing."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS repo_state")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            # WAL lets prompt/dashboard readers poll while a sync writes.
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(_SCHEMA)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        self._conn = conn
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Commit pending writes, unless the block raised, and close."""
+        conn = self._require_conn()
+        try:
+            if exc_info[0] is None:
+                conn.commit()
+        finally:
+            conn.close()
+            self._conn = None
+
+    def _require_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            msg = "StateStore must be used as a context manager"
+            raise RuntimeError(msg)
+        return self._conn
+
+    def record(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        observed_at: float | None = None,
+        **fields: t.Any,
+    ) -> None:
+        """Upsert the given fields for ``path``, leaving other fields as they were.
+
+        Only fields that were actually observed should be passed: a status
+        check that did not measure ahead/behind must not erase the counts a
+        previous detailed check recorded. ``clean`` and ``behind`` also stamp
+        their own observation time, so a later write of other fields does not
+        make them look recent.
+
+        Raises
+        ------
+        ValueError
+            If a field name is not one of :data:`STATE_FIELDS`.
+
+        Examples
+        --------
+        >>> with StateStore(tmp_path / "state.sqlite3") as store:
+        ...     store.record("/src/a", colour="blue")
+        Traceback (most recent call last):
+        ...
+        ValueError: unknown state field(s): colour
+        """
+        unknown = sorted(set(fields) - set(STATE_FIELDS))
+        if unknown:
+            msg = f"unknown state field(s): {', '.join(unknown)}"
+            raise ValueError(msg)
+        if observed_at is None:
+            observed_at = time.time()
+        timed = [column for field, column in _TIMED_FIELDS.items() if field in fields]
+        columns = ["path", "observed_at", *fields, *timed]
+        values = [
+            state_key(path),
+            observed_at,
+            *fields.values(),
+            *(observed_at for _ in timed),
+        ]
+        assignments = ", ".join(f"{col} = excluded.{col}" for col in columns[1:])
+        placeholders = ", ".join("?" for _ in columns)
+        self._require_conn().execute(
+            f"INSERT INTO repo_state ({', '.join(columns)}) "
+            f"VALUES ({placeholders}) "
+            f"ON CONFLICT(path) DO UPDATE SET {assignments}",
+            values,
+        )
+
+    def get(self, path: str | os.PathLike[str]) -> RepoState | None:
+        """Return the recorded state for ``path``, or ``None`` if never seen.
+
+        Examples
+        --------
+        >>> with StateStore(tmp_path / "state.sqlite3") as store:
+        ...     store.get("/never/seen") is None
+        True
+        """
+        return self.get_many([path]).get(state_key(path))
+
+    def get_many(
+        self,
+        paths: Iterable[str | os.PathLike[str]],
+        *,
+        max_age: float | None = None,
+    ) -> dict[str, RepoState]:
+        """Return recorded states keyed by :func:`state_key`.
+
+        Paths never recorded, or last observed more than ``max_age`` seconds
+        ago, are absent from the result. A returned row may still hold older
+        ``clean`` or ``behind`` values; check them with
+        :meth:`RepoState.observed_since`.
+
+        Examples
+        --------
+        >>> with StateStore(tmp_path / "state.sqlite3") as store:
+        ...     store.record("/src/old", present=True, observed_at=0.0)
+        ...     store.record("/src/new", present=True)
+        ...     sorted(store.get_many(["/src/old", "/src/new"], max_age=60))
+        ['/src/new']
+        """
+        keys = [state_key(path) for path in paths]
+        if not keys:
+            return {}
+        conn = self._require_conn()
+        cutoff = None if max_age is None else time.time() - max_age
+        select = ", ".join(
+            ("path", "observed_at", *_TIMED_FIELDS.values(), *STATE_FIELDS),
+        )
+        states: dict[str, RepoState] = {}
+        # Stay under SQLite's bound-parameter limit on very large configs.
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            query = (
+                f"SELECT {select} FROM repo_state "
+                f"WHERE path IN ({', '.join('?' for _ in chunk)})"
+            )
+            params: list[t.Any] = list(chunk)
+            if cutoff is not None:
+                query += " AND observed_at >= ?"
+                params.append(cutoff)
+            for row in conn.execute(query, params):
+                state = _row_to_state(row)
+                states[state.path] = state
+        return states
+
+
+def _row_to_state(row: tuple[t.Any, ...]) -> RepoState:
+    """Build a :class:`RepoState` from a row selected by :meth:`StateStore.get_many`."""
+    columns = (*_TIMED_FIELDS.values(), *STATE_FIELDS)
+    values = dict(zip(columns, row[2:], strict=True))
+    for field in _BOOL_FIELDS:
+        if values[field] is not None:
+            values[field] = bool(values[field])
+    return RepoState(path=row[0], observed_at=row[1], **values)
+
+
+def record_states(
+    observations: Mapping[str, Mapping[str, t.Any]],
+    *,
+    db_path: pathlib.Path | None = None,
+) -> None:
+    """Record observations for many checkouts in one transaction, best effort.
+
+    ``observations`` maps a checkout path to the fields observed for it. A
+    store that cannot be opened or written is logged at debug level and
+    otherwise ignored, so a read-only cache directory never fails a command.
+
+    Examples
+    --------
+    >>> record_states(
+    ...     {"/src/a": {"present": True, "clean": True}},
+    ...     db_path=tmp_path / "state.sqlite3",
+    ... )
+    >>> with StateStore(tmp_path / "state.sqlite3") as store:
+    ...     store.get("/src/a").clean
+    True
+    """
+    if not observations:
+        return
+    now = time.time()
+    try:
+        with StateStore(db_path) as store:
+            for path, fields in observations.items():
+                store.record(path, observed_at=now, **fields)
+    except (OSError, sqlite3.Error) as exc:
+        log.debug("Could not record repository state: %s", exc)
+
+
+@contextlib.contextmanager
+def open_state_store(
+    db_path: pathlib.Path | None = None,
+) -> Iterator[StateStore | None]:
+    """Open the store for reading, yielding ``None`` when it is unavailable.
+
+    Examples
+    --------
+    >>> with open_state_store(tmp_path / "state.sqlite3") as store:
+    ...     store is not None
+    True
+    """
+    try:
+        store = StateStore(db_path).__enter__()
+    except (OSError, sqlite3.Error) as exc:
+        log.debug("Could not open repository state store: %s", exc)
+        yield None
+        return
+    try:
+        yield store
+    finally:
+        store.__exit__(None, None, None)
+
+
+def status_observation(
+    status: Mapping[str, t.Any],
+    *,
+    detailed: bool,
+) -> dict[str, t.Any]:
+    """Turn a ``check_repo_status`` result into fields for :meth:`StateStore.record`.
+
+    Branch and ahead/behind are only recorded for detailed checks, which are
+    the only ones that measure them. ``HEAD`` is read from disk.
+
+    Examples
+    --------
+    >>> repo = create_git_remote_repo()
+    >>> fields = status_observation(
+    ...     {"name": "a", "path": str(repo), "workspace_root": "~/code/",
+    ...      "exists": True, "is_git": True, "clean": True},
+    ...     detailed=False,
+    ... )
+    >>> sorted(fields)
+    ['clean', 'head', 'is_git', 'name', 'present', 'workspace_root']
+    """
+    fields: dict[str, t.Any] = {
+        "name": status.get("name"),
+        "workspace_root": str(status.get("workspace_root", "")),
+        "present": bool(status.get("exists")),
+    }
+    if not status.get("exists"):
+        return fields
+    fields["is_git"] = bool(status.get("is_git"))
+    if status.get("is_git"):
+        fields["clean"] = status.get("clean")
+        repo_path = pathlib.Path(str(status["path"])).expanduser()
+        fields["head"] = read_head_revision(repo_path)
+        if detailed:
+            fields["branch"] = status.get("branch")
+            fields["ahead"] = status.get("ahead")
+            fields["behind"] = status.get("behind")
+    return fields
@@ -0,0 +1,96 @@
+"""Read Subversion working copy metadata from disk without spawning ``svn``.
+
+Since Subversion 1.7 a working copy keeps its state in a single SQLite
+database, ``.svn/wc.db``. The repository root URL lives in its ``REPOSITORY``
+table and the working copy root's path inside that repository in ``NODES``,
+so the URL ``svn info`` would print can be read with :mod:`sqlite3`. The
+database is opened read-only; older working copies, or databases that cannot
+be read, yield ``None`` so callers can fall back to ``svn info``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import pathlib
+import sqlite3
+import urllib.parse
+
+log = logging.getLogger(__name__)
+
+WC_DB_PATH = pathlib.PurePosixPath(".svn", "wc.db")
+
+#: Characters ``svn`` leaves unescaped in the path part of a URL.
+_URL_SAFE = "/!$&'()*+,-.:=@_~"
+
+_ROOT_NODE_QUERY = (
+    "SELECT repository.root, nodes.repos_path FROM nodes "
+    "JOIN repository ON repository.id = nodes.repos_id "
+    "WHERE nodes.local_relpath = '' AND nodes.op_depth = 0 "
+    "ORDER BY nodes.wc_id LIMIT 1"
+)
+
+
+def join_repository_url(root: str, repos_path: str) -> str:
+    """Return the URL of ``repos_path`` inside the repository at ``root``.
+
+    Examples
+    --------
+    >>> join_repository_url("https://svn.example.com/repo", "trunk")
+    'https://svn.example.com/repo/trunk'
+    >>> join_repository_url("https://svn.example.com/repo", "")
+    'https://svn.example.com/repo'
+    >>> join_repository_url("svn://example.com/r", "branches/a b")
+    'svn://example.com/r/branches/a%20b'
+    """
+    if not repos_path:
+        return root
+    return f"{root.rstrip('/')}/{urllib.parse.quote(repos_path, safe=_URL_SAFE)}"
+
+
+def read_working_copy_url(repo_path: pathlib.Path) -> str | None:
+    """Return the URL a Subversion working copy was checked out from.
+
+    Parameters
+    ----------
+    repo_path : pathlib.Path
+        Working copy root (the directory holding ``.svn``).
+
+    Returns
+    -------
+    str | None
+        The URL, or ``None`` when ``wc.db`` is missing or unreadable.
+
+    Examples
+    --------
+    >>> (tmp_path / ".svn").mkdir()
+    >>> read_working_copy_url(tmp_path) is None
+    True
+    >>> import sqlite3
+    >>> conn = sqlite3.connect(tmp_path / ".svn" / "wc.db")
+    >>> _ = conn.executescript(
+    ...     "CREATE TABLE repository (id INTEGER PRIMARY KEY, root TEXT, uuid TEXT);"
+    ...     "CREATE TABLE nodes (wc_id INTEGER, local_relpath TEXT, "
+    ...     "op_depth INTEGER, repos_id INTEGER, repos_path TEXT);"
+    ...     "INSERT INTO repository VALUES (1, 'https://svn.example.com/r', 'u');"
+    ...     "INSERT INTO nodes VALUES (1, '', 0, 1, 'trunk');"
+    ... )
+    >>> conn.commit()
+    >>> conn.close()
+    >>> read_working_copy_url(tmp_path)
+    'https://svn.example.com/r/trunk'
+    """
+    wc_db = repo_path / WC_DB_PATH
+    if not wc_db.is_file():
+        return None
+    try:
+        conn = sqlite3.connect(f"{wc_db.as_uri()}?mode=ro", uri=True)
+        with contextlib.closing(conn):
+            row = conn.execute(_ROOT_NODE_QUERY).fetchone()
+    except sqlite3.Error as exc:
+        log.debug("Could not read %s: %s", wc_db, exc)
+        return None
+    if row is None or not row[0]:
+        return None
+    root, repos_path = row
+    return join_repository_url(root, repos_path or "")
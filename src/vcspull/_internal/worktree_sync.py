@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import enum
 import logging
+import os
 import pathlib
 import subprocess
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
 
 from vcspull import exc
 from vcspull.types import WorktreeConfigDict
 
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable
+
 log = logging.getLogger(__name__)
 
+#: Worktrees planned or synced at once. Mostly bounded by git subprocesses,
+#: not CPU, so it may exceed the core count.
+DEFAULT_WORKTREE_CONCURRENCY = max(1, min(16, (os.cpu_count() or 4) * 2))
+
 
 class WorktreeAction(enum.Enum):
     """Actions that can be taken on a worktree during sync."""
@@ -84,6 +97,9 @@ class WorktreePlanEntry:
     checks: list[WorktreeCheck] = dataclasses.field(default_factory=list)
     """Ordered audit trail of checks performed during planning."""
 
+    duration_ms: int | None = None
+    """Wall time spent planning and applying this worktree, when synced."""
+
 
 @dataclasses.dataclass
 class WorktreeSyncResult:
@@ -107,6 +123,138 @@ class WorktreeSyncResult:
     errors: int = 0
     """Number of worktrees that encountered errors."""
 
+    duration_ms: int = 0
+    """Wall time for the whole repository; see each entry for its own."""
+
+    def add(self, entry: WorktreePlanEntry) -> None:
+        """Append ``entry`` and count it under its action.
+
+        Examples
+        --------
+        >>> result = WorktreeSyncResult()
+        >>> result.add(
+        ...     WorktreePlanEntry(
+        ...         worktree_path=pathlib.Path("/wt"),
+        ...         ref_type="tag",
+        ...         ref_value="v1",
+        ...         action=WorktreeAction.CREATE,
+        ...     )
+        ... )
+        >>> (len(result.entries), result.created)
+        (1, 1)
+        """
+        self.entries.append(entry)
+        if entry.action == WorktreeAction.CREATE:
+            self.created += 1
+        elif entry.action == WorktreeAction.UPDATE:
+            self.updated += 1
+        elif entry.action == WorktreeAction.UNCHANGED:
+            self.unchanged += 1
+        elif entry.action == WorktreeAction.BLOCKED:
+            self.blocked += 1
+        elif entry.action == WorktreeAction.ERROR:
+            self.errors += 1
+
+
+@dataclasses.dataclass
+class WorktreeSyncJob:
+    """One repository's worktrees, queued for :func:`sync_worktree_jobs`."""
+
+    repo_path: pathlib.Path
+    """Path to the main repository."""
+
+    worktrees_config: list[WorktreeConfigDict]
+    """Worktrees configured for the repository."""
+
+    workspace_root: pathlib.Path
+    """Workspace root used to resolve relative worktree paths."""
+
+
+@dataclasses.dataclass
+class LinkedWorktree:
+    """A linked worktree as reported by ``git worktree list --porcelain``."""
+
+    path: pathlib.Path
+    """Resolved worktree directory."""
+
+    head: str | None = None
+    """Commit the worktree's HEAD points at."""
+
+    branch: str | None = None
+    """Checked-out branch name, or None when detached."""
+
+    locked: bool = False
+    """Whether the worktree is locked against pruning."""
+
+    prunable: bool = False
+    """Whether git considers the registration stale (directory gone)."""
+
+
+@dataclasses.dataclass
+class WorktreeSnapshot:
+    """Worktrees and refs of one repository, captured with a fixed few git calls.
+
+    Answers "does this ref exist", "is this worktree registered", and "where is
+    its HEAD" for every configured worktree, instead of spawning git once per
+    question per worktree.
+    """
+
+    repo_path: pathlib.Path
+    """Path to the main repository."""
+
+    worktrees: dict[pathlib.Path, LinkedWorktree] = dataclasses.field(
+        default_factory=dict,
+    )
+    """Linked worktrees keyed by resolved path; the main worktree is excluded."""
+
+    refs: frozenset[str] = frozenset()
+    """Local branches, tags, and ``origin`` remote-tracking refs, fully qualified."""
+
+    commits: frozenset[str] = frozenset()
+    """Commit-ish values that were asked about and resolve to a commit."""
+
+    def has_ref(self, ref: str, ref_type: str) -> bool:
+        """Return whether ``ref`` of ``ref_type`` exists in the repository.
+
+        Branches match a local branch or, failing that, ``origin/<ref>``.
+        Commits match only if they were passed to :func:`snapshot_worktrees`.
+
+        Examples
+        --------
+        >>> snapshot = WorktreeSnapshot(
+        ...     pathlib.Path("/repo"),
+        ...     refs=frozenset({"refs/tags/v1.0.0", "refs/remotes/origin/dev"}),
+        ... )
+        >>> snapshot.has_ref("v1.0.0", "tag")
+        True
+        >>> snapshot.has_ref("dev", "branch")
+        True
+        >>> snapshot.has_ref("v1.0.0", "branch")
+        False
+        """
+        if ref_type == "tag":
+            return f"refs/tags/{ref}" in self.refs
+        if ref_type == "branch":
+            return (
+                f"refs/heads/{ref}" in self.refs
+                or f"refs/remotes/origin/{ref}" in self.refs
+            )
+        return ref in self.commits
+
+    def get(self, worktree_path: pathlib.Path) -> LinkedWorktree | None:
+        """Return the registered worktree at ``worktree_path`` if it is on disk.
+
+        Examples
+        --------
+        >>> snapshot = WorktreeSnapshot(pathlib.Path("/repo"))
+        >>> snapshot.get(pathlib.Path("/nonexistent")) is None
+        True
+        """
+        linked = self.worktrees.get(worktree_path)
+        if linked is None or linked.prunable or not worktree_path.is_dir():
+            return None
+        return linked
+
 
 def _get_ref_type_and_value(
     wt_config: WorktreeConfigDict,
@@ -262,160 +410,140 @@ def _is_worktree_dirty(worktree_path: pathlib.Path) -> bool:
         return True
 
 
-def _ref_exists(repo_path: pathlib.Path, ref: str, ref_type: str) -> bool:
-    """Check if a reference exists in the repository.
-
-    Parameters
-    ----------
-    repo_path : pathlib.Path
-        Path to the main repository.
-    ref : str
-        The reference to check.
-    ref_type : str
-        Type of reference: 'tag', 'branch', or 'commit'.
-
-    Returns
-    -------
-    bool
-        True if the reference exists.
-
-    Examples
-    --------
-    >>> import pathlib
-    >>> _ref_exists(pathlib.Path("/nonexistent/repo"), "v1.0.0", "tag")
-    False
-    >>> _ref_exists(pathlib.Path("/nonexistent/repo"), "main", "branch")
-    False
-    """
-    try:
-        if ref_type == "tag":
-            result = subprocess.run(
-                ["git", "rev-parse", f"refs/tags/{ref}"],
-                cwd=repo_path,
-                capture_output=True,
-                check=False,
-            )
-        elif ref_type == "branch":
-            # Check local branch namespace explicitly (not tags/notes)
-            result = subprocess.run(
-                ["git", "rev-parse", "--verify", f"refs/heads/{ref}"],
-                cwd=repo_path,
-                capture_output=True,
-                check=False,
-            )
-            if result.returncode != 0:
-                # Try remote-tracking branch namespace
-                result = subprocess.run(
-                    ["git", "rev-parse", "--verify", f"refs/remotes/origin/{ref}"],
-                    cwd=repo_path,
-                    capture_output=True,
-                    check=False,
-                )
-        else:  # commit
-            result = subprocess.run(
-                ["git", "rev-parse", "--verify", f"{ref}^{{commit}}"],
-                cwd=repo_path,
-                capture_output=True,
-                check=False,
-            )
-    except (FileNotFoundError, OSError):
-        return False
-    else:
-        return result.returncode == 0
-
-
-def _get_worktree_head(worktree_path: pathlib.Path) -> str | None:
-    """Get the current HEAD reference of a worktree.
-
-    Parameters
-    ----------
-    worktree_path : pathlib.Path
-        Path to the worktree.
-
-    Returns
-    -------
-    str | None
-        The HEAD reference or None if unable to determine.
-
-    Examples
-    --------
-    >>> import pathlib
-    >>> _get_worktree_head(pathlib.Path("/nonexistent/worktree")) is None
-    True
-    """
+def _git_output(repo_path: pathlib.Path, *args: str, stdin: str | None = None) -> str:
+    """Return stdout of a git command, or an empty string if it fails."""
     try:
         result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=worktree_path,
+            ["git", *args],
+            cwd=repo_path,
+            input=stdin,
             capture_output=True,
             text=True,
             check=False,
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
     except (FileNotFoundError, OSError) as e:
-        # Expected when worktree_path doesn't exist or git binary not found.
-        # Return None to indicate HEAD could not be determined.
-        log.debug("Could not get HEAD for %s: %s", worktree_path, e)
-    return None
+        log.debug("git %s failed in %s: %s", args[0], repo_path, e)
+        return ""
+    return result.stdout if result.returncode == 0 else ""
+
 
+def _list_linked_worktrees(
+    repo_path: pathlib.Path,
+) -> dict[pathlib.Path, LinkedWorktree]:
+    """Parse ``git worktree list --porcelain`` into linked worktrees.
+
+    Examples
+    --------
+    >>> _list_linked_worktrees(pathlib.Path("/nonexistent/repo"))
+    {}
+    """
+    output = _git_output(repo_path, "worktree", "list", "--porcelain")
+    if not output:
+        return {}
+    main_path = repo_path.resolve()
+    worktrees: dict[pathlib.Path, LinkedWorktree] = {}
+    for block in output.strip().split("\n\n"):
+        linked: LinkedWorktree | None = None
+        bare = False
+        for line in block.splitlines():
+            key, _, value = line.partition(" ")
+            if key == "worktree":
+                linked = LinkedWorktree(path=pathlib.Path(value).resolve())
+            elif linked is None:
+                continue
+            elif key == "HEAD":
+                linked.head = value or None
+            elif key == "branch":
+                linked.branch = value.removeprefix("refs/heads/")
+            elif key == "locked":
+                linked.locked = True
+            elif key == "prunable":
+                linked.prunable = True
+            elif key == "bare":
+                bare = True
+        # Skip the main worktree (the repo itself)
+        if linked is not None and not bare and linked.path != main_path:
+            worktrees[linked.path] = linked
+    return worktrees
+
+
+def snapshot_worktrees(
+    repo_path: pathlib.Path,
+    *,
+    commits: Iterable[str] = (),
+) -> WorktreeSnapshot:
+    """Capture a repository's worktrees and refs in one pass.
 
-def _worktree_exists(repo_path: pathlib.Path, worktree_path: pathlib.Path) -> bool:
-    """Check if a worktree is registered in the repository.
+    Runs ``git worktree list --porcelain`` and ``git for-each-ref``, plus one
+    ``git cat-file --batch-check`` when ``commits`` is non-empty, regardless
+    of how many worktrees are configured. A repository that cannot be read
+    yields an empty snapshot, so every ref check fails.
 
     Parameters
     ----------
     repo_path : pathlib.Path
         Path to the main repository.
-    worktree_path : pathlib.Path
-        Path to check for worktree.
+    commits : Iterable[str]
+        Commit SHAs (or other commit-ish values) to verify.
 
     Returns
     -------
-    bool
-        True if the worktree exists and is registered.
+    WorktreeSnapshot
+        Snapshot answering ref, registration, and HEAD questions.
 
     Examples
     --------
-    >>> import pathlib
-    >>> _worktree_exists(pathlib.Path("/repo"), pathlib.Path("/nonexistent"))
-    False
-    >>> repo_dir = tmp_path / "repo"
-    >>> repo_dir.mkdir()
-    >>> _worktree_exists(repo_dir, tmp_path / "missing")
+    >>> import subprocess
+    >>> repo = create_git_remote_repo()
+    >>> sha = subprocess.run(
+    ...     ["git", "rev-parse", "HEAD"],
+    ...     cwd=repo, capture_output=True, text=True, check=True,
+    ... ).stdout.strip()
+    >>> _ = subprocess.run(
+    ...     ["git", "worktree", "add", "--detach", str(tmp_path / "wt"), "HEAD"],
+    ...     cwd=repo, capture_output=True, check=True,
+    ... )
+    >>> snapshot = snapshot_worktrees(repo, commits=[sha, "0" * 40])
+    >>> snapshot.has_ref("master", "branch"), snapshot.has_ref(sha, "commit")
+    (True, True)
+    >>> snapshot.has_ref("0" * 40, "commit")
     False
+    >>> snapshot.get((tmp_path / "wt").resolve()).head == sha
+    True
+    >>> snapshot_worktrees(tmp_path / "missing").refs
+    frozenset()
     """
-    if not worktree_path.exists():
-        return False
-
-    # Check if it's a valid git worktree pointing to this repo
-    git_file = worktree_path / ".git"
-    if git_file.is_file():
-        try:
-            content = git_file.read_text().strip()
-            # Worktrees have "gitdir: <path>/.git/worktrees/<name>"
-            # Submodules have "gitdir: <path>/.git/modules/<name>"
-            if not content.startswith("gitdir:") or "/worktrees/" not in content:
-                return False
-            # Verify it points back to the expected repo's worktrees directory
-            gitdir = content.split("gitdir:", 1)[1].strip()
-            gitdir_path = pathlib.Path(gitdir)
-            if not gitdir_path.is_absolute():
-                gitdir_path = (worktree_path / gitdir_path).resolve()
-            repo_git_dir = (repo_path / ".git").resolve()
-            try:
-                gitdir_path.relative_to(repo_git_dir)
-            except ValueError:
-                return False
-            else:
-                return True
-        except (OSError, PermissionError):
-            return False
-    if git_file.is_dir():
-        # This is a regular repository, not a worktree
-        return False
-
-    return False
+    worktrees = _list_linked_worktrees(repo_path)
+    refs = _git_output(
+        repo_path,
+        "for-each-ref",
+        "--format=%(refname)",
+        "refs/heads",
+        "refs/tags",
+        "refs/remotes/origin",
+    ).split()
+
+    wanted = list(dict.fromkeys(commits))
+    verified: set[str] = set()
+    if wanted:
+        output = _git_output(
+            repo_path,
+            "cat-file",
+            "--batch-check=%(objecttype)",
+            stdin="".join(f"{commit}^{{commit}}\n" for commit in wanted),
+        )
+        # One output line per input line, in order; unknown objects print
+        # "<input> missing" (or "ambiguous") instead of a type.
+        for commit, line in zip(wanted, output.splitlines(), strict=False):
+            if line.strip() == "commit":
+                verified.add(commit)
+
+    return WorktreeSnapshot(
+        repo_path=repo_path,
+        worktrees=worktrees,
+        refs=frozenset(refs),
+        commits=frozenset(verified),
+    )
 
 
 def _resolve_worktree_path(
@@ -456,13 +584,30 @@ def _resolve_worktree_path(
     return (workspace_root / dir_path).resolve()
 
 
+def _configured_commits(worktrees_config: list[WorktreeConfigDict]) -> list[str]:
+    """Return the commit values configured across ``worktrees_config``.
+
+    Examples
+    --------
+    >>> _configured_commits([{"dir": "a", "commit": "abc123"}, {"dir": "b"}])
+    ['abc123']
+    """
+    return [commit for wt in worktrees_config if (commit := wt.get("commit"))]
+
+
 def plan_worktree_sync(
     repo_path: pathlib.Path,
     worktrees_config: list[WorktreeConfigDict],
     workspace_root: pathlib.Path,
+    *,
+    snapshot: WorktreeSnapshot | None = None,
 ) -> list[WorktreePlanEntry]:
     """Plan worktree sync operations without executing them.
 
+    Ref, registration, and HEAD checks for every worktree are answered from
+    one :class:`WorktreeSnapshot`; only the dirty check runs git per existing
+    worktree.
+
     Parameters
     ----------
     repo_path : pathlib.Path
@@ -471,6 +616,8 @@ def plan_worktree_sync(
         List of worktree configurations.
     workspace_root : pathlib.Path
         The workspace root directory for resolving relative paths.
+    snapshot : WorktreeSnapshot | None
+        Snapshot to reuse; captured from ``repo_path`` when omitted.
 
     Returns
     -------
@@ -491,6 +638,11 @@ def plan_worktree_sync(
     True
     """
     entries: list[WorktreePlanEntry] = []
+    if snapshot is None:
+        snapshot = snapshot_worktrees(
+            repo_path,
+            commits=_configured_commits(worktrees_config),
+        )
 
     for wt_config in worktrees_config:
         try:
@@ -529,7 +681,8 @@ def plan_worktree_sync(
         ref_type, ref_value = ref_info
 
         worktree_path = _resolve_worktree_path(wt_config, workspace_root)
-        exists = _worktree_exists(repo_path, worktree_path)
+        linked = snapshot.get(worktree_path)
+        exists = linked is not None
 
         entry = WorktreePlanEntry(
             worktree_path=worktree_path,
@@ -540,7 +693,7 @@ def plan_worktree_sync(
         )
 
         # Check if ref exists
-        if not _ref_exists(repo_path, ref_value, ref_type):
+        if not snapshot.has_ref(ref_value, ref_type):
             ref_exc = exc.WorktreeRefNotFoundError(ref_value, ref_type, str(repo_path))
             entry_checks.append(
                 WorktreeCheck(
@@ -573,13 +726,13 @@ def plan_worktree_sync(
             )
         )
 
-        if not exists:
+        if linked is None:
             # Worktree doesn't exist, create it
             entry.action = WorktreeAction.CREATE
             entry.detail = f"will create {ref_type} worktree"
         else:
             # Worktree exists
-            entry.current_ref = _get_worktree_head(worktree_path)
+            entry.current_ref = linked.head
             entry.is_dirty = _is_worktree_dirty(worktree_path)
 
             if entry.is_dirty:
@@ -622,6 +775,8 @@ def sync_worktree(
     workspace_root: pathlib.Path,
     *,
     dry_run: bool = False,
+    snapshot: WorktreeSnapshot | None = None,
+    repo_lock: contextlib.AbstractContextManager[t.Any] | None = None,
 ) -> WorktreePlanEntry:
     """Synchronize a single worktree.
 
@@ -635,6 +790,13 @@ def sync_worktree(
         The workspace root directory.
     dry_run : bool
         If True, only plan without executing.
+    snapshot : WorktreeSnapshot | None
+        Snapshot to plan from; captured from ``repo_path`` when omitted.
+    repo_lock : contextlib.AbstractContextManager | None
+        Held while creating or updating the worktree. ``git worktree add``,
+        checkout, and pull take locks on refs and worktree metadata shared by
+        the whole repository, so concurrent callers pass one lock per
+        repository; planning (including the dirty check) runs outside it.
 
     Returns
     -------
@@ -654,7 +816,12 @@ def sync_worktree(
     True
     """
     # Plan the operation
-    entries = plan_worktree_sync(repo_path, [wt_config], workspace_root)
+    entries = plan_worktree_sync(
+        repo_path,
+        [wt_config],
+        workspace_root,
+        snapshot=snapshot,
+    )
     if not entries:
         log.warning("plan_worktree_sync returned empty list for %s", wt_config)
         return WorktreePlanEntry(
@@ -677,23 +844,15 @@ def sync_worktree(
     worktree_path = entry.worktree_path
 
     try:
-        if entry.action == WorktreeAction.CREATE:
-            _create_worktree(
+        with repo_lock if repo_lock is not None else contextlib.nullcontext():
+            _apply_worktree_action(
+                entry,
                 repo_path,
                 worktree_path,
                 ref_type,
                 ref_value,
                 wt_config,
             )
-            entry.detail = f"created {ref_type} worktree"
-
-        elif entry.action == WorktreeAction.UPDATE:
-            _update_worktree(worktree_path, ref_value)
-            entry.detail = "branch worktree updated"
-
-        elif entry.action == WorktreeAction.UNCHANGED:
-            entry.detail = f"{ref_type} worktree already exists"
-
     except subprocess.CalledProcessError as e:
         entry.action = WorktreeAction.ERROR
         entry.error = e.stderr.strip() if e.stderr else str(e)
@@ -704,6 +863,33 @@ def sync_worktree(
     return entry
 
 
+def _apply_worktree_action(
+    entry: WorktreePlanEntry,
+    repo_path: pathlib.Path,
+    worktree_path: pathlib.Path,
+    ref_type: str,
+    ref_value: str,
+    wt_config: WorktreeConfigDict,
+) -> None:
+    """Create or update the worktree as planned in ``entry``."""
+    if entry.action == WorktreeAction.CREATE:
+        _create_worktree(
+            repo_path,
+            worktree_path,
+            ref_type,
+            ref_value,
+            wt_config,
+        )
+        entry.detail = f"created {ref_type} worktree"
+
+    elif entry.action == WorktreeAction.UPDATE:
+        _update_worktree(worktree_path, ref_value)
+        entry.detail = "branch worktree updated"
+
+    elif entry.action == WorktreeAction.UNCHANGED:
+        entry.detail = f"{ref_type} worktree already exists"
+
+
 def _create_worktree(
     repo_path: pathlib.Path,
     worktree_path: pathlib.Path,
@@ -899,9 +1085,13 @@ def sync_all_worktrees(
     workspace_root: pathlib.Path,
     *,
     dry_run: bool = False,
+    max_workers: int | None = None,
 ) -> WorktreeSyncResult:
     """Synchronize all worktrees for a repository.
 
+    Worktrees are planned concurrently; creates and updates run one at a
+    time, see :func:`sync_worktree_jobs`.
+
     Parameters
     ----------
     repo_path : pathlib.Path
@@ -912,11 +1102,14 @@ def sync_all_worktrees(
         The workspace root directory.
     dry_run : bool
         If True, only plan without executing.
+    max_workers : int | None
+        Worktrees handled at once (default:
+        :data:`DEFAULT_WORKTREE_CONCURRENCY`).
 
     Returns
     -------
     WorktreeSyncResult
-        Summary of all sync operations.
+        Summary of all sync operations, entries in configuration order.
 
     Examples
     --------
@@ -932,29 +1125,117 @@ def sync_all_worktrees(
     >>> len(result.entries)
     1
     """
-    result = WorktreeSyncResult()
+    (result,) = sync_worktree_jobs(
+        [WorktreeSyncJob(repo_path, worktrees_config, workspace_root)],
+        dry_run=dry_run,
+        max_workers=max_workers,
+    )
+    return result
 
-    for wt_config in worktrees_config:
+
+def sync_worktree_jobs(
+    jobs: list[WorktreeSyncJob],
+    *,
+    dry_run: bool = False,
+    max_workers: int | None = None,
+) -> list[WorktreeSyncResult]:
+    """Synchronize the worktrees of several repositories concurrently.
+
+    Every worktree is a task in one thread pool, so work in different
+    repositories overlaps freely. Within a repository, planning (snapshot
+    lookups and ``git status``) runs in parallel, while creates and updates
+    hold a per-repository lock because ``git worktree add``, checkout, and
+    pull lock refs and worktree metadata that all of its worktrees share.
+
+    Parameters
+    ----------
+    jobs : list[WorktreeSyncJob]
+        Repositories and their worktree configurations.
+    dry_run : bool
+        If True, only plan without executing.
+    max_workers : int | None
+        Worktrees handled at once (default:
+        :data:`DEFAULT_WORKTREE_CONCURRENCY`). ``1`` runs everything in order.
+
+    Returns
+    -------
+    list[WorktreeSyncResult]
+        One result per job, in job order, with entries in configuration order
+        and per-entry ``duration_ms``.
+
+    Examples
+    --------
+    >>> import pathlib
+    >>> results = sync_worktree_jobs(
+    ...     [
+    ...         WorktreeSyncJob(
+    ...             pathlib.Path(f"/nonexistent/{name}"),
+    ...             [{"dir": "../wt", "tag": "v1.0.0"}],
+    ...             pathlib.Path("/nonexistent"),
+    ...         )
+    ...         for name in ("a", "b")
+    ...     ],
+    ...     dry_run=True,
+    ... )
+    >>> [result.errors for result in results]
+    [1, 1]
+    >>> results[0].entries[0].duration_ms is not None
+    True
+    """
+    workers = max(1, max_workers or DEFAULT_WORKTREE_CONCURRENCY)
+    started = perf_counter()
+    # Jobs naming the same repository share one lock.
+    repo_locks: dict[pathlib.Path, threading.Lock] = {}
+    locks = [
+        repo_locks.setdefault(job.repo_path.resolve(), threading.Lock()) for job in jobs
+    ]
+    slots: list[list[WorktreePlanEntry | None]] = [
+        [None] * len(job.worktrees_config) for job in jobs
+    ]
+    finished_at = [started] * len(jobs)
+
+    def snapshot_job(job: WorktreeSyncJob) -> WorktreeSnapshot:
+        return snapshot_worktrees(
+            job.repo_path,
+            commits=_configured_commits(job.worktrees_config),
+        )
+
+    def run_one(job_index: int, wt_index: int, snapshot: WorktreeSnapshot) -> None:
+        job = jobs[job_index]
+        wt_started = perf_counter()
         entry = sync_worktree(
-            repo_path,
-            wt_config,
-            workspace_root,
+            job.repo_path,
+            job.worktrees_config[wt_index],
+            job.workspace_root,
             dry_run=dry_run,
+            snapshot=snapshot,
+            repo_lock=locks[job_index],
         )
-        result.entries.append(entry)
-
-        if entry.action == WorktreeAction.CREATE:
-            result.created += 1
-        elif entry.action == WorktreeAction.UPDATE:
-            result.updated += 1
-        elif entry.action == WorktreeAction.UNCHANGED:
-            result.unchanged += 1
-        elif entry.action == WorktreeAction.BLOCKED:
-            result.blocked += 1
-        elif entry.action == WorktreeAction.ERROR:
-            result.errors += 1
+        done = perf_counter()
+        entry.duration_ms = int((done - wt_started) * 1000)
+        slots[job_index][wt_index] = entry
+        finished_at[job_index] = max(finished_at[job_index], done)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        snapshots = list(pool.map(snapshot_job, jobs))
+        futures = [
+            pool.submit(run_one, job_index, wt_index, snapshots[job_index])
+            for job_index, job in enumerate(jobs)
+            for wt_index in range(len(job.worktrees_config))
+        ]
+        for future in futures:
+            future.result()
 
-    return result
+    results: list[WorktreeSyncResult] = []
+    for job_index, job_slots in enumerate(slots):
+        result = WorktreeSyncResult(
+            duration_ms=int((finished_at[job_index] - started) * 1000),
+        )
+        for entry in job_slots:
+            if entry is not None:
+                result.add(entry)
+        results.append(result)
+    return results
 
 
 def list_existing_worktrees(repo_path: pathlib.Path) -> list[pathlib.Path]:
@@ -976,27 +1257,7 @@ def list_existing_worktrees(repo_path: pathlib.Path) -> list[pathlib.Path]:
     >>> list_existing_worktrees(pathlib.Path("/nonexistent/repo"))
     []
     """
-    try:
-        result = subprocess.run(
-            ["git", "worktree", "list", "--porcelain"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError, OSError):
-        return []
-
-    paths: list[pathlib.Path] = []
-    for line in result.stdout.strip().split("\n"):
-        if line.startswith("worktree "):
-            path_str = line[9:]  # Remove "worktree " prefix
-            path = pathlib.Path(path_str)
-            # Skip the main worktree (the repo itself)
-            if path.resolve() != repo_path.resolve():
-                paths.append(path.resolve())
-
-    return paths
+    return list(_list_linked_worktrees(repo_path))
 
 
 def prune_worktrees(
@@ -1005,6 +1266,7 @@ def prune_worktrees(
     workspace_root: pathlib.Path,
     *,
     dry_run: bool = False,
+    existing: Iterable[pathlib.Path] | None = None,
 ) -> list[pathlib.Path]:
     """Remove worktrees that are not in the configuration.
 
@@ -1018,6 +1280,9 @@ def prune_worktrees(
         The workspace root directory.
     dry_run : bool
         If True, only report what would be pruned.
+    existing : Iterable[pathlib.Path] | None
+        Worktrees already listed by :func:`list_existing_worktrees`, so the
+        caller's listing is reused instead of running git again.
 
     Returns
     -------
@@ -1035,10 +1300,12 @@ def prune_worktrees(
     ... )
     []
     """
-    existing = set(list_existing_worktrees(repo_path))
+    existing_paths = set(
+        list_existing_worktrees(repo_path) if existing is None else existing,
+    )
     configured = {_resolve_worktree_path(wt, workspace_root) for wt in config_worktrees}
 
-    orphaned = existing - configured
+    orphaned = existing_paths - configured
     pruned: list[pathlib.Path] = []
 
     for wt_path in orphaned:
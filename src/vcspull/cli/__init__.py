@@ -1,29 +1,31 @@
-"""CLI utilities for vcspull."""
+"""CLI utilities for vcspull.
+
+Subcommand modules are imported only when their command runs, or when their
+arguments are needed for help output. Importing all of them, along with the
+forge importers and libvcs, costs more than many commands spend on their
+work, so :func:`cli` first finds the chosen subcommand with a parser that
+only knows the subcommand names, then builds the full arguments of that one
+command alone.
+"""
 
 from __future__ import annotations
 
 import argparse
+import importlib
 import logging
 import pathlib
+import sys
 import textwrap
+import types
 import typing as t
 
-from libvcs.__about__ import __version__ as libvcs_version
-
 from vcspull.__about__ import __version__
 from vcspull.log import setup_logger
 
 from ._formatter import VcspullHelpFormatter
-from .add import add_repo, create_add_subparser, handle_add_command
-from .discover import create_discover_subparser, discover_repos
-from .fmt import create_fmt_subparser, format_config_file
-from .import_cmd import create_import_subparser
-from .list import create_list_subparser, list_repos
-from .migrate import create_migrate_subparser, migrate_config_file
-from .search import create_search_subparser, search_repos
-from .status import create_status_subparser, status_repos
-from .sync import create_sync_subparser, sync
-from .worktree import create_worktree_subparser, handle_worktree_command
+
+if t.TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
 
 log = logging.getLogger(__name__)
 
@@ -80,6 +82,7 @@ CLI_DESCRIPTION = build_description(
                 "vcspull search name:django url:github",
                 "vcspull search --fixed-strings 'git+https://github.com/org/repo.git'",
                 "vcspull search --ignore-case --any django flask",
+                "vcspull search --fuzzy --limit 10 djrf",
             ],
         ),
         (
@@ -133,6 +136,8 @@ SYNC_DESCRIPTION = build_description(
                 "vcspull sync --all",
                 'vcspull sync "django-*"',
                 "vcspull sync --dry-run --all",
+                "vcspull sync --dry-run --all --save-plan plan.json",
+                "vcspull sync --apply-plan plan.json",
                 "vcspull sync -f ./myrepos.yaml --all",
                 "vcspull sync -w ~/code myproject",
             ],
@@ -152,6 +157,7 @@ LIST_DESCRIPTION = build_description(
                 'vcspull list "django-*"',
                 "vcspull list --tree",
                 "vcspull list --json",
+                "vcspull list --dirty --max-age 1h",
             ],
         ),
     ),
@@ -172,6 +178,7 @@ SEARCH_DESCRIPTION = build_description(
                 "vcspull search name:django url:github",
                 "vcspull search --fixed-strings 'git+https://github.com/org/repo.git'",
                 "vcspull search --ignore-case --any django flask",
+                "vcspull search --fuzzy --limit 10 djrf",
             ],
         ),
     ),
@@ -189,6 +196,10 @@ STATUS_DESCRIPTION = build_description(
                 'vcspull status "django-*"',
                 "vcspull status --detailed",
                 "vcspull status --json",
+                "vcspull status --from-cache",
+                "vcspull status --here",
+                "vcspull status --watch",
+                "vcspull status --watch --ndjson",
             ],
         ),
     ),
@@ -227,6 +238,13 @@ ADD_DESCRIPTION = build_description(
                 "vcspull add ~/code/mylib --no-merge",
             ],
         ),
+        (
+            "Batch",
+            [
+                "vcspull add --from-file urls.txt --workspace ~/code",
+                "vcspull add --stdin --dry-run",
+            ],
+        ),
     ),
 )
 
@@ -253,7 +271,8 @@ FMT_DESCRIPTION = build_description(
     Format vcspull configuration files for consistency.
 
     Normalizes repository entries, sorts sections, and can write changes
-    back to disk or format all discovered configuration files.
+    back to disk or format all discovered configuration files. With --check
+    it exits with status 1 if any file needs formatting.
     """,
     (
         (
@@ -263,6 +282,7 @@ FMT_DESCRIPTION = build_description(
                 "vcspull fmt -f ./myrepos.yaml",
                 "vcspull fmt --write",
                 "vcspull fmt --all",
+                "vcspull fmt --all --check",
             ],
         ),
     ),
@@ -274,7 +294,8 @@ MIGRATE_DESCRIPTION = build_description(
 
     Relocates per-repository rev/shallow/depth keys from the entry root into
     the options: block. Without --write it previews changes; with --write it
-    rewrites the file(s).
+    rewrites the file(s); with --check it exits with status 1 if any file
+    still needs migrating.
     """,
     (
         (
@@ -284,6 +305,7 @@ MIGRATE_DESCRIPTION = build_description(
                 "vcspull migrate -f ./myrepos.yaml",
                 "vcspull migrate --write",
                 "vcspull migrate --all --write",
+                "vcspull migrate --all --check",
             ],
         ),
     ),
@@ -337,20 +359,188 @@ WORKTREE_DESCRIPTION = build_description(
 )
 
 
+CACHE_DESCRIPTION = build_description(
+    """
+    Manage vcspull's caches.
+
+    Config snapshots, the checkout path index, and discover scan results are
+    rebuilt on demand, so clearing them is always safe.
+    """,
+    (
+        (
+            None,
+            [
+                "vcspull cache clear",
+            ],
+        ),
+    ),
+)
+
+
+class Subcommand(t.NamedTuple):
+    """A ``vcspull`` subcommand and where its arguments are defined."""
+
+    name: str
+    help: str
+    description: str
+    #: Submodule of :mod:`vcspull.cli` defining the command.
+    module: str
+    #: Function in ``module`` adding the command's arguments to its parser.
+    add_arguments: str
+
+
+#: Subcommands in the order ``vcspull --help`` lists them.
+SUBCOMMANDS: tuple[Subcommand, ...] = (
+    Subcommand(
+        "sync",
+        "synchronize repositories",
+        SYNC_DESCRIPTION,
+        "sync",
+        "create_sync_subparser",
+    ),
+    Subcommand(
+        "list",
+        "list configured repositories",
+        LIST_DESCRIPTION,
+        "list",
+        "create_list_subparser",
+    ),
+    Subcommand(
+        "status",
+        "check repository status",
+        STATUS_DESCRIPTION,
+        "status",
+        "create_status_subparser",
+    ),
+    Subcommand(
+        "search",
+        "search configured repositories",
+        SEARCH_DESCRIPTION,
+        "search",
+        "create_search_subparser",
+    ),
+    Subcommand(
+        "add",
+        "add a single repository",
+        ADD_DESCRIPTION,
+        "add",
+        "create_add_subparser",
+    ),
+    Subcommand(
+        "discover",
+        "discover repositories from filesystem",
+        DISCOVER_DESCRIPTION,
+        "discover",
+        "create_discover_subparser",
+    ),
+    Subcommand(
+        "fmt",
+        "format configuration files",
+        FMT_DESCRIPTION,
+        "fmt",
+        "create_fmt_subparser",
+    ),
+    Subcommand(
+        "migrate",
+        "migrate configuration files to the options: form",
+        MIGRATE_DESCRIPTION,
+        "migrate",
+        "create_migrate_subparser",
+    ),
+    Subcommand(
+        "import",
+        "import repositories from remote services",
+        IMPORT_DESCRIPTION,
+        "import_cmd",
+        "create_import_subparser",
+    ),
+    Subcommand(
+        "worktree",
+        "manage git worktrees",
+        WORKTREE_DESCRIPTION,
+        "worktree",
+        "create_worktree_subparser",
+    ),
+    Subcommand(
+        "cache",
+        "manage vcspull's caches",
+        CACHE_DESCRIPTION,
+        "cache",
+        "create_cache_subparser",
+    ),
+)
+
+
+class _VersionAction(argparse.Action):
+    """Print the vcspull and libvcs versions, importing libvcs only then."""
+
+    def __init__(
+        self,
+        option_strings: Sequence[str],
+        dest: str = argparse.SUPPRESS,
+        default: str = argparse.SUPPRESS,
+        help: str = "show program's version number and exit",  # noqa: A002
+    ) -> None:
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: str | Sequence[t.Any] | None,
+        option_string: str | None = None,
+    ) -> None:
+        from libvcs.__about__ import __version__ as libvcs_version
+
+        sys.stdout.write(f"{parser.prog} {__version__}, libvcs {libvcs_version}\n")
+        parser.exit()
+
+
 @t.overload
 def create_parser(
     return_subparsers: t.Literal[True],
+    *,
+    load: Collection[str] | None = None,
 ) -> tuple[argparse.ArgumentParser, t.Any]: ...
 
 
 @t.overload
-def create_parser(return_subparsers: t.Literal[False]) -> argparse.ArgumentParser: ...
+def create_parser(
+    return_subparsers: t.Literal[False] = False,
+    *,
+    load: Collection[str] | None = None,
+) -> argparse.ArgumentParser: ...
 
 
 def create_parser(
     return_subparsers: bool = False,
+    *,
+    load: Collection[str] | None = None,
 ) -> argparse.ArgumentParser | tuple[argparse.ArgumentParser, t.Any]:
-    """Create CLI argument parser for vcspull."""
+    """Create CLI argument parser for vcspull.
+
+    Parameters
+    ----------
+    return_subparsers : bool
+        Also return the subcommand parsers, in :data:`SUBCOMMANDS` order.
+    load : collection of str, optional
+        Names of the subcommands to define arguments for, importing only
+        their modules. By default every subcommand is complete. The others
+        accept any arguments and have no ``-h`` of their own, which is enough
+        to tell which subcommand a command line runs.
+
+    Examples
+    --------
+    >>> parser = create_parser(load=())
+    >>> parser.parse_known_args(["--log-level", "debug", "sync", "-h"])
+    (Namespace(log_level='debug', no_config_cache=False, subparser_name='sync'), ['-h'])
+    """
     parser = argparse.ArgumentParser(
         prog="vcspull",
         formatter_class=VcspullHelpFormatter,
@@ -359,8 +549,7 @@ def create_parser(
     parser.add_argument(
         "--version",
         "-V",
-        action="version",
-        version=f"%(prog)s {__version__}, libvcs {libvcs_version}",
+        action=_VersionAction,
     )
     parser.add_argument(
         "--log-level",
@@ -369,123 +558,47 @@ def create_parser(
         default="INFO",
         help="log level (debug, info, warning, error, critical)",
     )
-
-    subparsers = parser.add_subparsers(dest="subparser_name")
-
-    # Sync command
-    sync_parser = subparsers.add_parser(
-        "sync",
-        help="synchronize repositories",
-        formatter_class=VcspullHelpFormatter,
-        description=SYNC_DESCRIPTION,
-    )
-    create_sync_subparser(sync_parser)
-
-    # List command
-    list_parser = subparsers.add_parser(
-        "list",
-        help="list configured repositories",
-        formatter_class=VcspullHelpFormatter,
-        description=LIST_DESCRIPTION,
-    )
-    create_list_subparser(list_parser)
-
-    # Status command
-    status_parser = subparsers.add_parser(
-        "status",
-        help="check repository status",
-        formatter_class=VcspullHelpFormatter,
-        description=STATUS_DESCRIPTION,
-    )
-    create_status_subparser(status_parser)
-
-    # Search command
-    search_parser = subparsers.add_parser(
-        "search",
-        help="search configured repositories",
-        formatter_class=VcspullHelpFormatter,
-        description=SEARCH_DESCRIPTION,
-    )
-    create_search_subparser(search_parser)
-
-    # Add command
-    add_parser = subparsers.add_parser(
-        "add",
-        help="add a single repository",
-        formatter_class=VcspullHelpFormatter,
-        description=ADD_DESCRIPTION,
-    )
-    create_add_subparser(add_parser)
-
-    # Discover command
-    discover_parser = subparsers.add_parser(
-        "discover",
-        help="discover repositories from filesystem",
-        formatter_class=VcspullHelpFormatter,
-        description=DISCOVER_DESCRIPTION,
-    )
-    create_discover_subparser(discover_parser)
-
-    # Fmt command
-    fmt_parser = subparsers.add_parser(
-        "fmt",
-        help="format configuration files",
-        formatter_class=VcspullHelpFormatter,
-        description=FMT_DESCRIPTION,
-    )
-    create_fmt_subparser(fmt_parser)
-
-    # Migrate command
-    migrate_parser = subparsers.add_parser(
-        "migrate",
-        help="migrate configuration files to the options: form",
-        formatter_class=VcspullHelpFormatter,
-        description=MIGRATE_DESCRIPTION,
+    parser.add_argument(
+        "--no-config-cache",
+        action="store_true",
+        dest="no_config_cache",
+        help="parse config files instead of reusing the cached snapshot",
     )
-    create_migrate_subparser(migrate_parser)
 
-    # Import command
-    import_parser = subparsers.add_parser(
-        "import",
-        help="import repositories from remote services",
-        formatter_class=VcspullHelpFormatter,
-        description=IMPORT_DESCRIPTION,
-    )
-    create_import_subparser(import_parser)
+    subparsers = parser.add_subparsers(dest="subparser_name")
 
-    # Worktree command
-    worktree_parser = subparsers.add_parser(
-        "worktree",
-        help="manage git worktrees",
-        formatter_class=VcspullHelpFormatter,
-        description=WORKTREE_DESCRIPTION,
-    )
-    create_worktree_subparser(worktree_parser)
+    command_parsers: list[argparse.ArgumentParser] = []
+    for command in SUBCOMMANDS:
+        complete = load is None or command.name in load
+        command_parser = subparsers.add_parser(
+            command.name,
+            help=command.help,
+            formatter_class=VcspullHelpFormatter,
+            description=command.description,
+            add_help=complete,
+        )
+        if complete:
+            module = importlib.import_module(f"{__name__}.{command.module}")
+            getattr(module, command.add_arguments)(command_parser)
+        command_parsers.append(command_parser)
 
     if return_subparsers:
         # Return all parsers needed by cli() function
-        return parser, (
-            sync_parser,
-            list_parser,
-            status_parser,
-            search_parser,
-            add_parser,
-            discover_parser,
-            fmt_parser,
-            migrate_parser,
-            import_parser,
-            worktree_parser,
-        )
+        return parser, tuple(command_parsers)
     return parser
 
 
 def cli(_args: list[str] | None = None) -> None:
     """CLI entry point for vcspull."""
-    parser, subparsers = create_parser(return_subparsers=True)
+    chosen, _rest = create_parser(load=()).parse_known_args(_args)
+    parser, subparsers = create_parser(
+        return_subparsers=True,
+        load={chosen.subparser_name} if chosen.subparser_name else (),
+    )
     (
         sync_parser,
         _list_parser,
-        _status_parser,
+        status_parser,
         search_parser,
         add_parser,
         discover_parser,
@@ -493,9 +606,14 @@ def cli(_args: list[str] | None = None) -> None:
         _migrate_parser,
         _import_parser,
         _worktree_parser,
+        _cache_parser,
     ) = subparsers
     args = parser.parse_args(_args)
 
+    from vcspull._internal.config_cache import set_config_cache_enabled
+
+    set_config_cache_enabled(not args.no_config_cache)
+
     # ``args.verbosity`` is only set by the sync subcommand; default 0
     # everywhere else. The sync ``-v`` ladder (0 → libvcs WARNING; 1 → INFO;
     # 2+ → DEBUG) is documented in :func:`vcspull.log.setup_logger`.
@@ -510,6 +628,8 @@ def cli(_args: list[str] | None = None) -> None:
         return
 
     if args.subparser_name == "sync":
+        from .sync import sync
+
         sync(
             repo_patterns=args.repo_patterns,
             config=pathlib.Path(args.config) if args.config else None,
@@ -533,8 +653,12 @@ def cli(_args: list[str] | None = None) -> None:
             log_file=getattr(args, "log_file", None),
             no_log_file=getattr(args, "no_log_file", False),
             panel_lines=getattr(args, "panel_lines", None),
+            save_plan=getattr(args, "save_plan", None),
+            apply_plan=getattr(args, "apply_plan", None),
         )
     elif args.subparser_name == "list":
+        from .list import list_repos
+
         list_repos(
             repo_patterns=args.repo_patterns,
             config_path=pathlib.Path(args.config) if args.config else None,
@@ -544,8 +668,14 @@ def cli(_args: list[str] | None = None) -> None:
             output_ndjson=args.output_ndjson,
             color=args.color,
             include_worktrees=getattr(args, "include_worktrees", False),
+            dirty=getattr(args, "dirty", False),
+            behind=getattr(args, "behind", False),
+            missing=getattr(args, "missing", False),
+            max_age=getattr(args, "max_age", None),
         )
     elif args.subparser_name == "status":
+        from .status import DEFAULT_WATCH_INTERVAL, status_repos
+
         status_repos(
             repo_patterns=args.repo_patterns,
             config_path=pathlib.Path(args.config) if args.config else None,
@@ -556,11 +686,18 @@ def cli(_args: list[str] | None = None) -> None:
             color=args.color,
             concurrent=not getattr(args, "no_concurrent", False),
             max_concurrent=getattr(args, "max_concurrent", None),
+            from_cache=getattr(args, "from_cache", False),
+            watch=getattr(args, "watch", False),
+            interval=getattr(args, "interval", DEFAULT_WATCH_INTERVAL),
+            here=getattr(args, "here", False),
+            parser=status_parser,
         )
     elif args.subparser_name == "search":
         if not args.query_terms:
             search_parser.print_help()
             return
+        from .search import search_repos
+
         search_repos(
             query_terms=args.query_terms,
             config_path=pathlib.Path(args.config) if args.config else None,
@@ -575,16 +712,22 @@ def cli(_args: list[str] | None = None) -> None:
             word_regexp=getattr(args, "word_regexp", False),
             invert_match=getattr(args, "invert_match", False),
             match_any=getattr(args, "match_any", False),
+            fuzzy=getattr(args, "fuzzy", False),
+            limit=getattr(args, "limit", None),
         )
     elif args.subparser_name == "add":
-        if not args.repo_path:
+        if not (args.repo_path or args.batch_file or args.batch_stdin):
             add_parser.print_help()
             return
+        from .add import handle_add_command
+
         handle_add_command(args)
     elif args.subparser_name == "discover":
         if not args.scan_dir:
             discover_parser.print_help()
             return
+        from .discover import discover_repos
+
         discover_repos(
             scan_dir_str=args.scan_dir,
             config_file_path_str=args.config,
@@ -597,20 +740,34 @@ def cli(_args: list[str] | None = None) -> None:
             rev=getattr(args, "pin", None),
             shallow=getattr(args, "shallow", False),
             depth=getattr(args, "depth", None),
+            nested=getattr(args, "nested", False),
+            max_depth=getattr(args, "max_depth", None),
+            exclude=getattr(args, "exclude", []),
+            full=getattr(args, "full", False),
         )
     elif args.subparser_name == "fmt":
-        format_config_file(
+        from .fmt import format_config_file
+
+        result = format_config_file(
             args.config,
             args.write,
             args.all,
             merge_roots=args.merge_roots,
+            check=args.check,
         )
+        if result:
+            raise SystemExit(result)
     elif args.subparser_name == "migrate":
-        migrate_config_file(
+        from .migrate import migrate_config_file
+
+        result = migrate_config_file(
             args.config,
             args.write,
             args.all,
+            check=args.check,
         )
+        if result:
+            raise SystemExit(result)
     elif args.subparser_name == "import":
         handler = getattr(args, "import_handler", None)
         if handler is None:
@@ -620,4 +777,71 @@ def cli(_args: list[str] | None = None) -> None:
         if result:
             raise SystemExit(result)
     elif args.subparser_name == "worktree":
+        from .worktree import handle_worktree_command
+
         handle_worktree_command(args)
+    elif args.subparser_name == "cache":
+        from .cache import handle_cache_command
+
+        handle_cache_command(args)
+
+
+#: Functions this package re-exports, and the submodule each is defined in.
+#: They resolve on first access, so importing the package stays cheap.
+_LAZY_EXPORTS: dict[str, str] = {
+    "add_repo": "add",
+    "create_add_subparser": "add",
+    "handle_add_command": "add",
+    "create_discover_subparser": "discover",
+    "discover_repos": "discover",
+    "create_fmt_subparser": "fmt",
+    "format_config_file": "fmt",
+    "create_import_subparser": "import_cmd",
+    "create_list_subparser": "list",
+    "list_repos": "list",
+    "create_migrate_subparser": "migrate",
+    "migrate_config_file": "migrate",
+    "create_search_subparser": "search",
+    "search_repos": "search",
+    "create_status_subparser": "status",
+    "status_repos": "status",
+    "create_sync_subparser": "sync",
+    "sync": "sync",
+    "create_worktree_subparser": "worktree",
+    "handle_worktree_command": "worktree",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the submodule defining ``name`` on first access.
+
+    Examples
+    --------
+    >>> from vcspull.cli import list_repos
+    >>> list_repos.__module__
+    'vcspull.cli.list'
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+class _CliModule(types.ModuleType):
+    """Keep ``vcspull.cli.sync`` the command function, not its submodule.
+
+    Loading :mod:`vcspull.cli.sync` binds the submodule onto this package
+    under the function's name; the function is bound instead, as it was when
+    the package imported it eagerly.
+    """
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        if name == "sync" and isinstance(value, types.ModuleType):
+            value = value.sync
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _CliModule
@@ -0,0 +1,127 @@
+"""Check or rewrite many config files for ``vcspull fmt`` and ``migrate``.
+
+Both commands handle each file on its own, so :func:`run_config_files` hands
+them to worker processes once there are enough of them (see
+:func:`~vcspull._internal.parallel_load.parallel_workers`), replaying each
+file's log output in order afterwards. Files a previous run found already in
+shape, by content hash, are reported without being parsed again.
+"""
+
+from __future__ import annotations
+
+import enum
+import functools
+import logging
+import pathlib
+import typing as t
+
+from vcspull._internal import config_cache
+from vcspull._internal.parallel_load import (
+    capture_logs,
+    map_in_processes,
+    parallel_workers,
+    replay_logs,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+
+log = logging.getLogger(__name__)
+
+
+class FileCheck(enum.Enum):
+    """How a config file compared with the form a command would write."""
+
+    CLEAN = "clean"
+    DRIFT = "drift"
+    FAILED = "failed"
+
+
+class _HeldRun(t.NamedTuple):
+    """One file's result and the log output held back while computing it."""
+
+    check: FileCheck
+    records: list[logging.LogRecord]
+
+
+def _run_holding_logs(
+    process_file: Callable[[pathlib.Path], FileCheck],
+    file: pathlib.Path,
+) -> _HeldRun:
+    """Run ``process_file``, keeping its log output to replay in file order."""
+    with capture_logs() as records:
+        check = process_file(file)
+    return _HeldRun(check, records)
+
+
+def run_config_files(
+    process_file: Callable[[pathlib.Path], FileCheck],
+    files: Sequence[pathlib.Path],
+    *,
+    command: str,
+    options: Mapping[str, t.Any],
+    report_clean: Callable[[pathlib.Path], None],
+) -> list[FileCheck]:
+    """Return ``process_file(file)`` for each file, skipping known-clean ones.
+
+    Parameters
+    ----------
+    process_file : callable
+        Checks, and when asked rewrites, one file. Must be picklable, such as
+        a :func:`functools.partial` of a module-level function.
+    files : sequence of pathlib.Path
+        Config files, in the order their output is shown.
+    command : str
+        Name the clean-file keys are stored under.
+    options : mapping
+        Options ``process_file`` depends on, part of the clean-file keys.
+    report_clean : callable
+        Logs that a file is clean, for files that are not processed again.
+    """
+    keys: dict[pathlib.Path, str] = {}
+    if config_cache.config_cache_enabled():
+        cwd = pathlib.Path.cwd()
+        for file in files:
+            key = config_cache.clean_file_key(
+                file,
+                command=command,
+                cwd=cwd,
+                options=options,
+            )
+            if key is not None:
+                keys[file] = key
+    known = config_cache.known_clean_files(list(keys.values()))
+    pending = [file for file in files if keys.get(file) not in known]
+
+    run_file = functools.partial(_run_holding_logs, process_file)
+    workers = parallel_workers(pending)
+    held_runs: Iterator[_HeldRun] = (
+        map_in_processes(run_file, pending, workers=workers)
+        if workers
+        else map(run_file, pending)
+    )
+
+    checks: list[FileCheck] = []
+    new_clean: list[str] = []
+    for file in files:
+        key = keys.get(file)
+        if key in known:
+            report_clean(file)
+            checks.append(FileCheck.CLEAN)
+            continue
+        # Pending files keep their order, so output follows the file list.
+        held_run = next(held_runs)
+        replay_logs(held_run.records)
+        checks.append(held_run.check)
+        # Files that warn are checked again, so the warning shows every run.
+        if (
+            key is not None
+            and held_run.check is FileCheck.CLEAN
+            and all(record.levelno < logging.WARNING for record in held_run.records)
+        ):
+            new_clean.append(key)
+    # Runs the pool generator to its end, so the workers shut down here.
+    next(held_runs, None)
+
+    config_cache.store_clean_files(new_clean)
+    return checks
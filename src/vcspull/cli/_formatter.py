@@ -61,6 +61,7 @@ OPTIONS_FLAG_ONLY = {
     "-v",
     "--invert-match",
     "--any",
+    "--fuzzy",
     "--exit-on-error",
     "-x",
     "--fetch",
@@ -143,6 +143,48 @@ class PlanEntry:
             payload["diagnostics"] = list(self.diagnostics)
         return payload
 
+    @classmethod
+    def from_payload(cls, payload: dict[str, t.Any]) -> PlanEntry:
+        """Rebuild a plan entry from :meth:`to_payload` output.
+
+        Raises
+        ------
+        KeyError
+            If a required field is missing.
+        ValueError
+            If ``action`` is not a known :class:`PlanAction`.
+
+        Examples
+        --------
+        >>> entry = PlanEntry(
+        ...     name="myrepo",
+        ...     path="~/repos/myrepo",
+        ...     workspace_root="~/repos/",
+        ...     action=PlanAction.UPDATE,
+        ...     current_rev="1a2b3c",
+        ...     behind=2,
+        ... )
+        >>> PlanEntry.from_payload(entry.to_payload()) == entry
+        True
+        """
+        return cls(
+            name=str(payload["name"]),
+            path=str(payload["path"]),
+            workspace_root=str(payload["workspace_root"]),
+            action=PlanAction(payload["action"]),
+            detail=payload.get("detail"),
+            url=payload.get("url"),
+            branch=payload.get("branch"),
+            remote_branch=payload.get("remote_branch"),
+            current_rev=payload.get("current_rev"),
+            target_rev=payload.get("target_rev"),
+            ahead=payload.get("ahead"),
+            behind=payload.get("behind"),
+            dirty=payload.get("dirty"),
+            error=payload.get("error"),
+            diagnostics=list(payload.get("diagnostics", [])),
+        )
+
 
 @dataclass
 class PlanSummary:
@@ -211,6 +253,25 @@ class PlanSummary:
             payload["duration_ms"] = self.duration_ms
         return payload
 
+    @classmethod
+    def from_payload(cls, payload: dict[str, t.Any]) -> PlanSummary:
+        """Rebuild a summary from :meth:`to_payload` output.
+
+        Examples
+        --------
+        >>> summary = PlanSummary(clone=1, update=2, duration_ms=15)
+        >>> PlanSummary.from_payload(summary.to_payload()) == summary
+        True
+        """
+        return cls(
+            clone=int(payload.get("clone", 0)),
+            update=int(payload.get("update", 0)),
+            unchanged=int(payload.get("unchanged", 0)),
+            blocked=int(payload.get("blocked", 0)),
+            errors=int(payload.get("errors", 0)),
+            duration_ms=payload.get("duration_ms"),
+        )
+
 
 @dataclass
 class PlanRenderOptions:
@@ -258,6 +319,85 @@ class PlanResult:
     entries: list[PlanEntry]
     summary: PlanSummary
 
+    def to_payload(self) -> dict[str, t.Any]:
+        """Convert the whole plan into a document for ``--save-plan``.
+
+        Unlike streamed output, every entry is kept, including unchanged ones,
+        so the saved plan records exactly what was observed.
+
+        Examples
+        --------
+        >>> plan = PlanResult(
+        ...     entries=[
+        ...         PlanEntry(
+        ...             name="myrepo",
+        ...             path="~/repos/myrepo",
+        ...             workspace_root="~/repos/",
+        ...             action=PlanAction.CLONE,
+        ...         ),
+        ...     ],
+        ...     summary=PlanSummary(clone=1),
+        ... )
+        >>> payload = plan.to_payload()
+        >>> payload["type"]
+        'plan'
+        >>> [entry["name"] for entry in payload["entries"]]
+        ['myrepo']
+        >>> payload["summary"]["clone"]
+        1
+        """
+        return {
+            "format_version": "1",
+            "type": "plan",
+            "entries": [entry.to_payload() for entry in self.entries],
+            "summary": self.summary.to_payload(),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, t.Any]) -> PlanResult:
+        """Rebuild a plan from :meth:`to_payload` output.
+
+        Raises
+        ------
+        ValueError
+            If the document is not a version ``"1"`` plan, or an entry
+            carries an unknown action.
+        KeyError
+            If an entry lacks a required field.
+
+        Examples
+        --------
+        >>> plan = PlanResult(
+        ...     entries=[
+        ...         PlanEntry(
+        ...             name="myrepo",
+        ...             path="~/repos/myrepo",
+        ...             workspace_root="~/repos/",
+        ...             action=PlanAction.UPDATE,
+        ...             current_rev="1a2b3c",
+        ...             target_rev="4d5e6f",
+        ...         ),
+        ...     ],
+        ...     summary=PlanSummary(update=1),
+        ... )
+        >>> PlanResult.from_payload(plan.to_payload()) == plan
+        True
+
+        >>> PlanResult.from_payload({"type": "summary"})
+        Traceback (most recent call last):
+        ...
+        ValueError: not a vcspull plan (type='summary', format_version=None)
+        """
+        doc_type = payload.get("type")
+        version = payload.get("format_version")
+        if doc_type != "plan" or version != "1":
+            msg = f"not a vcspull plan (type={doc_type!r}, format_version={version!r})"
+            raise ValueError(msg)
+        return cls(
+            entries=[PlanEntry.from_payload(item) for item in payload["entries"]],
+            summary=PlanSummary.from_payload(payload.get("summary", {})),
+        )
+
 
 class OutputFormatter:
     """Manages output formatting for different modes (human, JSON, NDJSON)."""
@@ -1,4 +1,4 @@
-"""Add single repository functionality for vcspull."""
+"""Add repositories to a vcspull configuration, one or many at a time."""
 
 from __future__ import annotations
 
@@ -8,6 +8,7 @@ import enum
 import logging
 import pathlib
 import subprocess
+import sys
 import traceback
 import typing as t
 
@@ -18,6 +19,7 @@ from vcspull._internal.config_reader import (
     DuplicateAwareConfigReader,
     config_format_from_path,
 )
+from vcspull._internal.git_probe import may_rewrite_urls, read_origin_url
 from vcspull._internal.private_path import PrivatePath
 from vcspull.config import (
     build_repo_entry,
@@ -28,13 +30,20 @@ from vcspull.config import (
     is_pinned_for_op,
     merge_duplicate_workspace_roots,
     normalize_config_file_path,
+    patch_config_file,
     resolve_clone_depth,
     save_config,
+    save_config_in_place,
     save_config_json,
     save_config_yaml_with_items,
     workspace_root_label,
 )
 
+from ._output import OutputFormatter, OutputMode
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
 log = logging.getLogger(__name__)
 
 
@@ -106,6 +115,23 @@ def create_add_subparser(parser: argparse.ArgumentParser) -> None:
             "root already declared in the config."
         ),
     )
+    batch = parser.add_mutually_exclusive_group()
+    batch.add_argument(
+        "--from-file",
+        dest="batch_file",
+        metavar="FILE",
+        help=(
+            "Add every repository URL listed in FILE, one per line as "
+            "'URL [WORKSPACE [NAME]]' ('-' keeps the default workspace), "
+            "writing the config once and printing one JSON object per entry"
+        ),
+    )
+    batch.add_argument(
+        "--stdin",
+        dest="batch_stdin",
+        action="store_true",
+        help="Like --from-file, reading the list from standard input",
+    )
     parser.add_argument(
         "--name",
         dest="override_name",
@@ -219,7 +245,16 @@ def _resolve_workspace_path(
 
 
 def _detect_git_remote(repo_path: pathlib.Path) -> str | None:
-    """Return the ``origin`` remote URL for a Git repository if available."""
+    """Return the ``origin`` remote URL for a Git repository if available.
+
+    The URL is read from the repository's config file when no
+    ``url.<base>.insteadOf`` rule could rewrite it; otherwise, or when the file
+    has no URL, ``git remote get-url origin`` answers.
+    """
+    if not may_rewrite_urls(repo_path):
+        remote = read_origin_url(repo_path)
+        if remote:
+            return remote
     try:
         result = subprocess.run(
             ["git", "-C", str(repo_path), "remote", "get-url", "origin"],
@@ -695,10 +730,13 @@ def _save_ordered_items(
 ) -> None:
     """Persist ordered items in the format matching the config file extension.
 
+    Existing YAML and JSONL configs only have their changed lines rewritten
+    (:func:`~vcspull.config.patch_config_file`) where their layout allows.
+
     Parameters
     ----------
     config_file_path : pathlib.Path
-        Path to config file (.yaml or .json).
+        Path to config file (.yaml, .json, or .jsonl).
     ordered_items : list of dict
         Each dict has ``"label"`` and ``"section"`` keys.
 
@@ -722,18 +760,29 @@ def _save_ordered_items(
     >>> "~/code/" in data
     True
     """
-    if config_format_from_path(config_file_path) == "json":
+    fmt = config_format_from_path(config_file_path)
+    if fmt == "json":
         save_config_json(
             config_file_path,
             _collapse_ordered_items_to_dict(ordered_items),
         )
+    elif fmt == "jsonl":
+        save_config_in_place(
+            config_file_path,
+            _collapse_ordered_items_to_dict(ordered_items),
+        )
     else:
         items = [(entry["label"], entry["section"]) for entry in ordered_items]
-        save_config_yaml_with_items(config_file_path, items)
+        if not patch_config_file(config_file_path, items):
+            save_config_yaml_with_items(config_file_path, items)
 
 
 def handle_add_command(args: argparse.Namespace) -> None:
     """Entry point for the ``vcspull add`` CLI command."""
+    if getattr(args, "batch_file", None) or getattr(args, "batch_stdin", False):
+        _handle_batch_add_command(args)
+        return
+
     repo_input = getattr(args, "repo_path", None)
     if repo_input is None:
         log.error("A repository path or URL must be provided.")
@@ -1347,7 +1396,7 @@ def add_repo(
             return
 
         try:
-            save_config(config_file_path, raw_config)
+            save_config_in_place(config_file_path, raw_config)
             log.info(
                 "%s✓%s Successfully added %s'%s'%s (%s%s%s) to %s%s%s under '%s%s%s'.",
                 Fore.GREEN,
@@ -1553,3 +1602,343 @@ def add_repo(
         )
         if log.isEnabledFor(logging.DEBUG):
             traceback.print_exc()
+
+
+class BatchAddEntry(t.NamedTuple):
+    """One line of a ``vcspull add --from-file`` / ``--stdin`` list.
+
+    Attributes
+    ----------
+    line : int
+        1-based line number, for reporting.
+    url : str
+        Repository URL as written.
+    workspace_root : str | None
+        Workspace root for this repository, or ``None`` for the default.
+    name : str | None
+        Repository name, or ``None`` to derive it from the URL.
+    """
+
+    line: int
+    url: str
+    workspace_root: str | None
+    name: str | None
+
+
+def _parse_batch_lines(lines: t.Iterable[str]) -> Iterator[BatchAddEntry]:
+    """Yield the entries of a batch add list.
+
+    Each line is ``URL [WORKSPACE [NAME]]`` separated by whitespace, with
+    ``-`` as WORKSPACE to keep the default. Blank lines and ``#`` comments are
+    skipped.
+
+    Raises
+    ------
+    ValueError
+        For a line with more than three fields.
+
+    Examples
+    --------
+    >>> lines = [
+    ...     "# team repositories",
+    ...     "git+https://github.com/pallets/flask.git",
+    ...     "",
+    ...     "https://github.com/pallets/click.git ~/study/",
+    ...     "https://github.com/pallets/jinja.git - jinja2",
+    ... ]
+    >>> for entry in _parse_batch_lines(lines):
+    ...     print(entry.line, entry.workspace_root, entry.name)
+    2 None None
+    4 ~/study/ None
+    5 None jinja2
+    """
+    for number, text in enumerate(lines, start=1):
+        fields = text.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        if len(fields) > 3:
+            msg = f"line {number}: expected 'URL [WORKSPACE [NAME]]'"
+            raise ValueError(msg)
+        workspace_root = fields[1] if len(fields) > 1 and fields[1] != "-" else None
+        name = fields[2] if len(fields) > 2 else None
+        yield BatchAddEntry(number, fields[0], workspace_root, name)
+
+
+class BatchAddResult(t.NamedTuple):
+    """Outcome of a batch add, as counted for its summary.
+
+    Attributes
+    ----------
+    added : int
+        Repositories added (or that would be, on a dry run).
+    skip_existing : int
+        Repositories already in the config.
+    skip_pinned : int
+        Repositories pinned against ``add``.
+    errors : int
+        Lines that could not be added.
+    written : bool
+        Whether the config file was written.
+    """
+
+    added: int
+    skip_existing: int
+    skip_pinned: int
+    errors: int
+    written: bool
+
+
+def add_repos_batch(
+    lines: t.Iterable[str],
+    *,
+    config_file_path_str: str | None,
+    workspace_root_path: str | None,
+    dry_run: bool,
+    merge_duplicates: bool = True,
+    shallow: bool = False,
+    depth: int | None = None,
+) -> BatchAddResult | None:
+    """Add many repository URLs to a config, writing it at most once.
+
+    The config is read once and every entry is checked against an index of
+    its workspace roots, kept up to date as entries are added, so repeated
+    lines and lines naming the same root in different spellings resolve as
+    consecutive ``vcspull add`` calls would. Nothing prompts. Standard output
+    gets one JSON object per entry, then a ``summary`` object with the counts,
+    once the config has been saved.
+
+    Parameters
+    ----------
+    lines : iterable of str
+        Lines as :func:`_parse_batch_lines` reads them.
+    config_file_path_str : str | None
+        Path to config file, or None to use default.
+    workspace_root_path : str | None
+        Workspace root for entries that do not name one. Defaults to the first
+        workspace root the config declares, else the current directory.
+    dry_run : bool
+        If True, report what would be added without writing.
+    merge_duplicates : bool
+        Merge duplicate workspace roots before adding, as ``add`` does.
+    shallow : bool
+        Record ``options.shallow: true`` for every added repository.
+    depth : int | None
+        Record ``options.depth: N`` for every added repository.
+
+    Returns
+    -------
+    BatchAddResult | None
+        Counts for the summary, or ``None`` when the config could not be read
+        or the list could not be parsed.
+    """
+    try:
+        entries = list(_parse_batch_lines(lines))
+    except ValueError as exc:
+        log.error("Cannot read repository list: %s", exc)  # noqa: TRY400
+        return None
+
+    resolution = _resolve_config_file(config_file_path_str)
+    if resolution.ambiguous or resolution.path is None:
+        log.error(
+            "Multiple home config files found, please specify one with -f/--file",
+        )
+        return None
+    config_file_path = resolution.path
+    display_config_path = str(PrivatePath(config_file_path))
+
+    raw_config: dict[str, t.Any] = {}
+    duplicate_root_occurrences: dict[str, list[t.Any]] = {}
+    top_level_items: list[tuple[str, t.Any]] = []
+    if config_file_path.exists() and config_file_path.is_file():
+        try:
+            (
+                raw_config,
+                duplicate_root_occurrences,
+                top_level_items,
+            ) = DuplicateAwareConfigReader.load_with_duplicates(config_file_path)
+        except Exception:
+            log.exception(
+                "Error loading config from %s. Aborting.", display_config_path
+            )
+            return None
+
+    if merge_duplicates:
+        raw_config, conflicts, _changes, _details = merge_duplicate_workspace_roots(
+            raw_config,
+            duplicate_root_occurrences,
+        )
+        for message in conflicts:
+            log.warning(message)
+        ordered_items = _build_ordered_items(None, raw_config)
+    else:
+        ordered_items = _build_ordered_items(top_level_items, raw_config)
+
+    cwd = pathlib.Path.cwd()
+    # Canonical workspace path -> index of the section entries land in; the
+    # last section wins, as for a single ``add --no-merge``.
+    section_index: dict[pathlib.Path, int] = {}
+    for index, item in enumerate(ordered_items):
+        if not isinstance(item["section"], dict):
+            continue
+        try:
+            section_index[canonicalize_workspace_path(item["label"], cwd=cwd)] = index
+        except (OSError, ValueError):
+            continue
+
+    default_workspace = workspace_root_path
+    if default_workspace is None:
+        declared = [
+            item["label"] for item in ordered_items if isinstance(item["section"], dict)
+        ]
+        default_workspace = (
+            declared[0]
+            if declared
+            else workspace_root_label(
+                cwd,
+                cwd=cwd,
+                home=pathlib.Path.home(),
+                preserve_cwd_label=config_file_path.parent == cwd,
+            )
+        )
+
+    records: list[dict[str, t.Any]] = []
+    counts = dict.fromkeys(AddAction, 0)
+    errors = 0
+    for entry in entries:
+        record: dict[str, t.Any] = {
+            "type": "repo",
+            "line": entry.line,
+            "url": entry.url,
+        }
+        records.append(record)
+        if not GitURL.is_valid(entry.url):
+            record.update(action="error", reason="not a repository URL")
+            errors += 1
+            continue
+        parsed = _parse_repo_url(entry.url)
+        name = entry.name or parsed.name
+        if parsed.unparsed_rev is not None or name is None:
+            record.update(
+                action="error",
+                reason=(
+                    "no repository name in URL"
+                    if name is None
+                    else "only pip-style 'git+' URLs carry a revision"
+                ),
+            )
+            errors += 1
+            continue
+
+        workspace_input = entry.workspace_root or default_workspace
+        try:
+            placement = _resolve_placement(
+                workspace_input,
+                name,
+                pathlib.Path(),
+                url_mode=True,
+                cwd=cwd,
+            )
+            workspace_key = canonicalize_workspace_path(workspace_input, cwd=cwd)
+        except (OSError, RuntimeError, ValueError) as exc:
+            # ``~nosuchuser/`` and the like: only this line fails.
+            record.update(
+                action="error",
+                reason=f"cannot resolve workspace root {workspace_input!r}: {exc}",
+            )
+            errors += 1
+            continue
+        target_index = section_index.get(workspace_key)
+        if target_index is None:
+            ordered_items.append({"label": placement.workspace_label, "section": {}})
+            target_index = section_index[workspace_key] = len(ordered_items) - 1
+        section = ordered_items[target_index]["section"]
+        workspace_label = ordered_items[target_index]["label"]
+
+        action = _classify_add_action(section.get(name))
+        counts[action] += 1
+        record.update(
+            action=action.value,
+            name=name,
+            workspace_root=workspace_label,
+        )
+        if action == AddAction.ADD:
+            _display_url, config_url = _normalize_detected_url(parsed.url)
+            section[name] = build_repo_entry(
+                config_url,
+                rev=parsed.rev,
+                shallow=shallow,
+                depth=depth,
+            )
+
+    added = counts[AddAction.ADD]
+    written = False
+    if added and not dry_run:
+        try:
+            _save_ordered_items(config_file_path, ordered_items)
+        except Exception:
+            log.exception("Error saving config to %s", display_config_path)
+            return None
+        written = True
+
+    result = BatchAddResult(
+        added=added,
+        skip_existing=counts[AddAction.SKIP_EXISTING],
+        skip_pinned=counts[AddAction.SKIP_PINNED],
+        errors=errors,
+        written=written,
+    )
+    formatter = OutputFormatter(OutputMode.NDJSON)
+    for record in records:
+        formatter.emit(record)
+    formatter.emit({"type": "summary", "dry_run": dry_run, **result._asdict()})
+    return result
+
+
+def _handle_batch_add_command(args: argparse.Namespace) -> None:
+    """Run ``vcspull add --from-file`` / ``--stdin``."""
+    conflicting = [
+        flag
+        for flag, value in (
+            ("a repository argument", getattr(args, "repo_path", None)),
+            ("--name", getattr(args, "override_name", None)),
+            ("--url", getattr(args, "url", None)),
+            ("--pin", getattr(args, "pin", None)),
+        )
+        if value
+    ]
+    if conflicting:
+        log.error(
+            "Cannot combine %s with a repository list; put names and "
+            "revisions on each line instead.",
+            ", ".join(conflicting),
+        )
+        return
+
+    explicit_depth = getattr(args, "depth", None)
+    if explicit_depth is not None and explicit_depth < 1:
+        log.error("--depth must be a positive integer (got %s)", explicit_depth)
+        return
+
+    batch_kwargs: dict[str, t.Any] = {
+        "config_file_path_str": getattr(args, "config", None),
+        "workspace_root_path": getattr(args, "workspace_root_path", None),
+        "dry_run": args.dry_run,
+        "merge_duplicates": args.merge_duplicates,
+        "shallow": bool(getattr(args, "shallow", False)),
+        "depth": explicit_depth,
+    }
+    if args.batch_stdin:
+        add_repos_batch(sys.stdin, **batch_kwargs)
+        return
+    batch_path = pathlib.Path(args.batch_file).expanduser()
+    try:
+        lines = batch_path.open(encoding="utf-8")
+    except OSError as exc:
+        log.error(  # noqa: TRY400
+            "Cannot read repository list %s: %s",
+            PrivatePath(batch_path),
+            exc.strerror,
+        )
+        return
+    with lines:
+        add_repos_batch(lines, **batch_kwargs)
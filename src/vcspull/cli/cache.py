@@ -0,0 +1,112 @@
+"""Cache management CLI for vcspull."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import typing as t
+
+from colorama import Fore, Style
+
+from vcspull._internal.completion_cache import default_completion_cache_dir
+from vcspull._internal.config_cache import default_config_cache_path
+from vcspull._internal.path_index import default_index_path
+from vcspull._internal.private_path import PrivatePath
+from vcspull._internal.scan_cache import default_scan_cache_path
+
+if t.TYPE_CHECKING:
+    import argparse
+    import pathlib
+
+log = logging.getLogger(__name__)
+
+
+def create_cache_subparser(parser: argparse.ArgumentParser) -> None:
+    """Create ``vcspull cache`` argument subparser.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The parser to configure
+    """
+    subparsers = parser.add_subparsers(dest="cache_action")
+    subparsers.add_parser(
+        "clear",
+        help=(
+            "delete cached config snapshots, the path index, discover scans, "
+            "and shell completion data"
+        ),
+    )
+
+
+def cache_paths() -> list[pathlib.Path]:
+    """Return the caches that ``vcspull cache clear`` deletes.
+
+    Each is rebuilt from the config files or the filesystem on next use. The
+    sync state store is not among them, since it records what earlier runs
+    observed and cannot be rebuilt.
+
+    Examples
+    --------
+    >>> [path.name for path in cache_paths()]
+    ['config-cache.sqlite3', 'path-index.sqlite3', 'discover-cache.sqlite3',
+     'completion']
+    """
+    return [
+        default_config_cache_path(),
+        default_index_path(),
+        default_scan_cache_path(),
+        default_completion_cache_dir(),
+    ]
+
+
+def clear_caches() -> list[pathlib.Path]:
+    """Delete the caches in :func:`cache_paths`; return the ones that existed.
+
+    Examples
+    --------
+    >>> from vcspull._internal.config_cache import store_snapshot
+    >>> store_snapshot("key", [])
+    >>> [path.name for path in clear_caches()]
+    ['config-cache.sqlite3']
+    >>> clear_caches()
+    []
+    """
+    removed: list[pathlib.Path] = []
+    for path in cache_paths():
+        try:
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+        except FileNotFoundError:
+            continue
+        removed.append(path)
+    return removed
+
+
+def handle_cache_command(args: argparse.Namespace) -> None:
+    """Handle the vcspull cache command.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed command line arguments.
+    """
+    if args.cache_action is None:
+        print("Usage: vcspull cache {clear}")
+        return
+
+    removed = clear_caches()
+    if not removed:
+        log.info("%s•%s No caches to clear.", Fore.CYAN, Style.RESET_ALL)
+        return
+    for path in removed:
+        log.info(
+            "%s✓%s Removed %s%s%s",
+            Fore.GREEN,
+            Style.RESET_ALL,
+            Fore.BLUE,
+            PrivatePath(path),
+            Style.RESET_ALL,
+        )
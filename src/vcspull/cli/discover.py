@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import enum
 import logging
 import os
@@ -14,7 +15,12 @@ import typing as t
 from colorama import Fore, Style
 
 from vcspull._internal.config_reader import DuplicateAwareConfigReader
+from vcspull._internal.git_probe import read_origin_url
+from vcspull._internal.hg_probe import read_default_path
 from vcspull._internal.private_path import PrivatePath
+from vcspull._internal.repo_walker import walk_checkouts
+from vcspull._internal.scan_cache import DirectoryCache
+from vcspull._internal.svn_probe import read_working_copy_url
 from vcspull.config import (
     build_repo_entry,
     canonicalize_workspace_path,
@@ -27,6 +33,7 @@ from vcspull.config import (
     normalize_workspace_roots,
     resolve_clone_depth,
     save_config,
+    save_config_additions,
     workspace_root_label,
 )
 
@@ -202,6 +209,9 @@ def is_git_worktree(path: pathlib.Path) -> bool:
 def get_git_origin_url(repo_path: pathlib.Path) -> str | None:
     """Get the origin URL from a git repository.
 
+    Reads the repository's config file directly and only runs ``git config``
+    when that finds no URL.
+
     Parameters
     ----------
     repo_path : pathlib.Path
@@ -211,7 +221,22 @@ def get_git_origin_url(repo_path: pathlib.Path) -> str | None:
     -------
     str | None
         The origin URL if found, None otherwise
+
+    Examples
+    --------
+    >>> repo = create_git_remote_repo()
+    >>> get_git_origin_url(repo) is None
+    True
+    >>> _ = subprocess.run(
+    ...     ["git", "-C", str(repo), "remote", "add", "origin", "https://x/y.git"],
+    ...     check=True, capture_output=True,
+    ... )
+    >>> get_git_origin_url(repo)
+    'https://x/y.git'
     """
+    url = read_origin_url(repo_path)
+    if url:
+        return url
     try:
         result = subprocess.run(
             ["git", "config", "--get", "remote.origin.url"],
@@ -226,6 +251,130 @@ def get_git_origin_url(repo_path: pathlib.Path) -> str | None:
         return None
 
 
+def _run_url_command(cmd: list[str], repo_path: pathlib.Path) -> str | None:
+    """Return the stripped output of a VCS command, or ``None`` if it fails."""
+    try:
+        result = subprocess.run(
+            cmd,
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        log.debug("Could not get remote URL for %s: %s", repo_path, e)
+        return None
+    return result.stdout.strip() or None
+
+
+def get_hg_default_url(repo_path: pathlib.Path) -> str | None:
+    r"""Get the ``default`` path of a Mercurial checkout.
+
+    Reads ``.hg/hgrc`` directly and only runs ``hg paths default`` when that
+    finds no URL.
+
+    Examples
+    --------
+    >>> (tmp_path / ".hg").mkdir()
+    >>> _ = (tmp_path / ".hg" / "hgrc").write_text(
+    ...     "[paths]\ndefault = https://hg.example.com/repo\n"
+    ... )
+    >>> get_hg_default_url(tmp_path)
+    'https://hg.example.com/repo'
+    """
+    url = read_default_path(repo_path)
+    if url:
+        return url
+    return _run_url_command(["hg", "paths", "default"], repo_path)
+
+
+def get_svn_url(repo_path: pathlib.Path) -> str | None:
+    """Get the URL a Subversion working copy was checked out from.
+
+    Reads ``.svn/wc.db`` directly and only runs ``svn info`` when that finds
+    no URL.
+
+    Examples
+    --------
+    >>> (tmp_path / ".svn").mkdir()
+    >>> monkeypatch = getfixture("monkeypatch")
+    >>> monkeypatch.setattr(
+    ...     "vcspull.cli.discover.read_working_copy_url",
+    ...     lambda path: "https://svn.example.com/r/trunk",
+    ... )
+    >>> get_svn_url(tmp_path)
+    'https://svn.example.com/r/trunk'
+    """
+    url = read_working_copy_url(repo_path)
+    if url:
+        return url
+    return _run_url_command(["svn", "info", "--show-item", "url"], repo_path)
+
+
+def get_checkout_url(repo_path: pathlib.Path, vcs: str) -> str | None:
+    r"""Get the remote URL of a checkout, as recorded in vcspull config.
+
+    Git URLs are recorded as-is. Mercurial and Subversion URLs get an
+    ``hg+`` or ``svn+`` prefix, which ``vcspull sync`` needs to tell them
+    apart from git remotes.
+
+    Examples
+    --------
+    >>> (tmp_path / ".hg").mkdir()
+    >>> _ = (tmp_path / ".hg" / "hgrc").write_text(
+    ...     "[paths]\ndefault = https://hg.example.com/repo\n"
+    ... )
+    >>> get_checkout_url(tmp_path, "hg")
+    'hg+https://hg.example.com/repo'
+    """
+    if vcs == "hg":
+        url = get_hg_default_url(repo_path)
+    elif vcs == "svn":
+        url = get_svn_url(repo_path)
+    else:
+        return get_git_origin_url(repo_path)
+    if not url:
+        return None
+    prefix = f"{vcs}+"
+    return url if url.startswith(prefix) else f"{prefix}{url}"
+
+
+class _CheckoutProbe(t.NamedTuple):
+    """Metadata read from one checkout found while scanning."""
+
+    url: str | None
+    shallow: bool
+    depth: int | None
+
+
+def _probe_checkout(
+    repo_path: pathlib.Path,
+    *,
+    vcs: str,
+    include_worktrees: bool,
+    shallow: bool,
+    depth: int | None,
+) -> _CheckoutProbe | None:
+    """Read a checkout's remote URL and clone depth; ``None`` skips a worktree.
+
+    Clone depth only applies to git checkouts. Runs on a worker thread, so it
+    only gathers data; the caller logs.
+    """
+    if vcs != "git":
+        return _CheckoutProbe(get_checkout_url(repo_path, vcs), False, None)
+    if not include_worktrees and is_git_worktree(repo_path):
+        return None
+    url = get_git_origin_url(repo_path)
+    if not url:
+        return _CheckoutProbe(None, False, None)
+    repo_shallow, repo_depth = resolve_clone_depth(
+        repo_path,
+        explicit_shallow=shallow,
+        explicit_depth=depth,
+    )
+    return _CheckoutProbe(url, repo_shallow, repo_depth)
+
+
 def create_discover_subparser(parser: argparse.ArgumentParser) -> None:
     """Create ``vcspull discover`` argument subparser.
 
@@ -239,7 +388,7 @@ def create_discover_subparser(parser: argparse.ArgumentParser) -> None:
         metavar="PATH",
         nargs="?",
         default=None,
-        help="Directory to scan for git repositories",
+        help="Directory to scan for git, Mercurial, and Subversion repositories",
     )
     parser.add_argument(
         "-f",
@@ -295,6 +444,40 @@ def create_discover_subparser(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Scan directories recursively",
     )
+    parser.add_argument(
+        "--nested",
+        action="store_true",
+        help=(
+            "With --recursive, also look for repositories inside repositories "
+            "already found (stops at each repository root by default)"
+        ),
+    )
+    parser.add_argument(
+        "--max-depth",
+        dest="max_depth",
+        type=int,
+        metavar="N",
+        help="With --recursive, search at most N directory levels below PATH",
+    )
+    parser.add_argument(
+        "--exclude",
+        dest="exclude",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help=(
+            "Skip directories whose name or path relative to PATH matches GLOB "
+            "(repeatable; also read from .vcspullignore files)"
+        ),
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help=(
+            "Re-read every directory instead of skipping those unchanged since "
+            "the last scan"
+        ),
+    )
     parser.add_argument(
         "--yes",
         "-y",
@@ -364,13 +547,17 @@ def discover_repos(
     rev: str | None = None,
     shallow: bool = False,
     depth: int | None = None,
+    nested: bool = False,
+    max_depth: int | None = None,
+    exclude: t.Sequence[str] = (),
+    full: bool = False,
 ) -> None:
-    """Scan filesystem for git repositories and add to vcspull config.
+    """Scan filesystem for repositories and add to vcspull config.
 
     Parameters
     ----------
     scan_dir_str : str
-        Directory to scan for git repositories
+        Directory to scan for git, Mercurial, and Subversion repositories
     config_file_path_str : str | None
         Path to config file, or None to use default
     recursive : bool
@@ -390,10 +577,25 @@ def discover_repos(
     depth : int | None
         If set, record ``options.depth: N`` for every discovered repository;
         overrides ``shallow``.
+    nested : bool
+        When scanning recursively, keep looking for repositories inside
+        repositories that were already found.
+    max_depth : int | None
+        When scanning recursively, how many directory levels below
+        ``scan_dir_str`` to search. ``None`` means no limit.
+    exclude : Sequence[str]
+        Globs for directories to skip, in addition to any ``.vcspullignore``
+        files found while scanning.
+    full : bool
+        Read every directory again instead of reusing directory listings
+        cached by earlier scans.
     """
     if depth is not None and depth < 1:
         log.error("--depth must be a positive integer (got %s)", depth)
         return
+    if max_depth is not None and max_depth < 1:
+        log.error("--max-depth must be a positive integer (got %s)", max_depth)
+        return
 
     scan_dir = expand_dir(pathlib.Path(scan_dir_str))
 
@@ -560,90 +762,59 @@ def discover_repos(
             cwd=cwd,
         )
 
-    # TODO(#discover-non-git): Also scan for .hg and .svn repositories
-    if recursive:
-        for root, dirs, files in os.walk(scan_dir):
-            # Check for .git as directory (regular repos) or file (worktrees)
-            git_path = pathlib.Path(root) / ".git"
-            if ".git" in dirs or (".git" in files and git_path.is_file()):
-                repo_path = pathlib.Path(root)
-
-                # Skip worktrees unless explicitly included
-                if not include_worktrees and is_git_worktree(repo_path):
-                    log.debug(
-                        "Skipping git worktree at %s",
-                        PrivatePath(repo_path),
-                    )
-                    continue
-
-                repo_name = repo_path.name
-                repo_url = get_git_origin_url(repo_path)
-
-                if not repo_url:
-                    log.warning(
-                        "Could not determine remote URL for git repository "
-                        "at %s. Skipping.",
-                        PrivatePath(repo_path),
-                    )
-                    continue
+    checkouts = walk_checkouts(
+        scan_dir,
+        include_root=recursive,
+        max_depth=max_depth if recursive else 1,
+        nested=nested,
+        exclude=exclude,
+        cache=DirectoryCache.load(scan_dir, reuse=not full),
+    )
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        probes = list(
+            executor.map(
+                lambda checkout: _probe_checkout(
+                    checkout.path,
+                    vcs=checkout.vcs,
+                    include_worktrees=include_worktrees,
+                    shallow=shallow,
+                    depth=depth,
+                ),
+                checkouts,
+            ),
+        )
 
-                workspace_path = override_workspace_path or scan_dir
-                repo_shallow, repo_depth = resolve_clone_depth(
-                    repo_path,
-                    explicit_shallow=shallow,
-                    explicit_depth=depth,
-                )
-                found_repos.append(
-                    _FoundRepo(
-                        repo_name,
-                        repo_url,
-                        workspace_path,
-                        repo_shallow,
-                        repo_depth,
-                    ),
-                )
-    else:
-        for item in scan_dir.iterdir():
-            git_path = item / ".git"
-            if item.is_dir() and (git_path.is_dir() or git_path.is_file()):
-                # Skip worktrees unless explicitly included
-                if not include_worktrees and is_git_worktree(item):
-                    log.debug(
-                        "Skipping git worktree at %s",
-                        PrivatePath(item),
-                    )
-                    continue
+    for checkout, probe in zip(checkouts, probes, strict=True):
+        repo_path = checkout.path
 
-                repo_name = item.name
-                repo_url = get_git_origin_url(item)
+        if probe is None:
+            log.debug(
+                "Skipping git worktree at %s",
+                PrivatePath(repo_path),
+            )
+            continue
 
-                if not repo_url:
-                    log.warning(
-                        "Could not determine remote URL for git repository "
-                        "at %s. Skipping.",
-                        PrivatePath(item),
-                    )
-                    continue
+        if not probe.url:
+            log.warning(
+                "Could not determine remote URL for %s repository at %s. Skipping.",
+                checkout.vcs,
+                PrivatePath(repo_path),
+            )
+            continue
 
-                workspace_path = override_workspace_path or scan_dir
-                repo_shallow, repo_depth = resolve_clone_depth(
-                    item,
-                    explicit_shallow=shallow,
-                    explicit_depth=depth,
-                )
-                found_repos.append(
-                    _FoundRepo(
-                        repo_name,
-                        repo_url,
-                        workspace_path,
-                        repo_shallow,
-                        repo_depth,
-                    ),
-                )
+        found_repos.append(
+            _FoundRepo(
+                repo_path.name,
+                probe.url,
+                override_workspace_path or scan_dir,
+                probe.shallow,
+                probe.depth,
+            ),
+        )
 
     if not found_repos:
         log.info(
-            "%s!%s No git repositories found in %s%s%s. Nothing to import.",
+            "%s!%s No repositories found in %s%s%s. Nothing to import.",
             Fore.YELLOW,
             Style.RESET_ALL,
             Fore.BLUE,
@@ -847,6 +1018,10 @@ def discover_repos(
             log.info("%s✗%s Aborted by user.", Fore.RED, Style.RESET_ALL)
             return
 
+    # Additions alone can be appended to a JSONL config; merges and
+    # relabelled roots also edit what is already there.
+    edits_existing = changes_made
+    added_entries: list[tuple[str, str, t.Any]] = []
     for repo_name, repo_url, workspace_path, repo_shallow, repo_depth in repos_to_add:
         workspace_label = workspace_map.get(workspace_path)
         if workspace_label is None:
@@ -875,6 +1050,9 @@ def discover_repos(
                 shallow=repo_shallow,
                 depth=repo_depth,
             )
+            added_entries.append(
+                (workspace_label, repo_name, raw_config[workspace_label][repo_name]),
+            )
             log.info(
                 "%s+%s Importing %s'%s'%s (%s%s%s) under '%s%s%s'.",
                 Fore.GREEN,
@@ -893,7 +1071,12 @@ def discover_repos(
 
     if changes_made:
         try:
-            save_config(config_file_path, raw_config)
+            save_config_additions(
+                config_file_path,
+                raw_config,
+                added_entries,
+                edits_existing=edits_existing,
+            )
             log.info(
                 "%s✓%s Successfully updated %s%s%s.",
                 Fore.GREEN,
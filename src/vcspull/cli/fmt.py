@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import copy
 import enum
+import functools
 import logging
 import pathlib
 import traceback
@@ -24,6 +25,8 @@ from vcspull.config import (
     save_config,
 )
 
+from ._config_files import FileCheck, run_config_files
+
 log = logging.getLogger(__name__)
 
 
@@ -44,12 +47,18 @@ def create_fmt_subparser(parser: argparse.ArgumentParser) -> None:
         metavar="FILE",
         help="path to config file (default: .vcspull.yaml or ~/.vcspull.yaml)",
     )
-    parser.add_argument(
+    write_or_check = parser.add_mutually_exclusive_group()
+    write_or_check.add_argument(
         "--write",
         "-w",
         action="store_true",
         help="Write formatted configuration back to file",
     )
+    write_or_check.add_argument(
+        "--check",
+        action="store_true",
+        help="Write nothing; exit with status 1 if any file needs formatting",
+    )
     parser.add_argument(
         "--all",
         action="store_true",
@@ -227,12 +236,23 @@ def format_config(config_data: dict[str, t.Any]) -> tuple[dict[str, t.Any], int]
     return formatted, changes
 
 
+def _log_already_formatted(config_file_path: pathlib.Path) -> None:
+    log.info(
+        "%s✓%s %s%s%s is already formatted correctly.",
+        Fore.GREEN,
+        Style.RESET_ALL,
+        Fore.BLUE,
+        str(PrivatePath(config_file_path)),
+        Style.RESET_ALL,
+    )
+
+
 def format_single_config(
     config_file_path: pathlib.Path,
     write: bool,
     *,
     merge_roots: bool,
-) -> bool:
+) -> FileCheck:
     """Format a single vcspull configuration file.
 
     Parameters
@@ -246,8 +266,10 @@ def format_single_config(
 
     Returns
     -------
-    bool
-        True if formatting was successful, False otherwise
+    FileCheck
+        ``CLEAN`` if the file was already formatted, ``DRIFT`` if it needed
+        formatting (and was rewritten when ``write``), ``FAILED`` if it could
+        not be read or written
     """
     # Precompute redacted path for CLI output.
     display_config_path = str(PrivatePath(config_file_path))
@@ -262,7 +284,7 @@ def format_single_config(
             display_config_path,
             Style.RESET_ALL,
         )
-        return False
+        return FileCheck.FAILED
 
     # Load existing config
     try:
@@ -274,7 +296,7 @@ def format_single_config(
             "Config file %s is not a mapping",
             PrivatePath(config_file_path),
         )
-        return False
+        return FileCheck.FAILED
     except Exception:
         log.exception(
             "Error loading config from %s",
@@ -282,7 +304,7 @@ def format_single_config(
         )
         if log.isEnabledFor(logging.DEBUG):
             traceback.print_exc()
-        return False
+        return FileCheck.FAILED
 
     # Format the configuration
     cwd = pathlib.Path.cwd()
@@ -292,7 +314,8 @@ def format_single_config(
     duplicate_merge_changes = 0
     duplicate_merge_details: list[tuple[str, int]] = []
 
-    working_config = copy.deepcopy(raw_config)
+    # The freshly loaded config is ours to rework; no copy needed.
+    working_config = raw_config
 
     if merge_roots:
         (
@@ -346,15 +369,8 @@ def format_single_config(
     change_count += normalization_changes + duplicate_merge_changes
 
     if change_count == 0:
-        log.info(
-            "%s✓%s %s%s%s is already formatted correctly.",
-            Fore.GREEN,
-            Style.RESET_ALL,
-            Fore.BLUE,
-            display_config_path,
-            Style.RESET_ALL,
-        )
-        return True
+        _log_already_formatted(config_file_path)
+        return FileCheck.CLEAN
 
     # Show what would be changed
     log.info(
@@ -465,7 +481,7 @@ def format_single_config(
             )
             if log.isEnabledFor(logging.DEBUG):
                 traceback.print_exc()
-            return False
+            return FileCheck.FAILED
     else:
         log.info(
             "\n%s→%s Run with %s--write%s to apply these formatting changes.",
@@ -475,7 +491,7 @@ def format_single_config(
             Style.RESET_ALL,
         )
 
-    return True
+    return FileCheck.DRIFT
 
 
 def format_config_file(
@@ -484,9 +500,14 @@ def format_config_file(
     format_all: bool = False,
     *,
     merge_roots: bool = True,
-) -> None:
+    check: bool = False,
+) -> int:
     """Format vcspull configuration file(s).
 
+    Files are formatted in worker processes when there are many of them, and
+    files an earlier run found formatted are not parsed again while their
+    content is unchanged.
+
     Parameters
     ----------
     config_file_path_str : str | None
@@ -497,6 +518,14 @@ def format_config_file(
         If True, format all discovered config files
     merge_roots : bool
         Merge duplicate workspace roots when True (default)
+    check : bool
+        Report files that need formatting as a failure
+
+    Returns
+    -------
+    int
+        Exit status: ``1`` if a file could not be processed, or with
+        ``check``, needs formatting; ``0`` otherwise
     """
     if format_all:
         # Format all discovered config files
@@ -518,7 +547,7 @@ def format_config_file(
                 Fore.RED,
                 Style.RESET_ALL,
             )
-            return
+            return 1
 
         log.info(
             "%si%s Found %s%d%s configuration %s to format:",
@@ -542,32 +571,6 @@ def format_config_file(
             )
 
         log.info("")  # Empty line for readability
-
-        success_count = 0
-        for config_file in config_files:
-            if format_single_config(
-                config_file,
-                write,
-                merge_roots=merge_roots,
-            ):
-                success_count += 1
-
-        # Summary
-        if success_count == len(config_files):
-            log.info(
-                "\n%s✓%s All %d configuration files processed successfully.",
-                Fore.GREEN,
-                Style.RESET_ALL,
-                len(config_files),
-            )
-        else:
-            log.info(
-                "\n%si%s Processed %d/%d configuration files successfully.",
-                Fore.CYAN,
-                Style.RESET_ALL,
-                success_count,
-                len(config_files),
-            )
     else:
         # Format single config file
         if config_file_path_str:
@@ -588,18 +591,57 @@ def format_config_file(
                         Fore.RED,
                         Style.RESET_ALL,
                     )
-                    return
+                    return 1
             elif len(home_configs) > 1:
                 log.error(
                     "Multiple home config files found, "
                     "please specify one with -f/--file",
                 )
-                return
+                return 1
             else:
                 config_file_path = home_configs[0]
+        config_files = [config_file_path]
 
-        format_single_config(
-            config_file_path,
-            write,
+    checks = run_config_files(
+        functools.partial(
+            format_single_config,
+            write=write,
             merge_roots=merge_roots,
+        ),
+        config_files,
+        command="fmt",
+        options={"merge_roots": merge_roots},
+        report_clean=_log_already_formatted,
+    )
+    success_count = sum(check is not FileCheck.FAILED for check in checks)
+    drift_count = sum(check is FileCheck.DRIFT for check in checks)
+
+    if format_all:
+        # Summary
+        if success_count == len(config_files):
+            log.info(
+                "\n%s✓%s All %d configuration files processed successfully.",
+                Fore.GREEN,
+                Style.RESET_ALL,
+                len(config_files),
+            )
+        else:
+            log.info(
+                "\n%si%s Processed %d/%d configuration files successfully.",
+                Fore.CYAN,
+                Style.RESET_ALL,
+                success_count,
+                len(config_files),
+            )
+
+    if check and drift_count:
+        log.error(
+            "%s✗%s %d configuration %s need%s formatting.",
+            Fore.RED,
+            Style.RESET_ALL,
+            drift_count,
+            "file" if drift_count == 1 else "files",
+            "s" if drift_count == 1 else "",
         )
+        return 1
+    return 0 if success_count == len(config_files) else 1
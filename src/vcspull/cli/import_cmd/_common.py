@@ -37,7 +37,7 @@ from vcspull.config import (
     is_pinned_for_op,
     merge_duplicate_workspace_roots,
     normalize_config_file_path,
-    save_config,
+    save_config_additions,
     workspace_root_label,
 )
 from vcspull.exc import MultipleConfigWarning
@@ -573,7 +573,7 @@ def _resolve_config_file(config_path_str: str | None) -> pathlib.Path:
             raise ValueError(msg)
         return path
 
-    home_configs = find_home_config_files(filetype=["yaml", "json"])
+    home_configs = find_home_config_files(filetype=["yaml", "json", "jsonl"])
     if home_configs:
         return home_configs[0]
 
@@ -894,6 +894,7 @@ def _run_import(
 
     # Load existing config or create new
     raw_config: dict[str, t.Any]
+    duplicate_roots: dict[str, list[t.Any]] = {}
     if config_file_path.exists():
         try:
             raw_config, duplicate_roots, _top_level_items = (
@@ -964,6 +965,8 @@ def _run_import(
     skip_existing_count = skip_pinned_count = skip_unchanged_count = 0
     provenance_tagged_count = 0
     imported_workspace_repos: set[tuple[str, str]] = set()
+    # New entries, so a JSONL config can be appended to instead of rewritten.
+    added_entries: list[tuple[str, str, t.Any]] = []
 
     for repo in repos:
         # Determine workspace for this repo
@@ -1050,6 +1053,7 @@ def _run_import(
                 if import_source:
                     entry["metadata"] = {"imported_from": import_source}
                 raw_config[repo_workspace_label][repo.name] = entry
+                added_entries.append((repo_workspace_label, repo.name, entry))
             else:
                 log.info("[DRY-RUN] Would add: %s → %s", repo.name, incoming_url)
             added_count += 1
@@ -1316,7 +1320,17 @@ def _run_import(
         return 0
 
     try:
-        save_config(config_file_path, raw_config)
+        save_config_additions(
+            config_file_path,
+            raw_config,
+            added_entries,
+            edits_existing=bool(
+                updated_url_count
+                or pruned_count
+                or provenance_tagged_count
+                or duplicate_roots
+            ),
+        )
         if added_count > 0:
             log.info(
                 "%s Added %s repositories to %s",
@@ -5,9 +5,15 @@ from __future__ import annotations
 import argparse
 import logging
 import pathlib
+import re
+import time
+import typing as t
+from datetime import datetime, timezone
 
+from vcspull._internal.lazy_config import LazyConfig
 from vcspull._internal.private_path import PrivatePath
-from vcspull.config import filter_repos, find_config_files, load_configs
+from vcspull._internal.state_store import RepoState, open_state_store, state_key
+from vcspull.config import find_config_files, load_configs
 from vcspull.types import ConfigDict
 
 from ._colors import Colors, get_color_mode
@@ -16,6 +22,32 @@ from ._workspaces import filter_by_workspace
 
 log = logging.getLogger(__name__)
 
+_DURATION_RE = re.compile(r"^\s*(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>[smhdw]?)\s*$")
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def _max_age_arg(value: str) -> float:
+    """Parse ``--max-age`` durations such as ``90``, ``30m``, ``1h``, or ``2d``.
+
+    Examples
+    --------
+    >>> _max_age_arg("90")
+    90.0
+    >>> _max_age_arg("1h")
+    3600.0
+    >>> _max_age_arg("1.5d")
+    129600.0
+    >>> _max_age_arg("soon")
+    Traceback (most recent call last):
+    ...
+    argparse.ArgumentTypeError: --max-age takes a duration like 30m or 2d (got 'soon')
+    """
+    match = _DURATION_RE.match(value)
+    if match is None:
+        msg = f"--max-age takes a duration like 30m or 2d (got {value!r})"
+        raise argparse.ArgumentTypeError(msg)
+    return float(match.group("value")) * _DURATION_UNITS[match.group("unit")]
+
 
 def create_list_subparser(parser: argparse.ArgumentParser) -> None:
     """Create ``vcspull list`` argument subparser.
@@ -75,6 +107,34 @@ def create_list_subparser(parser: argparse.ArgumentParser) -> None:
         dest="include_worktrees",
         help="include configured worktrees in the listing",
     )
+    state_group = parser.add_argument_group(
+        "recorded state",
+        "filter by the state the last sync, status, or plan run recorded; "
+        "repositories match if any given filter matches, and git is not run",
+    )
+    state_group.add_argument(
+        "--dirty",
+        action="store_true",
+        help="only repositories last seen with uncommitted changes",
+    )
+    state_group.add_argument(
+        "--behind",
+        action="store_true",
+        help="only repositories last seen behind their upstream",
+    )
+    state_group.add_argument(
+        "--missing",
+        action="store_true",
+        help="only repositories last seen missing from disk",
+    )
+    state_group.add_argument(
+        "--max-age",
+        dest="max_age",
+        type=_max_age_arg,
+        metavar="DURATION",
+        default=None,
+        help="ignore state recorded longer ago than DURATION (e.g. 30m, 1h, 2d)",
+    )
 
 
 def list_repos(
@@ -86,6 +146,10 @@ def list_repos(
     output_ndjson: bool,
     color: str,
     include_worktrees: bool = False,
+    dirty: bool = False,
+    behind: bool = False,
+    missing: bool = False,
+    max_age: float | None = None,
 ) -> None:
     """List configured repositories.
 
@@ -107,21 +171,28 @@ def list_repos(
         Color mode (auto, always, never)
     include_worktrees : bool
         Include configured worktrees in the listing (default: False)
+    dirty : bool
+        Only list repositories recorded with uncommitted changes
+    behind : bool
+        Only list repositories recorded behind their upstream
+    missing : bool
+        Only list repositories recorded as missing from disk
+    max_age : float | None
+        Ignore recorded state older than this many seconds
     """
-    # Load configs
-    if config_path:
-        configs = load_configs([config_path])
-    else:
-        configs = load_configs(find_config_files(include_home=True))
+    config_files = (
+        [config_path] if config_path else find_config_files(include_home=True)
+    )
 
     # Filter by patterns if provided
     if repo_patterns:
+        configs = LazyConfig.load(config_files)
         found_repos: list[ConfigDict] = []
         for pattern in repo_patterns:
-            found_repos.extend(filter_repos(configs, name=pattern))
+            found_repos.extend(configs.filter(name=pattern))
     else:
         # No patterns = all repos
-        found_repos = configs
+        found_repos = load_configs(config_files)
 
     # Further filter by workspace root if specified
     if workspace_root:
@@ -132,25 +203,155 @@ def list_repos(
     formatter = OutputFormatter(output_mode)
     colors = Colors(get_color_mode(color))
 
+    states: dict[str, RepoState] | None = None
+    unrecorded = 0
+    if dirty or behind or missing:
+        found_repos, states, unrecorded = _filter_by_state(
+            found_repos,
+            dirty=dirty,
+            behind=behind,
+            missing=missing,
+            max_age=max_age,
+        )
+
     if not found_repos:
         formatter.emit_text(colors.warning("No repositories found."))
-        formatter.finalize()
-        return
-
     # Output based on mode
-    if tree:
-        _output_tree(found_repos, formatter, colors, include_worktrees)
+    elif tree:
+        _output_tree(found_repos, formatter, colors, include_worktrees, states)
     else:
-        _output_flat(found_repos, formatter, colors, include_worktrees)
+        _output_flat(found_repos, formatter, colors, include_worktrees, states)
+
+    if unrecorded:
+        age_note = " recent enough" if max_age is not None else ""
+        formatter.emit_text(
+            colors.muted(
+                f"{unrecorded} repositories have no recorded state{age_note}; "
+                "run `vcspull status --detailed` to refresh it.",
+            ),
+        )
 
     formatter.finalize()
 
 
+def _filter_by_state(
+    repos: list[ConfigDict],
+    *,
+    dirty: bool,
+    behind: bool,
+    missing: bool,
+    max_age: float | None,
+) -> tuple[list[ConfigDict], dict[str, RepoState], int]:
+    """Keep repositories whose recorded state matches any requested filter.
+
+    Returns the matching repositories, their states keyed by
+    :func:`~vcspull._internal.state_store.state_key`, and how many repositories
+    had no usable recorded state. With ``max_age``, each filter only trusts
+    the field it reads when that field was observed recently enough.
+
+    Examples
+    --------
+    >>> from vcspull._internal.state_store import record_states
+    >>> record_states(
+    ...     {"/src/a": {"present": True, "clean": False}, "/src/b": {"present": False}}
+    ... )
+    >>> repos = [
+    ...     {"name": "a", "path": "/src/a"},
+    ...     {"name": "b", "path": "/src/b"},
+    ...     {"name": "c", "path": "/src/c"},
+    ... ]
+    >>> matched, states, unrecorded = _filter_by_state(
+    ...     repos, dirty=True, behind=False, missing=False, max_age=None,
+    ... )
+    >>> [repo["name"] for repo in matched], unrecorded
+    (['a'], 1)
+    """
+    with open_state_store() as store:
+        recorded = (
+            store.get_many((repo.get("path", "") for repo in repos), max_age=max_age)
+            if store is not None
+            else {}
+        )
+    cutoff = None if max_age is None else time.time() - max_age
+    queried = [
+        field
+        for field, wanted in (
+            ("clean", dirty),
+            ("behind", behind),
+            ("present", missing),
+        )
+        if wanted
+    ]
+    matched: list[ConfigDict] = []
+    unrecorded = 0
+    for repo in repos:
+        state = recorded.get(state_key(repo.get("path", "")))
+        if state is None or not any(
+            state.observed_since(field, cutoff) for field in queried
+        ):
+            unrecorded += 1
+            continue
+        if (
+            (dirty and state.is_dirty and state.observed_since("clean", cutoff))
+            or (behind and state.is_behind and state.observed_since("behind", cutoff))
+            or (missing and state.is_missing)
+        ):
+            matched.append(repo)
+    return matched, recorded, unrecorded
+
+
+def _state_payload(state: RepoState | None) -> dict[str, t.Any]:
+    """Return the recorded-state keys added to list output under state filters.
+
+    Examples
+    --------
+    >>> payload = _state_payload(
+    ...     RepoState(path="/src/a", observed_at=0.0, present=True, clean=False),
+    ... )
+    >>> payload["dirty"], payload["exists"], payload["observed_at"]
+    (True, True, '1970-01-01T00:00:00+00:00')
+    """
+    if state is None:
+        return {}
+    return {
+        "exists": state.present,
+        "dirty": state.is_dirty,
+        "behind": state.behind,
+        "observed_at": datetime.fromtimestamp(
+            state.observed_at,
+            tz=timezone.utc,
+        ).isoformat(timespec="seconds"),
+    }
+
+
+def _state_tags(state: RepoState | None, colors: Colors) -> str:
+    """Return a human suffix naming why a repository matched a state filter.
+
+    Examples
+    --------
+    >>> from vcspull.cli._colors import ColorMode
+    >>> state = RepoState(path="/src/a", observed_at=0.0, clean=False, behind=2)
+    >>> _state_tags(state, Colors(ColorMode.NEVER))
+    '  dirty, behind 2'
+    """
+    if state is None:
+        return ""
+    tags: list[str] = []
+    if state.is_missing:
+        tags.append("missing")
+    if state.is_dirty:
+        tags.append("dirty")
+    if state.is_behind:
+        tags.append(f"behind {state.behind}")
+    return f"  {colors.warning(', '.join(tags))}" if tags else ""
+
+
 def _output_flat(
     repos: list[ConfigDict],
     formatter: OutputFormatter,
     colors: Colors,
     include_worktrees: bool = False,
+    states: dict[str, RepoState] | None = None,
 ) -> None:
     """Output repositories in flat list format.
 
@@ -164,11 +365,14 @@ def _output_flat(
         Color manager
     include_worktrees : bool
         Whether to include configured worktrees
+    states : dict[str, RepoState] | None
+        Recorded states, keyed by checkout path, when a state filter is active
     """
     for repo in repos:
         repo_name = repo.get("name", "unknown")
         repo_url = repo.get("url", repo.get("pip_url", "unknown"))
         repo_path = repo.get("path", "unknown")
+        state = states.get(state_key(repo_path)) if states is not None else None
 
         # JSON/NDJSON output (contract home for privacy/portability)
         formatter.emit(
@@ -177,13 +381,15 @@ def _output_flat(
                 "url": str(repo_url),
                 "path": str(PrivatePath(repo_path)),
                 "workspace_root": str(repo.get("workspace_root", "")),
+                **_state_payload(state),
             },
         )
 
         # Human output (contract home directory for privacy/brevity)
         formatter.emit_text(
             f"{colors.muted('•')} {colors.info(repo_name)} "
-            f"{colors.muted('→')} {PrivatePath(repo_path)}",
+            f"{colors.muted('→')} {PrivatePath(repo_path)}"
+            f"{_state_tags(state, colors)}",
         )
 
         # Output worktrees if enabled
@@ -222,6 +428,7 @@ def _output_tree(
     formatter: OutputFormatter,
     colors: Colors,
     include_worktrees: bool = False,
+    states: dict[str, RepoState] | None = None,
 ) -> None:
     """Output repositories grouped by workspace root (tree view).
 
@@ -235,6 +442,8 @@ def _output_tree(
         Color manager
     include_worktrees : bool
         Whether to include configured worktrees
+    states : dict[str, RepoState] | None
+        Recorded states, keyed by checkout path, when a state filter is active
     """
     # Group by workspace root
     by_workspace: dict[str, list[ConfigDict]] = {}
@@ -253,6 +462,7 @@ def _output_tree(
             repo_name = repo.get("name", "unknown")
             repo_url = repo.get("url", repo.get("pip_url", "unknown"))
             repo_path = repo.get("path", "unknown")
+            state = states.get(state_key(repo_path)) if states is not None else None
 
             # JSON/NDJSON output (contract home for privacy/portability)
             formatter.emit(
@@ -261,13 +471,15 @@ def _output_tree(
                     "url": str(repo_url),
                     "path": str(PrivatePath(repo_path)),
                     "workspace_root": workspace,
+                    **_state_payload(state),
                 },
             )
 
             # Human output: indented repo (contract home directory for privacy/brevity)
             formatter.emit_text(
                 f"  {colors.muted('•')} {colors.info(repo_name)} "
-                f"{colors.muted('→')} {PrivatePath(repo_path)}",
+                f"{colors.muted('→')} {PrivatePath(repo_path)}"
+                f"{_state_tags(state, colors)}",
             )
 
             # Output worktrees if enabled
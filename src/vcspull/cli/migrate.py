@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import argparse
-import copy
+import functools
 import logging
 import pathlib
 import traceback
@@ -22,6 +22,8 @@ from vcspull.config import (
     save_config,
 )
 
+from ._config_files import FileCheck, run_config_files
+
 log = logging.getLogger(__name__)
 
 
@@ -34,12 +36,18 @@ def create_migrate_subparser(parser: argparse.ArgumentParser) -> None:
         metavar="FILE",
         help="path to config file (default: .vcspull.yaml or ~/.vcspull.yaml)",
     )
-    parser.add_argument(
+    write_or_check = parser.add_mutually_exclusive_group()
+    write_or_check.add_argument(
         "--write",
         "-w",
         action="store_true",
         help="Write migrated configuration back to file",
     )
+    write_or_check.add_argument(
+        "--check",
+        action="store_true",
+        help="Write nothing; exit with status 1 if any file needs migrating",
+    )
     parser.add_argument(
         "--all",
         action="store_true",
@@ -74,22 +82,36 @@ def migrate_config(config_data: dict[str, t.Any]) -> tuple[dict[str, t.Any], int
     ... )
     ({'~/code/': {'flask': {'repo': 'git+x', 'options': {'shallow': True}}}}, 0)
     """
-    migrated: dict[str, t.Any] = copy.deepcopy(config_data)
+    # Sections are copied as they change; migrate_repo_entry copies entries.
+    migrated: dict[str, t.Any] = dict(config_data)
     change_count = 0
 
-    for repos in migrated.values():
+    for workspace_label, repos in config_data.items():
         if not isinstance(repos, dict):
             continue
         for repo_name, entry in repos.items():
             changed, new_entry = migrate_repo_entry(entry)
             if changed:
-                repos[repo_name] = new_entry
+                if migrated[workspace_label] is repos:
+                    migrated[workspace_label] = dict(repos)
+                migrated[workspace_label][repo_name] = new_entry
                 change_count += 1
 
     return migrated, change_count
 
 
-def migrate_single_config(config_file_path: pathlib.Path, write: bool) -> bool:
+def _log_already_migrated(config_file_path: pathlib.Path) -> None:
+    log.info(
+        "%s✓%s %s%s%s already nests rev/shallow/depth under options:.",
+        Fore.GREEN,
+        Style.RESET_ALL,
+        Fore.BLUE,
+        str(PrivatePath(config_file_path)),
+        Style.RESET_ALL,
+    )
+
+
+def migrate_single_config(config_file_path: pathlib.Path, write: bool) -> FileCheck:
     """Migrate a single vcspull configuration file.
 
     Parameters
@@ -101,8 +123,10 @@ def migrate_single_config(config_file_path: pathlib.Path, write: bool) -> bool:
 
     Returns
     -------
-    bool
-        ``True`` if the file was processed successfully, ``False`` otherwise.
+    FileCheck
+        ``CLEAN`` if nothing needed migrating, ``DRIFT`` if entries did (and
+        were rewritten when ``write``), ``FAILED`` if the file could not be
+        read or written.
     """
     display_config_path = str(PrivatePath(config_file_path))
 
@@ -115,7 +139,7 @@ def migrate_single_config(config_file_path: pathlib.Path, write: bool) -> bool:
             display_config_path,
             Style.RESET_ALL,
         )
-        return False
+        return FileCheck.FAILED
 
     try:
         raw_config, _duplicate_root_occurrences, _top_level_items = (
@@ -126,7 +150,7 @@ def migrate_single_config(config_file_path: pathlib.Path, write: bool) -> bool:
             "Config file %s is not a mapping",
             PrivatePath(config_file_path),
         )
-        return False
+        return FileCheck.FAILED
     except Exception:
         log.exception(
             "Error loading config from %s",
@@ -134,20 +158,13 @@ def migrate_single_config(config_file_path: pathlib.Path, write: bool) -> bool:
         )
         if log.isEnabledFor(logging.DEBUG):
             traceback.print_exc()
-        return False
+        return FileCheck.FAILED
 
     migrated_config, change_count = migrate_config(raw_config)
 
     if change_count == 0:
-        log.info(
-            "%s✓%s %s%s%s already nests rev/shallow/depth under options:.",
-            Fore.GREEN,
-            Style.RESET_ALL,
-            Fore.BLUE,
-            display_config_path,
-            Style.RESET_ALL,
-        )
-        return True
+        _log_already_migrated(config_file_path)
+        return FileCheck.CLEAN
 
     log.info(
         "%si%s Migrating %s%d%s %s in %s%s%s",
@@ -198,7 +215,7 @@ def migrate_single_config(config_file_path: pathlib.Path, write: bool) -> bool:
             )
             if log.isEnabledFor(logging.DEBUG):
                 traceback.print_exc()
-            return False
+            return FileCheck.FAILED
     else:
         log.info(
             "\n%s→%s Run with %s--write%s to apply these changes.",
@@ -208,16 +225,22 @@ def migrate_single_config(config_file_path: pathlib.Path, write: bool) -> bool:
             Style.RESET_ALL,
         )
 
-    return True
+    return FileCheck.DRIFT
 
 
 def migrate_config_file(
     config_file_path_str: str | None,
     write: bool,
     migrate_all: bool = False,
-) -> None:
+    *,
+    check: bool = False,
+) -> int:
     """Migrate vcspull configuration file(s) to the ``options:`` form.
 
+    Files are migrated in worker processes when there are many of them, and
+    files an earlier run found migrated are not parsed again while their
+    content is unchanged.
+
     Parameters
     ----------
     config_file_path_str : str | None
@@ -226,6 +249,14 @@ def migrate_config_file(
         Whether to write changes back to file.
     migrate_all : bool
         If True, migrate all discovered config files.
+    check : bool
+        Report files that still need migrating as a failure.
+
+    Returns
+    -------
+    int
+        Exit status: ``1`` if a file could not be processed, or with
+        ``check``, still needs migrating; ``0`` otherwise.
     """
     if migrate_all:
         config_files = find_config_files(include_home=True)
@@ -244,7 +275,7 @@ def migrate_config_file(
                 Fore.RED,
                 Style.RESET_ALL,
             )
-            return
+            return 1
 
         log.info(
             "%si%s Found %s%d%s configuration %s to check:",
@@ -265,12 +296,42 @@ def migrate_config_file(
                 Style.RESET_ALL,
             )
         log.info("")
+    elif config_file_path_str:
+        config_files = [
+            normalize_config_file_path(pathlib.Path(config_file_path_str)),
+        ]
+    else:
+        home_configs = find_home_config_files(filetype=["yaml"])
+        if not home_configs:
+            local_config = pathlib.Path.cwd() / ".vcspull.yaml"
+            if local_config.exists():
+                config_files = [local_config]
+            else:
+                log.error(
+                    "%s✗%s No configuration file found. Create .vcspull.yaml first.",
+                    Fore.RED,
+                    Style.RESET_ALL,
+                )
+                return 1
+        elif len(home_configs) > 1:
+            log.error(
+                "Multiple home config files found, please specify one with -f/--file",
+            )
+            return 1
+        else:
+            config_files = [home_configs[0]]
+
+    checks = run_config_files(
+        functools.partial(migrate_single_config, write=write),
+        config_files,
+        command="migrate",
+        options={},
+        report_clean=_log_already_migrated,
+    )
+    success_count = sum(check is not FileCheck.FAILED for check in checks)
+    drift_count = sum(check is FileCheck.DRIFT for check in checks)
 
-        success_count = 0
-        for config_file in config_files:
-            if migrate_single_config(config_file, write):
-                success_count += 1
-
+    if migrate_all:
         if success_count == len(config_files):
             log.info(
                 "\n%s✓%s All %d configuration files processed successfully.",
@@ -286,31 +347,15 @@ def migrate_config_file(
                 success_count,
                 len(config_files),
             )
-        return
 
-    if config_file_path_str:
-        config_file_path = normalize_config_file_path(
-            pathlib.Path(config_file_path_str)
+    if check and drift_count:
+        log.error(
+            "%s✗%s %d configuration %s need%s migrating.",
+            Fore.RED,
+            Style.RESET_ALL,
+            drift_count,
+            "file" if drift_count == 1 else "files",
+            "s" if drift_count == 1 else "",
         )
-    else:
-        home_configs = find_home_config_files(filetype=["yaml"])
-        if not home_configs:
-            local_config = pathlib.Path.cwd() / ".vcspull.yaml"
-            if local_config.exists():
-                config_file_path = local_config
-            else:
-                log.error(
-                    "%s✗%s No configuration file found. Create .vcspull.yaml first.",
-                    Fore.RED,
-                    Style.RESET_ALL,
-                )
-                return
-        elif len(home_configs) > 1:
-            log.error(
-                "Multiple home config files found, please specify one with -f/--file",
-            )
-            return
-        else:
-            config_file_path = home_configs[0]
-
-    migrate_single_config(config_file_path, write)
+        return 1
+    return 0 if success_count == len(config_files) else 1
@@ -3,20 +3,29 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import logging
 import pathlib
 import re
 import typing as t
 from dataclasses import dataclass
 
-from vcspull._internal.private_path import PrivatePath
-from vcspull.config import find_config_files, load_configs
-from vcspull.types import ConfigDict
+from vcspull._internal.search_index import (
+    SEARCH_FIELDS,
+    SearchIndex,
+    load_search_index,
+)
+from vcspull.config import find_config_files
 
 from ._colors import Colors, get_color_mode
 from ._output import OutputFormatter, get_output_mode
 from ._workspaces import filter_by_workspace
 
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from vcspull.types import ConfigDict
+
 log = logging.getLogger(__name__)
 
 FIELD_ALIASES = {
@@ -27,7 +36,17 @@ FIELD_ALIASES = {
     "root": "workspace",
     "ws": "workspace",
 }
-DEFAULT_FIELDS = ("name", "path", "url", "workspace")
+DEFAULT_FIELDS = SEARCH_FIELDS
+
+#: Characters that make a pattern a regular expression rather than a literal.
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+#: Multiplier of ``--fuzzy`` points by field: a name says most about a repo.
+FUZZY_FIELD_WEIGHTS = {"name": 4, "path": 2, "url": 1, "workspace": 1}
+
+#: Characters after which a ``--fuzzy`` character starts a word. NUL is
+#: there because it precedes each value in a joined column.
+_WORD_BOUNDARIES = frozenset("\0/-_.:@ ")
 
 
 class SearchToken(t.NamedTuple):
@@ -61,11 +80,37 @@ class SearchPattern:
     regex : re.Pattern[str]
         Matcher compiled from ``raw``, case-insensitive when ``--ignore-case``
         was given or smart-case resolved that way.
+    literal : str | None
+        Text every match contains, when the pattern is a plain string: a
+        ``--fixed-strings`` pattern or a regex without metacharacters. Lets
+        the search index skip repositories that cannot match.
     """
 
     fields: tuple[str, ...]
     raw: str
     regex: re.Pattern[str]
+    literal: str | None = None
+
+
+@dataclass(frozen=True)
+class FuzzyPattern:
+    """Search term matched as a subsequence, for ``--fuzzy``.
+
+    Attributes
+    ----------
+    fields : tuple[str, ...]
+        Canonical field names the term is scored against.
+    term : str
+        Lowercased term, whose characters must appear in this order.
+    regex : re.Pattern[str]
+        Finds the characters of ``term`` in order within a lowercased value,
+        as group 1 ending as early as possible, then consumes the rest of the
+        value so a scan of a joined column yields one match per value.
+    """
+
+    fields: tuple[str, ...]
+    term: str
+    regex: re.Pattern[str]
 
 
 def normalize_fields(fields: list[str] | None) -> tuple[str, ...]:
@@ -229,11 +274,135 @@ def compile_search_patterns(
             message = f"Invalid search pattern {raw!r}: {exc}"
             raise ValueError(message) from exc
 
-        patterns.append(SearchPattern(fields=token.fields, raw=raw, regex=regex))
+        literal = raw if fixed_strings or _REGEX_META.isdisjoint(raw) else None
+        patterns.append(
+            SearchPattern(fields=token.fields, raw=raw, regex=regex, literal=literal),
+        )
+
+    return patterns
+
+
+def compile_fuzzy_patterns(tokens: list[SearchToken]) -> list[FuzzyPattern]:
+    """Compile search tokens for ``--fuzzy`` matching.
+
+    Between two characters of a term the regex only skips characters other
+    than the next one, so it never backtracks. No pattern crosses the NUL
+    that ends a value in a joined column.
+
+    Parameters
+    ----------
+    tokens : list[SearchToken]
+        Parsed tokens
+
+    Returns
+    -------
+    list[FuzzyPattern]
+        Compiled fuzzy patterns
 
+    Examples
+    --------
+    >>> [pattern] = compile_fuzzy_patterns(
+    ...     [SearchToken(fields=("name",), pattern="DjG")],
+    ... )
+    >>> pattern.term
+    'djg'
+    >>> pattern.regex.search("django").group(1)
+    'djang'
+    """
+    patterns: list[FuzzyPattern] = []
+    for token in tokens:
+        if token.pattern == "":
+            message = "Search pattern cannot be empty"
+            raise ValueError(message)
+        term = token.pattern.lower()
+        parts = [re.escape(term[0])]
+        for char in term[1:]:
+            escaped = re.escape(char)
+            parts.append(f"[^\\0{escaped}]*{escaped}")
+        patterns.append(
+            FuzzyPattern(
+                fields=token.fields,
+                term=term,
+                regex=re.compile(f"({''.join(parts)})[^\\0]*"),
+            ),
+        )
     return patterns
 
 
+def _fuzzy_positions(
+    text: str,
+    term: str,
+    start: int,
+    end: int,
+) -> Sequence[int]:
+    """Return where the characters of ``term`` sit in ``text[start:end]``.
+
+    ``start:end`` is where the term's regex matched, ending as early as
+    possible. Walking back from its end, each character is taken as late as
+    possible, which drops a loose start such as the first ``f`` of
+    ``f-flask``.
+
+    Examples
+    --------
+    >>> _fuzzy_positions("f-flask", "fk", 0, 7)
+    [2, 6]
+    """
+    if end - start == len(term):
+        return range(start, end)
+    positions: list[int] = []
+    position = end
+    for char in reversed(term):
+        position = text.rfind(char, start, position)
+        positions.append(position)
+    positions.reverse()
+    return positions
+
+
+def _fuzzy_points(match: re.Match[str], term: str) -> int:
+    """Return how closely ``match`` of a fuzzy ``term``'s regex fits.
+
+    Each character scores 1, plus 2 when it directly follows the previous
+    one and 2 when it starts a word: the value, or after one of ``/-_.:@``
+    or a space.
+
+    Examples
+    --------
+    >>> [pattern] = compile_fuzzy_patterns([SearchToken(("name",), "drf")])
+    >>> _fuzzy_points(pattern.regex.search("django-rest-framework"), "drf")
+    9
+    >>> _fuzzy_points(pattern.regex.search("dockerfile"), "drf")
+    7
+    """
+    text = match.string
+    points = 0
+    previous = -2
+    for position in _fuzzy_positions(text, term, *match.span(1)):
+        points += 1
+        if position == previous + 1:
+            points += 2
+        if position == 0 or text[position - 1] in _WORD_BOUNDARIES:
+            points += 2
+        previous = position
+    return points
+
+
+def _fuzzy_runs(positions: Sequence[int]) -> list[tuple[int, int]]:
+    """Return ``(start, end)`` of each stretch of consecutive positions.
+
+    Examples
+    --------
+    >>> _fuzzy_runs([0, 1, 4, 6, 7])
+    [(0, 2), (4, 5), (6, 8)]
+    """
+    runs: list[tuple[int, int]] = []
+    for position in positions:
+        if runs and runs[-1][1] == position:
+            runs[-1] = (runs[-1][0], position + 1)
+        else:
+            runs.append((position, position + 1))
+    return runs
+
+
 def evaluate_match(
     fields: dict[str, str],
     patterns: list[SearchPattern],
@@ -376,6 +545,70 @@ def highlight_text(
     return combined.sub(repl_plain, text)
 
 
+def highlight_spans(
+    text: str,
+    spans: Iterable[tuple[int, int]],
+    *,
+    colors: Colors,
+    base_color: str | None = None,
+) -> str:
+    """Return text with the ``(start, end)`` spans highlighted.
+
+    Used for ``--fuzzy`` results, whose matched characters are known by
+    position rather than by a pattern to search for again.
+
+    Examples
+    --------
+    >>> from vcspull.cli._colors import ColorMode
+    >>> colors = Colors(ColorMode.ALWAYS)
+    >>> highlight_spans("django", [(0, 1), (4, 5)], colors=colors) == (
+    ...     f"{colors.HIGHLIGHT}d{colors.RESET}jan{colors.HIGHLIGHT}g{colors.RESET}o"
+    ... )
+    True
+    """
+    if not colors._enabled:
+        return text
+
+    restore = base_color or colors.RESET
+    parts = [base_color or ""]
+    previous = 0
+    for start, end in sorted(set(spans)):
+        if start < previous:
+            continue
+        parts.append(text[previous:start])
+        parts.append(f"{colors.HIGHLIGHT}{text[start:end]}{restore}")
+        previous = end
+    parts.append(text[previous:])
+    if base_color:
+        parts.append(colors.RESET)
+    return "".join(parts)
+
+
+def _highlight_result(
+    result: dict[str, t.Any],
+    field: str,
+    *,
+    patterns_by_field: dict[str, list[re.Pattern[str]]],
+    colors: Colors,
+    base_color: str | None = None,
+) -> str:
+    """Return ``field`` of a search result highlighted for display."""
+    text = result["workspace_root" if field == "workspace" else field]
+    if "spans" in result:
+        return highlight_spans(
+            text,
+            result["spans"].get(field, []),
+            colors=colors,
+            base_color=base_color,
+        )
+    return highlight_text(
+        text,
+        patterns_by_field.get(field, []),
+        colors=colors,
+        base_color=base_color,
+    )
+
+
 def find_search_matches(
     repos: list[ConfigDict],
     patterns: list[SearchPattern],
@@ -428,28 +661,90 @@ def find_search_matches(
     >>> [item["name"] for item in results]
     ['django']
     """
+    return search_index_matches(
+        SearchIndex.from_repos(repos),
+        patterns,
+        match_any=match_any,
+        invert_match=invert_match,
+        prefilter=False,
+    )
+
+
+def _candidate_rows(
+    index: SearchIndex,
+    patterns: list[SearchPattern],
+    *,
+    match_any: bool,
+) -> set[int] | None:
+    """Return the rows the trigram index leaves for ``patterns``; ``None``: all."""
+    rows: set[int] | None = None
+    for pattern in patterns:
+        found = (
+            index.candidates(pattern.literal, pattern.fields)
+            if pattern.literal is not None
+            else None
+        )
+        if match_any:
+            # One unindexed pattern may match any row.
+            if found is None:
+                return None
+            rows = found if rows is None else rows | found
+        elif found is not None:
+            rows = found if rows is None else rows & found
+    return rows
+
+
+def search_index_matches(
+    index: SearchIndex,
+    patterns: list[SearchPattern],
+    *,
+    match_any: bool,
+    invert_match: bool,
+    rows: Iterable[int] | None = None,
+    prefilter: bool = True,
+    limit: int | None = None,
+) -> list[dict[str, t.Any]]:
+    """Return search matches among the repositories of ``index``.
+
+    Parameters
+    ----------
+    index : SearchIndex
+        Field values of the repositories to search
+    patterns : list[SearchPattern]
+        Compiled search patterns
+    match_any : bool
+        Whether any token match is sufficient
+    invert_match : bool
+        Whether to return non-matching repositories
+    rows : Iterable[int] | None
+        Positions in ``index`` to search, in order; ``None`` searches all
+    prefilter : bool
+        Run regexes only over the rows the trigram index leaves for literal
+        patterns. Worth it when the index is reused, since building its
+        trigrams costs more than one scan.
+    limit : int | None
+        Stop after this many results
+
+    Returns
+    -------
+    list[dict[str, t.Any]]
+        Search results containing matched fields, in row order
+    """
+    positions: Iterable[int] = range(len(index)) if rows is None else rows
+    if prefilter and not invert_match:
+        candidates = _candidate_rows(index, patterns, match_any=match_any)
+        if candidates is not None:
+            positions = (
+                sorted(candidates)
+                if rows is None
+                else [position for position in positions if position in candidates]
+            )
+
     results: list[dict[str, t.Any]] = []
     field_order = DEFAULT_FIELDS
 
-    for repo in repos:
-        name = str(repo.get("name", ""))
-        path_value = PrivatePath(pathlib.Path(repo.get("path", "")))
-        url = str(repo.get("url", repo.get("pip_url", "")) or "")
-        workspace_raw = repo.get("workspace_root")
-        if workspace_raw:
-            workspace_path = pathlib.Path(str(workspace_raw)).expanduser()
-        else:
-            workspace_path = pathlib.Path(repo.get("path", ""))
-            if workspace_path:
-                workspace_path = workspace_path.expanduser().parent
-        workspace = str(PrivatePath(workspace_path)) if workspace_path else ""
-
-        field_values = {
-            "name": name,
-            "path": str(path_value),
-            "url": url,
-            "workspace": workspace,
-        }
+    for position in positions:
+        field_values = index.row(position)
 
         matched, matches_by_field = evaluate_match(
             field_values,
@@ -469,18 +764,223 @@ def find_search_matches(
 
         results.append(
             {
-                "name": name,
-                "path": str(path_value),
-                "url": url,
-                "workspace_root": workspace,
+                "name": field_values["name"],
+                "path": field_values["path"],
+                "url": field_values["url"],
+                "workspace_root": field_values["workspace"],
                 "matched_fields": matched_fields,
                 "matches": matches_by_field,
             },
         )
+        if limit is not None and len(results) >= limit:
+            break
 
     return results
 
 
+def fuzzy_search_matches(
+    index: SearchIndex,
+    patterns: list[FuzzyPattern],
+    *,
+    match_any: bool,
+    rows: Iterable[int] | None = None,
+    limit: int | None = None,
+) -> list[dict[str, t.Any]]:
+    """Return repositories of ``index`` ranked by how well they fuzzy-match.
+
+    Each pattern runs once over every field column it is scoped to, rather
+    than once per repository, and only the first match in a value is scored,
+    tightened from its end. A repository's points for a term are its best
+    field's points times that field's :data:`FUZZY_FIELD_WEIGHTS`, and its
+    score is the sum over the terms. Ties go to the shorter name, then
+    to the earlier repository.
+
+    Parameters
+    ----------
+    index : SearchIndex
+        Field values of the repositories to search
+    patterns : list[FuzzyPattern]
+        Compiled fuzzy patterns
+    match_any : bool
+        Whether any term matching is sufficient
+    rows : Iterable[int] | None
+        Positions in ``index`` to search; ``None`` searches all
+    limit : int | None
+        Return only this many of the best matches, picked with a bounded
+        heap instead of sorting every match. With a single term, lighter
+        fields are not scanned once they cannot change the best ``limit``.
+
+    Returns
+    -------
+    list[dict[str, t.Any]]
+        Search results with their ``score``, best first
+
+    Examples
+    --------
+    >>> index = SearchIndex.from_repos(
+    ...     [
+    ...         {"name": "flask-login", "path": "/c/flask-login", "url": ""},
+    ...         {"name": "dockerfile", "path": "/c/dockerfile", "url": ""},
+    ...         {"name": "flask", "path": "/c/flask", "url": ""},
+    ...     ],
+    ... )
+    >>> patterns = compile_fuzzy_patterns(
+    ...     parse_query_terms(["fl"], default_fields=DEFAULT_FIELDS),
+    ... )
+    >>> results = fuzzy_search_matches(index, patterns, match_any=False)
+    >>> [(item["name"], item["score"]) for item in results]
+    [('flask', 24), ('flask-login', 24), ('dockerfile', 8)]
+    >>> results[0]["matches"]
+    {'name': ['fl'], 'path': ['fl']}
+    >>> results = fuzzy_search_matches(index, patterns, match_any=False, limit=1)
+    >>> [item["name"] for item in results]
+    ['flask']
+    """
+    kept = None if rows is None else set(rows)
+    totals: dict[int, int] | None = None
+    for pattern in patterns:
+        term_points: dict[int, int] = {}
+        # At most: every character at a word start, and every one but the
+        # first right after the previous one.
+        most_points = 5 * len(pattern.term) - 2
+        fields = sorted(
+            pattern.fields,
+            key=FUZZY_FIELD_WEIGHTS.__getitem__,
+            reverse=True,
+        )
+        for field in fields:
+            weight = FUZZY_FIELD_WEIGHTS[field]
+            if (
+                limit is not None
+                and len(patterns) == 1
+                and sum(
+                    points > weight * most_points for points in term_points.values()
+                )
+                >= limit
+            ):
+                # The best ``limit`` repositories already beat anything this
+                # field, and the lighter ones after it, could add.
+                break
+            for row, match in index.finditer(field, pattern.regex):
+                if kept is not None and row not in kept:
+                    continue
+                if term_points.get(row, 0) >= weight * most_points:
+                    # A heavier field already matched at least as well.
+                    continue
+                points = weight * _fuzzy_points(match, pattern.term)
+                if points > term_points.get(row, 0):
+                    term_points[row] = points
+        if totals is None:
+            totals = term_points
+        elif match_any:
+            for row, points in term_points.items():
+                totals[row] = totals.get(row, 0) + points
+        else:
+            totals = {
+                row: points + term_points[row]
+                for row, points in totals.items()
+                if row in term_points
+            }
+        if not match_any:
+            # Later terms only need scoring where every earlier one matched.
+            kept = set(totals)
+    if not totals:
+        return []
+
+    def rank(row: int) -> tuple[int, int, int]:
+        start, end = index.span("name", row)
+        return totals[row], start - end, -row
+
+    ranked = (
+        heapq.nlargest(limit, totals, key=rank)
+        if limit is not None
+        else sorted(totals, key=rank, reverse=True)
+    )
+    return [_fuzzy_result(index, row, totals[row], patterns) for row in ranked]
+
+
+def _fuzzy_result(
+    index: SearchIndex,
+    row: int,
+    score: int,
+    patterns: list[FuzzyPattern],
+) -> dict[str, t.Any]:
+    """Return the search result of ``row``, with the text each term matched."""
+    field_values = index.row(row)
+    matches_by_field: dict[str, list[str]] = {}
+    spans_by_field: dict[str, list[tuple[int, int]]] = {}
+    for pattern in patterns:
+        for field in pattern.fields:
+            start, end = index.span(field, row)
+            lowered = index.lowered(field)
+            match = pattern.regex.search(lowered, start, end)
+            if match is None:
+                continue
+            field_matches = matches_by_field.setdefault(field, [])
+            field_spans = spans_by_field.setdefault(field, [])
+            positions = _fuzzy_positions(lowered, pattern.term, *match.span(1))
+            for run_start, run_end in _fuzzy_runs(positions):
+                span = (run_start - start, run_end - start)
+                text = field_values[field][span[0] : span[1]]
+                if text not in field_matches:
+                    field_matches.append(text)
+                field_spans.append(span)
+    return {
+        "name": field_values["name"],
+        "path": field_values["path"],
+        "url": field_values["url"],
+        "workspace_root": field_values["workspace"],
+        "matched_fields": [
+            field for field in DEFAULT_FIELDS if field in matches_by_field
+        ],
+        "matches": matches_by_field,
+        "spans": spans_by_field,
+        "score": score,
+    }
+
+
+def _rows_in_workspace(index: SearchIndex, workspace_root: str) -> list[int]:
+    """Return the rows of ``index`` that ``--workspace`` keeps, in order."""
+    kept_roots: dict[str, bool] = {}
+    rows: list[int] = []
+    for position, root in enumerate(index.workspace_roots):
+        kept = kept_roots.get(root) if root else None
+        if kept is None:
+            # Rows without a workspace root are judged by their own path.
+            repo = t.cast(
+                "ConfigDict",
+                {"workspace_root": root, "path": index.value("path", position)},
+            )
+            kept = bool(filter_by_workspace([repo], workspace_root))
+            if root:
+                kept_roots[root] = kept
+        if kept:
+            rows.append(position)
+    return rows
+
+
+def _limit_arg(value: str) -> int:
+    """Parse ``--limit`` as a positive number of results.
+
+    Examples
+    --------
+    >>> _limit_arg("10")
+    10
+    >>> _limit_arg("0")
+    Traceback (most recent call last):
+    ...
+    argparse.ArgumentTypeError: --limit takes a positive number of results (got '0')
+    """
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit <= 0:
+        msg = f"--limit takes a positive number of results (got {value!r})"
+        raise argparse.ArgumentTypeError(msg)
+    return limit
+
+
 def create_search_subparser(parser: argparse.ArgumentParser) -> None:
     """Create ``vcspull search`` argument subparser.
 
@@ -567,6 +1067,20 @@ def create_search_subparser(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="match if any term matches (default: all terms)",
     )
+    parser.add_argument(
+        "--fuzzy",
+        action="store_true",
+        help=(
+            "rank repositories by how closely a field holds each term's "
+            "characters in order, best first (ignores case)"
+        ),
+    )
+    parser.add_argument(
+        "--limit",
+        type=_limit_arg,
+        metavar="K",
+        help="show at most K repositories (with --fuzzy, the K best)",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -602,6 +1116,8 @@ def search_repos(
     word_regexp: bool,
     invert_match: bool,
     match_any: bool,
+    fuzzy: bool = False,
+    limit: int | None = None,
     emit_output: bool = True,
 ) -> list[dict[str, t.Any]]:
     """Search configured repositories.
@@ -634,6 +1150,10 @@ def search_repos(
         Return non-matching repositories
     match_any : bool
         Match if any term matches
+    fuzzy : bool
+        Rank repositories by fuzzy score instead of matching regexes
+    limit : int | None
+        Return at most this many repositories, the best ones with ``fuzzy``
     emit_output : bool
         Whether to emit human/JSON output
 
@@ -669,34 +1189,54 @@ def search_repos(
     >>> [item["name"] for item in results]
     ['django']
     """
-    if config_path:
-        configs = load_configs([config_path])
-    else:
-        configs = load_configs(find_config_files(include_home=True))
+    if fuzzy and invert_match:
+        log.error("--fuzzy ranks matches and cannot be combined with --invert-match")
+        return []
 
-    if workspace_root:
-        configs = filter_by_workspace(configs, workspace_root)
+    config_files = (
+        [pathlib.Path(config_path)]
+        if config_path
+        else find_config_files(include_home=True)
+    )
+    index = load_search_index(config_files)
+    rows = _rows_in_workspace(index, workspace_root) if workspace_root else None
 
     try:
         normalized_fields = normalize_fields(fields)
         tokens = parse_query_terms(query_terms, default_fields=normalized_fields)
-        patterns = compile_search_patterns(
-            tokens,
-            ignore_case=ignore_case,
-            smart_case=smart_case,
-            fixed_strings=fixed_strings,
-            word_regexp=word_regexp,
+        fuzzy_patterns = compile_fuzzy_patterns(tokens) if fuzzy else []
+        patterns = (
+            []
+            if fuzzy
+            else compile_search_patterns(
+                tokens,
+                ignore_case=ignore_case,
+                smart_case=smart_case,
+                fixed_strings=fixed_strings,
+                word_regexp=word_regexp,
+            )
         )
     except ValueError:
         log.exception("Search query parsing failed")
         return []
 
-    results = find_search_matches(
-        configs,
-        patterns,
-        match_any=match_any,
-        invert_match=invert_match,
-    )
+    if fuzzy:
+        results = fuzzy_search_matches(
+            index,
+            fuzzy_patterns,
+            match_any=match_any,
+            rows=rows,
+            limit=limit,
+        )
+    else:
+        results = search_index_matches(
+            index,
+            patterns,
+            match_any=match_any,
+            invert_match=invert_match,
+            rows=rows,
+            limit=limit,
+        )
 
     if not emit_output:
         return results
@@ -718,25 +1258,28 @@ def search_repos(
             patterns_by_field.setdefault(field, []).append(pattern.regex)
 
     for result in results:
-        formatter.emit(
-            {
-                "name": result["name"],
-                "url": result["url"],
-                "path": result["path"],
-                "workspace_root": result["workspace_root"],
-                "matched_fields": result["matched_fields"],
-            },
-        )
-
-        name_display = highlight_text(
-            result["name"],
-            patterns_by_field.get("name", []),
+        item = {
+            "name": result["name"],
+            "url": result["url"],
+            "path": result["path"],
+            "workspace_root": result["workspace_root"],
+            "matched_fields": result["matched_fields"],
+        }
+        if fuzzy:
+            item["score"] = result["score"]
+        formatter.emit(item)
+
+        name_display = _highlight_result(
+            result,
+            "name",
+            patterns_by_field=patterns_by_field,
             colors=colors,
             base_color=colors.INFO,
         )
-        path_display = highlight_text(
-            result["path"],
-            patterns_by_field.get("path", []),
+        path_display = _highlight_result(
+            result,
+            "path",
+            patterns_by_field=patterns_by_field,
             colors=colors,
         )
         formatter.emit_text(
@@ -745,16 +1288,18 @@ def search_repos(
 
         matched_fields = set(result.get("matched_fields", []))
         if "url" in matched_fields:
-            url_display = highlight_text(
-                result["url"],
-                patterns_by_field.get("url", []),
+            url_display = _highlight_result(
+                result,
+                "url",
+                patterns_by_field=patterns_by_field,
                 colors=colors,
             )
             formatter.emit_text(f"  {colors.muted('url:')} {url_display}")
         if "workspace" in matched_fields:
-            workspace_display = highlight_text(
-                result["workspace_root"],
-                patterns_by_field.get("workspace", []),
+            workspace_display = _highlight_result(
+                result,
+                "workspace",
+                patterns_by_field=patterns_by_field,
                 colors=colors,
             )
             formatter.emit_text(
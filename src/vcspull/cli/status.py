@@ -12,19 +12,34 @@ import subprocess
 import sys
 import typing as t
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from time import perf_counter
 
+from vcspull._internal.lazy_config import LazyConfig
+from vcspull._internal.path_index import lookup_repo
 from vcspull._internal.private_path import PrivatePath
-from vcspull.config import filter_repos, find_config_files, load_configs
+from vcspull._internal.repo_watch import create_repo_watcher
+from vcspull._internal.state_store import (
+    RepoState,
+    open_state_store,
+    record_states,
+    state_key,
+    status_observation,
+)
+from vcspull.config import find_config_files, load_configs
 from vcspull.types import ConfigDict
 
 from ._colors import Colors, get_color_mode
-from ._output import OutputFormatter, get_output_mode
+from ._output import OutputFormatter, OutputMode, get_output_mode
 from ._workspaces import filter_by_workspace
 
+if t.TYPE_CHECKING:
+    from vcspull._internal.repo_watch import RepoWatcher
+
 log = logging.getLogger(__name__)
 
 DEFAULT_STATUS_CONCURRENCY = max(1, min(32, (os.cpu_count() or 4) * 2))
+DEFAULT_WATCH_INTERVAL = 2.0
 ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
 
 
@@ -109,6 +124,28 @@ class StatusProgressPrinter:
         self._stream.flush()
 
 
+def _interval_arg(value: str) -> float:
+    """Parse ``--interval`` as a positive number of seconds.
+
+    Examples
+    --------
+    >>> _interval_arg("0.5")
+    0.5
+    >>> _interval_arg("0")
+    Traceback (most recent call last):
+    ...
+    argparse.ArgumentTypeError: --interval takes a positive number of seconds (got 0)
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = 0.0
+    if not seconds > 0:
+        msg = f"--interval takes a positive number of seconds (got {value})"
+        raise argparse.ArgumentTypeError(msg)
+    return seconds
+
+
 def create_status_subparser(parser: argparse.ArgumentParser) -> None:
     """Create ``vcspull status`` argument subparser.
 
@@ -138,6 +175,11 @@ def create_status_subparser(parser: argparse.ArgumentParser) -> None:
         nargs="*",
         help="filter repositories by name pattern (supports fnmatch)",
     )
+    parser.add_argument(
+        "--here",
+        action="store_true",
+        help="check only the configured repository containing the current directory",
+    )
     parser.add_argument(
         "--detailed",
         "-d",
@@ -178,6 +220,33 @@ def create_status_subparser(parser: argparse.ArgumentParser) -> None:
             f"maximum concurrent status checks (default: {DEFAULT_STATUS_CONCURRENCY})"
         ),
     )
+    parser.add_argument(
+        "--from-cache",
+        action="store_true",
+        dest="from_cache",
+        help=(
+            "report the state recorded by the last sync, status, or plan run "
+            "instead of running git"
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "keep running and re-check repositories as they change on disk; "
+            "works with human output and --ndjson"
+        ),
+    )
+    parser.add_argument(
+        "--interval",
+        type=_interval_arg,
+        metavar="SECONDS",
+        default=DEFAULT_WATCH_INTERVAL,
+        help=(
+            "with --watch, how often to look for changes when inotify is "
+            f"unavailable (default: {DEFAULT_WATCH_INTERVAL:g})"
+        ),
+    )
 
 
 async def _check_repos_status_async(
@@ -342,6 +411,70 @@ def check_repo_status(repo: ConfigDict, detailed: bool = False) -> dict[str, t.A
     return status
 
 
+def _status_from_state(repo: ConfigDict, state: RepoState | None) -> dict[str, t.Any]:
+    """Build a status dictionary from a recorded :class:`RepoState`.
+
+    The keys match :func:`check_repo_status`, plus ``observed_at`` and
+    ``clean_observed_at`` (ISO 8601, UTC). ``clean`` keeps its own time, since
+    a sync records a checkout without checking its working tree. A repository
+    with no recorded state has ``exists`` and both times of ``None``.
+
+    Examples
+    --------
+    >>> repo = {"name": "flask", "path": "/src/flask", "workspace_root": "/src/"}
+    >>> state = RepoState(
+    ...     path="/src/flask",
+    ...     observed_at=60.0,
+    ...     present=True,
+    ...     is_git=True,
+    ...     clean=False,
+    ...     branch="main",
+    ...     clean_observed_at=0.0,
+    ... )
+    >>> status = _status_from_state(repo, state)
+    >>> (status["exists"], status["clean"], status["branch"])
+    (True, False, 'main')
+    >>> status["observed_at"], status["clean_observed_at"]
+    ('1970-01-01T00:01:00+00:00', '1970-01-01T00:00:00+00:00')
+    >>> _status_from_state(repo, None)["exists"] is None
+    True
+    """
+    status: dict[str, t.Any] = {
+        "name": repo.get("name", "unknown"),
+        "path": str(PrivatePath(pathlib.Path(str(repo.get("path", ""))))),
+        "workspace_root": repo.get("workspace_root", ""),
+        "exists": None,
+        "is_git": False,
+        "clean": None,
+        "branch": None,
+        "ahead": None,
+        "behind": None,
+        "observed_at": None,
+        "clean_observed_at": None,
+    }
+    if state is None:
+        return status
+
+    def _iso(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(
+            timespec="seconds",
+        )
+
+    status.update(
+        exists=state.present,
+        is_git=bool(state.is_git),
+        clean=state.clean,
+        branch=state.branch,
+        ahead=state.ahead,
+        behind=state.behind,
+        observed_at=_iso(state.observed_at),
+        clean_observed_at=(
+            None if state.clean_observed_at is None else _iso(state.clean_observed_at)
+        ),
+    )
+    return status
+
+
 def status_repos(
     repo_patterns: list[str],
     config_path: pathlib.Path | None,
@@ -352,6 +485,11 @@ def status_repos(
     color: str,
     concurrent: bool = True,
     max_concurrent: int | None = None,
+    from_cache: bool = False,
+    watch: bool = False,
+    interval: float = DEFAULT_WATCH_INTERVAL,
+    here: bool = False,
+    parser: argparse.ArgumentParser | None = None,
 ) -> None:
     """Check status of configured repositories.
 
@@ -375,21 +513,50 @@ def status_repos(
         Whether to check repositories concurrently (default: True)
     max_concurrent : int | None
         Maximum concurrent status checks (default: based on CPU count)
+    from_cache : bool
+        Report the state recorded in the local state store instead of
+        running git (default: False)
+    watch : bool
+        Keep running and re-check repositories as they change, see
+        :func:`watch_status` (default: False)
+    interval : float
+        Seconds between change checks in watch mode
+    here : bool
+        Check only the repository containing the current directory, found
+        through the path index instead of scanning every config entry
+        (default: False)
+    parser : argparse.ArgumentParser | None
+        Parser used to report invalid flag combinations
     """
-    # Load configs
-    if config_path:
-        configs = load_configs([config_path])
-    else:
-        configs = load_configs(find_config_files(include_home=True))
-
-    # Filter by patterns if provided
-    if repo_patterns:
-        found_repos: list[ConfigDict] = []
+    flag_error: str | None = None
+    if watch and output_json:
+        flag_error = "--watch streams updates; use --ndjson instead of --json"
+    elif watch and from_cache:
+        flag_error = "--watch cannot be combined with --from-cache"
+    elif here and repo_patterns:
+        flag_error = "--here cannot be combined with patterns"
+    if flag_error is not None:
+        if parser is not None:
+            parser.error(flag_error)
+        raise SystemExit(flag_error)
+
+    config_files = (
+        [config_path] if config_path else find_config_files(include_home=True)
+    )
+    found_repos: list[ConfigDict]
+    if here:
+        # Prompt integrations call this constantly: resolve the current
+        # directory through the path index rather than loading every config.
+        match = lookup_repo(pathlib.Path.cwd(), config_files)
+        found_repos = [match.to_config()] if match is not None else []
+    elif repo_patterns:
+        configs = LazyConfig.load(config_files)
+        found_repos = []
         for pattern in repo_patterns:
-            found_repos.extend(filter_repos(configs, name=pattern))
+            found_repos.extend(configs.filter(name=pattern))
     else:
         # No patterns = all repos
-        found_repos = configs
+        found_repos = load_configs(config_files)
 
     # Further filter by workspace root if specified
     if workspace_root:
@@ -401,12 +568,46 @@ def status_repos(
     colors = Colors(get_color_mode(color))
 
     if not found_repos:
-        formatter.emit_text(colors.warning("No repositories found."))
+        formatter.emit_text(
+            colors.warning(
+                "Current directory is not inside a configured repository."
+                if here
+                else "No repositories found."
+            ),
+        )
         formatter.finalize()
         return
 
-    # Check status of repositories (concurrent or sequential)
-    if concurrent:
+    if watch:
+        watch_status(
+            found_repos,
+            formatter=formatter,
+            colors=colors,
+            detailed=detailed,
+            max_concurrent=(
+                max_concurrent
+                if max_concurrent is not None
+                else DEFAULT_STATUS_CONCURRENCY
+            ),
+            interval=interval,
+        )
+        return
+
+    # Check status of repositories (cached, concurrent, or sequential)
+    if from_cache:
+        start_time = perf_counter()
+        with open_state_store() as store:
+            states = (
+                store.get_many(repo.get("path", "") for repo in found_repos)
+                if store
+                else {}
+            )
+        status_results = [
+            _status_from_state(repo, states.get(state_key(repo.get("path", ""))))
+            for repo in found_repos
+        ]
+        duration_ms = int((perf_counter() - start_time) * 1000)
+    elif concurrent and not here:
         # Concurrent mode using asyncio
         actual_max_concurrent = (
             max_concurrent if max_concurrent is not None else DEFAULT_STATUS_CONCURRENCY
@@ -417,8 +618,6 @@ def status_repos(
         )
 
         # Enable progress for TTY human output
-        from ._output import OutputMode
-
         progress_enabled = formatter.mode == OutputMode.HUMAN and sys.stdout.isatty()
         progress_printer = StatusProgressPrinter(
             len(found_repos),
@@ -446,13 +645,25 @@ def status_repos(
             status_results.append(status)
         duration_ms = None
 
+    if not from_cache:
+        record_states(
+            {
+                str(status["path"]): status_observation(status, detailed=detailed)
+                for status in status_results
+            },
+        )
+
     # Process results
     summary = {"total": 0, "exists": 0, "missing": 0, "clean": 0, "dirty": 0}
+    if from_cache:
+        summary["uncached"] = 0
 
     for status in status_results:
         summary["total"] += 1
 
-        if status["exists"]:
+        if status["exists"] is None:
+            summary["uncached"] += 1
+        elif status["exists"]:
             summary["exists"] += 1
             if status["clean"] is True:
                 summary["clean"] += 1
@@ -483,15 +694,133 @@ def status_repos(
     formatter.emit(summary_data)
 
     # Human summary
-    formatter.emit_text(
+    summary_text = (
         f"\n{colors.info('Summary:')} {summary['total']} repositories, "
         f"{colors.success(str(summary['exists']))} exist, "
-        f"{colors.error(str(summary['missing']))} missing",
+        f"{colors.error(str(summary['missing']))} missing"
     )
+    if summary.get("uncached"):
+        summary_text += f", {colors.warning(str(summary['uncached']))} not cached"
+    formatter.emit_text(summary_text)
 
     formatter.finalize()
 
 
+def _probe_changed(
+    repos: dict[str, ConfigDict],
+    keys: t.Iterable[str],
+    *,
+    config: StatusCheckConfig,
+) -> dict[str, dict[str, t.Any]]:
+    """Check ``keys`` concurrently, record their state, and key the results."""
+    selected = [repos[key] for key in keys]
+    results = asyncio.run(
+        _check_repos_status_async(selected, config=config, progress=None),
+    )
+    record_states(
+        {
+            str(status["path"]): status_observation(status, detailed=config.detailed)
+            for status in results
+        },
+    )
+    return {state_key(status["path"]): status for status in results}
+
+
+def watch_status(
+    repos: list[ConfigDict],
+    *,
+    formatter: OutputFormatter,
+    colors: Colors,
+    detailed: bool,
+    max_concurrent: int,
+    interval: float,
+    watcher: RepoWatcher | None = None,
+) -> None:
+    """Report status, then re-check only repositories that change on disk.
+
+    Keeps an in-memory model of every repository's status. Each round waits
+    for the watcher (inotify where available, ``stat`` polling otherwise),
+    re-probes just the repositories it reports, and emits only the ones whose
+    status actually changed: ``status_changed`` events in NDJSON mode, a
+    redrawn table on a terminal, or changed lines otherwise. Runs until
+    interrupted with Ctrl-C.
+
+    Parameters
+    ----------
+    repos : list[ConfigDict]
+        Repositories to watch
+    formatter : OutputFormatter
+        Output formatter (human or NDJSON)
+    colors : Colors
+        Color manager
+    detailed : bool
+        Collect branch and ahead/behind counts on every check
+    max_concurrent : int
+        Ceiling on repositories re-checked at once
+    interval : float
+        Seconds between change checks when polling
+    watcher : RepoWatcher | None
+        Watcher to use instead of :func:`create_repo_watcher`
+    """
+    keyed: dict[str, ConfigDict] = {}
+    for repo in repos:
+        keyed.setdefault(state_key(repo.get("path", "")), repo)
+    order = list(keyed)
+    check_config = StatusCheckConfig(max_concurrent=max_concurrent, detailed=detailed)
+    redraw = formatter.mode == OutputMode.HUMAN and sys.stdout.isatty()
+
+    def render_table() -> None:
+        sys.stdout.write("\x1b[H\x1b[2J")
+        formatter.emit_text(
+            colors.info(
+                f"Watching {len(order)} repositories, "
+                f"updated {datetime.now().strftime('%H:%M:%S')} "
+                "(Ctrl-C to stop)",
+            ),
+        )
+        for key in order:
+            _format_status_line(model[key], formatter, colors, detailed=False)
+
+    if watcher is None:
+        watcher = create_repo_watcher(
+            {key: pathlib.Path(str(keyed[key].get("path", ""))) for key in order},
+            poll_interval=interval,
+        )
+    try:
+        model = _probe_changed(keyed, order, config=check_config)
+        watcher.acknowledge(order)
+        if redraw:
+            render_table()
+        else:
+            for key in order:
+                formatter.emit({"reason": "status", **model[key]})
+                _format_status_line(model[key], formatter, colors, detailed)
+
+        while True:
+            changed = watcher.wait(interval)
+            if not changed:
+                continue
+            probed = _probe_changed(keyed, sorted(changed), config=check_config)
+            watcher.acknowledge(changed)
+            deltas = [
+                key for key in order if key in probed and probed[key] != model.get(key)
+            ]
+            if not deltas:
+                continue
+            model.update(probed)
+            if redraw:
+                render_table()
+                continue
+            for key in deltas:
+                formatter.emit({"reason": "status_changed", **model[key]})
+                _format_status_line(model[key], formatter, colors, detailed)
+    except KeyboardInterrupt:
+        formatter.emit_text("")
+    finally:
+        watcher.close()
+        formatter.finalize()
+
+
 def _format_status_line(
     status: dict[str, t.Any],
     formatter: OutputFormatter,
@@ -513,7 +842,11 @@ def _format_status_line(
     """
     name = status["name"]
 
-    if not status["exists"]:
+    if status["exists"] is None:
+        symbol = colors.muted("?")
+        message = "no cached state"
+        status_color = colors.muted(message)
+    elif not status["exists"]:
         symbol = colors.error("✗")
         message = "missing"
         status_color = colors.error(message)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import asyncio
 import contextlib
+import json
 import logging
 import os
 import pathlib
@@ -24,19 +25,28 @@ from time import monotonic, perf_counter
 
 from libvcs._internal.shortcuts import create_project
 from libvcs._internal.types import VCSLiteral
+from libvcs.exc import CommandError
 from libvcs.sync.git import GitSync
 from libvcs.sync.hg import HgSync
 from libvcs.sync.svn import SvnSync
 from libvcs.url import registry as url_tools
 
 from vcspull import exc
+from vcspull._internal.git_probe import read_head_branch, read_head_revision
+from vcspull._internal.lazy_config import LazyConfig
 from vcspull._internal.private_path import PrivatePath
+from vcspull._internal.state_store import record_states
 from vcspull._internal.worktree_sync import (
     WorktreeAction,
     plan_worktree_sync,
     sync_all_worktrees,
 )
-from vcspull.config import expand_dir, filter_repos, find_config_files, load_configs
+from vcspull.config import (
+    _atomic_write,
+    expand_dir,
+    find_config_files,
+    load_configs,
+)
 from vcspull.log import default_debug_log_path, setup_file_logger, teardown_file_logger
 from vcspull.types import ConfigDict
 
@@ -53,7 +63,7 @@ from ._output import (
 )
 from ._progress import SyncStatusIndicator, build_indicator
 from ._workspaces import filter_by_workspace
-from .status import check_repo_status
+from .status import _run_git_command, check_repo_status
 
 log = logging.getLogger(__name__)
 
@@ -282,6 +292,27 @@ def _update_summary(summary: PlanSummary, action: PlanAction) -> None:
         summary.errors += 1
 
 
+def _read_upstream(repo_path: pathlib.Path) -> tuple[str | None, str | None]:
+    """Return the upstream commit and its short name, such as ``origin/main``.
+
+    One ``git rev-parse`` call reports both; ``(None, None)`` when the branch
+    has no upstream.
+    """
+    result = _run_git_command(
+        repo_path,
+        "rev-parse",
+        "@{upstream}",
+        "--abbrev-ref",
+        "@{upstream}",
+    )
+    if result is None:
+        return None, None
+    lines = result.stdout.strip().splitlines()
+    if len(lines) != 2:
+        return None, None
+    return lines[0], lines[1]
+
+
 def _build_plan_entry(
     repo: ConfigDict,
     *,
@@ -306,6 +337,14 @@ def _build_plan_entry(
     else:
         action, detail = _determine_plan_action(status, config=config)
 
+    current_rev: str | None = None
+    target_rev: str | None = None
+    remote_branch: str | None = None
+    if status.get("is_git"):
+        current_rev = read_head_revision(repo_path)
+        if isinstance(status.get("ahead"), int):
+            target_rev, remote_branch = _read_upstream(repo_path)
+
     return PlanEntry(
         name=str(repo.get("name", "unknown")),
         path=str(PrivatePath(repo_path)),
@@ -314,9 +353,9 @@ def _build_plan_entry(
         detail=detail,
         url=_extract_repo_url(repo),
         branch=status.get("branch"),
-        remote_branch=None,
-        current_rev=None,
-        target_rev=None,
+        remote_branch=remote_branch,
+        current_rev=current_rev,
+        target_rev=target_rev,
         ahead=status.get("ahead"),
         behind=status.get("behind"),
         dirty=status.get("clean") is False if status.get("clean") is not None else None,
@@ -544,6 +583,315 @@ def _emit_plan_output(
     formatter.emit(plan.summary)
 
 
+def _plan_observations(
+    plan: PlanResult,
+    *,
+    fetched: bool,
+) -> dict[str, dict[str, t.Any]]:
+    """Return state-store fields for what building ``plan`` observed.
+
+    Examples
+    --------
+    >>> plan = PlanResult(
+    ...     entries=[
+    ...         PlanEntry("a", "/src/a", "/src/", PlanAction.CLONE),
+    ...         PlanEntry(
+    ...             "b", "/src/b", "/src/", PlanAction.UPDATE,
+    ...             current_rev="f" * 40, ahead=0, behind=2, dirty=False,
+    ...         ),
+    ...     ],
+    ...     summary=PlanSummary(clone=1, update=1),
+    ... )
+    >>> observations = _plan_observations(plan, fetched=False)
+    >>> observations["/src/a"]["present"]
+    False
+    >>> observations["/src/b"]["behind"], observations["/src/b"]["clean"]
+    (2, True)
+    """
+    fetched_at = datetime.now().timestamp()
+    observations: dict[str, dict[str, t.Any]] = {}
+    for entry in plan.entries:
+        if entry.action is PlanAction.ERROR:
+            continue
+        fields: dict[str, t.Any] = {
+            "name": entry.name,
+            "workspace_root": entry.workspace_root,
+            "present": entry.action is not PlanAction.CLONE,
+        }
+        if entry.current_rev is not None:
+            fields.update(
+                is_git=True,
+                head=entry.current_rev,
+                branch=entry.branch,
+                ahead=entry.ahead,
+                behind=entry.behind,
+            )
+            if fetched:
+                fields["last_fetch"] = fetched_at
+        if entry.dirty is not None:
+            fields["clean"] = not entry.dirty
+        observations[entry.path] = fields
+    return observations
+
+
+def _synced_observation(repo: ConfigDict, duration: float) -> dict[str, t.Any]:
+    """Return state-store fields for a repository that just synced.
+
+    A sync moves the branch, so previously recorded ahead/behind counts are
+    cleared rather than left stale.
+
+    Examples
+    --------
+    >>> repo = create_git_remote_repo()
+    >>> fields = _synced_observation(
+    ...     {"name": "a", "path": repo, "workspace_root": str(repo.parent)},
+    ...     1.5,
+    ... )
+    >>> fields["branch"], fields["behind"], fields["last_sync_duration"]
+    ('master', None, 1.5)
+    """
+    repo_path = _get_repo_path(repo)
+    is_git = (repo_path / ".git").exists()
+    fields: dict[str, t.Any] = {
+        "name": str(repo.get("name", "unknown")),
+        "workspace_root": str(repo.get("workspace_root", "")),
+        "present": True,
+        "is_git": is_git,
+        "last_sync_duration": duration,
+    }
+    if is_git:
+        fields.update(
+            head=read_head_revision(repo_path),
+            branch=read_head_branch(repo_path),
+            ahead=None,
+            behind=None,
+            last_fetch=datetime.now().timestamp(),
+        )
+    return fields
+
+
+def _save_plan_file(plan: PlanResult, plan_path: pathlib.Path) -> None:
+    """Write ``plan`` to ``plan_path`` as JSON for a later ``--apply-plan``.
+
+    Examples
+    --------
+    >>> plan = PlanResult(
+    ...     entries=[
+    ...         PlanEntry(
+    ...             name="myrepo",
+    ...             path="~/repos/myrepo",
+    ...             workspace_root="~/repos/",
+    ...             action=PlanAction.CLONE,
+    ...         ),
+    ...     ],
+    ...     summary=PlanSummary(clone=1),
+    ... )
+    >>> _save_plan_file(plan, tmp_path / "plan.json")
+    >>> _load_plan_file(tmp_path / "plan.json") == plan
+    True
+    """
+    plan_path.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write(plan_path, json.dumps(plan.to_payload(), indent=2) + "\n")
+
+
+def _load_plan_file(plan_path: pathlib.Path) -> PlanResult:
+    """Read a plan written by :func:`_save_plan_file`.
+
+    Raises
+    ------
+    ValueError
+        If the file cannot be read or is not a vcspull plan.
+    TypeError
+        If the file holds JSON other than an object.
+
+    Examples
+    --------
+    >>> bad = tmp_path / "bad.json"
+    >>> _ = bad.write_text("[]", encoding="utf-8")
+    >>> _load_plan_file(bad)
+    Traceback (most recent call last):
+    ...
+    TypeError: Invalid plan file .../bad.json: expected a JSON object
+    """
+    try:
+        payload = json.loads(plan_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc_obj:
+        msg = f"Could not read plan file {plan_path}: {exc_obj}"
+        raise ValueError(msg) from exc_obj
+    if not isinstance(payload, dict):
+        msg = f"Invalid plan file {plan_path}: expected a JSON object"
+        raise TypeError(msg)
+    try:
+        return PlanResult.from_payload(payload)
+    except (KeyError, TypeError, ValueError) as exc_obj:
+        msg = f"Invalid plan file {plan_path}: {exc_obj}"
+        raise ValueError(msg) from exc_obj
+
+
+def _plan_entry_staleness(entry: PlanEntry) -> str | None:
+    """Explain why ``entry`` no longer matches the disk, or ``None`` if it does.
+
+    A planned clone is stale once something occupies its path. A planned
+    update is stale when its checkout is gone or ``HEAD`` moved away from the
+    recorded revision; ``HEAD`` is read from disk, so no ``git`` process runs.
+    Updates recorded without a revision (non-git checkouts) are never stale.
+
+    Examples
+    --------
+    >>> entry = PlanEntry(
+    ...     name="myrepo",
+    ...     path=str(tmp_path / "myrepo"),
+    ...     workspace_root=str(tmp_path),
+    ...     action=PlanAction.CLONE,
+    ... )
+    >>> _plan_entry_staleness(entry) is None
+    True
+    >>> (tmp_path / "myrepo").mkdir()
+    >>> _plan_entry_staleness(entry)
+    'path exists now'
+
+    >>> repo = create_git_remote_repo()
+    >>> head = read_head_revision(repo)
+    >>> entry = PlanEntry(
+    ...     name="myrepo",
+    ...     path=str(repo),
+    ...     workspace_root=str(repo.parent),
+    ...     action=PlanAction.UPDATE,
+    ...     current_rev=head,
+    ... )
+    >>> _plan_entry_staleness(entry) is None
+    True
+    >>> entry.current_rev = "0" * 40
+    >>> _plan_entry_staleness(entry)
+    'HEAD moved (0000000 -> ...)'
+    """
+    repo_path = pathlib.Path(entry.path).expanduser()
+    if entry.action is PlanAction.CLONE:
+        return "path exists now" if repo_path.exists() else None
+    if not repo_path.exists():
+        return "checkout missing"
+    if entry.current_rev is None:
+        return None
+    head = read_head_revision(repo_path)
+    if head is None:
+        return "HEAD unreadable"
+    if head != entry.current_rev:
+        return f"HEAD moved ({entry.current_rev[:7]} -> {head[:7]})"
+    return None
+
+
+def _plan_target_revs(plan: PlanResult) -> dict[str, str]:
+    """Return the upstream commit each planned update recorded, by checkout.
+
+    Keys are resolved checkout paths, as :func:`_select_repos_from_plan`
+    matches them.
+
+    Examples
+    --------
+    >>> plan = PlanResult(
+    ...     entries=[
+    ...         PlanEntry(
+    ...             "a",
+    ...             str(tmp_path / "a"),
+    ...             str(tmp_path),
+    ...             PlanAction.UPDATE,
+    ...             target_rev="b" * 40,
+    ...         ),
+    ...         PlanEntry("c", str(tmp_path / "c"), str(tmp_path), PlanAction.CLONE),
+    ...     ],
+    ...     summary=PlanSummary(update=1, clone=1),
+    ... )
+    >>> _plan_target_revs(plan) == {str((tmp_path / "a").resolve()): "b" * 40}
+    True
+    """
+    return {
+        str(pathlib.Path(entry.path).expanduser().resolve()): entry.target_rev
+        for entry in plan.entries
+        if entry.action is PlanAction.UPDATE and entry.target_rev is not None
+    }
+
+
+def _select_repos_from_plan(
+    plan: PlanResult,
+    configs: list[ConfigDict],
+    *,
+    formatter: OutputFormatter,
+    colors: Colors,
+    summary_only: bool,
+) -> tuple[list[ConfigDict], dict[str, int]]:
+    """Match actionable plan entries to config entries, dropping stale ones.
+
+    Only ``CLONE`` and ``UPDATE`` entries are acted on; every other action is
+    counted as skipped. Entries whose repository is no longer configured count
+    as unmatched, and entries whose checkout changed since planning count as
+    stale.
+
+    Examples
+    --------
+    >>> repos = [
+    ...     {"name": "a", "path": tmp_path / "a"},
+    ...     {"name": "b", "path": tmp_path / "b"},
+    ... ]
+    >>> plan = PlanResult(
+    ...     entries=[
+    ...         PlanEntry("a", str(tmp_path / "a"), str(tmp_path), PlanAction.CLONE),
+    ...         PlanEntry("b", str(tmp_path / "b"), str(tmp_path), PlanAction.BLOCKED),
+    ...         PlanEntry("c", str(tmp_path / "c"), str(tmp_path), PlanAction.CLONE),
+    ...     ],
+    ...     summary=PlanSummary(clone=2, blocked=1),
+    ... )
+    >>> selected, counts = _select_repos_from_plan(
+    ...     plan,
+    ...     repos,
+    ...     formatter=OutputFormatter(OutputMode.JSON),
+    ...     colors=Colors(get_color_mode("never")),
+    ...     summary_only=True,
+    ... )
+    >>> [repo["name"] for repo in selected]
+    ['a']
+    >>> counts
+    {'skipped': 1, 'stale': 0, 'unmatched': 1}
+    """
+    repos_by_path = {str(_get_repo_path(repo).resolve()): repo for repo in configs}
+    counts = {"skipped": 0, "stale": 0, "unmatched": 0}
+    selected: list[ConfigDict] = []
+    for entry in plan.entries:
+        if entry.action not in {PlanAction.CLONE, PlanAction.UPDATE}:
+            counts["skipped"] += 1
+            continue
+        resolved = str(pathlib.Path(entry.path).expanduser().resolve())
+        repo = repos_by_path.get(resolved)
+        if repo is None:
+            counts["unmatched"] += 1
+            if not summary_only:
+                formatter.emit_text(
+                    f"{colors.error('✗')} "
+                    f"{NO_REPOS_FOR_TERM_MSG.format(name=entry.name)}",
+                )
+            continue
+        stale_reason = _plan_entry_staleness(entry)
+        if stale_reason is not None:
+            counts["stale"] += 1
+            formatter.emit(
+                {
+                    "reason": "sync",
+                    "name": entry.name,
+                    "path": entry.path,
+                    "workspace_root": entry.workspace_root,
+                    "status": "stale",
+                    "detail": stale_reason,
+                },
+            )
+            if not summary_only:
+                formatter.emit_text(
+                    f"{colors.warning('⚠')} Skipped stale {colors.info(entry.name)}: "
+                    f"{colors.muted(stale_reason)}",
+                )
+            continue
+        selected.append(repo)
+    return selected, counts
+
+
 def create_sync_subparser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
     """Create ``vcspull sync`` argument subparser."""
     config_file = parser.add_argument(
@@ -553,7 +901,7 @@ def create_sync_subparser(parser: argparse.ArgumentParser) -> argparse.ArgumentP
         metavar="FILE",
         help="path to config file (default: ~/.vcspull.yaml or ./.vcspull.yaml)",
     )
-    parser.add_argument(
+    workspace_root = parser.add_argument(
         "-w",
         "--workspace",
         "--workspace-root",
@@ -561,7 +909,7 @@ def create_sync_subparser(parser: argparse.ArgumentParser) -> argparse.ArgumentP
         metavar="DIR",
         help="filter by workspace root directory",
     )
-    parser.add_argument(
+    repo_patterns = parser.add_argument(
         "repo_patterns",
         metavar="pattern",
         nargs="*",
@@ -650,6 +998,23 @@ def create_sync_subparser(parser: argparse.ArgumentParser) -> argparse.ArgumentP
         dest="sync_all",
         help="sync all configured repositories",
     )
+    save_plan = parser.add_argument(
+        "--save-plan",
+        dest="save_plan",
+        metavar="FILE",
+        default=None,
+        help="with --dry-run, write the plan to FILE for a later --apply-plan",
+    )
+    apply_plan = parser.add_argument(
+        "--apply-plan",
+        dest="apply_plan",
+        metavar="FILE",
+        default=None,
+        help=(
+            "sync only the clones and updates recorded in a saved plan, "
+            "skipping repositories that changed since it was made"
+        ),
+    )
     parser.add_argument(
         "--include-worktrees",
         action="store_true",
@@ -705,6 +1070,18 @@ def create_sync_subparser(parser: argparse.ArgumentParser) -> argparse.ArgumentP
         import shtab
 
         config_file.complete = shtab.FILE  # type: ignore
+        save_plan.complete = shtab.FILE  # type: ignore
+        apply_plan.complete = shtab.FILE  # type: ignore
+        # Shell functions from ``vcspull-complete preamble``, which answer
+        # from the completion cache instead of loading the configs.
+        repo_patterns.complete = {  # type: ignore
+            "bash": "_vcspull_complete_patterns",
+            "zsh": "_vcspull_complete_patterns",
+        }
+        workspace_root.complete = {  # type: ignore
+            "bash": "_vcspull_complete_roots",
+            "zsh": "_vcspull_complete_roots",
+        }
     except ImportError:
         pass
     return parser
@@ -1047,6 +1424,7 @@ def _sync_repo_with_watchdog(
     progress_callback: ProgressCallback,
     timeout: int,
     is_human: bool,
+    target_rev: str | None = None,
 ) -> _SyncOutcome:
     """Run :func:`update_repo` under a wall-clock watchdog.
 
@@ -1062,11 +1440,16 @@ def _sync_repo_with_watchdog(
     buffer: StringIO | None = None if is_human else StringIO()
     done = threading.Event()
     worker_error: list[BaseException] = []
+    update_kwargs: dict[str, t.Any] = {"progress_callback": progress_callback}
+    if target_rev is not None:
+        # Only applied plans pin a revision; plain syncs call update_repo as
+        # they always have.
+        update_kwargs["target_rev"] = target_rev
 
     def _run() -> None:
         try:
             if buffer is None:
-                update_repo(repo, progress_callback=progress_callback)
+                update_repo(repo, **update_kwargs)
                 return
             # Non-human output modes capture everything so the NDJSON/JSON
             # payload contains the per-repo details without polluting stdout.
@@ -1074,7 +1457,7 @@ def _sync_repo_with_watchdog(
                 contextlib.redirect_stdout(buffer),
                 contextlib.redirect_stderr(buffer),
             ):
-                update_repo(repo, progress_callback=progress_callback)
+                update_repo(repo, **update_kwargs)
         except BaseException as exc_obj:
             # Keep ``BaseException`` here so a worker-side KeyboardInterrupt
             # (rare but possible via ``PyThreadState_SetAsyncExc``) is still
@@ -1350,6 +1733,8 @@ def sync(
     log_file: str | pathlib.Path | None = None,
     no_log_file: bool = False,
     panel_lines: int | None = None,
+    save_plan: str | pathlib.Path | None = None,
+    apply_plan: str | pathlib.Path | None = None,
 ) -> None:
     """Entry point for ``vcspull sync``."""
     # Prevent git from blocking on credential prompts during batch sync
@@ -1403,6 +1788,8 @@ def sync(
             log_file_path=log_file_path,
             dry_run=dry_run,
             panel_lines=resolved_panel_lines,
+            save_plan=pathlib.Path(save_plan).expanduser() if save_plan else None,
+            apply_plan=pathlib.Path(apply_plan).expanduser() if apply_plan else None,
         )
     except KeyboardInterrupt as err:
         # Catch Ctrl-C from ANY phase of the sync -- the repo loop (where
@@ -1457,14 +1844,37 @@ def _sync_impl(
     repo_timeout: int,
     log_file_path: pathlib.Path | None,
     panel_lines: int,
+    save_plan: pathlib.Path | None = None,
+    apply_plan: pathlib.Path | None = None,
 ) -> None:
     """Run the core body of :func:`sync`.
 
     Kept separate so log-file teardown runs through ``finally`` regardless of
     where the caller exits the sync.
     """
+    plan_error: str | None = None
+    if save_plan is not None and not dry_run:
+        plan_error = "--save-plan requires --dry-run"
+    elif apply_plan is not None and dry_run:
+        plan_error = "--apply-plan cannot be combined with --dry-run"
+    elif apply_plan is not None and (repo_patterns or sync_all):
+        plan_error = "--apply-plan cannot be combined with patterns or --all"
+    if plan_error is not None:
+        if parser is not None:
+            parser.error(plan_error)
+        raise SystemExit(plan_error)
+
+    saved_plan: PlanResult | None = None
+    if apply_plan is not None:
+        try:
+            saved_plan = _load_plan_file(apply_plan)
+        except (TypeError, ValueError) as exc_obj:
+            if parser is not None:
+                parser.error(str(exc_obj))
+            raise SystemExit(str(exc_obj)) from exc_obj
+
     # Show help if no patterns and --all not specified
-    if not repo_patterns and not sync_all:
+    if saved_plan is None and not repo_patterns and not sync_all:
         if parser is not None:
             parser.print_help()
         else:
@@ -1487,17 +1897,27 @@ def _sync_impl(
     )
     plan_config = SyncPlanConfig(fetch=bool(fetch and not offline), offline=offline)
 
-    if config:
-        configs = load_configs([config], warn_legacy_options=True)
-    else:
-        configs = load_configs(
-            find_config_files(include_home=True),
-            warn_legacy_options=True,
-        )
+    config_files = [config] if config else find_config_files(include_home=True)
     found_repos: list[ConfigDict] = []
     unmatched_count = 0
+    plan_counts = {"skipped": 0, "stale": 0}
+    target_revs: dict[str, str] = {}
 
-    if sync_all:
+    if saved_plan is not None:
+        found_repos, selection_counts = _select_repos_from_plan(
+            saved_plan,
+            load_configs(config_files, warn_legacy_options=True),
+            formatter=formatter,
+            colors=colors,
+            summary_only=summary_only,
+        )
+        target_revs = _plan_target_revs(saved_plan)
+        unmatched_count = selection_counts["unmatched"]
+        plan_counts = {
+            "skipped": selection_counts["skipped"],
+            "stale": selection_counts["stale"],
+        }
+    elif sync_all:
         if repo_patterns:
             msg = "--all cannot be combined with positional patterns"
             if parser is not None:
@@ -1505,8 +1925,10 @@ def _sync_impl(
             else:
                 raise SystemExit(msg)
         # Load all repos when --all is specified
-        found_repos = list(configs)
+        found_repos = load_configs(config_files, warn_legacy_options=True)
     else:
+        # Patterns name a handful of repos; expand only those.
+        configs = LazyConfig.load(config_files, warn_legacy_options=True)
         for repo_pattern in repo_patterns:
             path, vcs_url, name = None, None, None
             if any(repo_pattern.startswith(n) for n in ["./", "/", "~", "$HOME"]):
@@ -1516,7 +1938,7 @@ def _sync_impl(
             else:
                 name = repo_pattern
 
-            found = filter_repos(configs, path=path, vcs_url=vcs_url, name=name)
+            found = configs.filter(path=path, vcs_url=vcs_url, name=name)
             if not found:
                 search_term = name or path or vcs_url or repo_pattern
                 log.debug('No repo found in config(s) for "%s"', search_term)
@@ -1557,6 +1979,9 @@ def _sync_impl(
         plan_result.summary.duration_ms = int((perf_counter() - start_time) * 1000)
         if progress_enabled:
             progress_printer.finish()
+        record_states(_plan_observations(plan_result, fetched=plan_config.fetch))
+        if save_plan is not None:
+            _save_plan_file(plan_result, save_plan)
         _emit_plan_output(
             formatter=formatter,
             colors=colors,
@@ -1607,7 +2032,7 @@ def _sync_impl(
         return
 
     if total_repos == 0:
-        if unmatched_count > 0:
+        if unmatched_count > 0 or any(plan_counts.values()):
             summary = {
                 "total": 0,
                 "synced": 0,
@@ -1615,8 +2040,10 @@ def _sync_impl(
                 "failed": 0,
                 "unmatched": unmatched_count,
             }
+            if saved_plan is not None:
+                summary.update(plan_counts)
             _emit_summary(formatter, colors, summary)
-            if exit_on_error:
+            if exit_on_error and (unmatched_count > 0 or plan_counts["stale"] > 0):
                 formatter.finalize()
                 if parser is not None:
                     parser.exit(status=1, message=EXIT_ON_ERROR_MSG)
@@ -1638,6 +2065,8 @@ def _sync_impl(
         "timed_out": 0,
         "unmatched": unmatched_count,
     }
+    if saved_plan is not None:
+        summary.update(plan_counts)
     timed_out_repos: list[_TimedOutRepo] = []
 
     indicator = build_indicator(
@@ -1673,10 +2102,12 @@ def _sync_impl(
     if indicator.enabled:
         restore_log_streams = _install_indicator_log_diverter(indicator)
 
+    observations: dict[str, dict[str, t.Any]] = {}
     interrupted = False
     try:
         _run_sync_loop(
             found_repos=found_repos,
+            target_revs=target_revs,
             formatter=formatter,
             colors=colors,
             summary=summary,
@@ -1690,6 +2121,7 @@ def _sync_impl(
             parser=parser,
             log_file_path=log_file_path,
             indicator=indicator,
+            observations=observations,
         )
     except KeyboardInterrupt:
         # Ctrl-C during the loop: stop the indicator cleanly, print a
@@ -1701,6 +2133,7 @@ def _sync_impl(
         if restore_log_streams is not None:
             restore_log_streams()
         indicator.close()
+        record_states(observations)
 
     if interrupted:
         # Shield the summary emission against late-breaking ``OSError``
@@ -1742,7 +2175,7 @@ def _sync_impl(
             f"{colors.info('→')} Full debug log: {colors.muted(str(log_file_path))}",
         )
 
-    if exit_on_error and unmatched_count > 0:
+    if exit_on_error and (unmatched_count > 0 or plan_counts["stale"] > 0):
         formatter.finalize()
         if parser is not None:
             parser.exit(status=1, message=EXIT_ON_ERROR_MSG)
@@ -1767,8 +2200,16 @@ def _run_sync_loop(
     parser: argparse.ArgumentParser | None,
     log_file_path: pathlib.Path | None,
     indicator: SyncStatusIndicator,
+    observations: dict[str, dict[str, t.Any]] | None = None,
+    target_revs: dict[str, str] | None = None,
 ) -> None:
-    """Iterate the repositories and drive the watchdog + indicator."""
+    """Iterate the repositories and drive the watchdog + indicator.
+
+    Successful syncs add their state-store fields to ``observations``, keyed
+    by checkout path, for the caller to record in one transaction. Checkouts
+    in ``target_revs`` (resolved path to commit, from an applied plan) move
+    to that commit rather than to their upstream.
+    """
     for repo in found_repos:
         repo_name = repo.get("name", "unknown")
         repo_path = repo.get("path", "unknown")
@@ -1794,6 +2235,11 @@ def _run_sync_loop(
         # spinner clears, then the formatter writes the permanent line
         # in a separate stream call. That two-step is the source of the
         # flicker reporters have called out.
+        target_rev = (
+            target_revs.get(str(_get_repo_path(repo).resolve()))
+            if target_revs
+            else None
+        )
         indicator.start_repo(repo_name)
         try:
             outcome = _sync_repo_with_watchdog(
@@ -1801,6 +2247,7 @@ def _run_sync_loop(
                 progress_callback=progress_callback,
                 timeout=repo_timeout,
                 is_human=is_human,
+                target_rev=target_rev,
             )
         except BaseException:
             # Any exception (KeyboardInterrupt, runtime crash) tears the
@@ -1896,6 +2343,8 @@ def _run_sync_loop(
 
         summary["synced"] += 1
         event["status"] = "synced"
+        if observations is not None:
+            observations[str(repo_path)] = _synced_observation(repo, outcome.duration)
         permanent = (
             f"{colors.success('✓')} Synced {colors.info(repo_name)} "
             f"{colors.muted('→')} {display_repo_path}"
@@ -2002,6 +2451,16 @@ def _emit_summary(
             parts.append(
                 f", {colors.warning(str(unmatched))} unmatched",
             )
+        stale = summary.get("stale", 0)
+        if stale > 0:
+            parts.append(
+                f", {colors.warning(str(stale))} stale",
+            )
+        skipped = summary.get("skipped", 0)
+        if skipped > 0:
+            parts.append(
+                f", {colors.muted(str(skipped))} skipped",
+            )
         wt_created = summary.get("worktree_created", 0)
         wt_updated = summary.get("worktree_updated", 0)
         wt_failed = summary.get("worktree_failed", 0)
@@ -2068,8 +2527,15 @@ def update_repo(
     repo_dict: t.Any,
     progress_callback: ProgressCallback | None = None,
     # repo_dict: Dict[str, Union[str, Dict[str, GitRemote], pathlib.Path]]
+    target_rev: str | None = None,
 ) -> GitSync | HgSync | SvnSync:
-    """Synchronize a single repository."""
+    """Synchronize a single repository.
+
+    With ``target_rev``, an existing git checkout is fast-forwarded to that
+    commit without fetching, instead of pulling whatever its upstream holds
+    now. Applied plans use this to move a checkout exactly as far as the
+    reviewed plan showed.
+    """
     repo_dict = deepcopy(repo_dict)
     if "pip_url" not in repo_dict:
         repo_dict["pip_url"] = repo_dict.pop("url")
@@ -2099,6 +2565,16 @@ def update_repo(
             r.git_shallow = True
         if git_depth is not None:
             r.depth = git_depth
+        if target_rev is not None:
+            try:
+                r.cmd.run(["merge", "--ff-only", "--quiet", target_rev])
+            except CommandError as exc_obj:
+                repo_name = str(repo_dict.get("name", repo_dict.get("url", "unknown")))
+                raise SyncFailedError(
+                    repo_name=repo_name,
+                    errors=f"could not fast-forward to {target_rev[:7]}: {exc_obj}",
+                ) from exc_obj
+            return r
     if repo_dict.get("vcs") == "git":
         result = r.update_repo(set_remotes=True)
     else:
@@ -6,16 +6,19 @@ import argparse
 import pathlib
 import typing as t
 
+from vcspull._internal.lazy_config import LazyConfig
 from vcspull._internal.private_path import PrivatePath
 from vcspull._internal.worktree_sync import (
+    DEFAULT_WORKTREE_CONCURRENCY,
     WorktreeAction,
     WorktreePlanEntry,
+    WorktreeSyncJob,
     list_existing_worktrees,
     plan_worktree_sync,
     prune_worktrees,
-    sync_all_worktrees,
+    sync_worktree_jobs,
 )
-from vcspull.config import expand_dir, filter_repos, find_config_files, load_configs
+from vcspull.config import expand_dir, find_config_files, load_configs
 
 from ._colors import Colors, get_color_mode
 from ._output import OutputFormatter, get_output_mode
@@ -34,6 +37,28 @@ WORKTREE_SYMBOLS: dict[WorktreeAction, str] = {
 }
 
 
+def _max_concurrent_arg(value: str) -> int:
+    """Parse ``--max-concurrent`` as a positive number of worktrees.
+
+    Examples
+    --------
+    >>> _max_concurrent_arg("4")
+    4
+    >>> _max_concurrent_arg("0")
+    Traceback (most recent call last):
+    ...
+    argparse.ArgumentTypeError: --max-concurrent takes a positive number (got '0')
+    """
+    try:
+        max_concurrent = int(value)
+    except ValueError:
+        max_concurrent = 0
+    if max_concurrent <= 0:
+        msg = f"--max-concurrent takes a positive number (got {value!r})"
+        raise argparse.ArgumentTypeError(msg)
+    return max_concurrent
+
+
 def create_worktree_subparser(parser: argparse.ArgumentParser) -> None:
     """Create ``vcspull worktree`` argument subparser.
 
@@ -63,6 +88,17 @@ def create_worktree_subparser(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="preview what would be synced without making changes",
     )
+    sync_parser.add_argument(
+        "--max-concurrent",
+        type=_max_concurrent_arg,
+        metavar="N",
+        dest="max_concurrent",
+        help=(
+            "maximum worktrees handled at once across repositories; creates "
+            "and updates within one repository always run one at a time "
+            f"(default: {DEFAULT_WORKTREE_CONCURRENCY})"
+        ),
+    )
 
     # Prune subcommand
     prune_parser = subparsers.add_parser(
@@ -141,16 +177,16 @@ def handle_worktree_command(args: argparse.Namespace) -> None:
 
     # Load configs
     config_path = pathlib.Path(args.config) if args.config else None
-    if config_path:
-        configs = load_configs([config_path])
-    else:
-        configs = load_configs(find_config_files(include_home=True))
+    config_files = (
+        [config_path] if config_path else find_config_files(include_home=True)
+    )
 
     # Filter by patterns
     if args.repo_patterns:
+        configs = LazyConfig.load(config_files)
         found_repos: list[ConfigDict] = []
         for pattern in args.repo_patterns:
-            found_repos.extend(filter_repos(configs, name=pattern))
+            found_repos.extend(configs.filter(name=pattern))
 
         # Deduplicate repos matched by multiple patterns
         seen_paths: set[str] = set()
@@ -162,7 +198,7 @@ def handle_worktree_command(args: argparse.Namespace) -> None:
                 deduped.append(repo)
         found_repos = deduped
     else:
-        found_repos = configs
+        found_repos = load_configs(config_files)
 
     # Filter by workspace root
     if args.workspace_root:
@@ -183,6 +219,7 @@ def handle_worktree_command(args: argparse.Namespace) -> None:
             formatter,
             colors,
             dry_run=args.dry_run,
+            max_concurrent=getattr(args, "max_concurrent", None),
         )
     elif args.worktree_action == "prune":
         # Use found_repos (not repos_with_worktrees) so repos whose worktree
@@ -288,6 +325,7 @@ def _emit_worktree_entry(
             "is_dirty": entry.is_dirty,
             "detail": entry.detail,
             "error": entry.error,
+            "duration_ms": entry.duration_ms,
         }
     )
 
@@ -306,9 +344,14 @@ def _handle_sync(
     colors: Colors,
     *,
     dry_run: bool = False,
+    max_concurrent: int | None = None,
 ) -> None:
     """Handle the worktree sync subcommand.
 
+    All repositories are synced together by
+    :func:`~vcspull._internal.worktree_sync.sync_worktree_jobs`, then reported
+    in configuration order.
+
     Parameters
     ----------
     repos : list[ConfigDict]
@@ -319,6 +362,8 @@ def _handle_sync(
         Color manager for terminal output.
     dry_run : bool
         If True, only preview what would be synced.
+    max_concurrent : int | None
+        Maximum worktrees handled at once (default: CPU-based).
 
     Notes
     -----
@@ -336,26 +381,33 @@ def _handle_sync(
     total_blocked = 0
     total_errors = 0
 
+    jobs: list[tuple[ConfigDict, WorktreeSyncJob]] = []
     for repo in repos:
-        repo_name = repo.get("name", "unknown")
-        repo_path = pathlib.Path(str(repo.get("path", ".")))
-        workspace_root = str(repo.get("workspace_root", "."))
         worktrees_config = repo.get("worktrees", [])
-
         if not worktrees_config:
             continue
+        workspace_root = str(repo.get("workspace_root", "."))
+        jobs.append(
+            (
+                repo,
+                WorktreeSyncJob(
+                    repo_path=pathlib.Path(str(repo.get("path", "."))),
+                    worktrees_config=worktrees_config,
+                    workspace_root=expand_dir(pathlib.Path(workspace_root)),
+                ),
+            ),
+        )
 
-        workspace_path = expand_dir(pathlib.Path(workspace_root))
+    results = sync_worktree_jobs(
+        [job for _, job in jobs],
+        dry_run=dry_run,
+        max_workers=max_concurrent,
+    )
 
+    for (repo, job), result in zip(jobs, results, strict=True):
+        repo_name = repo.get("name", "unknown")
         formatter.emit_text(
-            f"\n{colors.highlight(repo_name)} ({PrivatePath(repo_path)})"
-        )
-
-        result = sync_all_worktrees(
-            repo_path,
-            worktrees_config,
-            workspace_path,
-            dry_run=dry_run,
+            f"\n{colors.highlight(repo_name)} ({PrivatePath(job.repo_path)})"
         )
 
         for entry in result.entries:
@@ -434,6 +486,7 @@ def _handle_prune(
             worktrees_config or [],
             workspace_path,
             dry_run=dry_run,
+            existing=existing,
         )
 
         if pruned:
@@ -5,25 +5,38 @@ from __future__ import annotations
 import contextlib
 import copy
 import enum
-import fnmatch
+import functools
 import logging
 import os
 import pathlib
 import subprocess
 import tempfile
 import typing as t
-from collections.abc import Callable
-
-from libvcs.sync.git import GitRemote
+from collections.abc import Callable, Generator, Iterable, Sequence
 
 from vcspull.validator import is_valid_config
 
 from . import exc
+from ._internal import config_cache
+from ._internal.config_patch import patch_config_text
 from ._internal.config_reader import (
     ConfigReader,
     DuplicateAwareConfigReader,
     config_format_from_path,
+    iter_unique_jsonl_entries,
+    jsonl_line,
+    load_jsonl,
+)
+from ._internal.duplicate_index import DuplicateIndex, RepoClaim, RepoCollision
+from ._internal.git_probe import read_head_revision, read_shallow_commits
+from ._internal.parallel_load import (
+    capture_logs,
+    map_in_processes,
+    parallel_workers,
+    replay_logs,
 )
+from ._internal.repo_index import RepoIndex
+from ._internal.repo_record import RepoRecord, checkout_key, is_plain_name
 from .types import ConfigDict, RawConfigDict, WorktreeConfigDict
 from .util import get_config_dir, update_dict
 
@@ -312,110 +325,122 @@ def extract_repos(
     configs: list[ConfigDict] = []
     if callable(cwd):
         cwd = cwd()
+    # Expanded workspace roots, so each is expanded once rather than per entry.
+    roots: dict[str, str] = {}
 
     for directory, repos in config.items():
         assert isinstance(repos, dict)
-        for repo, repo_data in repos.items():
-            conf: dict[str, t.Any] = {}
+        configs.extend(
+            _expand_repo(directory, repo, repo_data, cwd=cwd, roots=roots)
+            for repo, repo_data in repos.items()
+        )
 
-            """
-            repo_name: http://myrepo.com/repo.git
+    return configs
 
-            to
 
-            repo_name: { url: 'http://myrepo.com/repo.git' }
+def _expand_repo(
+    directory: str,
+    repo: str,
+    repo_data: t.Any,
+    *,
+    cwd: pathlib.Path,
+    roots: dict[str, str],
+) -> ConfigDict:
+    """Return one raw entry expanded as :func:`extract_repos` does.
 
-            also assures the repo is a :py:class:`dict`.
-            """
+    ``roots`` memoizes expanded workspace roots across calls.
+    """
+    conf: dict[str, t.Any] = {}
 
-            if isinstance(repo_data, str):
-                conf["url"] = repo_data
-            else:
-                conf = update_dict(conf, repo_data)
-
-            if "repo" in conf:
-                if "url" not in conf:
-                    conf["url"] = conf.pop("repo")
-                else:
-                    conf.pop("repo", None)
-
-            # Sync-tuning keys (rev/shallow/depth) are canonical under
-            # ``options:``; lift them onto the flat ConfigDict the sync path
-            # reads. A legacy top-level key was already copied above by
-            # update_dict, but an ``options:`` value wins when both are set.
-            entry_options = conf.get("options")
-            if isinstance(entry_options, dict):
-                for option_key in LEGACY_REPO_OPTION_KEYS:
-                    if option_key in entry_options:
-                        conf[option_key] = entry_options[option_key]
-
-            if "name" not in conf:
-                conf["name"] = repo
-
-            if "workspace_root" not in conf:
-                conf["workspace_root"] = directory
-
-            if "path" not in conf:
-                conf["path"] = expand_dir(
-                    pathlib.Path(expand_dir(pathlib.Path(directory), cwd=cwd))
-                    / conf["name"],
-                    cwd,
-                )
+    """
+    repo_name: http://myrepo.com/repo.git
 
-            if "remotes" in conf:
-                assert isinstance(conf["remotes"], dict)
-                for remote_name, url in conf["remotes"].items():
-                    if isinstance(url, GitRemote):
-                        continue
-                    if isinstance(url, str):
-                        conf["remotes"][remote_name] = GitRemote(
-                            name=remote_name,
-                            fetch_url=url,
-                            push_url=url,
-                        )
-                    elif isinstance(url, dict):
-                        assert "push_url" in url
-                        assert "fetch_url" in url
-                        conf["remotes"][remote_name] = GitRemote(
-                            name=remote_name,
-                            **url,
-                        )
+    to
 
-            # Process worktrees configuration
-            if "worktrees" in conf:
-                worktrees_raw = conf["worktrees"]
-                if worktrees_raw is not None:
-                    repo_name_for_error = conf.get("name") or repo
-                    validated_worktrees = _validate_worktrees_config(
-                        worktrees_raw,
-                        repo_name=repo_name_for_error,
-                    )
-                    conf["worktrees"] = validated_worktrees
+    repo_name: { url: 'http://myrepo.com/repo.git' }
 
-            def is_valid_config_dict(val: t.Any) -> t.TypeGuard[ConfigDict]:
-                assert isinstance(val, dict)
-                return True
+    also assures the repo is a :py:class:`dict`.
+    """
 
-            assert is_valid_config_dict(conf)
+    if isinstance(repo_data, str):
+        conf["url"] = repo_data
+    else:
+        conf = update_dict(conf, repo_data)
+
+    if "repo" in conf:
+        if "url" not in conf:
+            conf["url"] = conf.pop("repo")
+        else:
+            conf.pop("repo", None)
+
+    # Sync-tuning keys (rev/shallow/depth) are canonical under
+    # ``options:``; lift them onto the flat ConfigDict the sync path
+    # reads. A legacy top-level key was already copied above by
+    # update_dict, but an ``options:`` value wins when both are set.
+    entry_options = conf.get("options")
+    if isinstance(entry_options, dict):
+        for option_key in LEGACY_REPO_OPTION_KEYS:
+            if option_key in entry_options:
+                conf[option_key] = entry_options[option_key]
+
+    if "name" not in conf:
+        conf["name"] = repo
+
+    if "workspace_root" not in conf:
+        conf["workspace_root"] = directory
+
+    parent: str | None = None
+    if "path" not in conf:
+        root = roots.get(directory)
+        if root is None:
+            root = str(expand_dir(pathlib.Path(directory), cwd=cwd))
+            roots[directory] = root
+        if "$" not in root and is_plain_name(conf["name"]):
+            # The record joins the two when ``path`` is read.
+            parent = root
+        else:
+            conf["path"] = expand_dir(
+                pathlib.Path(root) / conf["name"],
+                cwd,
+            )
 
-            configs.append(conf)
+    if "remotes" in conf:
+        assert isinstance(conf["remotes"], dict)
+        # GitRemote objects are built when the record's remotes are
+        # first read; check their shape now so errors surface at load.
+        for url in conf["remotes"].values():
+            if isinstance(url, dict):
+                assert "push_url" in url
+                assert "fetch_url" in url
+
+    # Process worktrees configuration
+    if "worktrees" in conf:
+        worktrees_raw = conf["worktrees"]
+        if worktrees_raw is not None:
+            repo_name_for_error = conf.get("name") or repo
+            validated_worktrees = _validate_worktrees_config(
+                worktrees_raw,
+                repo_name=repo_name_for_error,
+            )
+            conf["worktrees"] = validated_worktrees
 
-    return configs
+    record = RepoRecord.from_dict(conf, parent=parent)
+    return t.cast("ConfigDict", record)
 
 
 def find_home_config_files(
     filetype: list[str] | None = None,
 ) -> list[pathlib.Path]:
-    """Return configs of ``.vcspull.{yaml,json}`` in user's home directory.
+    """Return configs of ``.vcspull.{yaml,json,jsonl}`` in user's home directory.
 
     The returned path preserves the logical home entry name so callers
-    keep the config type implied by ``.yaml`` or ``.json`` even when the
-    file is a symlink.
+    keep the config type implied by ``.yaml``, ``.json``, or ``.jsonl`` even
+    when the file is a symlink.
 
     Parameters
     ----------
     filetype : list of str, optional
-        File types to search for (default ``["json", "yaml"]``)
+        File types to search for (default ``["json", "yaml", "jsonl"]``)
 
     Returns
     -------
@@ -428,30 +453,35 @@ def find_home_config_files(
     []
     """
     if filetype is None:
-        filetype = ["json", "yaml"]
+        filetype = ["json", "yaml", "jsonl"]
     configs: list[pathlib.Path] = []
 
     check_yaml = "yaml" in filetype
     check_json = "json" in filetype
+    check_jsonl = "jsonl" in filetype
 
     yaml_config = normalize_config_file_path(pathlib.Path("~/.vcspull.yaml"))
     has_yaml_config = check_yaml and yaml_config.exists()
     json_config = normalize_config_file_path(pathlib.Path("~/.vcspull.json"))
     has_json_config = check_json and json_config.exists()
+    jsonl_config = normalize_config_file_path(pathlib.Path("~/.vcspull.jsonl"))
+    has_jsonl_config = check_jsonl and jsonl_config.exists()
 
-    if not has_yaml_config and not has_json_config:
+    if not has_yaml_config and not has_json_config and not has_jsonl_config:
         log.debug(
             "No config file found. Create a .vcspull.yaml or .vcspull.json"
             " in your $HOME directory. http://vcspull.git-pull.com for a"
             " quickstart.",
         )
     else:
-        if sum(filter(None, [has_json_config, has_yaml_config])) > 1:
+        if sum(filter(None, [has_json_config, has_yaml_config, has_jsonl_config])) > 1:
             raise exc.MultipleConfigWarning
         if has_yaml_config:
             configs.append(yaml_config)
         if has_json_config:
             configs.append(json_config)
+        if has_jsonl_config:
+            configs.append(jsonl_config)
 
     return configs
 
@@ -459,8 +489,8 @@ def find_home_config_files(
 def find_config_files(
     path: list[pathlib.Path] | pathlib.Path | None = None,
     match: list[str] | str | None = None,
-    filetype: t.Literal["json", "yaml", "*"]
-    | list[t.Literal["json", "yaml", "*"]]
+    filetype: t.Literal["json", "yaml", "jsonl", "*"]
+    | list[t.Literal["json", "yaml", "jsonl", "*"]]
     | None = None,
     include_home: bool = False,
 ) -> list[pathlib.Path]:
@@ -488,7 +518,7 @@ def find_config_files(
         list of absolute paths to config files.
     """
     if filetype is None:
-        filetype = ["json", "yaml"]
+        filetype = ["json", "yaml", "jsonl"]
     if match is None:
         match = ["*"]
     config_files = []
@@ -517,12 +547,162 @@ def find_config_files(
     return config_files
 
 
+def read_config_file(
+    file: pathlib.Path,
+    *,
+    merge_duplicates: bool = True,
+    warn_legacy_options: bool = False,
+) -> tuple[RawConfigDict, bool]:
+    r"""Return the raw config in ``file`` and whether reading it was quiet.
+
+    Duplicate workspace roots are merged (or reported) and legacy options
+    warned about exactly as :func:`load_configs` does; entries are not
+    expanded. The flag is ``False`` when something was logged, so callers
+    that cache the result can avoid hiding those messages.
+
+    Examples
+    --------
+    >>> config_file = tmp_path / ".vcspull.yaml"
+    >>> _ = config_file.write_text("~/code/:\n  flask: git+https://x/flask\n")
+    >>> read_config_file(config_file)
+    ({'~/code/': {'flask': 'git+https://x/flask'}}, True)
+
+    In a ``.vcspull.jsonl`` config the first line for a repository wins, and
+    later ones are reported:
+
+    >>> jsonl_file = tmp_path / ".vcspull.jsonl"
+    >>> _ = jsonl_file.write_text(
+    ...     '{"workspace_root": "~/code/", "name": "flask", "url": "git+https://x"}\n'
+    ... )
+    >>> read_config_file(jsonl_file)
+    ({'~/code/': {'flask': 'git+https://x'}}, True)
+    """
+    if config_format_from_path(file) == "jsonl":
+        with file.open(encoding="utf-8") as lines:
+            jsonl_content, repeated = load_jsonl(lines)
+        config_content: dict[str, t.Any] = dict(jsonl_content)
+        duplicate_roots: dict[str, list[t.Any]] = {}
+        for entry, first_line in repeated:
+            log.warning(
+                "%s:%d: %s%s repeats line %d, which is kept",
+                file,
+                entry.line,
+                entry.workspace_root,
+                entry.name,
+                first_line,
+            )
+        quiet = not repeated
+    else:
+        config_content, duplicate_roots, _top_level_items = (
+            DuplicateAwareConfigReader.load_with_duplicates(file)
+        )
+        quiet = not duplicate_roots
+
+    if merge_duplicates and duplicate_roots:
+        (
+            config_content,
+            merge_conflicts,
+            _merge_change_count,
+            merge_details,
+        ) = merge_duplicate_workspace_roots(config_content, duplicate_roots)
+
+        for conflict in merge_conflicts:
+            log.warning("%s: %s", file, conflict)
+
+        for root_label, occurrence_count in merge_details:
+            duplicate_count = max(occurrence_count - 1, 0)
+            if duplicate_count == 0:
+                continue
+            plural = "entry" if duplicate_count == 1 else "entries"
+            log.info(
+                "%s: merged %d duplicate %s for workspace root '%s'",
+                file,
+                duplicate_count,
+                plural,
+                root_label,
+            )
+    elif duplicate_roots:
+        duplicate_list = ", ".join(sorted(duplicate_roots.keys()))
+        log.warning(
+            "%s: duplicate workspace roots detected (%s); keeping last occurrences",
+            file,
+            duplicate_list,
+        )
+
+    if warn_legacy_options:
+        legacy_entries = detect_legacy_repo_options(config_content)
+        if legacy_entries:
+            quiet = False
+            warn_legacy_repo_options(file, legacy_entries)
+
+    assert is_valid_config(config_content)
+    return config_content, quiet
+
+
+def warn_legacy_repo_options(
+    file: pathlib.Path,
+    legacy_entries: Sequence[tuple[str, str]],
+) -> None:
+    """Log the deprecation warning for :func:`detect_legacy_repo_options` hits."""
+    affected = ", ".join(f"{label}{name}" for label, name in legacy_entries)
+    log.warning(
+        "%s: top-level rev/shallow/depth are deprecated; move them "
+        "under 'options:' (run 'vcspull migrate'). Affected: %s",
+        file,
+        affected,
+        extra={
+            "vcspull_config_path": str(file),
+            "vcspull_legacy_count": len(legacy_entries),
+        },
+    )
+
+
+def iter_jsonl_repos(
+    file: pathlib.Path,
+    cwd: pathlib.Path | Callable[[], pathlib.Path] = pathlib.Path.cwd,
+) -> Generator[ConfigDict, None, None]:
+    r"""Yield the repositories of a ``.vcspull.jsonl`` config as it is read.
+
+    Each line is parsed and expanded only when the caller asks for the next
+    repository, so a caller that has found what it needs can stop without
+    reading the rest of the file. The first line for a workspace root and
+    name wins; repeats are skipped without the report :func:`read_config_file`
+    logs.
+
+    Examples
+    --------
+    >>> config_file = tmp_path / ".vcspull.jsonl"
+    >>> _ = config_file.write_text(
+    ...     '{"workspace_root": "/code/", "name": "flask", "url": "git+https://x"}\n'
+    ...     '{"workspace_root": "/code/", "name": "rich", "url": "git+https://y"}\n'
+    ... )
+    >>> repos = iter_jsonl_repos(config_file, cwd=tmp_path)
+    >>> str(next(repos)["path"])
+    '/code/flask'
+    >>> repos.close()
+    """
+    if callable(cwd):
+        cwd = cwd()
+    roots: dict[str, str] = {}
+    with file.open(encoding="utf-8") as lines:
+        for entry in iter_unique_jsonl_entries(lines):
+            yield _expand_repo(
+                entry.workspace_root,
+                entry.name,
+                entry.data,
+                cwd=cwd,
+                roots=roots,
+            )
+
+
 def load_configs(
     files: list[pathlib.Path],
     cwd: pathlib.Path | Callable[[], pathlib.Path] = pathlib.Path.cwd,
     *,
     merge_duplicates: bool = True,
     warn_legacy_options: bool = False,
+    use_cache: bool | None = None,
+    parallel: bool | None = None,
 ) -> list[ConfigDict]:
     """Return repos from a list of files.
 
@@ -536,90 +716,162 @@ def load_configs(
         If ``True``, log a deprecation warning for entries that still carry
         top-level ``rev``/``shallow``/``depth`` keys (see
         :func:`detect_legacy_repo_options`).
+    use_cache : bool | None
+        Reuse a snapshot from :mod:`vcspull._internal.config_cache` when the
+        files are unchanged, and store one otherwise. ``None`` follows
+        ``vcspull --no-config-cache``.
+    parallel : bool | None
+        Parse and expand files in worker processes. ``None`` does so once
+        the files pass the size or count thresholds in
+        :mod:`vcspull._internal.parallel_load`. Results, duplicate checks,
+        and log output are the same either way.
 
     Returns
     -------
     list of dict :
         expanded config dict item
 
+    Raises
+    ------
+    vcspull.exc.DuplicateRepoError
+        When two files configure the same checkout path. Two files checking
+        the same URL out to different paths log a warning instead.
+
     Todo
     ----
-    Validate scheme, check for duplicate destinations, VCS urls
+    Validate scheme
     """
     repos: list[ConfigDict] = []
     if callable(cwd):
         cwd = cwd()
+    files = [pathlib.Path(file) for file in files]
+
+    if use_cache is None:
+        use_cache = config_cache.config_cache_enabled()
+    cache_key = (
+        config_cache.snapshot_key(
+            files,
+            cwd=cwd,
+            options={
+                "merge_duplicates": merge_duplicates,
+                "warn_legacy_options": warn_legacy_options,
+            },
+        )
+        if use_cache
+        else None
+    )
+    if cache_key is not None:
+        cached_repos = config_cache.load_snapshot(cache_key)
+        if cached_repos is not None:
+            return cached_repos
+    # Loads that log are not stored, so their messages show on every run.
+    quiet = True
+    claimed = DuplicateIndex()
+
+    load_file = functools.partial(
+        _load_config_file,
+        cwd=cwd,
+        merge_duplicates=merge_duplicates,
+        warn_legacy_options=warn_legacy_options,
+    )
+    workers = parallel_workers(files, force=bool(parallel))
+    loads = (
+        map_in_processes(load_file, files, workers=workers)
+        if workers and parallel is not False
+        else map(functools.partial(load_file, hold_logs=False), files)
+    )
 
-    for file in files:
-        if isinstance(file, str):
-            file = pathlib.Path(file)
-        assert isinstance(file, pathlib.Path)
-
-        config_content, duplicate_roots, _top_level_items = (
-            DuplicateAwareConfigReader.load_with_duplicates(file)
+    for file, (newrepos, file_quiet, records, error) in zip(files, loads, strict=True):
+        replay_logs(records)
+        if error is not None:
+            raise error
+        quiet = quiet and file_quiet
+        collisions = claimed.add(
+            RepoClaim(
+                name=repo["name"],
+                checkout=checkout_key(repo),
+                url=str(repo.get("url", repo.get("repo"))),
+                source=file,
+            )
+            for repo in newrepos
         )
+        if report_collisions(collisions):
+            quiet = False
+        repos.extend(newrepos)
 
-        if merge_duplicates:
-            (
-                config_content,
-                merge_conflicts,
-                _merge_change_count,
-                merge_details,
-            ) = merge_duplicate_workspace_roots(config_content, duplicate_roots)
-
-            for conflict in merge_conflicts:
-                log.warning("%s: %s", file, conflict)
-
-            for root_label, occurrence_count in merge_details:
-                duplicate_count = max(occurrence_count - 1, 0)
-                if duplicate_count == 0:
-                    continue
-                plural = "entry" if duplicate_count == 1 else "entries"
-                log.info(
-                    "%s: merged %d duplicate %s for workspace root '%s'",
-                    file,
-                    duplicate_count,
-                    plural,
-                    root_label,
-                )
-        elif duplicate_roots:
-            duplicate_list = ", ".join(sorted(duplicate_roots.keys()))
-            log.warning(
-                "%s: duplicate workspace roots detected (%s); keeping last occurrences",
+    if cache_key is not None and quiet:
+        config_cache.store_snapshot(cache_key, repos)
+    return repos
+
+
+class _FileLoad(t.NamedTuple):
+    """One file's expanded repos, as :func:`load_configs` merges them."""
+
+    repos: list[ConfigDict]
+    quiet: bool
+    records: list[logging.LogRecord]
+    error: Exception | None = None
+
+
+def _load_config_file(
+    file: pathlib.Path,
+    *,
+    cwd: pathlib.Path,
+    merge_duplicates: bool,
+    warn_legacy_options: bool,
+    hold_logs: bool = True,
+) -> _FileLoad:
+    """Read and expand ``file``.
+
+    In worker processes (``hold_logs``) log output is held back and returned,
+    so :func:`load_configs` can replay it in file order. An error is returned
+    alongside the output logged before it, rather than raised without it.
+    In-process loads log directly, raise, and return no records.
+    """
+    records: list[logging.LogRecord] = []
+    with capture_logs() if hold_logs else contextlib.nullcontext(records) as records:
+        try:
+            config_content, quiet = read_config_file(
                 file,
-                duplicate_list,
+                merge_duplicates=merge_duplicates,
+                warn_legacy_options=warn_legacy_options,
             )
+            repos = extract_repos(config_content, cwd=cwd)
+        except Exception as error:
+            if not hold_logs:
+                raise
+            return _FileLoad([], True, records, error)
+    return _FileLoad(repos, quiet, records)
 
-        if warn_legacy_options:
-            legacy_entries = detect_legacy_repo_options(config_content)
-            if legacy_entries:
-                affected = ", ".join(f"{label}{name}" for label, name in legacy_entries)
-                log.warning(
-                    "%s: top-level rev/shallow/depth are deprecated; move them "
-                    "under 'options:' (run 'vcspull migrate'). Affected: %s",
-                    file,
-                    affected,
-                    extra={
-                        "vcspull_config_path": str(file),
-                        "vcspull_legacy_count": len(legacy_entries),
-                    },
-                )
-
-        assert is_valid_config(config_content)
-        newrepos = extract_repos(config_content, cwd=cwd)
 
-        if not repos:
-            repos.extend(newrepos)
-            continue
+def report_collisions(collisions: list[RepoCollision]) -> bool:
+    """Raise for shared checkout paths; warn about remotes checked out twice.
 
-        dupes = detect_duplicate_repos(repos, newrepos)
+    Parameters
+    ----------
+    collisions : list[RepoCollision]
+        Collisions found by
+        :class:`~vcspull._internal.duplicate_index.DuplicateIndex`.
 
-        if len(dupes) > 0:
-            msg = ("repos with same path + different VCS detected!", dupes)
-            raise exc.VCSPullException(msg)
-        repos.extend(newrepos)
+    Returns
+    -------
+    bool
+        Whether a warning was logged.
 
-    return repos
+    Raises
+    ------
+    vcspull.exc.DuplicateRepoError
+        When two config files configure the same checkout path.
+    """
+    path_collisions = [c for c in collisions if c.kind == "path"]
+    if path_collisions:
+        raise exc.DuplicateRepoError(path_collisions)
+    for collision in collisions:
+        log.warning(
+            "Same repository configured at two paths: %s",
+            collision.describe(),
+        )
+    return bool(collisions)
 
 
 def detect_duplicate_repos(
@@ -669,14 +921,14 @@ def in_dir(
     config_dir : str
         directory to search
     extensions : list
-        filetypes to check (e.g. ``['.yaml', '.json']``).
+        filetypes to check (e.g. ``['.yaml', '.json', '.jsonl']``).
 
     Returns
     -------
     list
     """
     if extensions is None:
-        extensions = [".yml", ".yaml", ".json"]
+        extensions = [".yml", ".yaml", ".json", ".jsonl"]
     if config_dir is None:
         config_dir = get_config_dir()
 
@@ -695,7 +947,9 @@ def filter_repos(
 ) -> list[ConfigDict]:
     """Return a :py:obj:`list` list of repos from (expanded) config file.
 
-    path, vcs_url and name all support fnmatch.
+    path, vcs_url and name all support fnmatch. Callers matching many patterns
+    against one list can build a :class:`~vcspull._internal.repo_index.RepoIndex`
+    once instead.
 
     Parameters
     ----------
@@ -713,30 +967,8 @@ def filter_repos(
     list :
         Repos
     """
-    repo_list: list[ConfigDict] = []
-
-    if path:
-        repo_list.extend(
-            [
-                r
-                for r in config
-                if fnmatch.fnmatch(str(pathlib.Path(r["path"]).parent), str(path))
-            ],
-        )
-
-    if vcs_url:
-        repo_list.extend(
-            r
-            for r in config
-            if fnmatch.fnmatch(str(r.get("url", r.get("repo"))), vcs_url)
-        )
-
-    if name:
-        repo_list.extend(
-            [r for r in config if fnmatch.fnmatch(str(r.get("name")), name)],
-        )
-
-    return repo_list
+    index = RepoIndex.from_repos(config)
+    return [config[position] for position in index.match(path, vcs_url, name)]
 
 
 def is_config_file(
@@ -750,14 +982,14 @@ def is_config_file(
     filename : str
         filename to check (e.g. ``mysession.json``).
     extensions : list or str
-        filetypes to check (e.g. ``['.yaml', '.json']``).
+        filetypes to check (e.g. ``['.yaml', '.json', '.jsonl']``).
 
     Returns
     -------
     bool : True if is a valid config file type
     """
     if extensions is None:
-        extensions = [".yml", ".yaml", ".json"]
+        extensions = [".yml", ".yaml", ".json", ".jsonl"]
     extensions = [extensions] if isinstance(extensions, str) else extensions
     return any(filename.endswith(e) for e in extensions)
 
@@ -849,6 +1081,46 @@ def save_config_yaml(config_file_path: pathlib.Path, data: dict[t.Any, t.Any]) -
     _atomic_write(config_file_path, yaml_content)
 
 
+def save_config_jsonl(
+    config_file_path: pathlib.Path,
+    data: dict[t.Any, t.Any],
+) -> None:
+    """Save configuration data to a ``.vcspull.jsonl`` file, one repo per line.
+
+    Examples
+    --------
+    >>> config_file = tmp_path / ".vcspull.jsonl"
+    >>> save_config_jsonl(config_file, {"~/code/": {"flask": "git+https://x"}})
+    >>> print(config_file.read_text(), end="")
+    {"workspace_root": "~/code/", "name": "flask", "url": "git+https://x"}
+    """
+    jsonl_content = ConfigReader._dump(fmt="jsonl", content=data)
+    _atomic_write(config_file_path, jsonl_content)
+
+
+def append_config_entries(
+    config_file_path: pathlib.Path,
+    entries: Iterable[tuple[str, str, t.Any]],
+) -> None:
+    """Append ``(workspace_root, name, entry)`` lines to a JSONL config.
+
+    Only the new lines are written, so appending costs the same however large
+    the file is. A final line missing its newline gets one first.
+    """
+    text = "".join(
+        f"{jsonl_line(workspace_root, name, data)}\n"
+        for workspace_root, name, data in entries
+    )
+    if not text:
+        return
+    with config_file_path.open("a+b") as handle:
+        if handle.tell() > 0:
+            handle.seek(-1, os.SEEK_END)
+            if handle.read(1) != b"\n":
+                text = f"\n{text}"
+        handle.write(text.encode("utf-8"))
+
+
 def save_config_json(config_file_path: pathlib.Path, data: dict[t.Any, t.Any]) -> None:
     """Save configuration data to a JSON file.
 
@@ -880,9 +1152,11 @@ def save_config_json(config_file_path: pathlib.Path, data: dict[t.Any, t.Any]) -
 def detect_git_shallow(repo_path: pathlib.Path) -> bool:
     """Return whether a local git checkout is shallow.
 
-    Uses ``git rev-parse --is-shallow-repository`` (git 2.15+), falling back to
-    the presence of ``.git/shallow``. Any error (missing binary, non-git path)
-    is treated as "not shallow".
+    Reads the ``shallow`` file in the checkout's git directory, following
+    ``.git`` files and ``commondir`` for worktrees. Only when the git directory
+    cannot be read does it ask ``git rev-parse --is-shallow-repository``
+    (git 2.15+). Any error (missing binary, non-git path) is treated as
+    "not shallow".
 
     Parameters
     ----------
@@ -917,6 +1191,10 @@ def detect_git_shallow(repo_path: pathlib.Path) -> bool:
     >>> detect_git_shallow(shallow)
     True
     """
+    shallow_commits = read_shallow_commits(repo_path)
+    if shallow_commits is not None:
+        return bool(shallow_commits)
+
     try:
         result = subprocess.run(
             ["git", "-C", str(repo_path), "rev-parse", "--is-shallow-repository"],
@@ -925,7 +1203,7 @@ def detect_git_shallow(repo_path: pathlib.Path) -> bool:
             text=True,
         )
     except (OSError, subprocess.CalledProcessError):
-        return (repo_path / ".git" / "shallow").exists()
+        return False
 
     return result.stdout.strip() == "true"
 
@@ -935,9 +1213,10 @@ def detect_git_depth(repo_path: pathlib.Path) -> int | None:
 
     A full (non-shallow) checkout returns ``None``. A shallow checkout returns
     the number of commits reachable from ``HEAD`` (``git rev-list --count
-    HEAD``), which equals the ``--depth`` used to clone a linear history. Any
-    error (missing binary, non-git path, unparsable output) is treated as
-    "cannot determine" and returns ``None``.
+    HEAD``), which equals the ``--depth`` used to clone a linear history. When
+    ``HEAD`` is itself a shallow boundary commit the depth is 1, which is read
+    from disk without running git. Any error (missing binary, non-git path,
+    unparsable output) is treated as "cannot determine" and returns ``None``.
 
     Parameters
     ----------
@@ -980,8 +1259,24 @@ def detect_git_depth(repo_path: pathlib.Path) -> int | None:
     ... )
     >>> detect_git_depth(shallow)
     2
+
+    A ``--depth 1`` clone is answered from its ``shallow`` file:
+
+    >>> single = tmp_path / "single"
+    >>> _ = subprocess.run(
+    ...     ["git", "clone", "--depth", "1", f"file://{remote}", str(single)],
+    ...     check=True, capture_output=True,
+    ... )
+    >>> detect_git_depth(single)
+    1
     """
-    if not detect_git_shallow(repo_path):
+    shallow_commits = read_shallow_commits(repo_path)
+    if shallow_commits is not None:
+        if not shallow_commits:
+            return None
+        if read_head_revision(repo_path) in shallow_commits:
+            return 1
+    elif not detect_git_shallow(repo_path):
         return None
 
     try:
@@ -1261,12 +1556,110 @@ def save_config(config_file_path: pathlib.Path, data: dict[t.Any, t.Any]) -> Non
     ...     "repo" in p.read_text(encoding="utf-8")
     True
     """
-    if config_format_from_path(config_file_path) == "json":
+    fmt = config_format_from_path(config_file_path)
+    if fmt == "json":
         save_config_json(config_file_path, data)
+    elif fmt == "jsonl":
+        save_config_jsonl(config_file_path, data)
     else:
         save_config_yaml(config_file_path, data)
 
 
+def patch_config_file(
+    config_file_path: pathlib.Path,
+    items: Sequence[tuple[str, t.Any]],
+) -> bool:
+    r"""Edit only the lines of an existing config that ``items`` change.
+
+    Returns ``False``, leaving the file alone, when it does not exist or
+    cannot be patched safely (see :mod:`vcspull._internal.config_patch`); the
+    caller then writes it in full.
+
+    Parameters
+    ----------
+    config_file_path : pathlib.Path
+        Config file to update.
+    items : sequence of (str, Any)
+        The whole config to save, as ordered ``(workspace_root, section)``
+        pairs, repeated roots included.
+
+    Examples
+    --------
+    >>> config_file = tmp_path / ".vcspull.yaml"
+    >>> _ = config_file.write_text(
+    ...     "~/code/:\n  flask: git+https://x  # pinned by hand\n",
+    ...     encoding="utf-8",
+    ... )
+    >>> patch_config_file(
+    ...     config_file,
+    ...     [("~/code/", {"flask": "git+https://x", "rich": "git+https://y"})],
+    ... )
+    True
+    >>> print(config_file.read_text(encoding="utf-8"), end="")
+    ~/code/:
+      flask: git+https://x  # pinned by hand
+      rich: git+https://y
+    """
+    try:
+        text = config_file_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return False
+    patched = patch_config_text(config_format_from_path(config_file_path), text, items)
+    if patched is None:
+        log.debug("Cannot patch %s in place, rewriting it", config_file_path)
+        return False
+    if patched != text:
+        _atomic_write(config_file_path, patched)
+    return True
+
+
+def save_config_in_place(
+    config_file_path: pathlib.Path,
+    data: dict[t.Any, t.Any],
+) -> None:
+    """Save ``data``, editing only the changed lines of an existing config.
+
+    Falls back to :func:`save_config` for new files and for changes the
+    file's layout cannot take line by line.
+    """
+    if not patch_config_file(config_file_path, list(data.items())):
+        save_config(config_file_path, data)
+
+
+def save_config_additions(
+    config_file_path: pathlib.Path,
+    data: dict[t.Any, t.Any],
+    added: Sequence[tuple[str, str, t.Any]],
+    *,
+    edits_existing: bool = False,
+) -> None:
+    """Save ``data``, which differs from the file by the ``added`` entries.
+
+    A ``.vcspull.jsonl`` config that exists is appended to, one line per
+    ``(workspace_root, name, entry)`` in ``added``, without reading it. When
+    the change also edits existing entries (``edits_existing``), or the file
+    is in another format, it goes through :func:`save_config_in_place`.
+
+    Examples
+    --------
+    >>> config_file = tmp_path / ".vcspull.jsonl"
+    >>> save_config(config_file, {"~/code/": {"flask": "git+https://x"}})
+    >>> data = {"~/code/": {"flask": "git+https://x", "rich": "git+https://y"}}
+    >>> save_config_additions(config_file, data, [("~/code/", "rich", "git+https://y")])
+    >>> print(config_file.read_text(), end="")
+    {"workspace_root": "~/code/", "name": "flask", "url": "git+https://x"}
+    {"workspace_root": "~/code/", "name": "rich", "url": "git+https://y"}
+    """
+    if (
+        not edits_existing
+        and config_format_from_path(config_file_path) == "jsonl"
+        and config_file_path.exists()
+    ):
+        append_config_entries(config_file_path, added)
+    else:
+        save_config_in_place(config_file_path, data)
+
+
 def save_config_yaml_with_items(
     config_file_path: pathlib.Path,
     items: list[tuple[str, t.Any]],
@@ -2,6 +2,13 @@
 
 from __future__ import annotations
 
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from vcspull._internal.duplicate_index import RepoCollision
+
 
 class VCSPullException(Exception):
     """Standard exception raised by vcspull."""
@@ -42,3 +49,14 @@ class WorktreeDirtyError(WorktreeError):
     def __init__(self, path: str) -> None:
         super().__init__(f"Worktree at {path} has uncommitted changes")
         self.path = path
+
+
+class DuplicateRepoError(VCSPullException):
+    """Config files configure the same checkout path more than once."""
+
+    def __init__(self, collisions: Sequence[RepoCollision]) -> None:
+        details = "\n".join(f"  {collision.describe()}" for collision in collisions)
+        super().__init__(
+            f"Repositories with the same path in more than one config file:\n{details}",
+        )
+        self.collisions = list(collisions)
@@ -24,6 +24,28 @@ def get_config_dir() -> pathlib.Path:
     str :
         absolute path to vcspull config directory
     """
+    paths = config_dir_candidates()
+    for path in paths:
+        if path.is_dir():
+            return path
+
+    # Return last path as default if none of the previous ones matched
+    return paths[-1]
+
+
+def config_dir_candidates() -> list[pathlib.Path]:
+    """Return the directories :func:`get_config_dir` picks from, in order.
+
+    Examples
+    --------
+    >>> monkeypatch = getfixture("monkeypatch")
+    >>> monkeypatch.setenv("VCSPULL_CONFIGDIR", str(tmp_path / "custom"))
+    >>> monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    >>> [path.relative_to(tmp_path).as_posix() for path in config_dir_candidates()[:2]]
+    ['custom', 'xdg/vcspull']
+    >>> config_dir_candidates()[-1] == LEGACY_CONFIG_DIR
+    True
+    """
     paths: list[pathlib.Path] = []
     if "VCSPULL_CONFIGDIR" in os.environ:
         paths.append(pathlib.Path(os.environ["VCSPULL_CONFIGDIR"]))
@@ -32,14 +54,38 @@ def get_config_dir() -> pathlib.Path:
     else:
         paths.append(pathlib.Path("~/.config/vcspull/"))
     paths.append(LEGACY_CONFIG_DIR)
+    return [path.expanduser() for path in paths]
 
-    for path in paths:
-        path = path.expanduser()
-        if path.is_dir():
-            return path
 
-    # Return last path as default if none of the previous ones matched
-    return path
+def get_cache_dir() -> pathlib.Path:
+    """
+    Return vcspull cache directory.
+
+    ``VCSPULL_CACHEDIR`` environmental variable has precedence if set, then
+    ``$XDG_CACHE_HOME/vcspull``, then ``~/.cache/vcspull``. The directory is not
+    created; writers create it on first use.
+
+    Returns
+    -------
+    pathlib.Path :
+        absolute path to vcspull cache directory
+
+    Examples
+    --------
+    >>> monkeypatch = getfixture("monkeypatch")
+    >>> monkeypatch.delenv("VCSPULL_CACHEDIR", raising=False)
+    >>> monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    >>> get_cache_dir() == tmp_path / "vcspull"
+    True
+    >>> monkeypatch.setenv("VCSPULL_CACHEDIR", str(tmp_path / "custom"))
+    >>> get_cache_dir() == tmp_path / "custom"
+    True
+    """
+    if "VCSPULL_CACHEDIR" in os.environ:
+        return pathlib.Path(os.environ["VCSPULL_CACHEDIR"]).expanduser()
+    if "XDG_CACHE_HOME" in os.environ:
+        return pathlib.Path(os.environ["XDG_CACHE_HOME"]).expanduser() / "vcspull"
+    return pathlib.Path("~/.cache/vcspull").expanduser()
 
 
 T = t.TypeVar("T", bound=dict[str, t.Any])
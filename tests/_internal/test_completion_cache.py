@@ -0,0 +1,178 @@
+"""Tests for vcspull._internal.completion_cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import typing as t
+
+import pytest
+
+from vcspull import config
+from vcspull._internal.completion_cache import (
+    Kind,
+    complete,
+    default_completion_cache_dir,
+)
+
+if t.TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+CONFIG = """\
+~/code/:
+  flask: git+https://github.com/pallets/flask.git
+  flask-login: git+https://github.com/maxcountryman/flask-login.git
+  click: git+https://github.com/pallets/click.git
+~/study/:
+  cpython: git+https://github.com/python/cpython.git
+"""
+
+
+class CompleteFixture(t.NamedTuple):
+    """Fixture for prefix queries against a config."""
+
+    test_id: str
+    kind: Kind
+    prefix: str
+    expected: list[str]
+
+
+COMPLETE_FIXTURES: list[CompleteFixture] = [
+    CompleteFixture(
+        test_id="names-by-prefix",
+        kind="names",
+        prefix="fl",
+        expected=["flask", "flask-login"],
+    ),
+    CompleteFixture(
+        test_id="all-names",
+        kind="names",
+        prefix="",
+        expected=["click", "cpython", "flask", "flask-login"],
+    ),
+    CompleteFixture(
+        test_id="roots",
+        kind="roots",
+        prefix="~/s",
+        expected=["~/study/"],
+    ),
+    CompleteFixture(
+        test_id="pattern-as-name",
+        kind="patterns",
+        prefix="c",
+        expected=["click", "cpython"],
+    ),
+    CompleteFixture(
+        test_id="pattern-as-home-path",
+        kind="patterns",
+        prefix="~/code/fl",
+        expected=["~/code/flask", "~/code/flask-login"],
+    ),
+    CompleteFixture(
+        test_id="no-match",
+        kind="names",
+        prefix="django",
+        expected=[],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(CompleteFixture._fields),
+    COMPLETE_FIXTURES,
+    ids=[fixture.test_id for fixture in COMPLETE_FIXTURES],
+)
+def test_complete(
+    test_id: str,
+    kind: Kind,
+    prefix: str,
+    expected: list[str],
+    config_path: pathlib.Path,
+) -> None:
+    """Names, roots, and paths of the default configs are listed by prefix."""
+    (config_path / "work.yaml").write_text(CONFIG)
+
+    assert complete(kind, prefix) == expected
+
+
+def test_fresh_cache_skips_loading(
+    config_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """Configs are loaded again only after a config file changes."""
+    config_file = config_path / "work.yaml"
+    config_file.write_text(CONFIG)
+    load_spy = mocker.spy(config, "load_configs")
+
+    assert complete("names", "fl") == ["flask", "flask-login"]
+    assert complete("names", "cl") == ["click"]
+    assert load_spy.call_count == 1
+
+    config_file.write_text(CONFIG + "  flake8: git+https://github.com/PyCQA/flake8\n")
+    assert complete("names", "fl") == ["flake8", "flask", "flask-login"]
+    assert load_spy.call_count == 2
+
+
+def test_new_config_file_is_noticed(config_path: pathlib.Path) -> None:
+    """A file added to the config directory is picked up by the next query."""
+    (config_path / "work.yaml").write_text(CONFIG)
+    assert complete("names", "dj") == []
+
+    (config_path / "web.yaml").write_text(
+        "~/web/:\n  django: git+https://github.com/django/django.git\n",
+    )
+    assert complete("names", "dj") == ["django"]
+
+
+def test_referenced_env_is_watched(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Paths are rebuilt when a variable the config refers to changes."""
+    config_file = tmp_path / "work.yaml"
+    config_file.write_text("$PROJECTS/:\n  flask: git+https://x/flask.git\n")
+
+    monkeypatch.setenv("PROJECTS", "/srv/a")
+    assert complete("paths", "/srv/", [config_file]) == ["/srv/a/flask"]
+    monkeypatch.setenv("PROJECTS", "/srv/b")
+    assert complete("paths", "/srv/", [config_file]) == ["/srv/b/flask"]
+
+
+def test_broken_config_completes_nothing(tmp_path: pathlib.Path) -> None:
+    """A config that fails to load yields no completions and no error."""
+    config_file = tmp_path / "broken.yaml"
+    config_file.write_text("~/code/: [unclosed\n")
+
+    assert complete("names", "", [config_file]) == []
+    assert not default_completion_cache_dir().exists()
+
+
+QUERY_CACHE = """\
+import json, sys
+from vcspull._internal.completion_cache import main
+main(sys.argv[1:])
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def test_query_imports_only_cache(tmp_path: pathlib.Path) -> None:
+    """Answering from a fresh cache loads neither the configs nor the CLI."""
+    config_file = tmp_path / "work.yaml"
+    config_file.write_text(CONFIG)
+    complete("names", "", [config_file])
+
+    proc = subprocess.run(
+        [sys.executable, "-c", QUERY_CACHE, "-f", str(config_file), "names", "fl"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ.copy(),
+    )
+    *values, modules = proc.stdout.splitlines()
+
+    assert values == ["flask", "flask-login"]
+    imported = set(json.loads(modules))
+    assert not {"vcspull.cli", "vcspull.config", "yaml", "libvcs"} & imported
@@ -0,0 +1,157 @@
+"""Tests for vcspull._internal.config_cache."""
+
+from __future__ import annotations
+
+import logging
+import os
+import typing as t
+
+import pytest
+
+from vcspull._internal import config_cache
+from vcspull._internal.config_reader import DuplicateAwareConfigReader
+from vcspull.config import load_configs
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from pytest_mock import MockerFixture
+
+CONFIG = """\
+~/code/:
+  flask: git+https://github.com/pallets/flask.git
+  django:
+    repo: git+https://github.com/django/django.git
+    remotes:
+      upstream: git+https://github.com/django/django.git
+"""
+
+
+def _write_keeping_stamp(path: pathlib.Path, content: str) -> None:
+    """Rewrite ``path`` without changing its size or mtime."""
+    st = path.stat()
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def test_load_configs_reuses_snapshot(
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """A second load of unchanged files skips parsing and returns equal repos."""
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text(CONFIG, encoding="utf-8")
+
+    first = load_configs([config_file], cwd=tmp_path)
+    parse_spy = mocker.spy(DuplicateAwareConfigReader, "load_with_duplicates")
+    second = load_configs([config_file], cwd=tmp_path)
+
+    assert parse_spy.call_count == 0
+    assert second == first
+    assert second[0] is not first[0]
+
+    load_configs([config_file], cwd=tmp_path, use_cache=False)
+    assert parse_spy.call_count == 1
+
+
+class InvalidationFixture(t.NamedTuple):
+    """Fixture for changes that must invalidate a snapshot."""
+
+    test_id: str
+    change: str
+
+
+INVALIDATION_FIXTURES: list[InvalidationFixture] = [
+    InvalidationFixture(test_id="content-same-size-and-mtime", change="content"),
+    InvalidationFixture(test_id="referenced-env-var", change="env"),
+    InvalidationFixture(test_id="home-directory", change="home"),
+    InvalidationFixture(test_id="working-directory", change="cwd"),
+]
+
+
+@pytest.mark.parametrize(
+    list(InvalidationFixture._fields),
+    INVALIDATION_FIXTURES,
+    ids=[fixture.test_id for fixture in INVALIDATION_FIXTURES],
+)
+def test_load_configs_snapshot_invalidation(
+    test_id: str,
+    change: str,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Anything the expanded repo list depends on invalidates the snapshot."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("CODE_ROOT", str(tmp_path / "code"))
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text(
+        "$CODE_ROOT/:\n  aaa: git+https://x/aaa.git\n"
+        "~/src/:\n  bbb: git+https://x/bbb.git\n"
+        "./rel/:\n  ccc: git+https://x/ccc.git\n",
+        encoding="utf-8",
+    )
+    cwd = tmp_path
+    load_configs([config_file], cwd=cwd)
+
+    if change == "content":
+        _write_keeping_stamp(
+            config_file,
+            config_file.read_text(encoding="utf-8").replace("aaa", "zzz"),
+        )
+    elif change == "env":
+        monkeypatch.setenv("CODE_ROOT", str(tmp_path / "elsewhere"))
+    elif change == "home":
+        monkeypatch.setenv("HOME", str(tmp_path / "other-home"))
+    else:
+        cwd = tmp_path / "sub"
+
+    assert load_configs([config_file], cwd=cwd) == load_configs(
+        [config_file],
+        cwd=cwd,
+        use_cache=False,
+    )
+
+
+def test_load_configs_does_not_cache_warnings(
+    tmp_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Loads that log are never served from a snapshot, so they log again."""
+    caplog.set_level(logging.INFO)
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text(
+        "~/code/:\n  a: git+https://x/a.git\n~/code/:\n  b: git+https://x/b.git\n",
+        encoding="utf-8",
+    )
+
+    for _ in range(2):
+        caplog.clear()
+        repos = load_configs([config_file], cwd=tmp_path)
+        assert [repo["name"] for repo in repos] == ["a", "b"]
+        assert "merged 1 duplicate entry" in caplog.text
+
+    assert not config_cache.default_config_cache_path().exists()
+
+
+def test_store_snapshot_keeps_newest(tmp_path: pathlib.Path) -> None:
+    """Only the newest MAX_SNAPSHOTS snapshots are kept."""
+    cache_path = tmp_path / "config-cache.sqlite3"
+    for index in range(config_cache.MAX_SNAPSHOTS + 2):
+        config_cache.store_snapshot(f"key-{index}", [], cache_path=cache_path)
+
+    assert config_cache.load_snapshot("key-0", cache_path=cache_path) is None
+    assert config_cache.load_snapshot("key-1", cache_path=cache_path) is None
+    assert config_cache.load_snapshot("key-2", cache_path=cache_path) == []
+
+
+def test_load_snapshot_survives_corrupt_cache(tmp_path: pathlib.Path) -> None:
+    """An unreadable cache file is a miss, not an error."""
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text(CONFIG, encoding="utf-8")
+    cache_path = config_cache.default_config_cache_path()
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(b"not a database")
+
+    repos = load_configs([config_file], cwd=tmp_path)
+
+    assert [repo["name"] for repo in repos] == ["flask", "django"]
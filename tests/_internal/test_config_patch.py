@@ -0,0 +1,209 @@
+"""Tests for vcspull._internal.config_patch."""
+
+from __future__ import annotations
+
+import textwrap
+import typing as t
+
+import pytest
+
+from vcspull._internal.config_patch import patch_jsonl, patch_yaml
+
+FLASK = "git+https://github.com/pallets/flask.git"
+RICH = "git+https://github.com/Textualize/rich.git"
+CLICK = "git+https://github.com/pallets/click.git"
+
+BASE_YAML = textwrap.dedent(
+    """\
+    # Work repositories
+    ~/code/:
+      flask: git+https://github.com/pallets/flask.git  # upstream
+      rich:
+        repo: git+https://github.com/Textualize/rich.git
+        options:
+          shallow: true
+
+      # Tools
+      click: git+https://github.com/pallets/click.git
+    ~/study/:
+      cpython: git+https://github.com/python/cpython.git
+    """,
+)
+BASE_CODE = {
+    "flask": FLASK,
+    "rich": {"repo": RICH, "options": {"shallow": True}},
+    "click": CLICK,
+}
+BASE_STUDY = {"cpython": "git+https://github.com/python/cpython.git"}
+
+
+class PatchYamlFixture(t.NamedTuple):
+    """Fixture for YAML configs edited in place."""
+
+    test_id: str
+    text: str
+    items: list[tuple[str, t.Any]]
+    expected: str | None
+
+
+PATCH_YAML_FIXTURES: list[PatchYamlFixture] = [
+    PatchYamlFixture(
+        test_id="insert-after-last-entry",
+        text=BASE_YAML,
+        items=[
+            ("~/code/", {**BASE_CODE, "jinja": "git+https://x/jinja"}),
+            ("~/study/", BASE_STUDY),
+        ],
+        expected=BASE_YAML.replace(
+            "  click: git+https://github.com/pallets/click.git\n",
+            "  click: git+https://github.com/pallets/click.git\n"
+            "  jinja: git+https://x/jinja\n",
+        ),
+    ),
+    PatchYamlFixture(
+        test_id="replace-nested-entry",
+        text=BASE_YAML,
+        items=[
+            ("~/code/", {**BASE_CODE, "rich": "git+https://x/rich"}),
+            ("~/study/", BASE_STUDY),
+        ],
+        expected=BASE_YAML.replace(
+            "  rich:\n"
+            "    repo: git+https://github.com/Textualize/rich.git\n"
+            "    options:\n"
+            "      shallow: true\n",
+            "  rich: git+https://x/rich\n",
+        ),
+    ),
+    PatchYamlFixture(
+        test_id="remove-entry",
+        text=BASE_YAML,
+        items=[
+            ("~/code/", {"rich": BASE_CODE["rich"], "click": CLICK}),
+            ("~/study/", BASE_STUDY),
+        ],
+        expected=BASE_YAML.replace(
+            "  flask: git+https://github.com/pallets/flask.git  # upstream\n",
+            "",
+        ),
+    ),
+    PatchYamlFixture(
+        test_id="append-new-root",
+        text="~/code/:\n  flask: git+https://github.com/pallets/flask.git",
+        items=[("~/code/", {"flask": FLASK}), ("~/new/", {"rich": RICH})],
+        expected=(
+            "~/code/:\n"
+            "  flask: git+https://github.com/pallets/flask.git\n"
+            "~/new/:\n"
+            "  rich: git+https://github.com/Textualize/rich.git\n"
+        ),
+    ),
+    PatchYamlFixture(
+        test_id="repeated-root",
+        text="~/code/:\n  flask: git+https://a\n~/code/:\n  rich: git+https://b\n",
+        items=[
+            ("~/code/", {"flask": "git+https://a"}),
+            ("~/code/", {"rich": "git+https://b", "click": "git+https://c"}),
+        ],
+        expected=(
+            "~/code/:\n  flask: git+https://a\n"
+            "~/code/:\n  rich: git+https://b\n  click: git+https://c\n"
+        ),
+    ),
+    PatchYamlFixture(
+        test_id="unchanged",
+        text=BASE_YAML,
+        items=[("~/code/", BASE_CODE), ("~/study/", BASE_STUDY)],
+        expected=BASE_YAML,
+    ),
+    PatchYamlFixture(
+        test_id="flow-style-section",
+        text="~/code/: {flask: git+https://a}\n",
+        items=[("~/code/", {"flask": "git+https://a", "rich": "git+https://b"})],
+        expected=None,
+    ),
+    PatchYamlFixture(
+        test_id="emptied-section",
+        text="~/code/:\n  flask: git+https://a\n",
+        items=[("~/code/", {})],
+        expected=None,
+    ),
+    PatchYamlFixture(
+        test_id="merged-roots",
+        text="~/code/:\n  flask: git+https://a\n~/code/:\n  rich: git+https://b\n",
+        items=[("~/code/", {"flask": "git+https://a", "rich": "git+https://b"})],
+        expected=None,
+    ),
+    PatchYamlFixture(
+        test_id="relabelled-root",
+        text="~/code:\n  flask: git+https://a\n",
+        items=[("~/code/", {"flask": "git+https://a"})],
+        expected=None,
+    ),
+    PatchYamlFixture(
+        test_id="anchored-entry",
+        text=(
+            "~/code/:\n  flask: &flask\n    repo: git+https://a\n  flask-docs: *flask\n"
+        ),
+        items=[("~/code/", {"flask": "git+https://b", "flask-docs": {"repo": "x"}})],
+        expected=None,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(PatchYamlFixture._fields),
+    PATCH_YAML_FIXTURES,
+    ids=[fixture.test_id for fixture in PATCH_YAML_FIXTURES],
+)
+def test_patch_yaml(
+    test_id: str,
+    text: str,
+    items: list[tuple[str, t.Any]],
+    expected: str | None,
+) -> None:
+    """Only the lines of changed entries move; unsafe layouts are refused."""
+    assert patch_yaml(text, items) == expected
+
+
+JSONL_TEXT = (
+    '{"workspace_root": "~/code/", "name": "flask", "url": "git+https://a"}\n'
+    "\n"
+    '{"workspace_root": "~/code/", "name": "rich", "url": "git+https://b"}\n'
+    '{"workspace_root": "~/code/", "name": "flask", "url": "git+https://old"}\n'
+)
+
+
+def test_patch_jsonl_edits_lines() -> None:
+    """Changed and removed lines are edited; blank and repeated lines stay."""
+    patched = patch_jsonl(
+        JSONL_TEXT,
+        [
+            (
+                "~/code/",
+                {
+                    "flask": "git+https://a",
+                    "click": {"repo": "git+https://c", "rev": "v1"},
+                },
+            ),
+            ("~/study/", {"cpython": "git+https://d"}),
+        ],
+    )
+
+    assert patched == (
+        '{"workspace_root": "~/code/", "name": "flask", "url": "git+https://a"}\n'
+        "\n"
+        '{"workspace_root": "~/code/", "name": "flask", "url": "git+https://old"}\n'
+        '{"workspace_root": "~/code/", "name": "click", "url": "git+https://c",'
+        ' "rev": "v1"}\n'
+        '{"workspace_root": "~/study/", "name": "cpython", "url": "git+https://d"}\n'
+    )
+
+
+def test_patch_jsonl_refuses_repeated_edit() -> None:
+    """Repositories listed twice are rewritten when edited or removed."""
+    removed = [("~/code/", {"rich": "git+https://b"})]
+    edited = [("~/code/", {"flask": "git+https://new", "rich": "git+https://b"})]
+
+    assert patch_jsonl(JSONL_TEXT, removed) is None
+    assert patch_jsonl(JSONL_TEXT, edited) is None
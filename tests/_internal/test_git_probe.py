@@ -0,0 +1,207 @@
+"""Tests for vcspull._internal.git_probe."""
+
+from __future__ import annotations
+
+import subprocess
+import typing as t
+
+import pytest
+
+from vcspull._internal.git_probe import (
+    may_rewrite_urls,
+    parse_git_config,
+    read_origin_url,
+    read_shallow_commits,
+)
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from libvcs.sync.git import GitSync
+
+
+class ParseConfigFixture(t.NamedTuple):
+    """Fixture for parsing git config text."""
+
+    test_id: str
+    text: str
+    expected: dict[str, list[str]] | None
+
+
+PARSE_CONFIG_FIXTURES: list[ParseConfigFixture] = [
+    ParseConfigFixture(
+        test_id="case-insensitive-section-and-name",
+        text='[Remote "Origin"]\n\tURL = https://x/y.git\n',
+        expected={"remote.Origin.url": ["https://x/y.git"]},
+    ),
+    ParseConfigFixture(
+        test_id="legacy-dotted-section",
+        text="[branch.Main]\n\tremote = origin\n",
+        expected={"branch.main.remote": ["origin"]},
+    ),
+    ParseConfigFixture(
+        test_id="multiple-values-keep-order",
+        text='[remote "o"]\n\turl = a\n\turl = b\n',
+        expected={"remote.o.url": ["a", "b"]},
+    ),
+    ParseConfigFixture(
+        test_id="comments-and-trailing-space",
+        text="# top\n[core]\n; note\n\tbare = false   # why\n",
+        expected={"core.bare": ["false"]},
+    ),
+    ParseConfigFixture(
+        test_id="quoted-comment-characters",
+        text='[alias]\n\tx = "echo #1; done"\n',
+        expected={"alias.x": ["echo #1; done"]},
+    ),
+    ParseConfigFixture(
+        test_id="escaped-subsection",
+        text='[remote "a\\"b"]\n\turl = u\n',
+        expected={'remote.a"b.url': ["u"]},
+    ),
+    ParseConfigFixture(
+        test_id="variable-after-header",
+        text="[core] bare = true\n",
+        expected={"core.bare": ["true"]},
+    ),
+    ParseConfigFixture(
+        test_id="implicit-true",
+        text="[core]\n\tbare\n",
+        expected={"core.bare": ["true"]},
+    ),
+    ParseConfigFixture(
+        test_id="include-unsupported",
+        text='[includeIf "gitdir:~/work/"]\n\tpath = work.gitconfig\n',
+        expected=None,
+    ),
+    ParseConfigFixture(
+        test_id="variable-outside-section",
+        text="bare = true\n",
+        expected=None,
+    ),
+    ParseConfigFixture(
+        test_id="unterminated-quote",
+        text='[core]\n\teditor = "vim\n',
+        expected=None,
+    ),
+    ParseConfigFixture(
+        test_id="bad-escape",
+        text="[core]\n\teditor = \\q\n",
+        expected=None,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ParseConfigFixture._fields),
+    PARSE_CONFIG_FIXTURES,
+    ids=[fixture.test_id for fixture in PARSE_CONFIG_FIXTURES],
+)
+def test_parse_git_config(
+    test_id: str,
+    text: str,
+    expected: dict[str, list[str]] | None,
+) -> None:
+    """Config text parses like ``git config --get`` reads it."""
+    assert parse_git_config(text) == expected
+
+
+def _git(cwd: pathlib.Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(cwd), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def test_read_origin_url_matches_git(
+    create_git_remote_repo: t.Callable[[], pathlib.Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The probe agrees with ``git config --get`` on an edited config."""
+    monkeypatch.delenv("GIT_CONFIG", raising=False)
+    repo = create_git_remote_repo()
+    _git(repo, "remote", "add", "origin", "https://example.com/first.git")
+    _git(repo, "config", "--add", "remote.origin.url", "git@example.com:two.git")
+    _git(repo, "config", "remote.upstream.url", "https://example.com/up.git")
+
+    assert read_origin_url(repo) == _git(repo, "config", "--get", "remote.origin.url")
+
+
+def test_read_origin_url_follows_linked_worktree(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+) -> None:
+    """A linked worktree reads its main repository's config via commondir."""
+    repo = git_repo.path
+    _git(repo, "remote", "set-url", "origin", "https://example.com/main.git")
+    worktree = tmp_path / "linked"
+    _git(repo, "worktree", "add", "--detach", str(worktree))
+
+    assert read_origin_url(worktree) == "https://example.com/main.git"
+
+
+def test_read_origin_url_layers_worktree_config(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``config.worktree`` values win when extensions.worktreeConfig is on."""
+    monkeypatch.delenv("GIT_CONFIG", raising=False)
+    repo = git_repo.path
+    _git(repo, "remote", "set-url", "origin", "https://example.com/main.git")
+    _git(repo, "config", "extensions.worktreeConfig", "true")
+    worktree = tmp_path / "linked"
+    _git(repo, "worktree", "add", "--detach", str(worktree))
+    _git(worktree, "config", "--worktree", "remote.origin.url", "https://x/fork.git")
+
+    assert read_origin_url(worktree) == _git(
+        worktree,
+        "config",
+        "--get",
+        "remote.origin.url",
+    )
+
+    assert read_origin_url(worktree) == "https://x/fork.git"
+    assert read_origin_url(repo) == "https://example.com/main.git"
+
+
+def test_read_shallow_commits_for_worktree_of_shallow_clone(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Worktrees of a shallow clone report the shared ``shallow`` file."""
+    clone = tmp_path / "clone"
+    subprocess.run(
+        ["git", "clone", "--depth", "1", f"file://{git_repo.path}", str(clone)],
+        check=True,
+        capture_output=True,
+    )
+    worktree = tmp_path / "linked"
+    _git(clone, "worktree", "add", "--detach", str(worktree))
+
+    assert read_shallow_commits(worktree) == frozenset(
+        {_git(clone, "rev-parse", "HEAD")}
+    )
+
+
+def test_may_rewrite_urls(
+    create_git_remote_repo: t.Callable[[], pathlib.Path],
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Rewrite rules in repo or global config, or unreadable configs, count."""
+    monkeypatch.delenv("GIT_CONFIG", raising=False)
+    repo = create_git_remote_repo()
+    global_config = tmp_path / "gitconfig"
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    assert may_rewrite_urls(repo) is False
+
+    global_config.write_text("[include]\n\tpath = other\n", encoding="utf-8")
+    assert may_rewrite_urls(repo) is True
+
+    global_config.write_text("[user]\n\tname = x\n", encoding="utf-8")
+    _git(repo, "config", "url.git@example.com:.insteadOf", "https://example.com/")
+    assert may_rewrite_urls(repo) is True
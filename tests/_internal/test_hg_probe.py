@@ -0,0 +1,84 @@
+"""Tests for vcspull._internal.hg_probe."""
+
+from __future__ import annotations
+
+import pathlib
+import typing as t
+
+import pytest
+
+from vcspull._internal.hg_probe import read_default_path
+
+
+class ReadDefaultPathFixture(t.NamedTuple):
+    """Fixture for reading a checkout's default path from ``.hg/hgrc``."""
+
+    test_id: str
+    hgrc: str
+    expected: str | None
+
+
+READ_DEFAULT_PATH_FIXTURES: list[ReadDefaultPathFixture] = [
+    ReadDefaultPathFixture(
+        test_id="clone-written-hgrc",
+        hgrc=(
+            "# example repository config (see 'hg help config' for more info)\n"
+            "[paths]\n"
+            "default = https://hg.example.com/repo\n"
+        ),
+        expected="https://hg.example.com/repo",
+    ),
+    ReadDefaultPathFixture(
+        test_id="later-assignment-wins",
+        hgrc="[paths]\ndefault = ssh://a/x\n[paths]\ndefault = ssh://b/x\n",
+        expected="ssh://b/x",
+    ),
+    ReadDefaultPathFixture(
+        test_id="sub-option-is-not-the-path",
+        hgrc="[paths]\ndefault:pushurl = ssh://push/x\n",
+        expected=None,
+    ),
+    ReadDefaultPathFixture(
+        test_id="relative-local-path",
+        hgrc="[paths]\ndefault = ../upstream\n",
+        expected="file:///work/upstream",
+    ),
+    ReadDefaultPathFixture(
+        test_id="unset",
+        hgrc="[paths]\ndefault = ssh://a/x\n%unset default\n",
+        expected=None,
+    ),
+    ReadDefaultPathFixture(
+        test_id="include-left-to-hg",
+        hgrc="%include ../shared.hgrc\n[paths]\ndefault = ssh://a/x\n",
+        expected=None,
+    ),
+    ReadDefaultPathFixture(
+        test_id="malformed",
+        hgrc="default = ssh://a/x\n",
+        expected=None,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ReadDefaultPathFixture._fields),
+    READ_DEFAULT_PATH_FIXTURES,
+    ids=[fixture.test_id for fixture in READ_DEFAULT_PATH_FIXTURES],
+)
+def test_read_default_path(
+    test_id: str,
+    hgrc: str,
+    expected: str | None,
+    tmp_path: pathlib.Path,
+) -> None:
+    """The default path matches what ``hg paths default`` reports."""
+    repo = tmp_path / "work" / "x"
+    (repo / ".hg").mkdir(parents=True)
+    (repo / ".hg" / "hgrc").write_text(hgrc, encoding="utf-8")
+
+    result = read_default_path(repo)
+
+    if expected is not None and expected.startswith("file://"):
+        expected = (tmp_path / expected.removeprefix("file:///")).as_uri()
+    assert result == expected
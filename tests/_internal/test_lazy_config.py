@@ -0,0 +1,198 @@
+"""Tests for vcspull._internal.lazy_config."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from vcspull import exc
+from vcspull._internal import lazy_config
+from vcspull._internal.config_reader import DuplicateAwareConfigReader
+from vcspull.config import filter_repos, load_configs
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from pytest_mock import MockerFixture
+
+CONFIG = """\
+~/code/:
+  flask: git+https://github.com/pallets/flask.git
+  flask-login:
+    repo: git+https://github.com/maxcountryman/flask-login.git
+    options:
+      shallow: true
+  django:
+    repo: git+https://github.com/django/django.git
+    remotes:
+      upstream: git+https://github.com/django/django.git
+  renamed:
+    name: werkzeug
+    url: git+https://github.com/pallets/werkzeug.git
+./relative/:
+  click: git+https://github.com/pallets/click.git
+/srv/mirrors/:
+  cpython:
+    repo: git+https://github.com/python/cpython.git
+    path: /opt/cpython
+"""
+
+
+class FilterFixture(t.NamedTuple):
+    """Fixture for lazy_config.LazyConfig.filter parity with filter_repos."""
+
+    test_id: str
+    path: str | None
+    vcs_url: str | None
+    name: str | None
+
+
+FILTER_FIXTURES: list[FilterFixture] = [
+    FilterFixture("literal-name", None, None, "django"),
+    FilterFixture("glob-name", None, None, "flask*"),
+    FilterFixture("name-field", None, None, "werkzeug"),
+    FilterFixture("config-key-is-not-name", None, None, "renamed"),
+    FilterFixture("unknown-name", None, None, "rails"),
+    FilterFixture("url-glob", None, "*pallets*", None),
+    FilterFixture(
+        "url-literal", None, "git+https://github.com/pallets/flask.git", None
+    ),
+    FilterFixture("path-glob", "*/relative", None, None),
+    FilterFixture("explicit-path", "/opt", None, None),
+    FilterFixture("path-and-name", "*code", None, "click"),
+]
+
+
+@pytest.mark.parametrize(
+    list(FilterFixture._fields),
+    FILTER_FIXTURES,
+    ids=[fixture.test_id for fixture in FILTER_FIXTURES],
+)
+def test_filter_matches_filter_repos(
+    tmp_path: pathlib.Path,
+    test_id: str,
+    path: str | None,
+    vcs_url: str | None,
+    name: str | None,
+) -> None:
+    """Lazy lookups return what filter_repos returns over a full load."""
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text(CONFIG, encoding="utf-8")
+
+    expected = filter_repos(
+        load_configs([config_file], cwd=tmp_path, use_cache=False),
+        path=path,
+        vcs_url=vcs_url,
+        name=name,
+    )
+    lazy = lazy_config.LazyConfig.load([config_file], cwd=tmp_path, use_cache=False)
+
+    assert lazy.filter(path=path, vcs_url=vcs_url, name=name) == expected
+
+
+def test_filter_expands_only_matches(
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """Only matching entries go through extract_repos, and only once each."""
+    lines = ["~/code/:"]
+    lines.extend(
+        f"  repo-{index}: git+https://example.com/repo-{index}.git"
+        for index in range(500)
+    )
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    extract_spy = mocker.spy(lazy_config, "extract_repos")
+    lazy = lazy_config.LazyConfig.load([config_file], cwd=tmp_path, use_cache=False)
+    assert extract_spy.call_count == 0
+
+    first = lazy.filter(name="repo-42")
+    again = lazy.filter(vcs_url="*/repo-42.git")
+
+    assert [repo["name"] for repo in first] == ["repo-42"]
+    assert again[0] is first[0]
+    assert extract_spy.call_count == lazy.expanded_count == 1
+    assert len(lazy.all()) == len(lazy) == 500
+
+
+def test_load_reuses_raw_entries(
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """An unchanged config is read from the cache instead of parsed."""
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text(CONFIG, encoding="utf-8")
+
+    first = lazy_config.LazyConfig.load([config_file], cwd=tmp_path).filter(
+        name="django"
+    )
+    parse_spy = mocker.spy(DuplicateAwareConfigReader, "load_with_duplicates")
+    second = lazy_config.LazyConfig.load([config_file], cwd=tmp_path).filter(
+        name="django"
+    )
+
+    assert parse_spy.call_count == 0
+    assert second == first
+
+
+def test_load_rejects_checkout_claimed_by_two_files(tmp_path: pathlib.Path) -> None:
+    """A checkout configured in two files raises like load_configs does."""
+    first_file = tmp_path / "first.yaml"
+    first_file.write_text(
+        "~/code/:\n  flask: git+https://github.com/pallets/flask.git\n",
+        encoding="utf-8",
+    )
+    second_file = tmp_path / "second.yaml"
+    second_file.write_text(
+        "~/code/:\n  flask: git+https://github.com/fork/flask.git\n",
+        encoding="utf-8",
+    )
+    files = [first_file, second_file]
+
+    with pytest.raises(exc.VCSPullException) as eager:
+        load_configs(files, cwd=tmp_path, use_cache=False)
+    with pytest.raises(exc.VCSPullException) as lazy:
+        lazy_config.LazyConfig.load(files, cwd=tmp_path, use_cache=False)
+
+    assert lazy.value.args == eager.value.args
+
+
+def test_load_streams_jsonl_without_repeat_report(
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """JSONL lines feed raw entries directly; repeats are left to full loads."""
+    config_file = tmp_path / ".vcspull.jsonl"
+    config_file.write_text(
+        '{"workspace_root": "~/code/", "name": "flask",'
+        ' "url": "git+https://github.com/pallets/flask.git"}\n'
+        '{"workspace_root": "~/code/", "name": "flask",'
+        ' "url": "git+https://github.com/fork/flask.git"}\n'
+        '{"workspace_root": "~/code/", "name": "rich",'
+        ' "url": "git+https://github.com/Textualize/rich.git", "shallow": true}\n',
+        encoding="utf-8",
+    )
+    expected = filter_repos(
+        load_configs([config_file], cwd=tmp_path, use_cache=False),
+        name="flask",
+    )
+    caplog.clear()
+
+    load_spy = mocker.spy(lazy_config, "read_config_file")
+    with caplog.at_level("WARNING", logger="vcspull"):
+        lazy = lazy_config.LazyConfig.load(
+            [config_file],
+            cwd=tmp_path,
+            warn_legacy_options=True,
+            use_cache=False,
+        )
+
+    assert load_spy.call_count == 0
+    assert lazy.filter(name="flask") == expected
+    assert len(lazy) == 2
+    [record] = caplog.records
+    assert "deprecated" in record.getMessage()
+    assert "~/code/rich" in record.getMessage()
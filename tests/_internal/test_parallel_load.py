@@ -0,0 +1,169 @@
+"""Tests for vcspull._internal.parallel_load."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import typing as t
+
+import pytest
+
+from vcspull import exc
+from vcspull._internal import parallel_load
+from vcspull.config import load_configs
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+
+def _write_fragments(directory: pathlib.Path, count: int) -> list[pathlib.Path]:
+    """Write ``count`` config fragments, some of them with load warnings."""
+    fragments = []
+    for index in range(count):
+        lines = [f"~/code/team-{index}/:"]
+        lines.extend(
+            f"  repo-{repo}: git+https://example.com/team-{index}/repo-{repo}.git"
+            for repo in range(5)
+        )
+        if index % 7 == 3:
+            # Duplicate workspace root: merged with an info message.
+            lines.extend(
+                [
+                    f"~/code/team-{index}/:",
+                    f"  extra: git+https://example.com/team-{index}/extra.git",
+                ],
+            )
+        if index % 11 == 5:
+            # Legacy top-level option: deprecation warning.
+            lines.extend(
+                [
+                    "  legacy:",
+                    f"    repo: git+https://example.com/team-{index}/legacy.git",
+                    "    shallow: true",
+                ],
+            )
+        fragment = directory / f"team-{index:03}.yaml"
+        fragment.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        fragments.append(fragment)
+    return fragments
+
+
+def test_parallel_load_matches_serial(
+    tmp_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A pooled load returns the same repos and logs the same lines in order."""
+    fragments = _write_fragments(tmp_path, 40)
+
+    def _load(parallel: bool) -> tuple[list[t.Any], list[tuple[str, int, str]]]:
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger="vcspull"):
+            repos = load_configs(
+                fragments,
+                cwd=tmp_path,
+                warn_legacy_options=True,
+                use_cache=False,
+                parallel=parallel,
+            )
+        return repos, caplog.record_tuples
+
+    serial_repos, serial_logs = _load(parallel=False)
+    pooled_repos, pooled_logs = _load(parallel=True)
+
+    assert pooled_repos == serial_repos
+    assert pooled_logs == serial_logs
+    assert any(level == logging.WARNING for _, level, _ in serial_logs)
+    assert any("merged" in message for _, _, message in serial_logs)
+
+
+def test_parallel_load_raises_like_serial(tmp_path: pathlib.Path) -> None:
+    """A checkout claimed twice raises the same error with or without a pool."""
+    fragments = _write_fragments(tmp_path, 6)
+    clash = tmp_path / "clash.yaml"
+    clash.write_text(
+        "~/code/team-2/:\n  repo-1: git+https://example.com/fork.git\n",
+        encoding="utf-8",
+    )
+    files = [*fragments, clash]
+
+    with pytest.raises(exc.DuplicateRepoError) as serial:
+        load_configs(files, cwd=tmp_path, use_cache=False, parallel=False)
+    with pytest.raises(exc.DuplicateRepoError) as pooled:
+        load_configs(files, cwd=tmp_path, use_cache=False, parallel=True)
+
+    assert str(pooled.value) == str(serial.value)
+
+
+def test_map_in_processes_falls_back_in_process(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """When no pool can start, items run in-process, still in order."""
+
+    def _no_pool(*_args: t.Any, **_kwargs: t.Any) -> t.NoReturn:
+        raise OSError
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", _no_pool)
+
+    assert list(parallel_load.map_in_processes(abs, [-3, 1, -2], workers=2)) == [
+        3,
+        1,
+        2,
+    ]
+
+
+def test_replay_logs_honours_parent_levels(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Records held back at DEBUG are only emitted if the parent wants them."""
+    with parallel_load.capture_logs() as records:
+        logging.getLogger("vcspull.config").debug("debug detail")
+        logging.getLogger("vcspull.config").warning("%s: warned", "team.yaml")
+    assert caplog.records == []
+
+    with caplog.at_level(logging.WARNING, logger="vcspull"):
+        parallel_load.replay_logs(records)
+
+    assert caplog.record_tuples == [
+        ("vcspull.config", logging.WARNING, "team.yaml: warned"),
+    ]
+
+
+def test_parallel_load_failure_logs_like_serial(
+    tmp_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A file that warns and then fails shows its warning with or without a pool."""
+    good = tmp_path / "a.yaml"
+    good.write_text("~/code/:\n  flask: git+https://x/flask.git\n", encoding="utf-8")
+    bad = tmp_path / "b.yaml"
+    bad.write_text(
+        "~/code/:\n"
+        "  legacy:\n"
+        "    repo: git+https://x/legacy.git\n"
+        "    shallow: true\n"
+        "  trees:\n"
+        "    repo: git+https://x/trees.git\n"
+        "    worktrees: 7\n",
+        encoding="utf-8",
+    )
+
+    def _load(parallel: bool) -> tuple[str, list[tuple[str, int, str]]]:
+        caplog.clear()
+        with (
+            caplog.at_level(logging.WARNING, logger="vcspull"),
+            pytest.raises(exc.VCSPullException) as raised,
+        ):
+            load_configs(
+                [good, bad],
+                cwd=tmp_path,
+                warn_legacy_options=True,
+                use_cache=False,
+                parallel=parallel,
+            )
+        return str(raised.value), caplog.record_tuples
+
+    serial = _load(parallel=False)
+    pooled = _load(parallel=True)
+
+    assert pooled == serial
+    assert any("deprecated" in message for _, _, message in serial[1])
@@ -0,0 +1,149 @@
+"""Tests for vcspull._internal.path_index."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+import yaml
+
+from vcspull._internal.path_index import lookup_repo
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+
+def _write_config(config_file: pathlib.Path, repos: dict[str, t.Any]) -> None:
+    config_file.write_text(yaml.dump(repos), encoding="utf-8")
+
+
+class LookupFixture(t.NamedTuple):
+    """Fixture for resolving a directory to its configured repository."""
+
+    test_id: str
+    lookup_subpath: str
+    expected_name: str | None
+
+
+LOOKUP_FIXTURES: list[LookupFixture] = [
+    LookupFixture(
+        test_id="checkout-root",
+        lookup_subpath="code/outer",
+        expected_name="outer",
+    ),
+    LookupFixture(
+        test_id="deep-inside-checkout",
+        lookup_subpath="code/outer/src/pkg",
+        expected_name="outer",
+    ),
+    LookupFixture(
+        test_id="nested-checkout-wins",
+        lookup_subpath="code/outer/vendor/inner/lib",
+        expected_name="inner",
+    ),
+    LookupFixture(
+        test_id="workspace-root-is-not-a-repo",
+        lookup_subpath="code",
+        expected_name=None,
+    ),
+    LookupFixture(
+        test_id="sibling-prefix-does-not-match",
+        lookup_subpath="code/outer-fork",
+        expected_name=None,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(LookupFixture._fields),
+    LOOKUP_FIXTURES,
+    ids=[fixture.test_id for fixture in LOOKUP_FIXTURES],
+)
+def test_lookup_repo(
+    tmp_path: pathlib.Path,
+    test_id: str,
+    lookup_subpath: str,
+    expected_name: str | None,
+) -> None:
+    """The nearest enclosing configured checkout is returned."""
+    config_file = tmp_path / ".vcspull.yaml"
+    _write_config(
+        config_file,
+        {
+            f"{tmp_path}/code/": {"outer": "git+https://example.com/outer.git"},
+            f"{tmp_path}/code/outer/vendor/": {
+                "inner": "git+https://example.com/inner.git",
+            },
+        },
+    )
+
+    found = lookup_repo(
+        tmp_path / lookup_subpath,
+        [config_file],
+        index_path=tmp_path / "index.sqlite3",
+    )
+
+    assert (found.name if found else None) == expected_name
+
+
+def test_lookup_repo_rebuilds_after_config_change(tmp_path: pathlib.Path) -> None:
+    """Editing a config file invalidates the index on the next lookup."""
+    config_file = tmp_path / ".vcspull.yaml"
+    index_path = tmp_path / "index.sqlite3"
+    checkout = tmp_path / "code" / "late"
+    _write_config(
+        config_file,
+        {f"{tmp_path}/code/": {"early": "git+https://example.com/early.git"}},
+    )
+    assert lookup_repo(checkout, [config_file], index_path=index_path) is None
+
+    _write_config(
+        config_file,
+        {
+            f"{tmp_path}/code/": {
+                "early": "git+https://example.com/early.git",
+                "late": "git+https://example.com/late.git",
+            },
+        },
+    )
+    found = lookup_repo(checkout, [config_file], index_path=index_path)
+
+    assert found is not None
+    assert found.url == "git+https://example.com/late.git"
+
+
+def test_lookup_repo_follows_symlinked_directory(tmp_path: pathlib.Path) -> None:
+    """A symlink into a checkout resolves to the configured repository."""
+    config_file = tmp_path / ".vcspull.yaml"
+    _write_config(
+        config_file,
+        {f"{tmp_path}/code/": {"project": "git+https://example.com/project.git"}},
+    )
+    (tmp_path / "code" / "project" / "docs").mkdir(parents=True)
+    link = tmp_path / "shortcut"
+    link.symlink_to(tmp_path / "code" / "project" / "docs")
+
+    found = lookup_repo(link, [config_file], index_path=tmp_path / "index.sqlite3")
+
+    assert found is not None
+    assert found.name == "project"
+
+
+def test_lookup_repo_without_writable_index(tmp_path: pathlib.Path) -> None:
+    """An unusable index location falls back to loading configs directly."""
+    config_file = tmp_path / ".vcspull.yaml"
+    _write_config(
+        config_file,
+        {f"{tmp_path}/code/": {"project": "git+https://example.com/project.git"}},
+    )
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("", encoding="utf-8")
+
+    found = lookup_repo(
+        tmp_path / "code" / "project",
+        [config_file],
+        index_path=blocker / "index.sqlite3",
+    )
+
+    assert found is not None
+    assert found.name == "project"
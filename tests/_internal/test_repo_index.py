@@ -0,0 +1,124 @@
+"""Tests for vcspull._internal.repo_index."""
+
+from __future__ import annotations
+
+import fnmatch
+import typing as t
+
+import pytest
+
+from vcspull._internal.repo_index import PathTrie, RepoIndex, UrlIndex
+
+NAMES = ["flask", "flask-login", "django", "Flask", "click", "[weird]", "flask"]
+
+URLS = [
+    "git+https://github.com/pallets/flask.git",
+    "git+https://github.com/maxcountryman/flask-login.git",
+    "git+ssh://git@github.com/django/django.git",
+    "git@github.com:pallets/click.git",
+    "git+https://gitlab.com/pallets/flask.git",
+    "git+file:///srv/mirrors/weird",
+    "git+https://mirror.example.com/redirect?to=https://github.com/pallets/x",
+    "hg+https://hg.example.com/repo",
+]
+
+PARENTS = [
+    "/home/user/code",
+    "/home/user/code/python",
+    "/home/user/code/python",
+    "/home/user/codes",
+    "/srv/mirrors",
+    "/",
+    "/home/user/work/python",
+]
+
+
+def _scan(keys: list[str], pattern: str) -> list[int]:
+    """Return positions matching ``pattern`` the way filter_repos scans."""
+    return [
+        position for position, key in enumerate(keys) if fnmatch.fnmatch(key, pattern)
+    ]
+
+
+class LookupFixture(t.NamedTuple):
+    """Fixture for index lookups that must equal a linear fnmatch scan."""
+
+    test_id: str
+    field: str
+    pattern: str
+
+
+LOOKUP_FIXTURES: list[LookupFixture] = [
+    LookupFixture("name-literal", "name", "flask"),
+    LookupFixture("name-literal-case", "name", "Flask"),
+    LookupFixture("name-prefix-glob", "name", "flask*"),
+    LookupFixture("name-suffix-glob", "name", "*go"),
+    LookupFixture("name-bracket", "name", "[fc]l*"),
+    LookupFixture("name-unclosed-bracket", "name", "[weird"),
+    LookupFixture("name-escaped-bracket", "name", "[[]weird]"),
+    LookupFixture("name-missing", "name", "rails"),
+    LookupFixture("url-literal", "url", "git+https://github.com/pallets/flask.git"),
+    LookupFixture("url-prefix-glob", "url", "git+https://github.com/*"),
+    LookupFixture("url-host-owner", "url", "*://github.com/pallets/*"),
+    LookupFixture("url-host-owner-user", "url", "*://git@github.com/django/*"),
+    LookupFixture("url-host-owner-scheme", "url", "git+https://github.com/pallets/*"),
+    LookupFixture("url-nested-scheme", "url", "*://github.com/pallets/x"),
+    LookupFixture("url-bracket-scheme", "url", "[gh]*://github.com/pallets/*"),
+    LookupFixture("url-substring", "url", "*pallets*"),
+    LookupFixture("url-file", "url", "git+file:///srv/*"),
+    LookupFixture("path-literal", "path", "/home/user/code/python"),
+    LookupFixture("path-directory-glob", "path", "/home/user/code/*"),
+    LookupFixture("path-partial-glob", "path", "/home/user/code*"),
+    LookupFixture("path-leading-glob", "path", "*/python"),
+    LookupFixture("path-root", "path", "/"),
+    LookupFixture("path-root-glob", "path", "/*"),
+    LookupFixture("path-relative", "path", "./code/*"),
+]
+
+
+@pytest.mark.parametrize(
+    list(LookupFixture._fields),
+    LOOKUP_FIXTURES,
+    ids=[fixture.test_id for fixture in LOOKUP_FIXTURES],
+)
+def test_lookup_matches_linear_scan(test_id: str, field: str, pattern: str) -> None:
+    """Every index answers exactly what a scan with fnmatch would."""
+    index = RepoIndex(NAMES, URLS, lambda: PARENTS)
+    keys = {"name": NAMES, "url": URLS, "path": PARENTS}[field]
+    argument = {"name": "name", "url": "vcs_url", "path": "path"}[field]
+
+    assert index.match(**{argument: pattern}) == _scan(keys, pattern)
+
+
+def test_url_index_narrows_by_host_and_owner() -> None:
+    """A host/owner glob only tests URLs under that host and owner."""
+    index = UrlIndex(URLS)
+    candidates = list(index._candidates("*://github.com/pallets/*"))
+
+    assert "git+https://github.com/pallets/flask.git" in candidates
+    assert "git+https://gitlab.com/pallets/flask.git" not in candidates
+    assert "git+ssh://git@github.com/django/django.git" not in candidates
+
+
+def test_path_trie_narrows_to_subtree() -> None:
+    """A directory glob only tests directories under its literal part."""
+    index = PathTrie(PARENTS)
+
+    assert sorted(index._candidates("/home/user/code/*")) == [
+        "/home/user/code",
+        "/home/user/code/python",
+    ]
+
+
+def test_many_patterns_do_not_rescan(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Literal lookups never call fnmatch, however many patterns there are."""
+    names = [f"repo-{index}" for index in range(2000)]
+    index = RepoIndex(names, names, lambda: names)
+
+    def _no_fnmatch(*_args: t.Any) -> t.NoReturn:
+        raise AssertionError
+
+    monkeypatch.setattr(fnmatch, "translate", _no_fnmatch)
+    matches = [index.match(name=f"repo-{number}") for number in range(0, 2000, 7)]
+
+    assert matches == [[number] for number in range(0, 2000, 7)]
@@ -0,0 +1,168 @@
+"""Tests for vcspull._internal.repo_record."""
+
+from __future__ import annotations
+
+import copy
+import pathlib
+import pickle
+import typing as t
+
+import pytest
+from libvcs.sync.git import GitRemote
+
+from vcspull._internal.repo_record import RepoRecord, checkout_key
+from vcspull.config import extract_repos
+
+if t.TYPE_CHECKING:
+    from vcspull.types import RawConfigDict
+
+
+class ExtractFixture(t.NamedTuple):
+    """Fixture for entries whose record must equal the dict they replace."""
+
+    test_id: str
+    name: str
+    entry: t.Any
+    expected: dict[str, t.Any]
+
+
+EXTRACT_FIXTURES: list[ExtractFixture] = [
+    ExtractFixture(
+        "url-shorthand",
+        "flask",
+        "git+https://github.com/pallets/flask.git",
+        {
+            "name": "flask",
+            "url": "git+https://github.com/pallets/flask.git",
+            "workspace_root": "/code/",
+            "path": pathlib.Path("/code/flask"),
+        },
+    ),
+    ExtractFixture(
+        "options-lifted",
+        "django",
+        {"repo": "git+https://x/django", "options": {"shallow": True}},
+        {
+            "name": "django",
+            "url": "git+https://x/django",
+            "workspace_root": "/code/",
+            "path": pathlib.Path("/code/django"),
+            "options": {"shallow": True},
+            "shallow": True,
+        },
+    ),
+    ExtractFixture(
+        "explicit-path",
+        "click",
+        {"url": "git+https://x/click", "path": "/srv/click"},
+        {
+            "name": "click",
+            "url": "git+https://x/click",
+            "workspace_root": "/code/",
+            "path": "/srv/click",
+        },
+    ),
+    ExtractFixture(
+        "nested-name",
+        "pallets/jinja",
+        "git+https://x/jinja",
+        {
+            "name": "pallets/jinja",
+            "url": "git+https://x/jinja",
+            "workspace_root": "/code/",
+            "path": pathlib.Path("/code/pallets/jinja"),
+        },
+    ),
+    ExtractFixture(
+        "remotes",
+        "rich",
+        {
+            "url": "git+https://x/rich",
+            "remotes": {
+                "upstream": "git+https://y/rich",
+                "mirror": {"fetch_url": "git+https://m/rich", "push_url": "no"},
+            },
+        },
+        {
+            "name": "rich",
+            "url": "git+https://x/rich",
+            "workspace_root": "/code/",
+            "path": pathlib.Path("/code/rich"),
+            "remotes": {
+                "upstream": GitRemote(
+                    name="upstream",
+                    fetch_url="git+https://y/rich",
+                    push_url="git+https://y/rich",
+                ),
+                "mirror": GitRemote(
+                    name="mirror",
+                    fetch_url="git+https://m/rich",
+                    push_url="no",
+                ),
+            },
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ExtractFixture._fields),
+    EXTRACT_FIXTURES,
+    ids=[fixture.test_id for fixture in EXTRACT_FIXTURES],
+)
+def test_extracted_record_equals_dict(
+    test_id: str,
+    name: str,
+    entry: t.Any,
+    expected: dict[str, t.Any],
+    tmp_path: pathlib.Path,
+) -> None:
+    """Records read, compare, and copy like the dicts extract_repos built."""
+    config = t.cast("RawConfigDict", {"/code/": {name: entry}})
+    (repo,) = extract_repos(config, cwd=tmp_path)
+
+    assert isinstance(repo, RepoRecord)
+    assert repo == expected
+    assert dict(repo) == expected
+    assert type(repo.copy()) is dict
+    assert repo.copy() == expected
+    assert len(repo) == len(expected)
+    assert pickle.loads(pickle.dumps(repo)) == expected
+    assert copy.deepcopy(repo) == expected
+
+
+def test_checkout_path_is_built_on_read() -> None:
+    """Only the interned root is stored; the Path is built when read."""
+    root = "/code"
+    first = RepoRecord.from_dict({"name": "flask"}, parent=root)
+    # An equal string built at run time, as each config file's roots are.
+    second = RepoRecord.from_dict({"name": "django"}, parent=root[:1] + root[1:])
+
+    assert first._parent is second._parent
+    assert first["path"] == pathlib.Path("/code/flask")
+    assert checkout_key(second) == "/code/django"
+
+
+def test_renaming_keeps_checkout_path() -> None:
+    """Changing the name of a record does not move its checkout."""
+    record = RepoRecord.from_dict({"name": "flask"}, parent="/code")
+    record["name"] = "flask-fork"
+
+    assert record["path"] == pathlib.Path("/code/flask")
+
+
+def test_mutation_like_dict() -> None:
+    """Setting, popping, and deleting keys behave as on a dict."""
+    record = RepoRecord.from_dict(
+        {"name": "flask", "url": "git+https://x/flask"},
+        parent="/code",
+    )
+    record["pip_url"] = record.pop("url")
+    record.setdefault("vcs", "git")
+    del record["path"]
+
+    assert record == {"name": "flask", "pip_url": "git+https://x/flask", "vcs": "git"}
+    with pytest.raises(KeyError):
+        del record["path"]
+    with pytest.raises(KeyError):
+        record["url"]
@@ -0,0 +1,312 @@
+"""Tests for vcspull._internal.repo_walker."""
+
+from __future__ import annotations
+
+import pathlib
+import typing as t
+
+import pytest
+
+from vcspull._internal.repo_walker import FoundCheckout, walk_checkouts
+from vcspull._internal.scan_cache import DirectoryCache
+
+if t.TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+#: Checkout layout shared by the walk fixtures, relative to the scan root.
+CHECKOUTS = (
+    "flask",
+    "flask/vendor/werkzeug",
+    "work/api",
+    "work/api/node_modules/left-pad",
+    "work/archive/old-api",
+    "work/deep/er/still/tool",
+)
+
+
+class WalkFixture(t.NamedTuple):
+    """Fixture for which checkouts a walk reports."""
+
+    test_id: str
+    walk_kwargs: dict[str, t.Any]
+    ignore_files: dict[str, str]
+    expected: list[str]
+
+
+WALK_FIXTURES: list[WalkFixture] = [
+    WalkFixture(
+        test_id="stops-at-checkout-roots",
+        walk_kwargs={},
+        ignore_files={},
+        expected=[
+            "flask",
+            "work/api",
+            "work/archive/old-api",
+            "work/deep/er/still/tool",
+        ],
+    ),
+    WalkFixture(
+        test_id="nested",
+        walk_kwargs={"nested": True},
+        ignore_files={},
+        expected=list(CHECKOUTS),
+    ),
+    WalkFixture(
+        test_id="max-depth",
+        walk_kwargs={"max_depth": 2},
+        ignore_files={},
+        expected=["flask", "work/api"],
+    ),
+    WalkFixture(
+        test_id="exclude-by-name",
+        walk_kwargs={"exclude": ["archive", "deep"]},
+        ignore_files={},
+        expected=["flask", "work/api"],
+    ),
+    WalkFixture(
+        test_id="exclude-by-relative-path",
+        walk_kwargs={"exclude": ["work/*"]},
+        ignore_files={},
+        expected=["flask"],
+    ),
+    WalkFixture(
+        test_id="exclude-applies-to-nested",
+        walk_kwargs={"nested": True, "exclude": ["node_modules"]},
+        ignore_files={},
+        expected=[
+            "flask",
+            "flask/vendor/werkzeug",
+            "work/api",
+            "work/archive/old-api",
+            "work/deep/er/still/tool",
+        ],
+    ),
+    WalkFixture(
+        test_id="ignore-file-at-root",
+        walk_kwargs={},
+        ignore_files={"": "# old stuff\narchive/\n"},
+        expected=["flask", "work/api", "work/deep/er/still/tool"],
+    ),
+    WalkFixture(
+        test_id="ignore-file-scoped-to-its-directory",
+        walk_kwargs={},
+        ignore_files={"work": "/deep\n", "": "/api\n"},
+        expected=["flask", "work/api", "work/archive/old-api"],
+    ),
+    WalkFixture(
+        test_id="children-only",
+        walk_kwargs={"include_root": False, "max_depth": 1},
+        ignore_files={},
+        expected=["flask"],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(WalkFixture._fields),
+    WALK_FIXTURES,
+    ids=[fixture.test_id for fixture in WALK_FIXTURES],
+)
+def test_walk_checkouts(
+    test_id: str,
+    walk_kwargs: dict[str, t.Any],
+    ignore_files: dict[str, str],
+    expected: list[str],
+    tmp_path: pathlib.Path,
+) -> None:
+    """Walks prune at checkout roots, depth limits, and exclude globs."""
+    for checkout in CHECKOUTS:
+        (tmp_path / checkout / ".git").mkdir(parents=True)
+    for directory, content in ignore_files.items():
+        (tmp_path / directory / ".vcspullignore").write_text(content, encoding="utf-8")
+
+    found = walk_checkouts(tmp_path, max_workers=4, **walk_kwargs)
+
+    assert [checkout.path.relative_to(tmp_path).as_posix() for checkout in found] == (
+        expected
+    )
+    assert {checkout.vcs for checkout in found} <= {"git"}
+
+
+def test_walk_checkouts_reports_root_checkout(tmp_path: pathlib.Path) -> None:
+    """A scan root that is a checkout is reported, and hides its children."""
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "inner" / ".git").mkdir(parents=True)
+
+    assert [c.path for c in walk_checkouts(tmp_path)] == [tmp_path]
+    assert [c.path for c in walk_checkouts(tmp_path, include_root=False)] == [
+        tmp_path / "inner",
+    ]
+
+
+def test_walk_checkouts_worktree_file_marker(tmp_path: pathlib.Path) -> None:
+    """A ``.git`` file (worktree or submodule) marks a checkout too."""
+    worktree = tmp_path / "feature"
+    worktree.mkdir()
+    (worktree / ".git").write_text("gitdir: /elsewhere/.git/worktrees/feature\n")
+
+    assert [c.path for c in walk_checkouts(tmp_path)] == [worktree]
+
+
+def test_walk_checkouts_classifies_vcs(tmp_path: pathlib.Path) -> None:
+    """Mercurial and Subversion roots are found in the same pass as git."""
+    (tmp_path / "a-git" / ".git").mkdir(parents=True)
+    (tmp_path / "b-hg" / ".hg").mkdir(parents=True)
+    (tmp_path / "c-svn" / ".svn").mkdir(parents=True)
+    (tmp_path / "c-svn" / "trunk" / ".svn").mkdir(parents=True)
+    (tmp_path / "d-both" / ".hg").mkdir(parents=True)
+    (tmp_path / "d-both" / ".git").mkdir()
+
+    assert [(c.path.name, c.vcs) for c in walk_checkouts(tmp_path)] == [
+        ("a-git", "git"),
+        ("b-hg", "hg"),
+        ("c-svn", "svn"),
+        ("d-both", "git"),
+    ]
+
+
+def test_walk_checkouts_does_not_follow_symlinks(tmp_path: pathlib.Path) -> None:
+    """Symlinked checkouts are reported; symlinked trees are not descended."""
+    real = tmp_path / "real"
+    (real / "repo" / ".git").mkdir(parents=True)
+    scan = tmp_path / "scan"
+    scan.mkdir()
+    (scan / "linked-repo").symlink_to(real / "repo")
+    (scan / "linked-tree").symlink_to(real)
+    (scan / "loop").symlink_to(scan)
+
+    assert [c.path for c in walk_checkouts(scan)] == [scan / "linked-repo"]
+
+
+def test_walk_checkouts_skips_unreadable_directories(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A directory that cannot be read is skipped, not fatal."""
+    import os
+
+    (tmp_path / "ok" / ".git").mkdir(parents=True)
+    (tmp_path / "locked" / "repo" / ".git").mkdir(parents=True)
+    real_scandir = os.scandir
+
+    def guarded_scandir(path: t.Any) -> t.Any:
+        if str(path).endswith("locked"):
+            msg = "denied"
+            raise PermissionError(msg)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", guarded_scandir)
+
+    assert [c.path for c in walk_checkouts(tmp_path)] == [tmp_path / "ok"]
+
+
+def _age_tree(root: pathlib.Path, seconds: int = 60) -> None:
+    """Backdate every directory and ignore file so walks may cache them."""
+    import os
+    import time
+
+    stamp = time.time() - seconds
+    for path in [root, *root.rglob("*")]:
+        if path.is_dir() or path.name == ".vcspullignore":
+            os.utime(path, (stamp, stamp))
+
+
+def _relative(root: pathlib.Path, checkouts: list[FoundCheckout]) -> list[str]:
+    return [checkout.path.relative_to(root).as_posix() for checkout in checkouts]
+
+
+def test_walk_checkouts_reuses_unchanged_listings(
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """A cached walk reads only directories whose mtime moved."""
+    import os
+
+    from vcspull._internal import repo_walker
+
+    scan_root = tmp_path / "scan"
+    for checkout in CHECKOUTS:
+        (scan_root / checkout / ".git").mkdir(parents=True)
+    _age_tree(scan_root)
+    cache_path = tmp_path / "discover-cache.sqlite3"
+
+    def cached_walk() -> list[str]:
+        cache = DirectoryCache.load(scan_root, cache_path=cache_path)
+        return _relative(scan_root, walk_checkouts(scan_root, cache=cache))
+
+    uncached = _relative(scan_root, walk_checkouts(scan_root))
+    assert cached_walk() == uncached
+
+    read_spy = mocker.spy(repo_walker, "_scan_directory")
+    assert cached_walk() == uncached
+    assert read_spy.call_count == 0
+
+    (scan_root / "work" / "new-repo" / ".git").mkdir(parents=True)
+    _age_tree(scan_root / "work" / "new-repo")
+    work_stamp = (scan_root / "work" / "new-repo").stat().st_mtime_ns
+    os.utime(scan_root / "work", ns=(work_stamp, work_stamp))
+    assert cached_walk() == [*uncached, "work/new-repo"]
+    assert sorted(
+        pathlib.Path(call.args[0]).relative_to(scan_root).as_posix()
+        for call in read_spy.call_args_list
+    ) == ["work", "work/new-repo"]
+
+
+def test_walk_checkouts_cache_notices_ignore_file_edits(
+    tmp_path: pathlib.Path,
+) -> None:
+    """Editing a .vcspullignore in place invalidates its directory's listing."""
+    import os
+    import time
+
+    for checkout in CHECKOUTS:
+        (tmp_path / checkout / ".git").mkdir(parents=True)
+    ignore_file = tmp_path / ".vcspullignore"
+    ignore_file.write_text("archive\n", encoding="utf-8")
+    _age_tree(tmp_path)
+    cache_path = tmp_path / "discover-cache.sqlite3"
+
+    def cached_walk() -> list[str]:
+        cache = DirectoryCache.load(tmp_path, cache_path=cache_path)
+        return _relative(tmp_path, walk_checkouts(tmp_path, cache=cache))
+
+    assert "work/archive/old-api" not in cached_walk()
+
+    directory_mtime = tmp_path.stat().st_mtime_ns
+    ignore_file.write_text("deep\n", encoding="utf-8")
+    stamp = time.time() - 30
+    os.utime(ignore_file, (stamp, stamp))
+    os.utime(tmp_path, ns=(directory_mtime, directory_mtime))
+
+    walked = cached_walk()
+    assert "work/archive/old-api" in walked
+    assert "work/deep/er/still/tool" not in walked
+
+
+def test_walk_checkouts_cache_skips_racy_and_stale_entries(
+    tmp_path: pathlib.Path,
+) -> None:
+    """Just-modified directories are not cached; vanished ones are dropped."""
+    import shutil
+
+    cache_path = tmp_path / "cache" / "discover-cache.sqlite3"
+    scan_root = tmp_path / "scan"
+    (scan_root / "old" / "repo" / ".git").mkdir(parents=True)
+    (scan_root / "gone" / "repo" / ".git").mkdir(parents=True)
+    _age_tree(scan_root)
+    (scan_root / "fresh" / "repo" / ".git").mkdir(parents=True)
+
+    walk_checkouts(
+        scan_root, cache=DirectoryCache.load(scan_root, cache_path=cache_path)
+    )
+    cache = DirectoryCache.load(scan_root, cache_path=cache_path)
+    assert cache.lookup(str(scan_root / "old" / "repo")) is not None
+    assert cache.lookup(str(scan_root / "fresh" / "repo")) is None
+    assert cache.lookup(str(scan_root)) is None
+
+    shutil.rmtree(scan_root / "gone")
+    _age_tree(scan_root)
+    walk_checkouts(scan_root, cache=cache)
+    cache = DirectoryCache.load(scan_root, cache_path=cache_path)
+    assert cache.lookup(str(scan_root / "gone" / "repo")) is None
+    assert cache.lookup(str(scan_root / "fresh" / "repo")) is not None
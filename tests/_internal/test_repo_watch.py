@@ -0,0 +1,137 @@
+"""Tests for vcspull._internal.repo_watch."""
+
+from __future__ import annotations
+
+import subprocess
+import typing as t
+
+import pytest
+
+from vcspull._internal.repo_watch import (
+    InotifyWatcher,
+    PollingWatcher,
+    inotify_available,
+    repo_fingerprint,
+)
+
+if t.TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable
+
+
+def _git(repo_path: pathlib.Path, *args: str) -> None:
+    subprocess.run(
+        ["git", *args],
+        cwd=repo_path,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _write_notes(repo_path: pathlib.Path) -> None:
+    (repo_path / "notes.txt").write_text("x", encoding="utf-8")
+
+
+def _commit(repo_path: pathlib.Path) -> None:
+    (repo_path / "CHANGELOG").write_text("entry", encoding="utf-8")
+    _git(repo_path, "add", "CHANGELOG")
+    _git(
+        repo_path,
+        "-c",
+        "user.name=vcspull",
+        "-c",
+        "user.email=vcspull@example.com",
+        "commit",
+        "-m",
+        "chore: changelog",
+    )
+
+
+class WatchChangeFixture(t.NamedTuple):
+    """Fixture for on-disk changes a watcher must report."""
+
+    test_id: str
+    mutate: Callable[[pathlib.Path], None]
+
+
+WATCH_CHANGE_FIXTURES: list[WatchChangeFixture] = [
+    WatchChangeFixture(test_id="commit", mutate=_commit),
+    WatchChangeFixture(
+        test_id="checkout-new-branch",
+        mutate=lambda repo: _git(repo, "checkout", "-q", "-b", "topic"),
+    ),
+    WatchChangeFixture(test_id="new-top-level-file", mutate=_write_notes),
+]
+
+
+@pytest.mark.parametrize(
+    list(WatchChangeFixture._fields),
+    WATCH_CHANGE_FIXTURES,
+    ids=[fixture.test_id for fixture in WATCH_CHANGE_FIXTURES],
+)
+def test_polling_watcher_reports_changed_repo(
+    create_git_remote_repo: Callable[[], pathlib.Path],
+    test_id: str,
+    mutate: Callable[[pathlib.Path], None],
+) -> None:
+    """Only the repository that changed is reported, once."""
+    changed_repo = create_git_remote_repo()
+    idle_repo = create_git_remote_repo()
+    watcher = PollingWatcher({"changed": changed_repo, "idle": idle_repo})
+
+    mutate(changed_repo)
+
+    assert watcher.wait(0) == {"changed"}
+    assert watcher.wait(0) == set()
+
+
+def test_polling_watcher_acknowledge_ignores_own_probe(
+    create_git_remote_repo: Callable[[], pathlib.Path],
+) -> None:
+    """Index refreshes made while probing a repo do not report it again."""
+    repo = create_git_remote_repo()
+    watcher = PollingWatcher({"repo": repo})
+
+    _git(repo, "status", "--porcelain")
+    watcher.acknowledge(["repo"])
+
+    assert watcher.wait(0) == set()
+
+
+def test_repo_fingerprint_sees_clone_appear(
+    tmp_path: pathlib.Path,
+    create_git_remote_repo: Callable[[], pathlib.Path],
+) -> None:
+    """A configured checkout that gets cloned changes its fingerprint."""
+    source = create_git_remote_repo()
+    target = tmp_path / "clone"
+    before = repo_fingerprint(target)
+
+    subprocess.run(
+        ["git", "clone", "-q", str(source), str(target)],
+        check=True,
+        capture_output=True,
+    )
+
+    assert repo_fingerprint(target) != before
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify is not available")
+def test_inotify_watcher_sees_nested_edit(
+    create_git_remote_repo: Callable[[], pathlib.Path],
+) -> None:
+    """Inotify reports edits below the top level of the working tree."""
+    repo = create_git_remote_repo()
+    nested = repo / "src" / "pkg"
+    nested.mkdir(parents=True)
+    idle_repo = create_git_remote_repo()
+    watcher = InotifyWatcher({"repo": repo, "idle": idle_repo})
+    try:
+        assert watcher.wait(0.05) == set()
+
+        (nested / "module.py").write_text("x = 1", encoding="utf-8")
+
+        assert watcher.wait(2) == {"repo"}
+        assert watcher.wait(0.05) == set()
+    finally:
+        watcher.close()
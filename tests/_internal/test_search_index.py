@@ -0,0 +1,163 @@
+"""Tests for vcspull._internal.search_index."""
+
+from __future__ import annotations
+
+import logging
+import pickle
+import typing as t
+
+import pytest
+
+from vcspull._internal import search_index
+from vcspull._internal.search_index import SearchIndex, load_search_index
+from vcspull.cli.search import (
+    DEFAULT_FIELDS,
+    compile_search_patterns,
+    parse_query_terms,
+    search_index_matches,
+)
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from pytest_mock import MockerFixture
+
+NAMES = [
+    *(f"flask-{number}" for number in range(100)),
+    *(f"django-{number}" for number in range(100)),
+    "Flask-Admin",
+    "ﬂask-ligature",
+    "kelvin-\u212a",
+    "a.b-dotted",
+]
+
+
+def _index() -> SearchIndex:
+    """Return an index large enough for common trigrams to be skipped."""
+    return SearchIndex(
+        {
+            "name": NAMES,
+            "path": [f"~/code/{name}" for name in NAMES],
+            "url": [f"git+https://github.com/org/{name}.git" for name in NAMES],
+            "workspace": ["~/code"] * len(NAMES),
+        },
+        workspace_roots=["~/code/"] * len(NAMES),
+    )
+
+
+class PrefilterFixture(t.NamedTuple):
+    """Fixture for queries the trigram index must not change the results of."""
+
+    test_id: str
+    query_terms: list[str]
+    ignore_case: bool
+    fixed_strings: bool
+    match_any: bool
+
+
+PREFILTER_FIXTURES: list[PrefilterFixture] = [
+    PrefilterFixture("literal", ["flask-4"], False, False, False),
+    PrefilterFixture("ignore-case", ["FLASK-ADMIN"], True, False, False),
+    PrefilterFixture("non-ascii-row", ["k-k"], True, False, False),
+    PrefilterFixture("fixed-string-metachars", ["a.b"], False, True, False),
+    PrefilterFixture("regex-metachars", ["a.b"], False, False, False),
+    PrefilterFixture("field-scoped", ["name:django-1", "url:org"], False, False, False),
+    PrefilterFixture("any-term", ["flask-99", "django-42"], False, False, True),
+    PrefilterFixture("common-trigrams-only", ["github"], False, False, False),
+    PrefilterFixture("short-literal", ["-4"], False, False, False),
+    PrefilterFixture("no-match", ["pyramid"], False, False, False),
+]
+
+
+@pytest.mark.parametrize(
+    list(PrefilterFixture._fields),
+    PREFILTER_FIXTURES,
+    ids=[fixture.test_id for fixture in PREFILTER_FIXTURES],
+)
+def test_prefilter_keeps_results(
+    test_id: str,
+    query_terms: list[str],
+    ignore_case: bool,
+    fixed_strings: bool,
+    match_any: bool,
+) -> None:
+    """Narrowing rows by trigram gives the results of a full scan."""
+    index = _index()
+    patterns = compile_search_patterns(
+        parse_query_terms(query_terms, default_fields=DEFAULT_FIELDS),
+        ignore_case=ignore_case,
+        smart_case=False,
+        fixed_strings=fixed_strings,
+        word_regexp=False,
+    )
+
+    def search(*, prefilter: bool) -> list[dict[str, t.Any]]:
+        return search_index_matches(
+            index,
+            patterns,
+            match_any=match_any,
+            invert_match=False,
+            prefilter=prefilter,
+        )
+
+    assert search(prefilter=True) == search(prefilter=False)
+
+
+def test_candidates_narrow_rows() -> None:
+    """Rare trigrams leave few rows; common ones are not looked up."""
+    index = _index()
+
+    # Names that are not ASCII stay candidates for every literal.
+    assert index.candidates("flask-42", ("name",)) == {42, 201, 202}
+    assert index.candidates("admin", ("name",)) == {200, 201, 202}
+    assert index.candidates("github", ("url",)) is None
+
+
+def test_pickled_index_is_equal() -> None:
+    """A stored index reads back the same values and postings."""
+    index = _index()
+    restored = pickle.loads(pickle.dumps(index))
+
+    assert len(restored) == len(index)
+    assert [restored.row(row) for row in range(len(index))] == [
+        index.row(row) for row in range(len(index))
+    ]
+    assert restored.candidates("flask-42", ("name",)) == {42, 201, 202}
+
+
+def test_stored_index_follows_config(
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """Unchanged configs reuse the stored index; an edit rebuilds it."""
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text("~/code/:\n  flask: git+https://x/flask.git\n")
+    load_spy = mocker.spy(search_index, "load_configs")
+
+    load_search_index([config_file])
+    index = load_search_index([config_file])
+    assert load_spy.call_count == 1
+    assert index.row(0)["name"] == "flask"
+
+    config_file.write_text("~/code/:\n  django: git+https://x/django.git\n")
+    assert load_search_index([config_file]).row(0)["name"] == "django"
+    assert load_spy.call_count == 2
+
+
+def test_noisy_loads_are_not_stored(
+    tmp_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A load that logs a notice logs it again on the next search."""
+    caplog.set_level(logging.INFO)
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text(
+        "~/code/:\n  flask: git+https://x/flask.git\n"
+        "~/code/:\n  django: git+https://x/django.git\n",
+    )
+
+    for _ in range(2):
+        caplog.clear()
+        index = load_search_index([config_file])
+        assert len(index) == 2
+        assert "duplicate" in caplog.text.lower()
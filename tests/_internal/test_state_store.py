@@ -0,0 +1,94 @@
+"""Tests for the local repository state store."""
+
+from __future__ import annotations
+
+import sqlite3
+import typing as t
+
+from vcspull._internal.state_store import (
+    SCHEMA_VERSION,
+    StateStore,
+    default_state_path,
+    record_states,
+)
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    import pytest
+
+
+def test_state_store_partial_updates_keep_other_fields(
+    tmp_path: pathlib.Path,
+) -> None:
+    """A later observation only overwrites the fields it carries."""
+    db_path = tmp_path / "state.sqlite3"
+    record_states(
+        {"/src/app": {"present": True, "clean": False, "behind": 2}},
+        db_path=db_path,
+    )
+    record_states({"/src/app": {"last_sync_duration": 1.25}}, db_path=db_path)
+
+    with StateStore(db_path) as store:
+        state = store.get("/src/app")
+
+    assert state is not None
+    assert state.is_dirty
+    assert state.is_behind
+    assert state.last_sync_duration == 1.25
+
+
+def test_state_store_times_clean_separately(tmp_path: pathlib.Path) -> None:
+    """A write without ``clean`` leaves its observation time where it was."""
+    db_path = tmp_path / "state.sqlite3"
+    with StateStore(db_path) as store:
+        store.record("/src/app", present=True, clean=False, observed_at=10.0)
+        store.record(
+            "/src/app", head="f" * 40, ahead=None, behind=None, observed_at=20.0
+        )
+        state = store.get("/src/app")
+
+    assert state is not None
+    assert state.observed_at == 20.0
+    assert state.clean_observed_at == 10.0
+    assert state.behind_observed_at == 20.0
+    assert not state.observed_since("clean", 15.0)
+    assert state.observed_since("behind", 15.0)
+
+
+def test_state_store_discards_other_schema_versions(tmp_path: pathlib.Path) -> None:
+    """A store written under another schema version starts over empty."""
+    db_path = tmp_path / "state.sqlite3"
+    record_states({"/src/app": {"present": True}}, db_path=db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+
+    with StateStore(db_path) as store:
+        assert store.get("/src/app") is None
+
+
+def test_record_states_ignores_unwritable_store(
+    tmp_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """An unusable cache location is logged, never raised."""
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+
+    with caplog.at_level("DEBUG", logger="vcspull._internal.state_store"):
+        record_states(
+            {"/src/app": {"present": True}},
+            db_path=blocker / "state.sqlite3",
+        )
+
+    assert "Could not record repository state" in caplog.text
+
+
+def test_default_state_path_uses_cache_dir(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The store lives under ``VCSPULL_CACHEDIR`` when it is set."""
+    monkeypatch.setenv("VCSPULL_CACHEDIR", str(tmp_path))
+
+    assert default_state_path() == tmp_path / "state.sqlite3"
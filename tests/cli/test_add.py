@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import logging
 import os
@@ -20,8 +21,10 @@ from vcspull.cli.add import (
     AddAction,
     _classify_add_action,
     _collapse_ordered_items_to_dict,
+    _detect_git_remote,
     _parse_repo_url,
     add_repo,
+    add_repos_batch,
     create_add_subparser,
     handle_add_command,
 )
@@ -2403,3 +2406,186 @@ def test_parse_repo_url_does_not_mistake_userinfo_for_a_revision() -> None:
     assert parsed.rev is None
     assert parsed.unparsed_rev is None
     assert parsed.url == "https://user@host/pallets/flask.git"
+
+
+def test_detect_git_remote_applies_url_rewrites(
+    create_git_remote_repo: t.Callable[[], pathlib.Path],
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The origin URL is read from disk unless an insteadOf rule may apply."""
+    monkeypatch.delenv("GIT_CONFIG", raising=False)
+    global_config = tmp_path / "gitconfig"
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    repo = create_git_remote_repo()
+    subprocess.run(
+        ["git", "-C", str(repo), "remote", "add", "origin", "https://example.com/o/r"],
+        check=True,
+        capture_output=True,
+    )
+
+    assert _detect_git_remote(repo) == "https://example.com/o/r"
+
+    global_config.write_text(
+        '[url "git@example.com:"]\n\tinsteadOf = https://example.com/\n',
+        encoding="utf-8",
+    )
+    assert _detect_git_remote(repo) == "git@example.com:o/r"
+
+
+def test_add_repo_keeps_rest_of_config_as_written(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Adding a repository only inserts its line; comments and order survive."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    config_file = tmp_path / ".vcspull.yaml"
+    original = textwrap.dedent(
+        """\
+        # Hand-kept inventory
+        ~/code/:
+          zola: git+https://github.com/getzola/zola.git  # static sites
+          flask: git+https://github.com/pallets/flask.git
+        """,
+    )
+    config_file.write_text(original, encoding="utf-8")
+
+    add_repo(
+        name="rich",
+        url="git+https://github.com/Textualize/rich.git",
+        config_file_path_str=str(config_file),
+        path=None,
+        workspace_root_path="~/code/",
+        dry_run=False,
+    )
+
+    assert config_file.read_text(encoding="utf-8") == (
+        f"{original}  rich:\n    repo: git+https://github.com/Textualize/rich.git\n"
+    )
+
+
+def test_add_repos_batch_writes_once(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A batch classifies every line against one load and saves once."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text(
+        "~/code/:\n  flask: git+https://github.com/pallets/flask.git\n",
+        encoding="utf-8",
+    )
+
+    import vcspull.cli.add as add_module
+
+    saves: list[pathlib.Path] = []
+    save_ordered_items = add_module._save_ordered_items
+
+    def _counting_save(path: pathlib.Path, items: list[dict[str, t.Any]]) -> None:
+        saves.append(path)
+        save_ordered_items(path, items)
+
+    monkeypatch.setattr(add_module, "_save_ordered_items", _counting_save)
+
+    result = add_repos_batch(
+        [
+            "# provisioning list",
+            "https://github.com/pallets/flask.git",
+            "https://github.com/pallets/click.git",
+            "git+https://github.com/pallets/jinja.git@3.1 ~/study/ jinja2",
+            "not-a-url",
+            "https://github.com/pallets/click.git ~/code",
+        ],
+        config_file_path_str=str(config_file),
+        workspace_root_path=None,
+        dry_run=False,
+    )
+
+    assert result is not None
+    assert result._asdict() == {
+        "added": 2,
+        "skip_existing": 2,
+        "skip_pinned": 0,
+        "errors": 1,
+        "written": True,
+    }
+    assert saves == [config_file]
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(record.get("line"), record.get("action")) for record in records] == [
+        (2, "skip_existing"),
+        (3, "add"),
+        (4, "add"),
+        (5, "error"),
+        (6, "skip_existing"),
+        (None, None),
+    ]
+    assert records[-1]["type"] == "summary"
+    config = DuplicateAwareConfigReader.from_file(config_file).content
+    assert config["~/code/"]["click"] == {
+        "repo": "git+https://github.com/pallets/click.git",
+    }
+    assert config["~/study/"]["jinja2"] == {
+        "repo": "git+https://github.com/pallets/jinja.git",
+        "options": {"rev": "3.1"},
+    }
+
+
+def test_add_repos_batch_reports_unresolvable_workspace(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A workspace root that cannot be expanded fails its line, not the batch."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text("~/code/: {}\n", encoding="utf-8")
+
+    result = add_repos_batch(
+        [
+            "https://github.com/pallets/jinja.git ~nosuchuser/x/",
+            "https://github.com/pallets/click.git ~/code/",
+        ],
+        config_file_path_str=str(config_file),
+        workspace_root_path=None,
+        dry_run=False,
+    )
+
+    assert result is not None
+    assert (result.added, result.errors, result.written) == (1, 1, True)
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records[0]["action"] == "error"
+    assert "~nosuchuser/x/" in records[0]["reason"]
+    assert records[1]["action"] == "add"
+    config = DuplicateAwareConfigReader.from_file(config_file).content
+    assert list(config["~/code/"]) == ["click"]
+
+
+def test_add_stdin_dry_run_leaves_config(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """``vcspull add --stdin --dry-run`` reports entries without writing."""
+    from vcspull.cli import cli
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text("~/code/: {}\n", encoding="utf-8")
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO("https://github.com/pallets/click.git\n"),
+    )
+
+    cli(["add", "--stdin", "--dry-run", "-f", str(config_file)])
+
+    assert config_file.read_text(encoding="utf-8") == "~/code/: {}\n"
+    summary = json.loads(capsys.readouterr().out.splitlines()[-1])
+    assert summary["added"] == 1
+    assert summary["written"] is False
@@ -0,0 +1,67 @@
+"""Tests for vcspull cache command."""
+
+from __future__ import annotations
+
+import logging
+import typing as t
+
+from vcspull._internal import config_cache
+from vcspull._internal.completion_cache import (
+    complete,
+    default_completion_cache_dir,
+)
+from vcspull._internal.config_reader import DuplicateAwareConfigReader
+from vcspull.cli import cli
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    import pytest
+    from pytest_mock import MockerFixture
+
+
+def test_cache_clear_removes_config_snapshots(
+    tmp_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """``vcspull cache clear`` deletes the snapshot cache and reports it."""
+    caplog.set_level(logging.INFO)
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text("~/code/:\n  flask: git+https://x/flask.git\n")
+    cli(["list", "-f", str(config_file)])
+    assert config_cache.default_config_cache_path().exists()
+
+    cli(["cache", "clear"])
+
+    assert not config_cache.default_config_cache_path().exists()
+    assert "Removed" in caplog.text
+    assert "config-cache.sqlite3" in caplog.text
+
+    caplog.clear()
+    complete("names", "", [config_file])
+    assert default_completion_cache_dir().is_dir()
+    cli(["cache", "clear"])
+    assert not default_completion_cache_dir().exists()
+
+    caplog.clear()
+    cli(["cache", "clear"])
+    assert "No caches to clear." in caplog.text
+
+
+def test_no_config_cache_flag_parses_every_time(
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """``--no-config-cache`` neither reads nor writes snapshots."""
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text("~/code/:\n  flask: git+https://x/flask.git\n")
+    parse_spy = mocker.spy(DuplicateAwareConfigReader, "load_with_duplicates")
+
+    cli(["--no-config-cache", "list", "-f", str(config_file)])
+    cli(["--no-config-cache", "list", "-f", str(config_file)])
+    assert parse_spy.call_count == 2
+    assert not config_cache.default_config_cache_path().exists()
+
+    cli(["list", "-f", str(config_file)])
+    cli(["list", "-f", str(config_file)])
+    assert parse_spy.call_count == 3
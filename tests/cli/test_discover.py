@@ -15,6 +15,7 @@ from vcspull.cli.discover import ConfigScope, _classify_config_scope, discover_r
 
 if t.TYPE_CHECKING:
     from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock import MockerFixture
     from syrupy.assertion import SnapshotAssertion
 
 
@@ -829,6 +830,307 @@ def test_discover_skips_repos_without_remote(
     assert "Could not determine remote URL" in caplog.text
 
 
+class DiscoverPruningFixture(t.NamedTuple):
+    """Fixture for how far a recursive discover scan descends."""
+
+    test_id: str
+    nested: bool
+    max_depth: int | None
+    exclude: list[str]
+    ignore_file: str | None
+    expected_names: set[str]
+
+
+DISCOVER_PRUNING_FIXTURES: list[DiscoverPruningFixture] = [
+    DiscoverPruningFixture(
+        test_id="stops-at-repo-roots",
+        nested=False,
+        max_depth=None,
+        exclude=[],
+        ignore_file=None,
+        expected_names={"app", "tool"},
+    ),
+    DiscoverPruningFixture(
+        test_id="nested",
+        nested=True,
+        max_depth=None,
+        exclude=[],
+        ignore_file=None,
+        expected_names={"app", "vendored-lib", "tool"},
+    ),
+    DiscoverPruningFixture(
+        test_id="max-depth",
+        nested=False,
+        max_depth=1,
+        exclude=[],
+        ignore_file=None,
+        expected_names={"app"},
+    ),
+    DiscoverPruningFixture(
+        test_id="exclude-glob",
+        nested=True,
+        max_depth=None,
+        exclude=["vendor"],
+        ignore_file=None,
+        expected_names={"app", "tool"},
+    ),
+    DiscoverPruningFixture(
+        test_id="vcspullignore",
+        nested=False,
+        max_depth=None,
+        exclude=[],
+        ignore_file="tools/\n",
+        expected_names={"app"},
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(DiscoverPruningFixture._fields),
+    DISCOVER_PRUNING_FIXTURES,
+    ids=[fixture.test_id for fixture in DISCOVER_PRUNING_FIXTURES],
+)
+def test_discover_recursive_pruning(
+    test_id: str,
+    nested: bool,
+    max_depth: int | None,
+    exclude: list[str],
+    ignore_file: str | None,
+    expected_names: set[str],
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Recursive discover honors --nested, --max-depth, and exclude globs."""
+    import yaml
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    scan_dir = tmp_path / "code"
+    init_git_repo(scan_dir / "app", "git+https://github.com/user/app.git")
+    init_git_repo(
+        scan_dir / "app" / "vendor" / "vendored-lib",
+        "git+https://github.com/user/vendored-lib.git",
+    )
+    init_git_repo(scan_dir / "tools" / "tool", "git+https://github.com/user/tool.git")
+    if ignore_file is not None:
+        (scan_dir / ".vcspullignore").write_text(ignore_file, encoding="utf-8")
+    config_file = tmp_path / ".vcspull.yaml"
+
+    discover_repos(
+        scan_dir_str=str(scan_dir),
+        config_file_path_str=str(config_file),
+        recursive=True,
+        workspace_root_override=None,
+        yes=True,
+        dry_run=False,
+        nested=nested,
+        max_depth=max_depth,
+        exclude=exclude,
+    )
+
+    config = yaml.safe_load(config_file.read_text(encoding="utf-8"))
+    assert {name for repos in config.values() for name in repos} == expected_names
+
+
+def test_discover_full_ignores_directory_cache(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """--full rereads directories that the cache believes are unchanged."""
+    import os
+    import time
+
+    import yaml
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    scan_dir = tmp_path / "code"
+    init_git_repo(scan_dir / "group" / "first", "git+https://github.com/u/first.git")
+    stamp = time.time() - 60
+    for directory in [scan_dir, *scan_dir.rglob("*")]:
+        if directory.is_dir():
+            os.utime(directory, (stamp, stamp))
+    config_file = tmp_path / ".vcspull.yaml"
+
+    def discover(*, full: bool) -> set[str]:
+        discover_repos(
+            scan_dir_str=str(scan_dir),
+            config_file_path_str=str(config_file),
+            recursive=True,
+            workspace_root_override=None,
+            yes=True,
+            dry_run=False,
+            full=full,
+        )
+        config = yaml.safe_load(config_file.read_text(encoding="utf-8"))
+        return {name for repos in config.values() for name in repos}
+
+    assert discover(full=False) == {"first"}
+
+    # A change the cache cannot see: the parent's mtime is put back afterwards.
+    group = scan_dir / "group"
+    group_mtime = group.stat().st_mtime_ns
+    init_git_repo(group / "second", "git+https://github.com/u/second.git")
+    os.utime(group, ns=(group_mtime, group_mtime))
+
+    assert discover(full=False) == {"first"}
+    assert discover(full=True) == {"first", "second"}
+
+
+def test_discover_reads_metadata_without_git(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+    mocker: MockerFixture,
+) -> None:
+    """Origin URLs and clone depth come from disk, so discover runs no git."""
+    import yaml
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    scan_dir = tmp_path / "code"
+    remote = scan_dir / "upstream"
+    init_git_repo(remote, "git+https://github.com/user/upstream.git")
+    subprocess.run(
+        ["git", "-C", str(remote), "commit", "--allow-empty", "-q", "-m", "one"],
+        check=True,
+        capture_output=True,
+    )
+    subprocess.run(
+        ["git", "clone", "-q", "--depth", "1", f"file://{remote}", "shallow"],
+        cwd=scan_dir,
+        check=True,
+        capture_output=True,
+    )
+    config_file = tmp_path / ".vcspull.yaml"
+
+    run_spy = mocker.spy(subprocess, "run")
+    discover_repos(
+        scan_dir_str=str(scan_dir),
+        config_file_path_str=str(config_file),
+        recursive=False,
+        workspace_root_override=None,
+        yes=True,
+        dry_run=False,
+    )
+
+    assert run_spy.call_count == 0
+    config = yaml.safe_load(config_file.read_text(encoding="utf-8"))
+    repos = next(iter(config.values()))
+    assert repos["upstream"] == {"repo": "git+https://github.com/user/upstream.git"}
+    assert repos["shallow"] == {
+        "repo": f"file://{remote}",
+        "options": {"shallow": True},
+    }
+
+
+def _write_svn_wc_db(repo: pathlib.Path, root: str, repos_path: str) -> None:
+    """Write the parts of a Subversion ``wc.db`` that discover reads."""
+    import sqlite3
+
+    (repo / ".svn").mkdir(parents=True)
+    conn = sqlite3.connect(repo / ".svn" / "wc.db")
+    conn.executescript(
+        "CREATE TABLE repository (id INTEGER PRIMARY KEY, root TEXT, uuid TEXT);"
+        "CREATE TABLE nodes (wc_id INTEGER, local_relpath TEXT, op_depth INTEGER, "
+        "repos_id INTEGER, repos_path TEXT);",
+    )
+    conn.execute("INSERT INTO repository VALUES (1, ?, 'uuid')", (root,))
+    conn.execute("INSERT INTO nodes VALUES (1, '', 0, 1, ?)", (repos_path,))
+    conn.commit()
+    conn.close()
+
+
+def test_discover_mercurial_and_subversion_checkouts(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+    mocker: MockerFixture,
+) -> None:
+    """Mercurial and Subversion checkouts are found next to git ones."""
+    import yaml
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    scan_dir = tmp_path / "code"
+    init_git_repo(scan_dir / "gitrepo", "https://github.com/user/gitrepo.git")
+    (scan_dir / "hgrepo" / ".hg").mkdir(parents=True)
+    (scan_dir / "hgrepo" / ".hg" / "hgrc").write_text(
+        "[paths]\ndefault = https://hg.example.com/hgrepo\n",
+        encoding="utf-8",
+    )
+    _write_svn_wc_db(scan_dir / "svnrepo", "https://svn.example.com/proj", "trunk")
+    (scan_dir / "svnrepo" / "sub" / ".svn").mkdir(parents=True)
+    config_file = tmp_path / ".vcspull.yaml"
+
+    run_spy = mocker.spy(subprocess, "run")
+    discover_repos(
+        scan_dir_str=str(scan_dir),
+        config_file_path_str=str(config_file),
+        recursive=True,
+        workspace_root_override=None,
+        yes=True,
+        dry_run=False,
+    )
+
+    assert run_spy.call_count == 0
+    config = yaml.safe_load(config_file.read_text(encoding="utf-8"))
+    repos = next(iter(config.values()))
+    assert repos == {
+        "gitrepo": {"repo": "https://github.com/user/gitrepo.git"},
+        "hgrepo": {"repo": "hg+https://hg.example.com/hgrepo"},
+        "svnrepo": {"repo": "svn+https://svn.example.com/proj/trunk"},
+    }
+
+
+def test_discover_falls_back_to_vcs_commands(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+    mocker: MockerFixture,
+) -> None:
+    """Checkouts whose metadata cannot be read ask ``hg``/``svn`` instead."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    scan_dir = tmp_path / "code"
+    (scan_dir / "hgrepo" / ".hg").mkdir(parents=True)
+    (scan_dir / "hgrepo" / ".hg" / "hgrc").write_text(
+        "%include ../shared.hgrc\n",
+        encoding="utf-8",
+    )
+    (scan_dir / "svnrepo" / ".svn").mkdir(parents=True)
+    urls = {
+        "hg": "https://hg.example.com/hgrepo\n",
+        "svn": "https://svn.example.com/proj/trunk\n",
+    }
+    run_mock = mocker.patch(
+        "vcspull.cli.discover.subprocess.run",
+        side_effect=lambda cmd, **kwargs: subprocess.CompletedProcess(
+            cmd, 0, stdout=urls[cmd[0]]
+        ),
+    )
+    config_file = tmp_path / ".vcspull.yaml"
+
+    discover_repos(
+        scan_dir_str=str(scan_dir),
+        config_file_path_str=str(config_file),
+        recursive=False,
+        workspace_root_override=None,
+        yes=True,
+        dry_run=False,
+    )
+
+    assert sorted(call.args[0][0] for call in run_mock.call_args_list) == [
+        "hg",
+        "svn",
+    ]
+    content = config_file.read_text(encoding="utf-8")
+    assert "hg+https://hg.example.com/hgrepo" in content
+    assert "svn+https://svn.example.com/proj/trunk" in content
+
+
 def test_discover_shows_existing_repos(
     tmp_path: pathlib.Path,
     monkeypatch: MonkeyPatch,
@@ -1262,3 +1564,40 @@ def test_classify_discover_action(
     """Test _classify_discover_action covers all permutations."""
     action = _classify_discover_action(existing_entry)
     assert action == expected_action
+
+
+def test_discover_appends_to_jsonl_config(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """New repositories are appended to a JSONL config, leaving lines as-is."""
+    from vcspull.config import load_configs
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    scan_dir = tmp_path / "code"
+    init_git_repo(scan_dir / "first", "git+https://github.com/u/first.git")
+    init_git_repo(scan_dir / "second", "git+https://github.com/u/second.git")
+    config_file = tmp_path / ".vcspull.jsonl"
+    # Hand-written, without a final newline: kept byte for byte.
+    existing = (
+        '{"name": "first", "workspace_root": "~/code/",'
+        ' "url": "git+https://github.com/u/first.git"}'
+    )
+    config_file.write_text(existing, encoding="utf-8")
+
+    discover_repos(
+        scan_dir_str=str(scan_dir),
+        config_file_path_str=str(config_file),
+        recursive=False,
+        workspace_root_override=None,
+        yes=True,
+        dry_run=False,
+    )
+
+    content = config_file.read_text(encoding="utf-8")
+    assert content.startswith(existing + "\n")
+    assert content.count("\n") == 2
+    repos = load_configs([config_file], cwd=tmp_path, use_cache=False)
+    assert sorted(repo["name"] for repo in repos) == ["first", "second"]
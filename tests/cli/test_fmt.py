@@ -10,6 +10,7 @@ import typing as t
 import pytest
 import yaml
 
+from vcspull._internal.config_reader import DuplicateAwareConfigReader
 from vcspull._internal.private_path import PrivatePath
 from vcspull.cli import cli
 from vcspull.cli.fmt import format_config, format_config_file, normalize_repo_config
@@ -21,6 +22,7 @@ from vcspull.config import (
 
 if t.TYPE_CHECKING:
     from _pytest.logging import LogCaptureFixture
+    from pytest_mock import MockerFixture
     from syrupy.assertion import SnapshotAssertion
 
 
@@ -570,6 +572,128 @@ def test_fmt_cli_integration(
     assert expected_log_fragment in caplog.text
 
 
+FORMATTED_YAML = """\
+~/code/:
+  flask:
+    repo: git+https://github.com/pallets/flask.git
+"""
+
+
+class FmtCheckFixture(t.NamedTuple):
+    """Fixture for ``vcspull fmt --check`` exit statuses."""
+
+    test_id: str
+    content: str
+    expected_exit: int | None
+
+
+FMT_CHECK_FIXTURES: list[FmtCheckFixture] = [
+    FmtCheckFixture(
+        test_id="formatted",
+        content=FORMATTED_YAML,
+        expected_exit=None,
+    ),
+    FmtCheckFixture(
+        test_id="needs-formatting",
+        content="~/code/:\n  flask: git+https://github.com/pallets/flask.git\n",
+        expected_exit=1,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(FmtCheckFixture._fields),
+    FMT_CHECK_FIXTURES,
+    ids=[fixture.test_id for fixture in FMT_CHECK_FIXTURES],
+)
+def test_fmt_check_exit_status(
+    tmp_path: pathlib.Path,
+    test_id: str,
+    content: str,
+    expected_exit: int | None,
+) -> None:
+    """--check exits non-zero on drift and never writes."""
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text(content, encoding="utf-8")
+
+    if expected_exit is None:
+        cli(["fmt", "-f", str(config_file), "--check"])
+    else:
+        with pytest.raises(SystemExit) as excinfo:
+            cli(["fmt", "-f", str(config_file), "--check"])
+        assert excinfo.value.code == expected_exit
+
+    assert config_file.read_text(encoding="utf-8") == content
+
+
+def test_format_skips_files_found_clean(
+    tmp_path: pathlib.Path,
+    caplog: LogCaptureFixture,
+    mocker: MockerFixture,
+) -> None:
+    """A file found formatted is not parsed again until its content changes."""
+    config_file = tmp_path / ".vcspull.yaml"
+    config_file.write_text(FORMATTED_YAML, encoding="utf-8")
+    assert format_config_file(str(config_file), write=True) == 0
+    mtime = config_file.stat().st_mtime_ns
+
+    parse_spy = mocker.spy(DuplicateAwareConfigReader, "load_with_duplicates")
+    with caplog.at_level(logging.INFO):
+        assert format_config_file(str(config_file), write=True) == 0
+
+    assert parse_spy.call_count == 0
+    assert "already formatted correctly" in caplog.text
+    assert config_file.stat().st_mtime_ns == mtime
+
+    config_file.write_text(FORMATTED_YAML.replace("flask", "click"), encoding="utf-8")
+    format_config_file(str(config_file), write=True)
+    assert parse_spy.call_count == 1
+
+
+def test_format_all_in_worker_processes(
+    tmp_path: pathlib.Path,
+    caplog: LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Files formatted in a pool are written and reported in file order."""
+    config_files = []
+    for index in range(4):
+        config_file = tmp_path / f"team-{index}.yaml"
+        config_file.write_text(
+            f"~/team-{index}/:\n  zebra: url{index}\n  alpha: url{index}\n",
+            encoding="utf-8",
+        )
+        config_files.append(config_file)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        "vcspull.cli.fmt.find_config_files",
+        lambda include_home=False: list(config_files),
+    )
+    monkeypatch.setattr(
+        "vcspull.cli._config_files.parallel_workers",
+        lambda files: len(files),
+    )
+
+    with caplog.at_level(logging.INFO):
+        assert format_config_file(None, write=True, format_all=True) == 0
+
+    formatted = [
+        record.getMessage()
+        for record in caplog.records
+        if "Successfully formatted" in record.getMessage()
+    ]
+    assert len(formatted) == 4
+    for index, message in enumerate(formatted):
+        assert f"team-{index}.yaml" in message
+    for index, config_file in enumerate(config_files):
+        assert yaml.safe_load(config_file.read_text(encoding="utf-8")) == {
+            f"~/team-{index}/": {
+                "alpha": {"repo": f"url{index}"},
+                "zebra": {"repo": f"url{index}"},
+            },
+        }
+
+
 # ---------------------------------------------------------------------------
 # FmtAction classifier unit tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,155 @@
+"""Tests that vcspull imports only the subcommand it runs."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import typing as t
+
+import pytest
+
+#: Microseconds importing ``vcspull.cli`` may take before ``vcspull --help``
+#: prints. Eagerly importing every subcommand took about twice this.
+HELP_IMPORT_BUDGET_US = 200_000
+
+SUBCOMMAND_MODULES = {
+    "vcspull.cli.add",
+    "vcspull.cli.cache",
+    "vcspull.cli.discover",
+    "vcspull.cli.fmt",
+    "vcspull.cli.import_cmd",
+    "vcspull.cli.list",
+    "vcspull.cli.migrate",
+    "vcspull.cli.search",
+    "vcspull.cli.status",
+    "vcspull.cli.sync",
+    "vcspull.cli.worktree",
+}
+
+
+RUN_CLI = """\
+import contextlib, io, json, sys
+from vcspull.cli import cli
+with contextlib.redirect_stdout(io.StringIO()), contextlib.suppress(SystemExit):
+    cli(sys.argv[1:])
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _run_cli(argv: list[str]) -> subprocess.CompletedProcess[str]:
+    """Run ``vcspull ARGV`` with ``-X importtime`` in a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUN_CLI, *argv],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    return proc
+
+
+def _import_times(argv: list[str]) -> dict[str, int]:
+    """Return ``{module: cumulative microseconds}`` for ``vcspull ARGV``.
+
+    Modules loaded through :func:`importlib.import_module` are not listed
+    themselves, only the modules they import.
+    """
+    proc = _run_cli(argv)
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class LazyImportFixture(t.NamedTuple):
+    """Fixture for the subcommand modules a command line imports."""
+
+    test_id: str
+    argv: list[str]
+    expected_modules: set[str]
+
+
+LAZY_IMPORT_FIXTURES: list[LazyImportFixture] = [
+    LazyImportFixture(
+        test_id="top-level-help",
+        argv=["--help"],
+        expected_modules=set(),
+    ),
+    LazyImportFixture(
+        test_id="list-help",
+        argv=["list", "--help"],
+        expected_modules={"vcspull.cli.list"},
+    ),
+    LazyImportFixture(
+        test_id="import-help",
+        argv=["import", "github", "--help"],
+        expected_modules={"vcspull.cli.import_cmd"},
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(LazyImportFixture._fields),
+    LAZY_IMPORT_FIXTURES,
+    ids=[fixture.test_id for fixture in LAZY_IMPORT_FIXTURES],
+)
+def test_only_chosen_subcommand_is_imported(
+    test_id: str,
+    argv: list[str],
+    expected_modules: set[str],
+) -> None:
+    """Other subcommands' modules stay unloaded; help alone loads no libvcs."""
+    imported = set(json.loads(_run_cli(argv).stdout))
+
+    assert imported & SUBCOMMAND_MODULES == expected_modules
+    if not expected_modules:
+        assert "libvcs.sync.git" not in imported
+
+
+def test_help_import_time_budget() -> None:
+    """``vcspull --help`` imports the CLI within the budget.
+
+    ``vcspull.cli`` is the outermost import, so its cumulative time covers
+    the ``vcspull`` package and everything the CLI pulls in.
+    """
+    times = _import_times(["--help"])
+
+    assert times["vcspull.cli"] >= times["vcspull"]
+    assert times["vcspull.cli"] < HELP_IMPORT_BUDGET_US
+
+
+RESOLVE_EXPORTS = """\
+import importlib, json, sys
+import vcspull.cli
+before = sorted(set(sys.modules) & set(sys.argv[1:]))
+importlib.import_module("vcspull.cli.sync")
+exports = {
+    name: getattr(vcspull.cli, name).__module__
+    for name in vcspull.cli._LAZY_EXPORTS
+}
+print(json.dumps({"before": before, "exports": exports}))
+"""
+
+
+def test_package_exports_resolve_lazily() -> None:
+    """Functions the package re-exports load their submodule on first access.
+
+    ``vcspull.cli.sync`` stays the command function even once the submodule
+    of the same name is imported.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-c", RESOLVE_EXPORTS, *sorted(SUBCOMMAND_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = json.loads(proc.stdout)
+
+    assert result["before"] == []
+    assert result["exports"]["sync"] == "vcspull.cli.sync"
+    assert result["exports"]["add_repo"] == "vcspull.cli.add"
+    assert set(result["exports"].values()) <= SUBCOMMAND_MODULES
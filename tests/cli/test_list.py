@@ -361,3 +361,175 @@ def test_list_repos_path_contraction(
             assert not path.startswith(str(tmp_path)), (
                 f"Path {path} should not contain absolute home path"
             )
+
+
+class ListStateFilterFixture(t.NamedTuple):
+    """Fixture for ``--dirty`` / ``--behind`` / ``--missing`` filtering."""
+
+    test_id: str
+    dirty: bool
+    behind: bool
+    missing: bool
+    max_age: float | None
+    expected_repo_names: list[str]
+
+
+LIST_STATE_FILTER_FIXTURES: list[ListStateFilterFixture] = [
+    ListStateFilterFixture(
+        test_id="dirty",
+        dirty=True,
+        behind=False,
+        missing=False,
+        max_age=None,
+        expected_repo_names=["dirty-repo", "synced-repo"],
+    ),
+    ListStateFilterFixture(
+        test_id="behind",
+        dirty=False,
+        behind=True,
+        missing=False,
+        max_age=None,
+        expected_repo_names=["behind-repo"],
+    ),
+    ListStateFilterFixture(
+        test_id="missing",
+        dirty=False,
+        behind=False,
+        missing=True,
+        max_age=None,
+        expected_repo_names=["missing-repo"],
+    ),
+    ListStateFilterFixture(
+        test_id="any-of-several",
+        dirty=True,
+        behind=False,
+        missing=True,
+        max_age=None,
+        expected_repo_names=["dirty-repo", "missing-repo", "synced-repo"],
+    ),
+    ListStateFilterFixture(
+        test_id="max-age-drops-old-state",
+        dirty=True,
+        behind=True,
+        missing=True,
+        max_age=3600,
+        expected_repo_names=["dirty-repo", "missing-repo"],
+    ),
+    ListStateFilterFixture(
+        test_id="max-age-ignores-old-clean-after-sync",
+        dirty=True,
+        behind=False,
+        missing=False,
+        max_age=3600,
+        expected_repo_names=["dirty-repo"],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(ListStateFilterFixture._fields),
+    LIST_STATE_FILTER_FIXTURES,
+    ids=[fixture.test_id for fixture in LIST_STATE_FILTER_FIXTURES],
+)
+def test_list_repos_state_filters(
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+    test_id: str,
+    dirty: bool,
+    behind: bool,
+    missing: bool,
+    max_age: float | None,
+    expected_repo_names: list[str],
+) -> None:
+    """State filters answer from the recorded store without probing disk."""
+    from vcspull._internal.state_store import StateStore
+
+    workspace = tmp_path / "code"
+    names = [
+        "clean-repo",
+        "dirty-repo",
+        "behind-repo",
+        "missing-repo",
+        "synced-repo",
+        "unseen-repo",
+    ]
+    config_file = tmp_path / ".vcspull.yaml"
+    create_test_config(
+        config_file,
+        {
+            f"{workspace}/": {
+                name: {"repo": f"git+https://example.com/{name}.git"} for name in names
+            },
+        },
+    )
+
+    with StateStore() as store:
+        store.record(workspace / "clean-repo", present=True, clean=True, behind=0)
+        store.record(workspace / "dirty-repo", present=True, clean=False)
+        # Recorded long ago, so --max-age drops it.
+        store.record(
+            workspace / "behind-repo",
+            present=True,
+            clean=True,
+            behind=3,
+            observed_at=0.0,
+        )
+        store.record(workspace / "missing-repo", present=False)
+        # Seen dirty long ago, then synced: the sync does not check the tree.
+        store.record(
+            workspace / "synced-repo",
+            present=True,
+            clean=False,
+            observed_at=0.0,
+        )
+        store.record(workspace / "synced-repo", present=True, head="f" * 40)
+
+    list_repos(
+        repo_patterns=[],
+        config_path=config_file,
+        workspace_root=None,
+        tree=False,
+        output_json=True,
+        output_ndjson=False,
+        color="never",
+        dirty=dirty,
+        behind=behind,
+        missing=missing,
+        max_age=max_age,
+    )
+
+    output = json.loads(capsys.readouterr().out)
+    assert sorted(item["name"] for item in output) == expected_repo_names
+    for item in output:
+        assert "observed_at" in item
+
+
+def test_list_repos_state_filter_notes_unrecorded(
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Human output says how many repositories had no recorded state."""
+    config_file = tmp_path / ".vcspull.yaml"
+    create_test_config(
+        config_file,
+        {
+            f"{tmp_path / 'code'}/": {
+                "flask": {"repo": "git+https://github.com/pallets/flask.git"},
+            },
+        },
+    )
+
+    list_repos(
+        repo_patterns=[],
+        config_path=config_file,
+        workspace_root=None,
+        tree=False,
+        output_json=False,
+        output_ndjson=False,
+        color="never",
+        dirty=True,
+    )
+
+    output = capsys.readouterr().out
+    assert "No repositories found." in output
+    assert "1 repositories have no recorded state" in output
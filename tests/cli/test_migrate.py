@@ -187,3 +187,26 @@ def test_migrate_cli_end_to_end(
 
     result = yaml.safe_load(config_file.read_text(encoding="utf-8"))
     assert result["~/code/"]["flask"] == {"repo": "git+x", "options": {"shallow": True}}
+
+
+def test_migrate_check_exit_status(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """`vcspull migrate --check` fails while legacy keys remain, writing nothing."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config_file = tmp_path / ".vcspull.yaml"
+    save_config_yaml(
+        config_file,
+        {"~/code/": {"flask": {"repo": "git+x", "shallow": True}}},
+    )
+    before = config_file.read_text(encoding="utf-8")
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli(["migrate", "-f", str(config_file), "--check"])
+
+    assert excinfo.value.code == 1
+    assert config_file.read_text(encoding="utf-8") == before
+
+    cli(["migrate", "-f", str(config_file), "--write"])
+    cli(["migrate", "-f", str(config_file), "--check"])
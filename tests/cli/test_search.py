@@ -8,9 +8,13 @@ import typing as t
 
 import pytest
 
+from vcspull._internal.search_index import SearchIndex
 from vcspull.cli._colors import ColorMode, Colors
 from vcspull.cli.search import (
+    DEFAULT_FIELDS,
+    compile_fuzzy_patterns,
     compile_search_patterns,
+    fuzzy_search_matches,
     highlight_text,
     normalize_fields,
     parse_query_terms,
@@ -796,3 +800,225 @@ def test_normalize_fields_empty_after_comma() -> None:
     """Test normalize_fields with empty string after comma."""
     result = normalize_fields(["name,", ",url"])
     assert result == ("name", "url")
+
+
+FUZZY_CONFIG = {
+    "~/code/": {
+        "django": {"repo": "git+https://github.com/django/django.git"},
+        "django-rest-framework": {
+            "repo": "git+https://github.com/encode/django-rest-framework.git",
+        },
+        "dockerfile-lint": {"repo": "git+https://github.com/x/dockerfile-lint.git"},
+        "flask": {"repo": "git+https://github.com/pallets/flask.git"},
+    },
+}
+
+
+class FuzzySearchFixture(t.NamedTuple):
+    """Fixture for ``--fuzzy`` rankings."""
+
+    test_id: str
+    query_terms: list[str]
+    match_any: bool
+    limit: int | None
+    expected_repo_names: list[str]
+
+
+FUZZY_SEARCH_FIXTURES: list[FuzzySearchFixture] = [
+    FuzzySearchFixture(
+        test_id="word-starts-rank-first",
+        query_terms=["drf"],
+        match_any=False,
+        limit=None,
+        expected_repo_names=["django-rest-framework", "dockerfile-lint"],
+    ),
+    FuzzySearchFixture(
+        test_id="shorter-name-wins-tie",
+        query_terms=["django"],
+        match_any=False,
+        limit=None,
+        expected_repo_names=["django", "django-rest-framework"],
+    ),
+    FuzzySearchFixture(
+        test_id="limit-keeps-best",
+        query_terms=["d"],
+        match_any=False,
+        limit=2,
+        expected_repo_names=["django", "dockerfile-lint"],
+    ),
+    FuzzySearchFixture(
+        test_id="all-terms",
+        query_terms=["dj", "fw"],
+        match_any=False,
+        limit=None,
+        expected_repo_names=["django-rest-framework"],
+    ),
+    FuzzySearchFixture(
+        test_id="any-term",
+        query_terms=["fla", "lint"],
+        match_any=True,
+        limit=None,
+        expected_repo_names=["dockerfile-lint", "flask"],
+    ),
+    FuzzySearchFixture(
+        test_id="field-scoped",
+        query_terms=["url:encode"],
+        match_any=False,
+        limit=None,
+        expected_repo_names=["django-rest-framework"],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(FuzzySearchFixture._fields),
+    FUZZY_SEARCH_FIXTURES,
+    ids=[fixture.test_id for fixture in FUZZY_SEARCH_FIXTURES],
+)
+def test_search_repos_fuzzy(
+    test_id: str,
+    query_terms: list[str],
+    match_any: bool,
+    limit: int | None,
+    expected_repo_names: list[str],
+    user_path: pathlib.Path,
+) -> None:
+    """Fuzzy results come best first, cut to ``limit``."""
+    config_file = user_path / ".vcspull.yaml"
+    create_test_config(config_file, FUZZY_CONFIG)
+
+    results = search_repos(
+        query_terms=query_terms,
+        config_path=config_file,
+        workspace_root=None,
+        output_json=False,
+        output_ndjson=False,
+        color="never",
+        fields=None,
+        ignore_case=False,
+        smart_case=False,
+        fixed_strings=False,
+        word_regexp=False,
+        invert_match=False,
+        match_any=match_any,
+        fuzzy=True,
+        limit=limit,
+        emit_output=False,
+    )
+
+    assert [item["name"] for item in results] == expected_repo_names
+    scores = [item["score"] for item in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_fuzzy_limit_matches_full_ranking() -> None:
+    """Skipping fields under ``limit`` never changes the best results."""
+    names = [
+        f"{prefix}-{number}" for prefix in ("ab", "ba", "xa") for number in range(40)
+    ]
+    index = SearchIndex(
+        {
+            "name": names,
+            "path": [f"~/a/{name}" for name in names],
+            "url": [f"git+https://a.example/{name}.git" for name in names],
+            "workspace": ["~/a"] * len(names),
+        },
+        workspace_roots=["~/a/"] * len(names),
+    )
+
+    for term in ("a", "ab", "a-1", "x"):
+        patterns = compile_fuzzy_patterns(
+            parse_query_terms([term], default_fields=DEFAULT_FIELDS),
+        )
+        ranked = fuzzy_search_matches(index, patterns, match_any=False)
+        for limit in (1, 10, 50):
+            assert (
+                fuzzy_search_matches(index, patterns, match_any=False, limit=limit)
+                == ranked[:limit]
+            )
+
+
+def test_search_repos_limit_without_fuzzy(user_path: pathlib.Path) -> None:
+    """``--limit`` keeps the first matches in config order."""
+    config_file = user_path / ".vcspull.yaml"
+    create_test_config(config_file, FUZZY_CONFIG)
+
+    results = search_repos(
+        query_terms=["d"],
+        config_path=config_file,
+        workspace_root=None,
+        output_json=False,
+        output_ndjson=False,
+        color="never",
+        fields=None,
+        ignore_case=False,
+        smart_case=False,
+        fixed_strings=False,
+        word_regexp=False,
+        invert_match=False,
+        match_any=False,
+        limit=2,
+        emit_output=False,
+    )
+
+    assert [item["name"] for item in results] == ["django", "django-rest-framework"]
+
+
+def test_search_repos_fuzzy_json_score(
+    user_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Fuzzy JSON output carries each repository's score."""
+    config_file = user_path / ".vcspull.yaml"
+    create_test_config(config_file, FUZZY_CONFIG)
+
+    search_repos(
+        query_terms=["flask"],
+        config_path=config_file,
+        workspace_root=None,
+        output_json=True,
+        output_ndjson=False,
+        color="never",
+        fields=None,
+        ignore_case=False,
+        smart_case=False,
+        fixed_strings=False,
+        word_regexp=False,
+        invert_match=False,
+        match_any=False,
+        fuzzy=True,
+    )
+
+    [item] = json.loads(capsys.readouterr().out)
+    assert item["name"] == "flask"
+    assert item["score"] > 0
+
+
+def test_search_repos_fuzzy_rejects_invert(
+    user_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """``--fuzzy`` with ``--invert-match`` is an error, not an empty ranking."""
+    config_file = user_path / ".vcspull.yaml"
+    create_test_config(config_file, FUZZY_CONFIG)
+
+    results = search_repos(
+        query_terms=["flask"],
+        config_path=config_file,
+        workspace_root=None,
+        output_json=False,
+        output_ndjson=False,
+        color="never",
+        fields=None,
+        ignore_case=False,
+        smart_case=False,
+        fixed_strings=False,
+        word_regexp=False,
+        invert_match=True,
+        match_any=False,
+        fuzzy=True,
+        emit_output=False,
+    )
+
+    assert results == []
+    assert "--invert-match" in caplog.text
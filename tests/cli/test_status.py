@@ -9,11 +9,16 @@ import typing as t
 import pytest
 import yaml
 
+from vcspull._internal.state_store import state_key
+from vcspull.cli import cli
+from vcspull.cli._colors import ColorMode, Colors
+from vcspull.cli._output import OutputFormatter, OutputMode
 from vcspull.cli.status import (
     StatusCheckConfig,
     _check_repos_status_async,
     check_repo_status,
     status_repos,
+    watch_status,
 )
 
 if t.TYPE_CHECKING:
@@ -992,3 +997,230 @@ def test_status_repos_non_git_not_counted_as_dirty(
     assert summary["dirty"] == 0
     assert summary["clean"] == 0
     assert summary["exists"] == 1
+
+
+def test_status_repos_from_cache(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """``--from-cache`` reports what the last status run recorded, not disk."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    repo_path, _ = setup_repo_with_remote(tmp_path)
+    config_file = tmp_path / ".vcspull.yaml"
+    create_test_config(
+        config_file,
+        {
+            f"{repo_path.parent}/": {
+                "project": {"repo": f"git+file://{tmp_path / 'remote.git'}"},
+                "unseen": {"repo": "git+https://example.com/unseen.git"},
+            },
+        },
+    )
+
+    status_repos(
+        repo_patterns=["project"],
+        config_path=config_file,
+        workspace_root=None,
+        detailed=True,
+        output_json=True,
+        output_ndjson=False,
+        color="never",
+    )
+    capsys.readouterr()
+
+    # Dirty the checkout after recording; the cached answer must not see it.
+    (repo_path / "README.md").write_text("changed", encoding="utf-8")
+
+    def _no_git(*args: t.Any, **kwargs: t.Any) -> t.NoReturn:
+        pytest.fail("status --from-cache must not run git")
+
+    monkeypatch.setattr("vcspull.cli.status._run_git_command", _no_git)
+
+    status_repos(
+        repo_patterns=[],
+        config_path=config_file,
+        workspace_root=None,
+        detailed=True,
+        output_json=True,
+        output_ndjson=False,
+        color="never",
+        from_cache=True,
+    )
+
+    output = json.loads(capsys.readouterr().out)
+    statuses = {item["name"]: item for item in output if item["reason"] == "status"}
+    summary = next(item for item in output if item["reason"] == "summary")
+
+    assert statuses["project"]["exists"] is True
+    assert statuses["project"]["clean"] is True
+    assert statuses["project"]["branch"] == "main"
+    assert statuses["project"]["ahead"] == 0
+    assert statuses["project"]["observed_at"] is not None
+    assert statuses["unseen"]["exists"] is None
+    assert statuses["unseen"]["observed_at"] is None
+    assert summary["uncached"] == 1
+
+
+class ScriptedWatcher:
+    """Watcher that replays scripted changes, then simulates Ctrl-C."""
+
+    def __init__(
+        self,
+        rounds: list[tuple[t.Callable[[], None], set[str]]],
+    ) -> None:
+        self.rounds = list(rounds)
+        self.acknowledged: list[set[str]] = []
+        self.closed = False
+
+    def wait(self, timeout: float) -> set[str]:
+        """Apply the next scripted change and report its keys."""
+        if not self.rounds:
+            raise KeyboardInterrupt
+        mutate, keys = self.rounds.pop(0)
+        mutate()
+        return keys
+
+    def acknowledge(self, keys: t.Iterable[str]) -> None:
+        """Remember which keys were re-probed."""
+        self.acknowledged.append(set(keys))
+
+    def close(self) -> None:
+        """Mark the watcher closed."""
+        self.closed = True
+
+
+def test_watch_status_emits_only_changed_repos(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Watch mode re-probes reported repos and streams only real changes."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    repo_path, _ = setup_repo_with_remote(tmp_path)
+    other_path = tmp_path / "workspace" / "other"
+    repos: list[ConfigDict] = [
+        {
+            "name": "project",
+            "vcs": "git",
+            "url": "git+file://remote.git",
+            "path": repo_path,
+            "workspace_root": str(repo_path.parent),
+        },
+        {
+            "name": "other",
+            "vcs": "git",
+            "url": "git+file://other.git",
+            "path": other_path,
+            "workspace_root": str(other_path.parent),
+        },
+    ]
+    project_key = state_key(repo_path)
+    other_key = state_key(other_path)
+
+    def dirty_project() -> None:
+        (repo_path / "README.md").write_text("changed", encoding="utf-8")
+
+    def touch_nothing() -> None:
+        pass
+
+    probed: list[str] = []
+    real_check = check_repo_status
+
+    def counting_check(repo: ConfigDict, detailed: bool = False) -> dict[str, t.Any]:
+        probed.append(str(repo["name"]))
+        return real_check(repo, detailed=detailed)
+
+    monkeypatch.setattr("vcspull.cli.status.check_repo_status", counting_check)
+    watcher = ScriptedWatcher(
+        [
+            (dirty_project, {project_key}),
+            # Reported but unchanged: re-probed, yet nothing is emitted.
+            (touch_nothing, {other_key}),
+        ],
+    )
+
+    watch_status(
+        repos,
+        formatter=OutputFormatter(OutputMode.NDJSON),
+        colors=Colors(ColorMode.NEVER),
+        detailed=False,
+        max_concurrent=2,
+        interval=0.01,
+        watcher=watcher,
+    )
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(event["reason"], event["name"]) for event in events] == [
+        ("status", "project"),
+        ("status", "other"),
+        ("status_changed", "project"),
+    ]
+    assert events[0]["clean"] is True
+    assert events[2]["clean"] is False
+    assert sorted(probed) == sorted(["project", "other", "project", "other"])
+    assert watcher.acknowledged[1:] == [{project_key}, {other_key}]
+    assert watcher.closed
+
+
+def test_status_watch_rejects_json(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """``--watch`` streams updates, so buffered ``--json`` is refused."""
+    with pytest.raises(SystemExit) as excinfo:
+        cli(["status", "--watch", "--json"])
+
+    assert excinfo.value.code == 2
+    assert "use --ndjson instead of --json" in capsys.readouterr().err
+
+
+def test_status_here(
+    tmp_path: pathlib.Path,
+    monkeypatch: MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """``--here`` reports only the repository containing the cwd."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    repo_path, _ = setup_repo_with_remote(tmp_path)
+    (repo_path / "src").mkdir()
+    config_file = tmp_path / ".vcspull.yaml"
+    create_test_config(
+        config_file,
+        {
+            f"{repo_path.parent}/": {
+                "project": {"repo": f"git+file://{tmp_path / 'remote.git'}"},
+                "neighbour": {"repo": "git+https://example.com/neighbour.git"},
+            },
+        },
+    )
+    monkeypatch.chdir(repo_path / "src")
+
+    status_repos(
+        repo_patterns=[],
+        config_path=config_file,
+        workspace_root=None,
+        detailed=False,
+        output_json=True,
+        output_ndjson=False,
+        color="never",
+        here=True,
+    )
+
+    output = json.loads(capsys.readouterr().out)
+    assert [item["name"] for item in output if item["reason"] == "status"] == [
+        "project",
+    ]
+
+    monkeypatch.chdir(tmp_path)
+    status_repos(
+        repo_patterns=[],
+        config_path=config_file,
+        workspace_root=None,
+        detailed=False,
+        output_json=False,
+        output_ndjson=False,
+        color="never",
+        here=True,
+    )
+
+    assert "not inside a configured repository" in capsys.readouterr().out
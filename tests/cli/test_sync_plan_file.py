@@ -0,0 +1,362 @@
+"""Tests for saving and applying ``vcspull sync`` plans."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import subprocess
+import typing as t
+
+import pytest
+import yaml
+
+from vcspull._internal.git_probe import read_head_revision
+from vcspull.cli import cli
+from vcspull.cli._output import PlanAction, PlanEntry, PlanResult, PlanSummary
+from vcspull.cli.sync import _load_plan_file, _save_plan_file
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from libvcs.sync.git import GitSync
+
+
+def _write_single_repo_config(
+    config_path: pathlib.Path,
+    git_repo: GitSync,
+    name: str,
+) -> str:
+    """Write a config holding one repository, ``name``, cloned from ``git_repo``.
+
+    The home directory is shared across tests, so each test picks its own name
+    to avoid seeing another test's checkout, and passes the returned path via
+    ``-f`` so stray home configs are not loaded.
+    """
+    config = {
+        "~/github_projects/": {
+            name: {
+                "url": f"git+file://{git_repo.path}",
+            },
+        },
+    }
+    config_file = config_path / ".vcspull.yaml"
+    config_file.write_text(
+        yaml.dump(config, default_flow_style=False),
+        encoding="utf-8",
+    )
+    return str(config_file)
+
+
+def _summary_event(output: str) -> dict[str, t.Any]:
+    """Return the sync summary event from ``--json`` output."""
+    events = json.loads(output)
+    return next(event for event in events if event.get("reason") == "summary")
+
+
+def test_plan_file_round_trip(tmp_path: pathlib.Path) -> None:
+    """A saved plan loads back with every entry, including unchanged ones."""
+    plan = PlanResult(
+        entries=[
+            PlanEntry(
+                name="repo-a",
+                path="~/code/repo-a",
+                workspace_root="~/code/",
+                action=PlanAction.UPDATE,
+                current_rev="a" * 40,
+                target_rev="b" * 40,
+                remote_branch="origin/main",
+                ahead=0,
+                behind=3,
+                dirty=False,
+            ),
+            PlanEntry(
+                name="repo-b",
+                path="~/code/repo-b",
+                workspace_root="~/code/",
+                action=PlanAction.UNCHANGED,
+                detail="up to date",
+            ),
+        ],
+        summary=PlanSummary(update=1, unchanged=1, duration_ms=12),
+    )
+    plan_path = tmp_path / "plans" / "plan.json"
+
+    _save_plan_file(plan, plan_path)
+
+    assert _load_plan_file(plan_path) == plan
+
+
+class InvalidPlanFixture(t.NamedTuple):
+    """Fixture for rejected plan files."""
+
+    test_id: str
+    content: str
+    expected_error: str
+
+
+INVALID_PLAN_FIXTURES: list[InvalidPlanFixture] = [
+    InvalidPlanFixture(
+        test_id="not-json",
+        content="{not json",
+        expected_error="Could not read plan file",
+    ),
+    InvalidPlanFixture(
+        test_id="wrong-type",
+        content=json.dumps({"format_version": "1", "type": "summary"}),
+        expected_error="not a vcspull plan",
+    ),
+    InvalidPlanFixture(
+        test_id="unknown-action",
+        content=json.dumps(
+            {
+                "format_version": "1",
+                "type": "plan",
+                "entries": [
+                    {
+                        "name": "repo",
+                        "path": "~/code/repo",
+                        "workspace_root": "~/code/",
+                        "action": "teleport",
+                    },
+                ],
+            },
+        ),
+        expected_error="'teleport' is not a valid PlanAction",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(InvalidPlanFixture._fields),
+    INVALID_PLAN_FIXTURES,
+    ids=[fixture.test_id for fixture in INVALID_PLAN_FIXTURES],
+)
+def test_load_plan_file_rejects_invalid(
+    tmp_path: pathlib.Path,
+    test_id: str,
+    content: str,
+    expected_error: str,
+) -> None:
+    """Malformed plan files raise ValueError naming the problem."""
+    plan_path = tmp_path / "plan.json"
+    plan_path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError, match=expected_error):
+        _load_plan_file(plan_path)
+
+
+class PlanFlagConflictFixture(t.NamedTuple):
+    """Fixture for invalid ``--save-plan`` / ``--apply-plan`` combinations."""
+
+    test_id: str
+    sync_args: list[str]
+    expected_error: str
+
+
+PLAN_FLAG_CONFLICT_FIXTURES: list[PlanFlagConflictFixture] = [
+    PlanFlagConflictFixture(
+        test_id="save-plan-without-dry-run",
+        sync_args=["--all", "--save-plan", "plan.json"],
+        expected_error="--save-plan requires --dry-run",
+    ),
+    PlanFlagConflictFixture(
+        test_id="apply-plan-with-dry-run",
+        sync_args=["--dry-run", "--apply-plan", "plan.json"],
+        expected_error="--apply-plan cannot be combined with --dry-run",
+    ),
+    PlanFlagConflictFixture(
+        test_id="apply-plan-with-all",
+        sync_args=["--all", "--apply-plan", "plan.json"],
+        expected_error="--apply-plan cannot be combined with patterns or --all",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    list(PlanFlagConflictFixture._fields),
+    PLAN_FLAG_CONFLICT_FIXTURES,
+    ids=[fixture.test_id for fixture in PLAN_FLAG_CONFLICT_FIXTURES],
+)
+def test_sync_plan_flag_conflicts(
+    capsys: pytest.CaptureFixture[str],
+    test_id: str,
+    sync_args: list[str],
+    expected_error: str,
+) -> None:
+    """Plan flags reject combinations that would ignore one of the inputs."""
+    with pytest.raises(SystemExit) as excinfo:
+        cli(["sync", *sync_args])
+
+    assert excinfo.value.code == 2
+    assert expected_error in capsys.readouterr().err
+
+
+def test_sync_save_and_apply_plan(
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+    user_path: pathlib.Path,
+    config_path: pathlib.Path,
+    git_repo: GitSync,
+) -> None:
+    """A saved clone plan applies once, then reports the checkout as stale."""
+    config_file = _write_single_repo_config(config_path, git_repo, "plan_clone_project")
+    plan_path = tmp_path / "plan.json"
+    checkout = user_path / "github_projects" / "plan_clone_project"
+
+    cli(
+        ["sync", "-f", config_file, "--dry-run", "--all", "--save-plan", str(plan_path)]
+    )
+    capsys.readouterr()
+
+    plan = _load_plan_file(plan_path)
+    assert [(entry.name, entry.action) for entry in plan.entries] == [
+        ("plan_clone_project", PlanAction.CLONE),
+    ]
+    assert not checkout.exists()
+
+    cli(["sync", "-f", config_file, "--apply-plan", str(plan_path), "--json"])
+    summary = _summary_event(capsys.readouterr().out)
+    assert summary["synced"] == 1
+    assert summary["stale"] == 0
+    assert read_head_revision(checkout) == read_head_revision(git_repo.path)
+
+    # The clone already happened, so re-applying the same plan must not act.
+    cli(["sync", "-f", config_file, "--apply-plan", str(plan_path), "--json"])
+    events = json.loads(capsys.readouterr().out)
+    stale_events = [event for event in events if event.get("status") == "stale"]
+    assert [event["detail"] for event in stale_events] == ["path exists now"]
+    summary = _summary_event(json.dumps(events))
+    assert summary["synced"] == 0
+    assert summary["stale"] == 1
+
+
+def test_sync_apply_plan_records_and_checks_head(
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+    user_path: pathlib.Path,
+    config_path: pathlib.Path,
+    git_repo: GitSync,
+) -> None:
+    """Update plans record HEAD and skip checkouts whose HEAD has moved."""
+    config_file = _write_single_repo_config(
+        config_path, git_repo, "plan_update_project"
+    )
+    cli(["sync", "-f", config_file, "--all"])
+    capsys.readouterr()
+    checkout = user_path / "github_projects" / "plan_update_project"
+
+    plan_path = tmp_path / "plan.json"
+    cli(
+        ["sync", "-f", config_file, "--dry-run", "--all", "--save-plan", str(plan_path)]
+    )
+    capsys.readouterr()
+
+    plan = _load_plan_file(plan_path)
+    (entry,) = plan.entries
+    assert entry.current_rev == read_head_revision(checkout)
+    assert entry.target_rev == entry.current_rev
+    assert entry.remote_branch == "origin/master"
+
+    # Force the entry to UPDATE and pretend HEAD was elsewhere at plan time.
+    entry.action = PlanAction.UPDATE
+    entry.current_rev = "0" * 40
+    _save_plan_file(plan, plan_path)
+
+    cli(["sync", "-f", config_file, "--apply-plan", str(plan_path), "--json"])
+    events = json.loads(capsys.readouterr().out)
+    (stale_event,) = [event for event in events if event.get("status") == "stale"]
+    assert stale_event["detail"].startswith("HEAD moved (0000000 -> ")
+    assert _summary_event(json.dumps(events))["synced"] == 0
+
+
+def _commit(repo_path: pathlib.Path, message: str) -> str:
+    """Add an empty commit to ``repo_path`` and return its revision."""
+    subprocess.run(
+        ["git", "-C", str(repo_path), "commit", "-q", "--allow-empty", "-m", message],
+        check=True,
+        capture_output=True,
+    )
+    revision = read_head_revision(repo_path)
+    assert revision is not None
+    return revision
+
+
+def test_sync_apply_plan_stops_at_planned_commit(
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+    user_path: pathlib.Path,
+    config_path: pathlib.Path,
+    git_repo: GitSync,
+) -> None:
+    """Commits pushed upstream after planning are not pulled by the apply."""
+    config_file = _write_single_repo_config(config_path, git_repo, "plan_pin_project")
+    cli(["sync", "-f", config_file, "--all"])
+    checkout = user_path / "github_projects" / "plan_pin_project"
+    planned = _commit(git_repo.path, "reviewed")
+
+    plan_path = tmp_path / "plan.json"
+    cli(
+        [
+            "sync",
+            "-f",
+            config_file,
+            "--dry-run",
+            "--all",
+            "--fetch",
+            "--save-plan",
+            str(plan_path),
+        ]
+    )
+    (entry,) = _load_plan_file(plan_path).entries
+    assert (entry.action, entry.target_rev) == (PlanAction.UPDATE, planned)
+
+    _commit(git_repo.path, "not reviewed")
+    capsys.readouterr()
+    cli(["sync", "-f", config_file, "--apply-plan", str(plan_path), "--json"])
+
+    assert _summary_event(capsys.readouterr().out)["synced"] == 1
+    assert read_head_revision(checkout) == planned
+
+
+def test_sync_apply_plan_skips_non_actionable(
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+    user_path: pathlib.Path,
+    config_path: pathlib.Path,
+    git_repo: GitSync,
+) -> None:
+    """Unchanged, blocked, and errored entries are counted but never synced."""
+    config_file = _write_single_repo_config(config_path, git_repo, "plan_skip_project")
+    checkout = user_path / "github_projects" / "plan_skip_project"
+    plan = PlanResult(
+        entries=[
+            PlanEntry(
+                name="plan_skip_project",
+                path=str(checkout),
+                workspace_root="~/github_projects/",
+                action=action,
+            )
+            for action in (PlanAction.BLOCKED, PlanAction.UNCHANGED, PlanAction.ERROR)
+        ],
+        summary=PlanSummary(blocked=1, unchanged=1, errors=1),
+    )
+    plan_path = tmp_path / "plan.json"
+    _save_plan_file(plan, plan_path)
+
+    with contextlib.suppress(SystemExit):
+        cli(
+            [
+                "sync",
+                "-f",
+                config_file,
+                "--apply-plan",
+                str(plan_path),
+                "--color",
+                "never",
+            ]
+        )
+
+    output = capsys.readouterr().out
+    assert "0 synced" in output
+    assert "3 skipped" in output
+    assert not checkout.exists()
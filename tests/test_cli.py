@@ -2301,33 +2301,31 @@ def test_sync_human_output_redacts_repo_paths(
         "workspace_root": "~/repos/",
     }
 
-    monkeypatch.setattr(
-        sync_module,
-        "load_configs",
-        lambda _paths, **_kwargs: [repo_config],
-    )
+    class _FakeLazyConfig:
+        @classmethod
+        def load(cls, _paths: t.Any, **_kwargs: t.Any) -> _FakeLazyConfig:
+            return cls()
+
+        def filter(
+            self,
+            path: str | None = None,
+            vcs_url: str | None = None,
+            name: str | None = None,
+        ) -> list[dict[str, t.Any]]:
+            if name and name != repo_config["name"]:
+                return []
+            if path and path != repo_config["path"]:
+                return []
+            if vcs_url and vcs_url != repo_config["url"]:
+                return []
+            return [repo_config]
+
+    monkeypatch.setattr(sync_module, "LazyConfig", _FakeLazyConfig)
     monkeypatch.setattr(
         sync_module,
         "find_config_files",
         lambda include_home=True: [],
     )
-
-    def _fake_filter_repos(
-        _configs: list[dict[str, t.Any]],
-        *,
-        path: str | None = None,
-        vcs_url: str | None = None,
-        name: str | None = None,
-    ) -> list[dict[str, t.Any]]:
-        if name and name != repo_config["name"]:
-            return []
-        if path and path != repo_config["path"]:
-            return []
-        if vcs_url and vcs_url != repo_config["url"]:
-            return []
-        return [repo_config]
-
-    monkeypatch.setattr(sync_module, "filter_repos", _fake_filter_repos)
     monkeypatch.setattr(
         sync_module,
         "update_repo",
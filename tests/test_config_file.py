@@ -507,3 +507,154 @@ def test_merge_nested_dict(tmp_path: pathlib.Path, config_path: pathlib.Path) ->
     assert config2 in config_files
     with pytest.raises(exc.VCSPullException):
         config.load_configs(config_files)
+
+
+def test_duplicate_path_error_names_both_files(config_path: pathlib.Path) -> None:
+    """Two files claiming one checkout raise with both URLs and files."""
+    first = write_config(
+        config_path=config_path / "team-a.yaml",
+        content="/path/to/test/:\n  flask: git+https://github.com/pallets/flask.git\n",
+    )
+    second = write_config(
+        config_path=config_path / "team-b.yaml",
+        content="/path/to/test/:\n  flask: git+https://github.com/fork/flask.git\n",
+    )
+
+    with pytest.raises(exc.DuplicateRepoError) as excinfo:
+        config.load_configs([first, second], use_cache=False)
+
+    message = str(excinfo.value)
+    assert "/path/to/test/flask" in message
+    assert "team-a.yaml" in message
+    assert "team-b.yaml" in message
+    assert [c.kind for c in excinfo.value.collisions] == ["path"]
+
+
+def test_same_url_at_two_paths_warns(
+    config_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """One remote checked out by two files at different paths is a warning."""
+    url = "git+https://github.com/pallets/flask.git"
+    first = write_config(
+        config_path=config_path / "team-a.yaml",
+        content=f"/path/to/a/:\n  flask: {url}\n",
+    )
+    second = write_config(
+        config_path=config_path / "team-b.yaml",
+        content=f"/path/to/b/:\n  flask: {url}\n",
+    )
+
+    with caplog.at_level("WARNING", logger="vcspull.config"):
+        repos = config.load_configs([first, second], use_cache=False)
+
+    assert len(repos) == 2
+    [record] = caplog.records
+    assert url in record.getMessage()
+    assert "team-a.yaml" in record.getMessage()
+    assert "team-b.yaml" in record.getMessage()
+
+
+def test_duplicate_detection_across_many_files(config_path: pathlib.Path) -> None:
+    """Fragments are each checked against all earlier ones."""
+    fragments = [
+        write_config(
+            config_path=config_path / f"team-{index:03}.yaml",
+            content=(
+                f"/path/to/team-{index}/:\n"
+                f"  repo: git+https://example.com/team-{index}/repo.git\n"
+            ),
+        )
+        for index in range(200)
+    ]
+    assert len(config.load_configs(fragments, use_cache=False)) == 200
+
+    clash = write_config(
+        config_path=config_path / "clash.yaml",
+        content="/path/to/team-7/:\n  repo: git+https://example.com/other.git\n",
+    )
+    with pytest.raises(exc.DuplicateRepoError) as excinfo:
+        config.load_configs([*fragments, clash], use_cache=False)
+
+    [collision] = excinfo.value.collisions
+    assert collision.first.source.name == "team-007.yaml"
+    assert collision.second.source.name == "clash.yaml"
+
+
+def test_jsonl_config_loads_like_yaml(config_path: pathlib.Path) -> None:
+    """A JSONL inventory expands to the same repos as the YAML it mirrors."""
+    yaml_file = write_config(
+        config_path=config_path / "inventory.yaml",
+        content=textwrap.dedent(
+            """\
+            /path/to/code/:
+              flask: git+https://github.com/pallets/flask.git
+              rich:
+                repo: git+https://github.com/Textualize/rich.git
+                options:
+                  shallow: true
+            """,
+        ),
+    )
+    jsonl_file = write_config(
+        config_path=config_path / "inventory.jsonl",
+        content=(
+            '{"workspace_root": "/path/to/code/", "name": "flask",'
+            ' "url": "git+https://github.com/pallets/flask.git"}\n'
+            '{"workspace_root": "/path/to/code/", "name": "rich",'
+            ' "url": "git+https://github.com/Textualize/rich.git",'
+            ' "options": {"shallow": true}}\n'
+        ),
+    )
+
+    assert config.load_configs([jsonl_file], use_cache=False) == config.load_configs(
+        [yaml_file],
+        use_cache=False,
+    )
+    assert config.find_config_files(path=config_path, filetype="jsonl") == [
+        jsonl_file,
+    ]
+
+
+def test_jsonl_repeated_entry_warns(
+    config_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """The first line for a repository wins; later ones are reported."""
+    jsonl_file = write_config(
+        config_path=config_path / "inventory.jsonl",
+        content=(
+            '{"workspace_root": "/path/to/code/", "name": "flask",'
+            ' "url": "git+https://github.com/pallets/flask.git"}\n'
+            '{"workspace_root": "/path/to/code/", "name": "flask",'
+            ' "url": "git+https://github.com/fork/flask.git"}\n'
+        ),
+    )
+
+    with caplog.at_level("WARNING", logger="vcspull.config"):
+        [repo] = config.load_configs([jsonl_file], use_cache=False)
+
+    assert repo["url"] == "git+https://github.com/pallets/flask.git"
+    [record] = caplog.records
+    assert record.getMessage().endswith(
+        "inventory.jsonl:2: /path/to/code/flask repeats line 1, which is kept",
+    )
+
+
+def test_iter_jsonl_repos_stops_early(config_path: pathlib.Path) -> None:
+    """Lines past the ones a caller consumes are never parsed."""
+    jsonl_file = write_config(
+        config_path=config_path / "inventory.jsonl",
+        content=(
+            '{"workspace_root": "/path/to/code/", "name": "flask",'
+            ' "url": "git+https://github.com/pallets/flask.git"}\n'
+            "not json\n"
+        ),
+    )
+
+    repos = config.iter_jsonl_repos(jsonl_file)
+    assert next(repos)["path"] == pathlib.Path("/path/to/code/flask")
+    repos.close()
+
+    with pytest.raises(ValueError, match="line 2"):
+        list(config.iter_jsonl_repos(jsonl_file))
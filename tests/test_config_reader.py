@@ -178,3 +178,127 @@ def test_duplicate_aware_reader_ignores_nested_list_mappings(
 
     # No duplicates at all in this config
     assert reader.duplicate_sections == {}
+
+
+PARITY_CONFIG = """\
+defaults: &defaults
+  options:
+    shallow: true
+~/code/:
+  flask:
+    repo: git+https://github.com/pallets/flask.git
+    worktrees:
+      - dir: ../flask-v3
+        tag: "3.0.0"
+      - dir: ../flask-main
+        branch: main
+~/code/:
+  django:
+    <<: *defaults
+    repo: git+https://github.com/django/django.git
+  "quoted: name": 'git+https://example.com/q.git'
+  empty:
+"~/ünïcode/":
+  tool: git+https://example.com/tool.git
+"""
+
+
+def test_duplicate_aware_reader_matches_pure_python_loader() -> None:
+    """The libyaml-backed loader reports exactly what the pure loader does."""
+    from vcspull._internal.config_reader import _PyDuplicateTrackingSafeLoader
+
+    fast = DuplicateAwareConfigReader._load_yaml_with_duplicates(PARITY_CONFIG)
+    pure = DuplicateAwareConfigReader._load_yaml_with_duplicates(
+        PARITY_CONFIG,
+        loader_class=_PyDuplicateTrackingSafeLoader,
+    )
+
+    assert fast == pure
+
+
+def test_duplicate_aware_reader_keeps_lists_in_duplicate_sections() -> None:
+    """Lists inside a duplicated root survive into its recorded sections."""
+    _, duplicates, items = DuplicateAwareConfigReader._load_yaml_with_duplicates(
+        PARITY_CONFIG,
+    )
+
+    flask = duplicates["~/code/"][0]["flask"]
+    assert [worktree["dir"] for worktree in flask["worktrees"]] == [
+        "../flask-v3",
+        "../flask-main",
+    ]
+    assert items[1] == ("~/code/", duplicates["~/code/"][0])
+
+
+def test_config_reader_dump_matches_pure_python_dumper() -> None:
+    """YAML written through libyaml is byte-identical to PyYAML's own."""
+    import yaml
+
+    content, _, _ = DuplicateAwareConfigReader._load_yaml_with_duplicates(
+        PARITY_CONFIG,
+    )
+
+    assert DuplicateAwareConfigReader._dump("yaml", content) == yaml.dump(
+        content,
+        indent=2,
+        default_flow_style=False,
+        Dumper=yaml.SafeDumper,
+    )
+
+
+def test_config_reader_falls_back_without_libyaml() -> None:
+    """Without libyaml the reader uses PyYAML's pure-Python classes."""
+    import subprocess
+    import sys
+
+    script = textwrap.dedent(
+        """\
+        import yaml
+
+        del yaml.CSafeLoader, yaml.CSafeDumper
+        from vcspull._internal import config_reader
+
+        assert not config_reader.LIBYAML_AVAILABLE
+        assert issubclass(
+            config_reader._DuplicateTrackingSafeLoader, yaml.SafeLoader
+        )
+        text = "~/a/:\\n  x: git+https://x\\n~/a/:\\n  y: git+https://y\\n"
+        _, duplicates, _ = (
+            config_reader.DuplicateAwareConfigReader._load_yaml_with_duplicates(
+                text
+            )
+        )
+        assert list(duplicates) == ["~/a/"], duplicates
+        """,
+    )
+
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_duplicate_aware_reader_reads_jsonl(tmp_path: pathlib.Path) -> None:
+    """JSONL configs read into the same mapping a YAML config would give."""
+    config_path = _write(
+        tmp_path,
+        "config.jsonl",
+        '{"workspace_root": "~/code/", "name": "repo",'
+        ' "url": "git+https://example.com/repo.git", "options": {"rev": "v1"}}\n'
+        "\n"
+        '{"workspace_root": "~/code/", "name": "other",'
+        ' "url": "git+https://example.com/other.git"}\n',
+    )
+
+    reader = DuplicateAwareConfigReader.from_file(config_path)
+
+    assert reader.content == {
+        "~/code/": {
+            "repo": {
+                "repo": "git+https://example.com/repo.git",
+                "options": {"rev": "v1"},
+            },
+            "other": "git+https://example.com/other.git",
+        },
+    }
+    assert reader.duplicate_sections == {}
+    assert DuplicateAwareConfigReader._load("jsonl", reader.dump("jsonl")) == (
+        reader.content
+    )
@@ -428,10 +428,12 @@ def test_get_cli_logger_names_includes_base() -> None:
     expected = [
         "vcspull.cli",
         "vcspull.cli._colors",
+        "vcspull.cli._config_files",
         "vcspull.cli._output",
         "vcspull.cli._progress",
         "vcspull.cli._workspaces",
         "vcspull.cli.add",
+        "vcspull.cli.cache",
         "vcspull.cli.discover",
         "vcspull.cli.fmt",
         "vcspull.cli.import_cmd",
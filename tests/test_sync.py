@@ -65,8 +65,9 @@ def test_makes_recursive(
         assert len(filtered_repos) > 0
 
         for r in filtered_repos:
-            assert isinstance(r, dict)
-            repo = create_project(**r)  # type: ignore
+            repo_dict = r.copy()
+            assert isinstance(repo_dict, dict)
+            repo = create_project(**repo_dict)  # type: ignore
             repo.obtain()
 
             assert repo.path.exists()
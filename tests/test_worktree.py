@@ -14,14 +14,17 @@ from vcspull import config as vcspull_config, exc
 from vcspull._internal.worktree_sync import (
     WorktreeAction,
     WorktreePlanEntry,
+    WorktreeSyncJob,
     WorktreeSyncResult,
     _get_ref_type_and_value,
     _resolve_worktree_path,
     list_existing_worktrees,
     plan_worktree_sync,
     prune_worktrees,
+    snapshot_worktrees,
     sync_all_worktrees,
     sync_worktree,
+    sync_worktree_jobs,
     validate_worktree_config,
 )
 from vcspull.cli.discover import is_git_worktree
@@ -486,6 +489,47 @@ def test_plan_worktree_sync_existing_tag_unchanged(
     assert entries[0].action == WorktreeAction.UNCHANGED
 
 
+def test_plan_worktree_sync_batches_git_calls(
+    git_repo: GitSync,
+    mocker: MockerFixture,
+) -> None:
+    """Planning many worktrees lists refs and worktrees once for the repo.
+
+    Only the dirty check runs per existing worktree; ref, registration, and
+    HEAD lookups come from one snapshot.
+    """
+    workspace_root = git_repo.path.parent
+    subprocess.run(
+        ["git", "tag", "v-batch"],
+        cwd=git_repo.path,
+        check=True,
+        capture_output=True,
+    )
+    worktrees_config: list[WorktreeConfigDict] = []
+    for index in range(6):
+        worktree_path = workspace_root / f"batch-wt-{index}"
+        if index % 2 == 0:
+            subprocess.run(
+                ["git", "worktree", "add", "--detach", str(worktree_path), "v-batch"],
+                cwd=git_repo.path,
+                check=True,
+                capture_output=True,
+            )
+        worktrees_config.append({"dir": str(worktree_path), "tag": "v-batch"})
+
+    run_spy = mocker.spy(subprocess, "run")
+    entries = plan_worktree_sync(git_repo.path, worktrees_config, workspace_root)
+
+    assert [entry.action for entry in entries] == [
+        WorktreeAction.UNCHANGED,
+        WorktreeAction.CREATE,
+    ] * 3
+    git_commands = [call.args[0][1] for call in run_spy.call_args_list]
+    assert sorted(git_commands) == sorted(
+        ["worktree", "for-each-ref", "status", "status", "status"],
+    )
+
+
 def test_plan_worktree_sync_dirty_worktree_blocked(
     git_repo: GitSync,
     tmp_path: pathlib.Path,
@@ -1190,6 +1234,22 @@ def test_sync_command_include_worktrees_flag_exists() -> None:
     assert args.dry_run is True
 
 
+@pytest.mark.parametrize("value", ["0", "-2", "many"])
+def test_worktree_sync_rejects_non_positive_max_concurrent(
+    value: str,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """--max-concurrent below 1 is a usage error, not a silent fallback."""
+    from vcspull.cli import create_parser
+
+    parser = create_parser(return_subparsers=False)
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["worktree", "sync", "--max-concurrent", value])
+
+    assert "--max-concurrent takes a positive number" in capsys.readouterr().err
+
+
 # ---------------------------------------------------------------------------
 # Additional CLI Tests for Coverage
 # ---------------------------------------------------------------------------
@@ -1322,6 +1382,63 @@ def test_cli_worktree_sync_creates_worktree(
     assert (worktree_path / ".git").is_file()
 
 
+def test_cli_worktree_sync_max_concurrent_ndjson(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test vcspull worktree sync --max-concurrent reports per-worktree timing."""
+    import json
+
+    from vcspull.cli import cli
+
+    subprocess.run(
+        ["git", "tag", "v-max-concurrent"],
+        cwd=git_repo.path,
+        check=True,
+        capture_output=True,
+    )
+    worktree_paths = [
+        git_repo.path.parent / f"{git_repo.path.name}-mc-{index}" for index in range(2)
+    ]
+    config_path = tmp_path / ".vcspull.yaml"
+    config_path.write_text(
+        f"""\
+{git_repo.path.parent}/:
+  {git_repo.path.name}:
+    repo: git+file://{git_repo.path}
+    worktrees:
+      - dir: {worktree_paths[0]}
+        tag: v-max-concurrent
+      - dir: {worktree_paths[1]}
+        tag: v-max-concurrent
+""",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+
+    cli(
+        [
+            "worktree",
+            "sync",
+            "--max-concurrent",
+            "1",
+            "--ndjson",
+            "-f",
+            str(config_path),
+        ],
+    )
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    worktree_events = [event for event in events if "duration_ms" in event]
+    assert [pathlib.Path(event["worktree_path"]).name for event in worktree_events] == [
+        path.name for path in worktree_paths
+    ]
+    assert all(event["duration_ms"] >= 0 for event in worktree_events)
+    assert all(path.is_dir() for path in worktree_paths)
+
+
 def test_cli_worktree_prune_dry_run(
     git_repo: GitSync,
     tmp_path: pathlib.Path,
@@ -1583,16 +1700,88 @@ def test_sync_all_worktrees_counts_mixed(
     assert len(sync_result.entries) == 5
 
 
-def test_worktree_exists_with_git_dir(tmp_path: pathlib.Path) -> None:
-    """Test _worktree_exists returns False for regular git directory."""
-    from vcspull._internal.worktree_sync import _worktree_exists
+def test_sync_worktree_jobs_serializes_writes_per_repo(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """Creates overlap across repositories but never within one repository."""
+    import threading
+    import time
 
-    # Create a directory with .git as a directory (regular repo, not worktree)
-    fake_repo = tmp_path / "fake_repo"
-    fake_repo.mkdir()
-    (fake_repo / ".git").mkdir()
+    subprocess.run(
+        ["git", "tag", "v-concurrent"],
+        cwd=git_repo.path,
+        check=True,
+        capture_output=True,
+    )
+    repos = [tmp_path / "concurrent-a", tmp_path / "concurrent-b"]
+    for repo in repos:
+        subprocess.run(
+            ["git", "clone", "--quiet", str(git_repo.path), str(repo)],
+            check=True,
+            capture_output=True,
+        )
 
-    assert _worktree_exists(tmp_path, fake_repo) is False
+    active: dict[pathlib.Path, int] = dict.fromkeys(repos, 0)
+    peak_per_repo: dict[pathlib.Path, int] = dict.fromkeys(repos, 0)
+    peak_overall = 0
+    guard = threading.Lock()
+
+    def slow_create(repo_path: pathlib.Path, *args: t.Any) -> None:
+        nonlocal peak_overall
+        with guard:
+            active[repo_path] += 1
+            peak_per_repo[repo_path] = max(peak_per_repo[repo_path], active[repo_path])
+            peak_overall = max(peak_overall, sum(active.values()))
+        time.sleep(0.05)
+        with guard:
+            active[repo_path] -= 1
+
+    mocker.patch(
+        "vcspull._internal.worktree_sync._create_worktree",
+        side_effect=slow_create,
+    )
+    jobs = [
+        WorktreeSyncJob(
+            repo_path=repo,
+            worktrees_config=[
+                {
+                    "dir": str(tmp_path / f"{repo.name}-wt-{index}"),
+                    "tag": "v-concurrent",
+                }
+                for index in range(3)
+            ],
+            workspace_root=tmp_path,
+        )
+        for repo in repos
+    ]
+
+    results = sync_worktree_jobs(jobs, max_workers=4)
+
+    assert [result.created for result in results] == [3, 3]
+    assert [
+        [entry.worktree_path.name for entry in result.entries] for result in results
+    ] == [[f"{repo.name}-wt-{index}" for index in range(3)] for repo in repos]
+    assert all(
+        entry.duration_ms is not None and entry.duration_ms >= 50
+        for result in results
+        for entry in result.entries
+    )
+    assert set(peak_per_repo.values()) == {1}
+    assert peak_overall == 2
+
+
+def test_snapshot_ignores_regular_repository(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+) -> None:
+    """A separate repository at a worktree path is not a registered worktree."""
+    other_repo = tmp_path / "other_repo"
+    other_repo.mkdir()
+    subprocess.run(["git", "init"], cwd=other_repo, check=True, capture_output=True)
+
+    assert snapshot_worktrees(git_repo.path).get(other_repo) is None
 
 
 def test_is_worktree_dirty_with_actual_dirty_state(
@@ -1622,12 +1811,10 @@ def test_is_worktree_dirty_with_actual_dirty_state(
     assert _is_worktree_dirty(worktree_path) is True
 
 
-def test_ref_exists_with_commit(
+def test_snapshot_has_commit(
     git_repo: GitSync,
 ) -> None:
-    """Test _ref_exists correctly finds commits."""
-    from vcspull._internal.worktree_sync import _ref_exists
-
+    """Test the worktree snapshot verifies requested commits."""
     # Get current commit
     result = subprocess.run(
         ["git", "rev-parse", "HEAD"],
@@ -1638,17 +1825,17 @@ def test_ref_exists_with_commit(
     )
     commit_sha = result.stdout.strip()
 
-    assert _ref_exists(git_repo.path, commit_sha, "commit") is True
-    assert _ref_exists(git_repo.path, "0000000000", "commit") is False
+    snapshot = snapshot_worktrees(git_repo.path, commits=[commit_sha, "0000000000"])
 
+    assert snapshot.has_ref(commit_sha, "commit") is True
+    assert snapshot.has_ref("0000000000", "commit") is False
 
-def test_get_worktree_head_with_actual_worktree(
+
+def test_snapshot_worktree_head(
     git_repo: GitSync,
     tmp_path: pathlib.Path,
 ) -> None:
-    """Test _get_worktree_head returns commit SHA."""
-    from vcspull._internal.worktree_sync import _get_worktree_head
-
+    """Test the worktree snapshot records each worktree's HEAD commit."""
     worktree_path = git_repo.path.parent / "head-test-wt"
 
     subprocess.run(
@@ -1658,9 +1845,11 @@ def test_get_worktree_head_with_actual_worktree(
         capture_output=True,
     )
 
-    head = _get_worktree_head(worktree_path)
-    assert head is not None
-    assert len(head) == 40  # Full SHA
+    linked = snapshot_worktrees(git_repo.path).get(worktree_path.resolve())
+    assert linked is not None
+    assert linked.head is not None
+    assert len(linked.head) == 40  # Full SHA
+    assert linked.branch is None
 
 
 # ---------------------------------------------------------------------------
@@ -2299,36 +2488,30 @@ def test_cli_worktree_list_config_discovery(
 # ---------------------------------------------------------------------------
 
 
-def test_worktree_exists_rejects_submodule_path(tmp_path: pathlib.Path) -> None:
-    """Test _worktree_exists returns False for submodule .git files.
+def test_snapshot_rejects_submodule_path(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test a submodule-style ``.git`` file is not treated as a worktree.
 
-    Regression test: _worktree_exists only checked if .git was a file,
-    not whether it pointed to the repo's worktrees directory. Submodules
-    also have .git files but point to .git/modules/, not .git/worktrees/.
+    Submodules also have .git files but point to .git/modules/, and git
+    never lists them as worktrees.
     """
-    from vcspull._internal.worktree_sync import _worktree_exists
-
-    repo_path = tmp_path / "repo"
-    repo_path.mkdir()
-    (repo_path / ".git").mkdir()
-
     # Create a fake submodule directory with a .git file pointing to /modules/
     submodule_path = tmp_path / "submodule"
     submodule_path.mkdir()
     (submodule_path / ".git").write_text(
-        f"gitdir: {repo_path / '.git' / 'modules' / 'sub'}\n"
+        f"gitdir: {git_repo.path / '.git' / 'modules' / 'sub'}\n"
     )
 
-    assert _worktree_exists(repo_path, submodule_path) is False
+    assert snapshot_worktrees(git_repo.path).get(submodule_path) is None
 
 
-def test_worktree_exists_accepts_real_worktree(
+def test_snapshot_accepts_real_worktree(
     git_repo: GitSync,
     tmp_path: pathlib.Path,
 ) -> None:
-    """Test _worktree_exists returns True for actual worktrees of the repo."""
-    from vcspull._internal.worktree_sync import _worktree_exists
-
+    """Test the snapshot finds actual worktrees of the repo."""
     worktree_path = git_repo.path.parent / "real-wt-check"
     subprocess.run(
         ["git", "worktree", "add", str(worktree_path), "HEAD", "--detach"],
@@ -2337,24 +2520,20 @@ def test_worktree_exists_accepts_real_worktree(
         capture_output=True,
     )
 
-    assert _worktree_exists(git_repo.path, worktree_path) is True
+    assert snapshot_worktrees(git_repo.path).get(worktree_path.resolve()) is not None
 
 
-def test_worktree_exists_rejects_prefix_collision(tmp_path: pathlib.Path) -> None:
-    """Test _worktree_exists rejects paths whose .git dir is a prefix collision.
+def test_snapshot_rejects_prefix_collision(
+    git_repo: GitSync,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test a ``.git`` file whose gitdir only shares a string prefix is rejected.
 
-    Regression test: str.startswith() would match /repo/.git-other/worktrees/feat
-    against /repo/.git because the string prefix matches. Path.relative_to()
-    correctly rejects this since .git-other is not inside .git.
+    /repo/.git-other/worktrees/feat starts with /repo/.git as a string, but
+    it is not a worktree of the repository.
     """
-    from vcspull._internal.worktree_sync import _worktree_exists
-
-    repo_path = tmp_path / "repo"
-    repo_path.mkdir()
-    (repo_path / ".git").mkdir()
-
     # Create a sibling directory that is a prefix collision with .git
-    collider_git = repo_path / ".git-other" / "worktrees" / "feat"
+    collider_git = git_repo.path / ".git-other" / "worktrees" / "feat"
     collider_git.mkdir(parents=True)
 
     # Create a fake worktree pointing to the collider path
@@ -2362,23 +2541,16 @@ def test_worktree_exists_rejects_prefix_collision(tmp_path: pathlib.Path) -> Non
     worktree_path.mkdir()
     (worktree_path / ".git").write_text(f"gitdir: {collider_git}\n")
 
-    # Should be False: .git-other is not inside .git
-    assert _worktree_exists(repo_path, worktree_path) is False
-
+    assert snapshot_worktrees(git_repo.path).get(worktree_path) is None
 
-def test_worktree_exists_path_no_git(tmp_path: pathlib.Path) -> None:
-    """Test _worktree_exists returns False for path without .git.
-
-    Coverage: Line 346 in worktree_sync.py.
-    """
-    from vcspull._internal.worktree_sync import _worktree_exists
 
+def test_snapshot_path_no_git(git_repo: GitSync, tmp_path: pathlib.Path) -> None:
+    """Test a directory without ``.git`` is not a registered worktree."""
     # Create a directory that exists but has no .git file or dir
     some_path = tmp_path / "not_a_worktree"
     some_path.mkdir()
 
-    # Should return False (hits line 346)
-    assert _worktree_exists(tmp_path, some_path) is False
+    assert snapshot_worktrees(git_repo.path).get(some_path) is None
 
 
 # ---------------------------------------------------------------------------
@@ -2523,16 +2695,11 @@ def test_cli_sync_skips_empty_worktrees(
 # ---------------------------------------------------------------------------
 
 
-def test_ref_exists_remote_branch_fallback(
+def test_snapshot_remote_branch_fallback(
     git_repo: GitSync,
     tmp_path: pathlib.Path,
 ) -> None:
-    """Test _ref_exists falls back to remote branch check.
-
-    Coverage: Line 257 in worktree_sync.py.
-    """
-    from vcspull._internal.worktree_sync import _ref_exists
-
+    """Test branch lookups fall back to ``origin/<branch>``."""
     # Create a bare remote
     remote_path = tmp_path / "remote.git"
     subprocess.run(
@@ -2581,18 +2748,17 @@ def test_ref_exists_remote_branch_fallback(
     )
 
     # The branch should exist on remote but not locally
-    # _ref_exists should find it via the fallback to origin/branch
-    assert _ref_exists(git_repo.path, "remote-only-branch", "branch") is True
+    # The snapshot should find it via the fallback to origin/branch
+    snapshot = snapshot_worktrees(git_repo.path)
+    assert snapshot.has_ref("remote-only-branch", "branch") is True
 
 
-def test_ref_exists_branch_rejects_tag(git_repo: GitSync) -> None:
-    """Test _ref_exists with ref_type='branch' does not match a tag.
+def test_snapshot_branch_rejects_tag(git_repo: GitSync) -> None:
+    """Test a branch lookup does not match a tag.
 
-    Ensures branch validation uses refs/heads/ namespace, not bare rev-parse
-    which would resolve tags too.
+    Ensures branch validation uses the refs/heads/ namespace, not a bare
+    name that would resolve tags too.
     """
-    from vcspull._internal.worktree_sync import _ref_exists
-
     # Create a tag in the repo
     subprocess.run(
         ["git", "tag", "v9.9.9"],
@@ -2601,27 +2767,22 @@ def test_ref_exists_branch_rejects_tag(git_repo: GitSync) -> None:
         capture_output=True,
     )
 
+    snapshot = snapshot_worktrees(git_repo.path)
+
     # Tag should be found as a tag
-    assert _ref_exists(git_repo.path, "v9.9.9", "tag") is True
+    assert snapshot.has_ref("v9.9.9", "tag") is True
 
     # Tag should NOT be found as a branch
-    assert _ref_exists(git_repo.path, "v9.9.9", "branch") is False
-
+    assert snapshot.has_ref("v9.9.9", "branch") is False
 
-def test_get_worktree_head_exception_handling(tmp_path: pathlib.Path) -> None:
-    """Test _get_worktree_head handles exceptions gracefully.
-
-    Coverage: Lines 305-307 in worktree_sync.py.
-    """
-    from vcspull._internal.worktree_sync import _get_worktree_head
 
+def test_snapshot_non_repo_directory(tmp_path: pathlib.Path) -> None:
+    """Test a directory that is not a repository is not a worktree of one."""
     # Create a directory that exists but is not a git repo
     non_repo = tmp_path / "not_a_repo"
     non_repo.mkdir()
 
-    # Should return None (exception path)
-    result = _get_worktree_head(non_repo)
-    assert result is None
+    assert snapshot_worktrees(non_repo).get(non_repo) is None
 
 
 def test_is_worktree_dirty_exception_handling(tmp_path: pathlib.Path) -> None:
@@ -2659,20 +2820,17 @@ def test_is_worktree_dirty_nonzero_returncode(
     assert result is True
 
 
-def test_ref_exists_exception_handling(tmp_path: pathlib.Path) -> None:
-    """Test _ref_exists handles exceptions gracefully.
-
-    Coverage: Lines 270-271 in worktree_sync.py.
-    """
-    from vcspull._internal.worktree_sync import _ref_exists
-
+def test_snapshot_missing_repository(tmp_path: pathlib.Path) -> None:
+    """Test a missing repository yields an empty snapshot."""
     # Pass a path that doesn't exist
     nonexistent = tmp_path / "nonexistent"
 
-    # Should return False for all ref types (exception path)
-    assert _ref_exists(nonexistent, "v1.0.0", "tag") is False
-    assert _ref_exists(nonexistent, "main", "branch") is False
-    assert _ref_exists(nonexistent, "abc123", "commit") is False
+    snapshot = snapshot_worktrees(nonexistent, commits=["abc123"])
+
+    # Should return False for all ref types
+    assert snapshot.has_ref("v1.0.0", "tag") is False
+    assert snapshot.has_ref("main", "branch") is False
+    assert snapshot.has_ref("abc123", "commit") is False
 
 
 # ---------------------------------------------------------------------------
@@ -3150,37 +3308,25 @@ def test_cli_prune_no_existing_worktrees(
 
 
 # ---------------------------------------------------------------------------
-# 6. Test: _get_worktree_head OSError exception - lines 305-306
+# 6. Test: worktree snapshot when git cannot run
 # ---------------------------------------------------------------------------
 
 
-def test_get_worktree_head_oserror(
-    tmp_path: pathlib.Path,
+def test_snapshot_oserror(
+    git_repo: GitSync,
     mocker: MockerFixture,
 ) -> None:
-    """Test _get_worktree_head handles OSError exception.
-
-    Coverage: Lines 305-306 in worktree_sync.py.
-
-    The existing test (test_get_worktree_head_exception_handling) uses a
-    non-repo directory which triggers CalledProcessError, not OSError.
-    This test specifically triggers OSError.
-    """
-    from vcspull._internal.worktree_sync import _get_worktree_head
-
-    # Create a directory
-    test_dir = tmp_path / "oserror-head-test"
-    test_dir.mkdir()
-
+    """Test the snapshot is empty when git cannot be run at all."""
     # Mock subprocess.run to raise OSError (e.g., git binary not found)
     mocker.patch(
         "subprocess.run",
         side_effect=OSError("Mocked OSError: git not found"),
     )
 
-    # Should return None (OSError exception path)
-    result = _get_worktree_head(test_dir)
-    assert result is None
+    snapshot = snapshot_worktrees(git_repo.path)
+
+    assert snapshot.worktrees == {}
+    assert snapshot.refs == frozenset()
 
 
 def test_cli_worktree_deduplicates_patterns(